@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+"""Benchmark loading and evaluating observatory clock corrections.
+
+For each observatory this times what a fresh process has to do before it can
+apply clock corrections: reading the clock files one by one as PINT used to,
+compiling them into a clock chain, and loading the compiled chain from the
+on-disk cache. It then compares evaluating the corrections for many TOAs with
+the chain and with one interpolation per clock file.
+"""
+import argparse
+import tempfile
+import time
+
+import astropy.units as u
+import numpy as np
+
+from pint.observatory import get_observatory
+from pint.observatory.clock_chain import ClockChain, load_clock_chain
+from pint.observatory.clock_file import ClockFile
+from pint.pulsar_mjd import Time
+
+
+def read_clock_files(sources):
+    """The clock files, read one at a time."""
+    return [
+        ClockFile.read(s.filename, format=s.format, obscode=s.obscode) for s in sources
+    ]
+
+
+def evaluate_clock_files(clocks, sources, t):
+    """The clock corrections, summed over the clock files."""
+    corr = clocks[0].evaluate(t) - sources[0].offset * u.s
+    for clock, source in zip(clocks[1:], sources[1:]):
+        corr += clock.evaluate(t) - source.offset * u.s
+    return corr
+
+
+def timed(f, *args, repeats=3):
+    start_time = time.perf_counter()
+    for _ in range(repeats):
+        r = f(*args)
+    return (time.perf_counter() - start_time) / repeats, r
+
+
+def bench(ntoas, sites):
+    rng = np.random.default_rng(0)
+    t = Time(
+        np.sort(rng.uniform(53000, 58000, ntoas)), scale="utc", format="pulsar_mjd"
+    )
+    cache_dir = tempfile.mkdtemp()
+    total_old = total_new = 0
+    for name in sites:
+        sources = get_observatory(name).clock_sources()
+        read, clocks = timed(read_clock_files, sources)
+        compile, _ = timed(ClockChain.from_sources, sources)
+        load_clock_chain(sources, cache_dir=cache_dir)
+        load, chain = timed(load_clock_chain, sources, cache_dir)
+        old, corr_old = timed(evaluate_clock_files, clocks, sources, t)
+        new, corr = timed(chain.evaluate, t)
+        total_old += read + old
+        total_new += load + new
+        print(
+            "{}: read clock files {:.3f} s, compile chain {:.3f} s, load "
+            "cached chain {:.4f} s; evaluate per file {:.4f} s, chain {:.4f} s, "
+            "max difference {:.1e} s".format(
+                name,
+                read,
+                compile,
+                load,
+                old,
+                new,
+                np.max(np.abs(corr - corr_old.to_value(u.s))),
+            )
+        )
+    print(
+        "Total for {} TOAs per observatory: per file {:.3f} s, cached chains "
+        "{:.3f} s; speedup {:.1f}x".format(
+            ntoas, total_old, total_new, total_old / total_new
+        )
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark loading and evaluating clock corrections."
+    )
+    parser.add_argument(
+        "--ntoas", type=int, default=100000, help="Number of TOAs to use."
+    )
+    parser.add_argument(
+        "--sites",
+        nargs="+",
+        default=["gbt", "ao", "jodrell", "vla", "chime", "fast"],
+        help="Observatories to load the clock corrections of.",
+    )
+    args = parser.parse_args()
+    bench(args.ntoas, args.sites)
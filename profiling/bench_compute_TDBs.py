@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+"""Benchmark TOAs.compute_TDBs for different kinds of observatory.
+
+For each kind of observatory (a TopoObs, a SatelliteObs and the
+Barycenter) this builds synthetic data sets of increasing size and compares
+the array-based compute_TDBs with the per-TOA code PINT used to have.
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import astropy.table
+import astropy.time
+import astropy.units as u
+import numpy as np
+from astropy.coordinates import EarthLocation
+
+import pint.toa
+from pint.observatory import get_observatory
+from pint.observatory.satellite_obs import get_satellite_observatory
+from pint.observatory.topo_obs import TopoObs
+
+datadir = os.path.join(os.path.dirname(__file__), "..", "tests", "datafile")
+ft2file = os.path.join(datadir, "lat_spacecraft_weekly_w323_p202_v001.fits")
+
+
+def make_fake_tim(filename, ntoas, obs, start, stop):
+    """Write a tempo2 .tim file with ntoas TOAs from obs between start and stop."""
+    rng = np.random.default_rng(0)
+    mjds = np.sort(rng.uniform(start, stop, ntoas))
+    with open(filename, "w") as f:
+        f.write("FORMAT 1\n")
+        for i, mjd in enumerate(mjds):
+            f.write("fake {:.3f} {:.15f} 1.000 {}\n".format(1400 + i % 100, mjd, obs))
+
+
+def compute_TDBs_per_toa(toas, ephem="DE421"):
+    """Compute the tdb and tdbld columns one TOA at a time, as PINT used to."""
+    tdbs = np.zeros_like(toas.table["mjd"])
+    for ii, key in enumerate(toas.table.groups.keys):
+        grp = toas.table.groups[ii]
+        site = get_observatory(key["obs"])
+        loind, hiind = toas.table.groups.indices[ii : ii + 2]
+        if isinstance(site, TopoObs):
+            grpmjds = astropy.time.Time(grp["mjd"], location=grp["mjd"][0].location)
+        else:
+            loclist = [t.location for t in grp["mjd"]]
+            if loclist[0] is None:
+                grpmjds = astropy.time.Time(grp["mjd"], location=None)
+            else:
+                locs = EarthLocation(
+                    np.array([loc.x.value for loc in loclist]) * u.m,
+                    np.array([loc.y.value for loc in loclist]) * u.m,
+                    np.array([loc.z.value for loc in loclist]) * u.m,
+                )
+                grpmjds = astropy.time.Time(grp["mjd"], location=locs)
+        grptdbs = site.get_TDBs(grpmjds, ephem=ephem, grp=grp)
+        tdbs[loind:hiind] = np.asarray([t for t in grptdbs])
+    col_tdb = astropy.table.Column(name="tdb", data=tdbs)
+    col_tdbld = astropy.table.Column(name="tdbld", data=[t.tdb.mjd_long for t in tdbs])
+    return col_tdb, col_tdbld
+
+
+def tdb_scaling(sizes, loop_limit):
+    fermi = get_satellite_observatory("Fermi", ft2file)
+    ft2_start, ft2_stop = fermi.FT2["MJD_TT"][0], fermi.FT2["MJD_TT"][-1]
+    sites = [
+        ("TopoObs", "gbt", 53000, 58000),
+        ("SatelliteObs", "fermi", ft2_start + 0.01, ft2_stop - 0.01),
+        ("Barycenter", "@", 53000, 58000),
+    ]
+    with tempfile.TemporaryDirectory() as d:
+        for kind, obs, start, stop in sites:
+            print(kind)
+            for ntoas in sizes:
+                timfile = os.path.join(d, "fake.tim")
+                make_fake_tim(timfile, ntoas, obs, start, stop)
+                toas = pint.toa.TOAs(timfile)
+                toas.ephem = "DE421"
+                start_time = time.perf_counter()
+                toas.compute_TDBs()
+                vectorized = time.perf_counter() - start_time
+                line = "{:>9d} TOAs: vectorized {:8.2f} s".format(ntoas, vectorized)
+                if ntoas <= loop_limit:
+                    start_time = time.perf_counter()
+                    compute_TDBs_per_toa(toas)
+                    per_toa = time.perf_counter() - start_time
+                    line += ", per-TOA {:8.2f} s, speedup {:6.1f}x".format(
+                        per_toa, per_toa / vectorized
+                    )
+                print(line)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark TDB computation for different observatories."
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[1000, 10000, 100000],
+        help="Numbers of TOAs to try.",
+    )
+    parser.add_argument(
+        "--loop-limit",
+        type=int,
+        default=100000,
+        help="Skip the (slow) per-TOA code for data sets larger than this.",
+    )
+    args = parser.parse_args()
+    tdb_scaling(args.sizes, args.loop_limit)
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+"""Benchmark the DMX model with many ranges.
+
+This builds a model with many DMX ranges and a synthetic data set spanning
+them, and compares assigning the TOAs to ranges by binary search with the
+comparison of every TOA against every range PINT used to do, for the DMX
+delay and for the DMX columns of the design matrix.
+"""
+import argparse
+import io
+import time
+
+import astropy.units as u
+import numpy as np
+
+import pint.toa
+from pint.models import get_model
+from pint.toa_select import TOASelect
+
+par_base = """
+PSR J1234+5678
+ELAT 10
+ELONG 20
+PEPOCH 55000
+F0 100 1
+F1 -1e-15 1
+DM 10
+DMX 14
+"""
+
+
+def make_model(nranges, start, stop):
+    edges = np.linspace(start, stop, nranges + 1)
+    lines = [par_base]
+    for i in range(nranges):
+        lines.append("DMX_{:04d} 0.001 1".format(i + 1))
+        lines.append("DMXR1_{:04d} {:.6f}".format(i + 1, edges[i]))
+        lines.append("DMXR2_{:04d} {:.6f}".format(i + 1, edges[i + 1] - 1e-3))
+    return get_model(io.StringIO("\n".join(lines)))
+
+
+def dmx_dm_per_range(dmx, toas):
+    """The DMX values for the TOAs, comparing every TOA with every range."""
+    condition = {}
+    selector = TOASelect(is_range=True)
+    DMX_mapping = dmx.get_prefix_mapping_component("DMX_")
+    DMXR1_mapping = dmx.get_prefix_mapping_component("DMXR1_")
+    DMXR2_mapping = dmx.get_prefix_mapping_component("DMXR2_")
+    for i in DMX_mapping:
+        r1 = getattr(dmx, DMXR1_mapping[i]).quantity
+        r2 = getattr(dmx, DMXR2_mapping[i]).quantity
+        condition[DMX_mapping[i]] = (r1.mjd, r2.mjd)
+    select_idx = selector.get_select_index(condition, toas.table["mjd_float"])
+    dm = np.zeros(len(toas)) * u.pc / u.cm ** 3
+    for k, v in select_idx.items():
+        dm[v] = getattr(dmx, k).quantity
+    return dm
+
+
+def dmx_columns_per_parameter(model, toas):
+    """The DMX columns of the design matrix, one parameter at a time."""
+    delay = model.delay(toas)
+    params = [p for p in model.free_params if p.startswith("DMX_")]
+    with model.evaluation_cache(toas):
+        return [model.d_phase_d_param(toas, delay, p) for p in params]
+
+
+def timed(f, *args):
+    start_time = time.perf_counter()
+    f(*args)
+    return time.perf_counter() - start_time
+
+
+def bench(ntoas, nranges):
+    model = make_model(nranges, 53000, 58000)
+    dmx = model.components["DispersionDMX"]
+    rng = np.random.default_rng(0)
+    mjds = np.sort(rng.uniform(53000, 58000, ntoas))
+    freqs = rng.choice([430.0, 820.0, 1400.0, 2300.0], ntoas)
+    toas = pint.toa.get_TOAs_array(mjds, "gbt", freqs=freqs, errors=1.0, ephem="DE436")
+    print("{} TOAs, {} DMX ranges".format(ntoas, nranges))
+
+    dmx.dmx_dm(toas)
+    new = timed(dmx.dmx_dm, toas)
+    old = timed(dmx_dm_per_range, dmx, toas)
+    assert np.all(dmx.dmx_dm(toas) == dmx_dm_per_range(dmx, toas))
+    print(
+        "DMX delay: binary search {:.3f} s, per range {:.3f} s, "
+        "speedup {:.1f}x".format(new, old, old / new)
+    )
+
+    new = timed(model.designmatrix, toas)
+    old = timed(dmx_columns_per_parameter, model, toas)
+    print(
+        "Design matrix: with DMX block {:.3f} s; "
+        "DMX columns alone, one parameter at a time {:.3f} s".format(new, old)
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the DMX model.")
+    parser.add_argument(
+        "--ntoas", type=int, default=300000, help="Number of TOAs to use."
+    )
+    parser.add_argument("--ranges", type=int, default=600, help="Number of DMX ranges.")
+    args = parser.parse_args()
+    bench(args.ntoas, args.ranges)
@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+"""Benchmark evaluating the solar system ephemeris for the planets.
+
+This builds a synthetic data set spread over several observatories and
+times evaluating the positions and velocities of the Sun and the planets
+for all its TOAs, as TOAs.compute_posvels does with planets: once for all
+TOAs with the SPK engine, and through astropy for each observatory group
+and each body, as PINT used to. It checks that the results are identical.
+The positions of the observatories themselves are not included.
+"""
+import argparse
+import time
+
+import numpy as np
+from astropy.time import Time
+
+import pint.toa
+from pint.solar_system_ephemerides import objPosVel_wrt_SSB, objPosVels_wrt_SSB
+
+bodies = ["sun"] + list(pint.toa.all_planets)
+
+
+def posvels_per_group(toas, ephem):
+    """The Sun and planet positions, one group and one body at a time."""
+    posvels = {p: [] for p in bodies}
+    for grp in toas.table.groups:
+        tdb = Time(grp["tdb"], precision=9)
+        for p in bodies:
+            posvels[p].append(objPosVel_wrt_SSB(p, tdb, ephem, engine="astropy"))
+    return posvels
+
+
+def timed(f, *args, **kwargs):
+    start_time = time.perf_counter()
+    r = f(*args, **kwargs)
+    return time.perf_counter() - start_time, r
+
+
+def bench(ntoas, sites, ephem):
+    rng = np.random.default_rng(0)
+    toas = pint.toa.merge_TOAs(
+        [
+            pint.toa.get_TOAs_array(
+                np.sort(rng.uniform(53000, 58000, ntoas // len(sites))),
+                site,
+                freqs=1400.0,
+                errors=1.0,
+                ephem=ephem,
+            )
+            for site in sites
+        ]
+    )
+    print("{} TOAs from {} observatories".format(toas.ntoas, len(sites)))
+    tdb = Time(toas.table["tdb"], precision=9)
+
+    # Once to load the kernel and, for the SPK engine, decode the records
+    objPosVels_wrt_SSB(bodies, tdb, ephem)
+    posvels_per_group(toas, ephem)
+    new, posvels = timed(objPosVels_wrt_SSB, bodies, tdb, ephem)
+    old, per_group = timed(posvels_per_group, toas, ephem)
+    for p in bodies:
+        for i, pv in enumerate(per_group[p]):
+            loind, hiind = toas.table.groups.indices[i : i + 2]
+            assert np.array_equal(posvels[p].pos[:, loind:hiind], pv.pos)
+            assert np.array_equal(posvels[p].vel[:, loind:hiind], pv.vel)
+    print(
+        "Sun and planets: SPK engine, all TOAs at once {:.3f} s; astropy, per "
+        "group and body {:.3f} s; speedup {:.1f}x".format(new, old, old / new)
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark evaluating the ephemeris for the planets."
+    )
+    parser.add_argument(
+        "--ntoas", type=int, default=100000, help="Number of TOAs to use."
+    )
+    parser.add_argument(
+        "--sites",
+        nargs="+",
+        default=["gbt", "ao", "jodrell", "vla", "chime", "fast", "barycenter"],
+        help="Observatories to spread the TOAs over.",
+    )
+    parser.add_argument("--ephem", default="DE436", help="Solar system ephemeris.")
+    args = parser.parse_args()
+    bench(args.ntoas, args.sites, args.ephem)
@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+"""Benchmark loading photon events as TOAs.
+
+This writes a synthetic barycentered NICER event file and compares building
+one TOA object per event with load_event_TOAs and turning them into a table
+with get_TOAs_list, as photonphase used to, with reading the file a chunk at
+a time with iter_event_TOAs. It reports the time taken by each and, with
+--memory, the peak memory allocated (as traced by tracemalloc, which makes
+everything several times slower).
+"""
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+import astropy.io.fits as pyfits
+import numpy as np
+
+import pint.toa as toa
+from pint.event_toas import iter_event_TOAs, load_event_TOAs
+
+
+def write_events(filename, nevents, days):
+    """Write a barycentered NICER event file with nevents random events."""
+    rng = np.random.default_rng(0)
+    t = np.sort(rng.uniform(0, days * 86400, nevents)) + 2e8
+    columns = [
+        pyfits.Column(name="TIME", format="D", array=t),
+        pyfits.Column(name="PHA", format="J", array=rng.integers(0, 1500, nevents)),
+    ]
+    hdu = pyfits.BinTableHDU.from_columns(columns, name="EVENTS")
+    hdu.header["TIMESYS"] = "TDB"
+    hdu.header["TIMEREF"] = "SOLARSYSTEM"
+    hdu.header["MJDREFI"] = 56658
+    hdu.header["MJDREFF"] = 7.775925925925930e-04
+    hdu.writeto(filename, overwrite=True)
+
+
+def timed(f, *args, memory=False):
+    if memory:
+        tracemalloc.start()
+    start_time = time.perf_counter()
+    r = f(*args)
+    t = time.perf_counter() - start_time
+    peak = np.nan
+    if memory:
+        peak = tracemalloc.get_traced_memory()[1] / 2 ** 20
+        tracemalloc.stop()
+    return t, peak, r
+
+
+def load_all(filename):
+    """The TOAs of all the events, built one TOA object at a time."""
+    ts = toa.get_TOAs_list(
+        load_event_TOAs(filename, "nicer"), include_bipm=False, include_gps=False
+    )
+    return ts.get_mjds().value
+
+
+def load_chunks(filename, chunksize):
+    """The TOAs of all the events, built a chunk at a time."""
+    mjds = np.empty(0)
+    for rows, ts in iter_event_TOAs(
+        filename, "nicer", chunksize=chunksize, include_bipm=False, include_gps=False
+    ):
+        mjds = np.concatenate([mjds, ts.get_mjds().value])
+    return mjds
+
+
+def bench(nevents, days, chunksize, memory):
+    filename = os.path.join(tempfile.mkdtemp(), "events.evt")
+    write_events(filename, nevents, days)
+    old, old_peak, mjds_old = timed(load_all, filename, memory=memory)
+    new, new_peak, mjds = timed(load_chunks, filename, chunksize, memory=memory)
+    print(
+        "{} events: TOA objects {:.2f} s, peak {:.0f} MiB; chunks of {} "
+        "{:.2f} s, peak {:.0f} MiB; speedup {:.1f}x; same MJDs {}".format(
+            nevents,
+            old,
+            old_peak,
+            chunksize,
+            new,
+            new_peak,
+            old / new,
+            np.array_equal(mjds, mjds_old),
+        )
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark loading photon events.")
+    parser.add_argument(
+        "--nevents", type=int, default=200000, help="Number of events to use."
+    )
+    parser.add_argument(
+        "--days", type=float, default=10, help="Time span of the events in days."
+    )
+    parser.add_argument(
+        "--chunksize", type=int, default=100000, help="Events to read at a time."
+    )
+    parser.add_argument(
+        "--memory", action="store_true", help="Also measure the peak memory use."
+    )
+    args = parser.parse_args()
+    bench(args.nevents, args.days, args.chunksize, args.memory)
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+"""Benchmark the Kepler equation solver.
+
+This compares pint.orbital.kepler.solve_kepler with the Newton-Raphson loop
+the binary models used to have, which starts from the mean anomaly and
+iterates on the whole array until every element has converged. The old loop
+is limited to a number of iterations because at high eccentricity (or for
+float64 mean anomalies of many orbits) it does not converge. Accuracy is
+measured as the residual of Kepler's equation evaluated in long double.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from pint.orbital.kepler import solve_kepler
+
+
+def solve_kepler_newton(e, mean_anomaly, maxiter):
+    """Solve Kepler's equation as the binary models used to."""
+    k = lambda E: E - e * np.sin(E) - mean_anomaly
+    dk = lambda E: 1 - e * np.cos(E)
+    U = mean_anomaly
+    for _ in range(maxiter):
+        if np.max(abs(k(U))) <= 5e-15:
+            break
+        U = U - k(U) / dk(U)
+    return U
+
+
+def residual(e, mean_anomaly, E):
+    E = np.longdouble(E)
+    return np.max(np.abs(E - e * np.sin(E) - np.longdouble(mean_anomaly)))
+
+
+def timed(f, *args):
+    start_time = time.perf_counter()
+    r = f(*args)
+    return time.perf_counter() - start_time, r
+
+
+def bench(n, maxiter):
+    rng = np.random.default_rng(0)
+    for dtype in [np.float64, np.longdouble]:
+        # About five years of a 10-day orbit
+        mean_anomaly = rng.uniform(0, 2 * np.pi * 200, n).astype(dtype)
+        for e in [0.1, 0.5, 0.9, 0.99, 0.9999]:
+            e = dtype(e)
+            new, E_new = timed(solve_kepler, e, mean_anomaly)
+            old, E_old = timed(solve_kepler_newton, e, mean_anomaly, maxiter)
+            print(
+                "{:>10} e={:<6} solve_kepler {:.3f} s (residual {:.1e}), "
+                "Newton loop {:.3f} s (residual {:.1e}), speedup {:.1f}x".format(
+                    np.dtype(dtype).name,
+                    float(e),
+                    new,
+                    residual(e, mean_anomaly, E_new),
+                    old,
+                    residual(e, mean_anomaly, E_old),
+                    old / new,
+                )
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the Kepler solver.")
+    parser.add_argument(
+        "--n", type=int, default=1000000, help="Number of mean anomalies."
+    )
+    parser.add_argument(
+        "--maxiter",
+        type=int,
+        default=50,
+        help="Maximum number of iterations of the old Newton loop.",
+    )
+    args = parser.parse_args()
+    bench(args.n, args.maxiter)
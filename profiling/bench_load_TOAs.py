@@ -1,20 +1,122 @@
 #!/usr/bin/env python
+"""Benchmark loading TOAs.
+
+Run with no arguments to load the J0740+6620 data set (used by
+high_level_benchmark.py). Run with ``--clock-scaling`` to compare the
+vectorized clock correction code against a per-TOA loop on synthetic data
+sets of increasing size.
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import astropy.time
+import astropy.units as u
+import numpy as np
 
 import pint.toa
+from pint.observatory import get_observatory
+
+
+def load_J0740():
+    # Get .tim file from here:
+    # curl -O https://data.nanograv.org/static/data/J0740+6620.cfr+19.tim
+
+    # This will load the TOAs, compute the positions of the Earth and planets, and apply clock corrections and build the table.
+    thanktoas = pint.toa.get_TOAs(
+        "J0740+6620.cfr+19.tim",
+        ephem="DE436",
+        planets=True,
+        usepickle=False,
+        include_gps=True,
+        bipm_version="BIPM2015",
+        include_bipm=True,
+    )
+    print()
+    print("Number of TOAs: " + str(thanktoas.ntoas))
+    print()
+
+
+def make_fake_tim(filename, ntoas, obss=("gbt", "ao")):
+    """Write a tempo2 .tim file with ntoas TOAs spread over several observatories."""
+    rng = np.random.default_rng(0)
+    mjds = np.sort(rng.uniform(53000, 58000, ntoas))
+    with open(filename, "w") as f:
+        f.write("FORMAT 1\n")
+        for i, mjd in enumerate(mjds):
+            f.write(
+                "fake {:.3f} {:.15f} 1.000 {} -to 0.5\n".format(
+                    1400 + i % 100, mjd, obss[i % len(obss)]
+                )
+            )
+
+
+def apply_clock_corrections_per_toa(toas):
+    """Apply clock corrections one TOA at a time, as PINT used to."""
+    flags = toas.table["flags"]
+    corr = np.zeros(toas.ntoas) * u.s
+    times = toas.table["mjd"]
+    for ii, key in enumerate(toas.table.groups.keys):
+        grp = toas.table.groups[ii]
+        site = get_observatory(key["obs"])
+        loind, hiind = toas.table.groups.indices[ii : ii + 2]
+        for jj in range(loind, hiind):
+            if "to" in flags[jj]:
+                corr[jj] = flags[jj]["to"] * u.s
+                times[jj] += astropy.time.TimeDelta(corr[jj])
+        gcorr = site.clock_corrections(astropy.time.Time(grp["mjd"]))
+        for jj, cc in enumerate(gcorr):
+            grp["mjd"][jj] += astropy.time.TimeDelta(cc)
+        corr[loind:hiind] += gcorr
+        for jj in range(loind, hiind):
+            if corr[jj] != 0:
+                flags[jj]["clkcorr"] = corr[jj]
+
+
+def clock_scaling(sizes, loop_limit):
+    with tempfile.TemporaryDirectory() as d:
+        for ntoas in sizes:
+            timfile = os.path.join(d, "fake.tim")
+            make_fake_tim(timfile, ntoas)
+            toas = pint.toa.TOAs(timfile)
+            start = time.perf_counter()
+            toas.apply_clock_corrections()
+            vectorized = time.perf_counter() - start
+            line = "{:>9d} TOAs: vectorized {:8.2f} s".format(ntoas, vectorized)
+            if ntoas <= loop_limit:
+                toas = pint.toa.TOAs(timfile)
+                start = time.perf_counter()
+                apply_clock_corrections_per_toa(toas)
+                per_toa = time.perf_counter() - start
+                line += ", per-TOA loop {:8.2f} s, speedup {:6.1f}x".format(
+                    per_toa, per_toa / vectorized
+                )
+            print(line)
+
 
-# Get .tim file from here:
-# curl -O https://data.nanograv.org/static/data/J0740+6620.cfr+19.tim
-
-# This will load the TOAs, compute the positions of the Earth and planets, and apply clock corrections and build the table.
-thanktoas = pint.toa.get_TOAs(
-    "J0740+6620.cfr+19.tim",
-    ephem="DE436",
-    planets=True,
-    usepickle=False,
-    include_gps=True,
-    bipm_version="BIPM2015",
-    include_bipm=True,
-)
-print()
-print("Number of TOAs: " + str(thanktoas.ntoas))
-print()
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark loading TOAs.")
+    parser.add_argument(
+        "--clock-scaling",
+        action="store_true",
+        help="Time clock corrections on synthetic data sets instead.",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[10000, 100000, 1000000],
+        help="Numbers of TOAs for --clock-scaling.",
+    )
+    parser.add_argument(
+        "--loop-limit",
+        type=int,
+        default=1000000,
+        help="Skip the (slow) per-TOA loop for data sets larger than this.",
+    )
+    args = parser.parse_args()
+    if args.clock_scaling:
+        clock_scaling(args.sizes, args.loop_limit)
+    else:
+        load_J0740()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+"""Benchmark reading a par file with many parameters.
+
+This writes synthetic par files with a number of DMX ranges (three
+parameters each) and one JUMP for every eight ranges, and reports how long
+get_model takes to build a TimingModel from each. With linear-time reading
+the time per parameter should stay roughly the same as the file grows.
+"""
+import argparse
+import io
+import time
+
+from pint.models import get_model
+
+par_base = """
+PSR J1234+5678
+ELAT 0
+ELONG 0
+PEPOCH 58000
+F0 1 1
+F1 0 1
+DM 10
+DMX 14
+"""
+
+
+def make_fake_par(ndmx):
+    """A par file with ndmx DMX ranges and ndmx // 8 JUMPs."""
+    lines = [par_base]
+    for i in range(1, ndmx + 1):
+        lines.append("DMX_{:04d} 0.001 1".format(i))
+        lines.append("DMXR1_{:04d} {}".format(i, 50000 + i))
+        lines.append("DMXR2_{:04d} {}".format(i, 50000.5 + i))
+    for i in range(1, ndmx // 8 + 1):
+        lines.append("JUMP -fe be{} 0.0 1".format(i))
+    return "\n".join(lines)
+
+
+def bench(sizes):
+    for ndmx in sizes:
+        par = make_fake_par(ndmx)
+        start_time = time.perf_counter()
+        model = get_model(io.StringIO(par))
+        elapsed = time.perf_counter() - start_time
+        nparams = len(model.params)
+        print(
+            "{:>6d} parameters: {:8.2f} s, {:6.1f} ms per parameter".format(
+                nparams, elapsed, 1000 * elapsed / nparams
+            )
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark building a TimingModel from a large par file."
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[100, 200, 400, 800, 1600],
+        help="Numbers of DMX ranges to try.",
+    )
+    args = parser.parse_args()
+    bench(args.sizes)
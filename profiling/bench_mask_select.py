@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+"""Benchmark selecting TOAs for mask parameters.
+
+This builds a synthetic data set with many backends and a JUMP, EFAC and
+EQUAD for each, plus JUMPs on MJD ranges, and times how long selecting the
+TOAs for all of them takes, as it is done for every evaluation of the
+noise model and the jumps. It compares the shared selection index with the
+per-parameter selection PINT used to do, where each parameter compared a
+whole flag or column (keeping a TOASelect to reuse range selections).
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+import pint.toa
+from pint.models.parameter import maskParameter
+from pint.toa_select import TOASelect
+
+
+def make_fake_tim(filename, ntoas, nbackends):
+    """Write a tempo2 .tim file with ntoas TOAs spread over nbackends."""
+    rng = np.random.default_rng(0)
+    mjds = np.sort(rng.uniform(53000, 58000, ntoas))
+    backends = rng.integers(nbackends, size=ntoas)
+    with open(filename, "w") as f:
+        f.write("FORMAT 1\n")
+        for i, (mjd, b) in enumerate(zip(mjds, backends)):
+            f.write(
+                "fake {:.3f} {:.15f} 1.000 gbt -f be{} -fe rcvr{}\n".format(
+                    1400 + i % 100, mjd, b, b % 3
+                )
+            )
+
+
+def make_masks(nbackends, nranges):
+    masks = []
+    for i in range(nbackends):
+        for name in ["JUMP", "EFAC", "EQUAD"]:
+            masks.append(
+                maskParameter(
+                    name=name, index=i + 1, key="-f", key_value="be{}".format(i)
+                )
+            )
+    for i in range(nranges):
+        start = 53000 + i * 5000 / nranges
+        masks.append(
+            maskParameter(
+                name="JUMP",
+                index=nbackends + i + 1,
+                key="mjd",
+                key_value=[start, start + 5000 / nranges],
+            )
+        )
+    return masks
+
+
+def select_toa_mask_per_parameter(mask, toas):
+    """Select the TOAs for a mask parameter as PINT used to."""
+    if not hasattr(mask, "toa_selector_old"):
+        mask.toa_selector_old = TOASelect(
+            is_range=len(mask.key_value) == 2, use_hash=True
+        )
+    tbl = toas.table
+    if mask.key == "mjd":
+        condition = {mask.name: tuple(mask.key_value)}
+        col = tbl["mjd_float"]
+        return mask.toa_selector_old.get_select_index(condition, col)[mask.name]
+    return np.nonzero(tbl["flags"].matches(mask.key[1:], mask.key_value[0]))[0]
+
+
+def timed(f, masks, toas, repeats):
+    f(masks[0], toas)
+    start_time = time.perf_counter()
+    for _ in range(repeats):
+        for m in masks:
+            f(m, toas)
+    return (time.perf_counter() - start_time) / repeats
+
+
+def bench(sizes, nbackends, nranges, repeats):
+    masks = make_masks(nbackends, nranges)
+    print("{} mask parameters".format(len(masks)))
+    with tempfile.TemporaryDirectory() as d:
+        for ntoas in sizes:
+            timfile = os.path.join(d, "fake.tim")
+            make_fake_tim(timfile, ntoas, nbackends)
+            toas = pint.toa.TOAs(timfile)
+            new = timed(maskParameter.select_toa_mask, masks, toas, repeats)
+            old = timed(select_toa_mask_per_parameter, masks, toas, repeats)
+            for m in masks:
+                assert np.array_equal(
+                    m.select_toa_mask(toas), select_toa_mask_per_parameter(m, toas)
+                )
+            print(
+                "{:>9d} TOAs: index {:8.4f} s, per parameter {:8.4f} s, "
+                "speedup {:6.1f}x".format(ntoas, new, old, old / new)
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark selecting the TOAs for mask parameters."
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[10000, 100000],
+        help="Numbers of TOAs to try.",
+    )
+    parser.add_argument(
+        "--backends", type=int, default=50, help="Number of backends (-f flags)."
+    )
+    parser.add_argument(
+        "--ranges", type=int, default=50, help="Number of JUMPs on MJD ranges."
+    )
+    parser.add_argument(
+        "--repeats", type=int, default=5, help="Number of times to select."
+    )
+    args = parser.parse_args()
+    bench(args.sizes, args.backends, args.ranges, args.repeats)
@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+"""Benchmark loading and interpolating satellite orbit files.
+
+This writes a synthetic (circular orbit) FPorbit file and compares loading
+it and evaluating the spacecraft position and velocity with one spline per
+component, as SatelliteObs does by default, with the cubic Hermite
+interpolator and the persistent orbit table cache.
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import astropy.io.fits as pyfits
+import astropy.units as u
+import numpy as np
+from astropy.time import Time
+
+from pint.observatory.satellite_obs import get_satellite_observatory
+
+
+def write_orbit(filename, days, step):
+    """Write an FPorbit file with a 92 minute circular orbit."""
+    t = np.arange(0, days * 86400, step)
+    r = 6.8e6
+    w = 2 * np.pi / (92 * 60)
+    phase = w * t
+    columns = [pyfits.Column(name="TIME", format="D", array=t)]
+    pos = [r * np.cos(phase), r * np.sin(phase) * 0.8, r * np.sin(phase) * 0.6]
+    vel = [
+        -r * w * np.sin(phase),
+        r * w * np.cos(phase) * 0.8,
+        r * w * np.cos(phase) * 0.6,
+    ]
+    for name, x in zip(["X", "Y", "Z", "Vx", "Vy", "Vz"], pos + vel):
+        columns.append(pyfits.Column(name=name, format="D", array=x))
+    hdu = pyfits.BinTableHDU.from_columns(columns, name="ORBIT")
+    hdu.header["TIMESYS"] = "TT"
+    hdu.header["TIMEREF"] = "LOCAL"
+    hdu.header["MJDREFI"] = 56658
+    hdu.header["MJDREFF"] = 7.775925925925930e-04
+    hdu.writeto(filename, overwrite=True)
+
+
+def timed(f, *args, **kwargs):
+    start_time = time.perf_counter()
+    r = f(*args, **kwargs)
+    return time.perf_counter() - start_time, r
+
+
+def bench(days, step, ntimes):
+    directory = tempfile.mkdtemp()
+    filename = os.path.join(directory, "FPorbit")
+    write_orbit(filename, days, step)
+    cachedir = os.path.join(directory, "cache")
+
+    load_spline, spline = timed(get_satellite_observatory, "rxte_spline", filename)
+    load_first, _ = timed(
+        get_satellite_observatory,
+        "rxte_first",
+        filename,
+        interpolator="hermite",
+        usecache=True,
+        cachedir=cachedir,
+    )
+    load_cached, hermite = timed(
+        get_satellite_observatory,
+        "rxte_hermite",
+        filename,
+        interpolator="hermite",
+        usecache=True,
+        cachedir=cachedir,
+    )
+    print(
+        "Load: splines {:.3f} s; Hermite, parsing and caching {:.3f} s; "
+        "Hermite, from cache {:.3f} s".format(load_spline, load_first, load_cached)
+    )
+    mjd = hermite._orbit.mjd
+    print("{} orbit entries".format(len(mjd)))
+    rng = np.random.default_rng(0)
+    t = Time(np.sort(rng.uniform(mjd[0], mjd[-1], ntimes)), format="mjd", scale="tt")
+    old, (pos_old, vel_old) = timed(spline._geo_posvel, t)
+    new, (pos, vel) = timed(hermite._geo_posvel, t)
+    print(
+        "Position and velocity at {} times: splines {:.3f} s; Hermite {:.3f} s; "
+        "speedup {:.1f}x; max difference {:.2g} m, {:.2g} m/s".format(
+            ntimes,
+            old,
+            new,
+            old / new,
+            np.max(np.abs(pos - pos_old).to_value(u.m)),
+            np.max(np.abs(vel - vel_old).to_value(u.m / u.s)),
+        )
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark loading and interpolating satellite orbits."
+    )
+    parser.add_argument(
+        "--days", type=float, default=30, help="Length of the orbit file in days."
+    )
+    parser.add_argument(
+        "--step", type=float, default=10, help="Orbit file spacing in seconds."
+    )
+    parser.add_argument(
+        "--ntimes", type=int, default=1000000, help="Number of times to evaluate."
+    )
+    args = parser.parse_args()
+    bench(args.days, args.step, args.ntimes)
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+"""Benchmark the direction to the pulsar and residuals that use it.
+
+This builds a synthetic data set for the J0740+6620 model (an MSP with
+ecliptic coordinates and proper motion) and compares the closed-form
+pulsar direction with the astropy SkyCoord calculation PINT used to do,
+both on its own and in a full residual evaluation.
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+
+import pint.toa
+from pint.models import get_model
+from pint.residuals import Residuals
+
+parfile = os.path.join(os.path.dirname(__file__), "J0740+6620.par")
+
+
+def psr_dir_skycoord(model, epoch=None):
+    """The direction to the pulsar computed with SkyCoord, as PINT used to."""
+    return model.coords_as_ICRS(epoch=epoch).cartesian.xyz.transpose()
+
+
+def timed(f, *args):
+    start_time = time.perf_counter()
+    f(*args)
+    return time.perf_counter() - start_time
+
+
+def bench(ntoas, repeats):
+    model = get_model(parfile)
+    rng = np.random.default_rng(0)
+    mjds = np.sort(rng.uniform(56640, 58461, ntoas))
+    freqs = np.where(np.arange(ntoas) % 2, 820.0, 1400.0)
+    toas = pint.toa.get_TOAs_array(
+        mjds, "gbt", freqs=freqs, errors=1.0, ephem="DE436", planets=True
+    )
+    epoch = toas.table["tdbld"]
+    print("{} TOAs".format(ntoas))
+
+    new = min(timed(model.ssb_to_psb_xyz_ICRS, epoch) for _ in range(repeats))
+    old = min(timed(psr_dir_skycoord, model, epoch) for _ in range(repeats))
+    diff = np.max(
+        np.abs(model.ssb_to_psb_xyz_ICRS(epoch) - psr_dir_skycoord(model, epoch))
+    )
+    print(
+        "Pulsar direction: closed form {:.3f} s, SkyCoord {:.3f} s, "
+        "speedup {:.1f}x, max difference {:.1e}".format(new, old, old / new, diff)
+    )
+
+    def resids():
+        return Residuals(toas, model).time_resids
+
+    new = min(timed(resids) for _ in range(repeats))
+    r_new = resids()
+    astrometry = model.components["AstrometryEcliptic"]
+    astrometry.ssb_to_psb_xyz_ICRS = lambda epoch=None: psr_dir_skycoord(model, epoch)
+    try:
+        old = min(timed(resids) for _ in range(repeats))
+        r_old = resids()
+    finally:
+        del astrometry.ssb_to_psb_xyz_ICRS
+    print(
+        "Residuals: closed form {:.3f} s, SkyCoord {:.3f} s, "
+        "speedup {:.1f}x, max difference {:.1e}".format(
+            new, old, old / new, np.max(np.abs(r_new - r_old))
+        )
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark the pulsar direction calculation."
+    )
+    parser.add_argument(
+        "--ntoas", type=int, default=100000, help="Number of TOAs to use."
+    )
+    parser.add_argument(
+        "--repeats", type=int, default=3, help="Number of times to repeat each timing."
+    )
+    args = parser.parse_args()
+    bench(args.ntoas, args.repeats)
@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+"""Benchmark the solar system Shapiro delay.
+
+This builds a synthetic data set spread over several observatories and a
+model with PLANET_SHAPIRO, and compares the Shapiro delay computed for all
+TOAs and bodies at once with the loop over observatory groups and planets
+PINT used to have. It also times the design matrix, whose astrometric
+columns now include the derivatives of the Shapiro delay.
+"""
+import argparse
+import io
+import time
+
+import numpy as np
+
+import pint.toa
+from pint.models import get_model
+
+par = """
+PSR J1234+5678
+ELONG 181.0 1
+ELAT 1.5 1
+PMELONG 3 1
+PMELAT -2 1
+PEPOCH 55000
+POSEPOCH 55000
+F0 100 1
+F1 -1e-15 1
+DM 10
+PLANET_SHAPIRO Y
+"""
+
+
+def shapiro_delay_per_group(shapiro, toas):
+    """The Shapiro delay, one observatory group and one body at a time."""
+    tbl = toas.table
+    delay = np.zeros(len(tbl))
+    psr_dirs = shapiro._parent.psr_dir_ICRS(toas)
+    for ii, key in enumerate(tbl.groups.keys):
+        grp = tbl.groups[ii]
+        loind, hiind = tbl.groups.indices[ii : ii + 2]
+        if key["obs"].lower() == "barycenter":
+            continue
+        psr_dir = psr_dirs[loind:hiind]
+        for body in ("sun", "jupiter", "saturn", "venus", "uranus", "neptune"):
+            delay[loind:hiind] += shapiro.ss_obj_shapiro_delay(
+                grp["obs_" + body + "_pos"], psr_dir, shapiro._ss_mass_sec[body]
+            )
+    return delay
+
+
+def timed(f, *args, repeats=5):
+    f(*args)
+    start_time = time.perf_counter()
+    for _ in range(repeats):
+        r = f(*args)
+    return (time.perf_counter() - start_time) / repeats, r
+
+
+def bench(ntoas, sites, ephem):
+    model = get_model(io.StringIO(par))
+    shapiro = model.components["SolarSystemShapiro"]
+    rng = np.random.default_rng(0)
+    toas = pint.toa.merge_TOAs(
+        [
+            pint.toa.get_TOAs_array(
+                np.sort(rng.uniform(53000, 58000, ntoas // len(sites))),
+                site,
+                freqs=1400.0,
+                errors=1.0,
+                ephem=ephem,
+                planets=True,
+            )
+            for site in sites
+        ]
+    )
+    print("{} TOAs from {} observatories".format(toas.ntoas, len(sites)))
+
+    new, delay = timed(shapiro.solar_system_shapiro_delay, toas)
+    old, delay_old = timed(shapiro_delay_per_group, shapiro, toas)
+    print(
+        "Shapiro delay: all TOAs and bodies {:.4f} s; per group and body "
+        "{:.4f} s; speedup {:.1f}x, max difference {:.1e} s".format(
+            new, old, old / new, np.max(np.abs(delay.value - delay_old))
+        )
+    )
+    t, _ = timed(model.designmatrix, toas, repeats=1)
+    print("Design matrix {:.3f} s".format(t))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark the solar system Shapiro delay."
+    )
+    parser.add_argument(
+        "--ntoas", type=int, default=100000, help="Number of TOAs to use."
+    )
+    parser.add_argument(
+        "--sites",
+        nargs="+",
+        default=["gbt", "ao", "jodrell", "vla", "chime", "fast", "barycenter"],
+        help="Observatories to spread the TOAs over.",
+    )
+    parser.add_argument("--ephem", default="DE436", help="Solar system ephemeris.")
+    args = parser.parse_args()
+    bench(args.ntoas, args.sites, args.ephem)
@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+"""Benchmark the design matrix with sparse columns.
+
+This builds a model with many DMX ranges and JUMPs and a synthetic data set
+spanning them, and compares the dense design matrix with the one that keeps
+the mostly-zero columns in a sparse matrix: the time to compute it, the
+memory it takes, and the time to form the normal equations M^T N^-1 M as
+the fitters do.
+"""
+import argparse
+import io
+import time
+
+import numpy as np
+
+import pint.toa
+from pint.fitter import WLSFitter
+from pint.models import get_model
+
+par_base = """
+PSR J1234+5678
+ELAT 10
+ELONG 20
+PEPOCH 55000
+F0 100 1
+F1 -1e-15 1
+DM 10
+DMX 14
+"""
+
+
+def make_model(nranges, njumps, start, stop):
+    edges = np.linspace(start, stop, nranges + 1)
+    lines = [par_base]
+    for i in range(nranges):
+        lines.append("DMX_{:04d} 0.001 1".format(i + 1))
+        lines.append("DMXR1_{:04d} {:.6f}".format(i + 1, edges[i]))
+        lines.append("DMXR2_{:04d} {:.6f}".format(i + 1, edges[i + 1] - 1e-3))
+    for i in range(njumps):
+        lines.append("JUMP -be be{} 0.0 1".format(i + 1))
+    return get_model(io.StringIO("\n".join(lines)))
+
+
+def timed(f, *args, **kwargs):
+    start_time = time.perf_counter()
+    r = f(*args, **kwargs)
+    return time.perf_counter() - start_time, r
+
+
+def bench(ntoas, nranges, njumps):
+    model = make_model(nranges, njumps, 53000, 58000)
+    rng = np.random.default_rng(0)
+    mjds = np.sort(rng.uniform(53000, 58000, ntoas))
+    freqs = rng.choice([430.0, 820.0, 1400.0, 2300.0], ntoas)
+    toas = pint.toa.get_TOAs_array(mjds, "gbt", freqs=freqs, errors=1.0, ephem="DE436")
+    backends = rng.integers(njumps + 1, size=ntoas)
+    toas.table["flags"].set_values("be", ["be{}".format(b) for b in backends])
+    weights = 1 / toas.get_errors().to_value("s") ** 2
+    print("{} TOAs, {} DMX ranges, {} JUMPs".format(ntoas, nranges, njumps))
+    model.delay(toas)
+
+    old, (M, params, units) = timed(model.designmatrix, toas)
+    new, (S, _, _) = timed(model.designmatrix, toas, sparse=True)
+    assert np.array_equal(S.toarray(), M)
+    sparse_bytes = S.dense.nbytes + S.sparse.data.nbytes + S.sparse.indices.nbytes
+    print(
+        "Design matrix: dense {:.3f} s, {:.0f} MB; sparse columns {:.3f} s, "
+        "{:.0f} MB ({} of {} columns sparse)".format(
+            old,
+            M.nbytes / 1e6,
+            new,
+            sparse_bytes / 1e6,
+            len(S.sparse_columns),
+            len(params),
+        )
+    )
+
+    old, mtcm = timed(lambda: np.dot(M.T, weights[:, None] * M))
+    new, gram = timed(S.gram, weights)
+    print(
+        "Normal equations: dense {:.3f} s, blockwise {:.3f} s, speedup {:.1f}x, "
+        "max relative difference {:.1e}".format(
+            old, new, old / new, np.max(np.abs(gram - mtcm)) / np.max(np.abs(mtcm))
+        )
+    )
+
+    fitters = [WLSFitter(toas, model) for _ in range(2)]
+    old, _ = timed(fitters[0].fit_toas)
+    new, _ = timed(fitters[1].fit_toas, sparse=True)
+    values = np.array(
+        [[f.model[p].value for p in params[1:]] for f in fitters], dtype=float
+    )
+    errors = np.array([fitters[0].model[p].uncertainty_value for p in params[1:]])
+    print(
+        "WLS fit: dense {:.3f} s, sparse {:.3f} s, "
+        "max difference {:.1e} sigma".format(
+            old, new, np.max(np.abs(values[1] - values[0]) / errors)
+        )
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark the design matrix with sparse columns."
+    )
+    parser.add_argument(
+        "--ntoas", type=int, default=100000, help="Number of TOAs to use."
+    )
+    parser.add_argument("--ranges", type=int, default=600, help="Number of DMX ranges.")
+    parser.add_argument("--jumps", type=int, default=20, help="Number of JUMPs.")
+    args = parser.parse_args()
+    bench(args.ntoas, args.ranges, args.jumps)
@@ -5,10 +5,14 @@ from astropy import log
 
 import pint.toa as toa
 from pint.fits_utils import read_fits_event_mjds_tuples
+from pint.observatory import bipm_default, get_observatory
+from pint.pulsar_mjd import day_frac
 
 __all__ = [
     "load_fits_TOAs",
     "load_event_TOAs",
+    "iter_fits_TOAs",
+    "iter_event_TOAs",
     "load_NuSTAR_TOAs",
     "load_NICER_TOAs",
     "load_RXTE_TOAs",
@@ -69,9 +73,11 @@ def _default_obs_and_scale(mission, timesys, timeref):
     return obs, scale
 
 
-def _get_columns_from_fits(hdu, cols):
+def _get_columns_from_fits(hdu, cols, rows=None):
     new_dict = {}
     event_dat = hdu.data
+    if rows is not None:
+        event_dat = event_dat[rows]
     default_val = np.zeros(len(event_dat))
     # Parse and retrieve default values from the FITS columns listed in config
     for col in cols.keys():
@@ -119,6 +125,27 @@ def _get_timeref(hdu):
     return timeref
 
 
+def _get_obs_and_scale(hdulist, mission, extension, timesys, timeref):
+    """Check the event extension and find the observatory and scale of its TOAs."""
+    if extension is not None and hdulist[1].name not in extension.split(","):
+        raise RuntimeError(
+            "First table in FITS file"
+            + "must be {}. Found {}".format(extension, hdulist[1].name)
+        )
+
+    if timesys is None:
+        timesys = _get_timesys(hdulist[1])
+    if timeref is None:
+        timeref = _get_timeref(hdulist[1])
+    check_timesys(timesys)
+    check_timeref(timeref)
+
+    if not mission_config[mission]["allow_local"] and timesys != "TDB":
+        log.error("Raw spacecraft TOAs not yet supported for " + mission)
+
+    return _default_obs_and_scale(mission, timesys, timeref)
+
+
 def load_fits_TOAs(
     eventname,
     mission,
@@ -165,23 +192,7 @@ def load_fits_TOAs(
     # Load photon times from event file
     hdulist = pyfits.open(eventname)
 
-    if extension is not None and hdulist[1].name not in extension.split(","):
-        raise RuntimeError(
-            "First table in FITS file"
-            + "must be {}. Found {}".format(extension, hdulist[1].name)
-        )
-
-    if timesys is None:
-        timesys = _get_timesys(hdulist[1])
-    if timeref is None:
-        timeref = _get_timeref(hdulist[1])
-    check_timesys(timesys)
-    check_timeref(timeref)
-
-    if not mission_config[mission]["allow_local"] and timesys != "TDB":
-        log.error("Raw spacecraft TOAs not yet supported for " + mission)
-
-    obs, scale = _default_obs_and_scale(mission, timesys, timeref)
+    obs, scale = _get_obs_and_scale(hdulist, mission, extension, timesys, timeref)
 
     # Read time column from FITS file
     mjds = read_fits_event_mjds_tuples(hdulist[1])
@@ -254,6 +265,146 @@ def load_event_TOAs(eventname, mission, weights=None, minmjd=-np.inf, maxmjd=np.
     )
 
 
+def iter_fits_TOAs(
+    eventname,
+    mission,
+    weights=None,
+    extension=None,
+    timesys=None,
+    timeref=None,
+    minmjd=-np.inf,
+    maxmjd=np.inf,
+    chunksize=100000,
+    ephem=None,
+    include_bipm=True,
+    bipm_version=bipm_default,
+    include_gps=True,
+    planets=False,
+    tdb_method="default",
+):
+    """
+    Read photon event times out of a FITS file as a sequence of TOAs objects.
+
+    This reads the event list ``chunksize`` rows at a time and builds a
+    :class:`pint.toa.TOAs` object for each chunk directly from the columns,
+    with clock corrections, TDBs and positions already computed (see
+    :func:`pint.toa.get_TOAs_array`). Unlike :func:`pint.event_toas.load_fits_TOAs`
+    it does not construct a :class:`pint.toa.TOA` for each event, and only
+    one chunk is held in memory at a time, so it can be used on event lists
+    too large to load at once.
+
+    The observatory and the event extension are checked when this function
+    is called, so errors such as an unknown observatory are raised then
+    rather than when the first chunk is read.
+
+    Parameters
+    ----------
+    eventname : str
+        File name of the FITS event list
+    mission : str
+        Name of the mission (e.g. RXTE, XMM)
+    weights : array or None
+        The array has to be of the same size as the event list. Overwrites
+        possible weight lists from mission-specific FITS files
+    extension : str
+        FITS extension to read
+    timesys : str, default None
+        Force this time system
+    timeref : str, default None
+        Forse this time reference
+    minmjd : float, default "-infinity"
+        minimum MJD timestamp to return
+    maxmjd : float, default "infinity"
+        maximum MJD timestamp to return
+    chunksize : int
+        Number of rows of the event list to read at a time
+    ephem, include_bipm, bipm_version, include_gps, planets, tdb_method
+        As for :func:`pint.toa.get_TOAs_array`.
+
+    Yields
+    ------
+    rows : numpy.ndarray
+        The rows of the event list the TOAs come from, in the order of the
+        TOAs in the table.
+    toas : pint.toa.TOAs
+        The TOAs of the events in this chunk between minmjd and maxmjd.
+        Chunks with no such events are skipped.
+    """
+    with pyfits.open(eventname) as hdulist:
+        obs, scale = _get_obs_and_scale(hdulist, mission, extension, timesys, timeref)
+    get_observatory(obs)
+    if weights is not None:
+        weights = np.asarray(weights)
+    return _fits_TOA_chunks(
+        eventname,
+        obs,
+        scale,
+        mission_config[mission]["fits_columns"],
+        weights,
+        minmjd,
+        maxmjd,
+        chunksize,
+        dict(
+            ephem=ephem,
+            include_bipm=include_bipm,
+            bipm_version=bipm_version,
+            include_gps=include_gps,
+            planets=planets,
+            tdb_method=tdb_method,
+        ),
+    )
+
+
+def _fits_TOA_chunks(
+    eventname, obs, scale, columns, weights, minmjd, maxmjd, chunksize, toa_kwargs
+):
+    with pyfits.open(eventname, memmap=True) as hdulist:
+        hdu = hdulist[1]
+        nrows = len(hdu.data)
+        for start in range(0, nrows, chunksize):
+            rows = slice(start, min(start + chunksize, nrows))
+            mjds = read_fits_event_mjds_tuples(hdu, rows=rows)
+            mjds_float = mjds[:, 0] + mjds[:, 1]
+            idx = (minmjd < mjds_float) & (mjds_float < maxmjd)
+            if not idx.any():
+                continue
+            flags = _get_columns_from_fits(hdu, columns, rows=rows)
+            if weights is not None:
+                flags["weights"] = weights[rows]
+            flags = {key: np.asarray(value)[idx] for key, value in flags.items()}
+            ts = toa.get_TOAs_array(
+                day_frac(mjds[idx, 0], mjds[idx, 1]),
+                obs,
+                scale=scale,
+                flags=flags,
+                **toa_kwargs,
+            )
+            ts.filename = eventname
+            rows = np.arange(rows.start, rows.stop)[idx]
+            yield rows[ts.table["index"]], ts
+
+
+def iter_event_TOAs(
+    eventname, mission, weights=None, minmjd=-np.inf, maxmjd=np.inf, **kwargs
+):
+    """
+    Read photon event times out of a FITS file as a sequence of TOAs objects.
+
+    This is :func:`pint.event_toas.iter_fits_TOAs` with the event extension
+    of the mission; other keyword arguments are passed to it.
+    """
+    extension = mission_config[mission]["fits_extension"]
+    return iter_fits_TOAs(
+        eventname,
+        mission,
+        weights=weights,
+        extension=extension,
+        minmjd=minmjd,
+        maxmjd=maxmjd,
+        **kwargs,
+    )
+
+
 def load_RXTE_TOAs(eventname, minmjd=-np.inf, maxmjd=np.inf):
     return load_event_TOAs(eventname, "rxte", minmjd=minmjd, maxmjd=maxmjd)
 
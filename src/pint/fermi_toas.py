@@ -7,9 +7,10 @@ import numpy as np
 
 import pint.toa as toa
 from pint.fits_utils import read_fits_event_mjds_tuples
-from pint.observatory import get_observatory
+from pint.observatory import bipm_default, get_observatory
+from pint.pulsar_mjd import day_frac
 
-__all__ = ["load_Fermi_TOAs"]
+__all__ = ["load_Fermi_TOAs", "iter_Fermi_TOAs"]
 
 
 def calc_lat_weights(energies, angseps, logeref=4.1, logesig=0.5):
@@ -64,6 +65,44 @@ def calc_lat_weights(energies, angseps, logeref=4.1, logesig=0.5):
     return fgeom * np.exp(-np.power((logE - logeref) / np.sqrt(2.0) / logesig, 2.0))
 
 
+def _get_weights(ft1dat, weightcolumn, targetcoord, logeref, logesig):
+    """Photon weights from an FT1 table, read or computed as load_Fermi_TOAs does."""
+    if weightcolumn == "CALC":
+        photoncoords = SkyCoord(
+            ft1dat.field("RA") * u.degree,
+            ft1dat.field("DEC") * u.degree,
+            frame="icrs",
+        )
+        return calc_lat_weights(
+            ft1dat.field("ENERGY"),
+            photoncoords.separation(targetcoord),
+            logeref=logeref,
+            logesig=logesig,
+        )
+    return ft1dat.field(weightcolumn)
+
+
+def _get_obs_and_scale(timesys, timeref, fermiobs):
+    """Observatory, scale and description of the TOAs in an FT1 file."""
+    if timesys == "TDB":
+        log.info("Building barycentered TOAs")
+        return "Barycenter", "tdb", "barycentric"
+    elif (timesys == "TT") and (timeref == "LOCAL"):
+        try:
+            get_observatory(fermiobs)
+        except KeyError:
+            log.error(
+                "%s observatory not defined. Make sure you have specified an FT2 file!"
+                % fermiobs
+            )
+            raise
+        return fermiobs, "tt", "spacecraft local"
+    elif (timesys == "TT") and (timeref == "GEOCENTRIC"):
+        return "Geocenter", "tt", "geocentric"
+    else:
+        raise ValueError("Unrecognized TIMEREF/TIMESYS.")
+
+
 def load_Fermi_TOAs(
     ft1name,
     weightcolumn=None,
@@ -135,20 +174,7 @@ def load_Fermi_TOAs(
 
     energies = ft1dat.field("ENERGY") * u.MeV
     if weightcolumn is not None:
-        if weightcolumn == "CALC":
-            photoncoords = SkyCoord(
-                ft1dat.field("RA") * u.degree,
-                ft1dat.field("DEC") * u.degree,
-                frame="icrs",
-            )
-            weights = calc_lat_weights(
-                ft1dat.field("ENERGY"),
-                photoncoords.separation(targetcoord),
-                logeref=logeref,
-                logesig=logesig,
-            )
-        else:
-            weights = ft1dat.field(weightcolumn)
+        weights = _get_weights(ft1dat, weightcolumn, targetcoord, logeref, logesig)
         if minweight > 0.0:
             idx = np.where(weights > minweight)[0]
             mjds = mjds[idx]
@@ -163,30 +189,7 @@ def load_Fermi_TOAs(
     if weightcolumn is not None:
         weights = weights[idx]
 
-    if timesys == "TDB":
-        log.info("Building barycentered TOAs")
-        obs = "Barycenter"
-        scale = "tdb"
-        msg = "barycentric"
-    elif (timesys == "TT") and (timeref == "LOCAL"):
-        assert timesys == "TT"
-        try:
-            get_observatory(fermiobs)
-        except KeyError:
-            log.error(
-                "%s observatory not defined. Make sure you have specified an FT2 file!"
-                % fermiobs
-            )
-            raise
-        obs = fermiobs
-        scale = "tt"
-        msg = "spacecraft local"
-    elif (timesys == "TT") and (timeref == "GEOCENTRIC"):
-        obs = "Geocenter"
-        scale = "tt"
-        msg = "geocentric"
-    else:
-        raise ValueError("Unrecognized TIMEREF/TIMESYS.")
+    obs, scale, msg = _get_obs_and_scale(timesys, timeref, fermiobs)
 
     log.info(
         "Building {0} TOAs, with MJDs in range {1} to {2}".format(
@@ -205,3 +208,125 @@ def load_Fermi_TOAs(
         ]
 
     return toalist
+
+
+def iter_Fermi_TOAs(
+    ft1name,
+    weightcolumn=None,
+    targetcoord=None,
+    logeref=4.1,
+    logesig=0.5,
+    minweight=0.0,
+    minmjd=-np.inf,
+    maxmjd=np.inf,
+    fermiobs="Fermi",
+    chunksize=100000,
+    ephem=None,
+    include_bipm=True,
+    bipm_version=bipm_default,
+    include_gps=True,
+    planets=False,
+    tdb_method="default",
+):
+    """
+    Read photon event times out of a Fermi FT1 file as a sequence of TOAs objects.
+
+    This selects the same events as :func:`pint.fermi_toas.load_Fermi_TOAs`
+    but reads the FT1 file ``chunksize`` rows at a time and builds a
+    :class:`pint.toa.TOAs` object for each chunk directly from the columns,
+    with clock corrections, TDBs and positions already computed (see
+    :func:`pint.toa.get_TOAs_array`), so whole-mission files can be
+    processed without holding all the events in memory. The TOAs have an
+    ``energy`` flag in MeV and, if weights are used, a ``weight`` flag.
+
+    Parameters
+    ----------
+    ft1name, weightcolumn, targetcoord, logeref, logesig, minweight, minmjd, maxmjd, fermiobs
+        As for :func:`pint.fermi_toas.load_Fermi_TOAs`.
+    chunksize : int
+        Number of rows of the FT1 file to read at a time.
+    ephem, include_bipm, bipm_version, include_gps, planets, tdb_method
+        As for :func:`pint.toa.get_TOAs_array`.
+
+    Yields
+    ------
+    rows : numpy.ndarray
+        The rows of the FT1 file the TOAs come from, in the order of the
+        TOAs in the table.
+    toas : pint.toa.TOAs
+        The TOAs of the selected events in this chunk. Chunks with no
+        selected events are skipped.
+    """
+    ft1hdr = fits.getheader(ft1name, ext=1)
+    timesys = ft1hdr["TIMESYS"]
+    log.info("TIMESYS {0}".format(timesys))
+    timeref = ft1hdr["TIMEREF"]
+    log.info("TIMEREF {0}".format(timeref))
+    obs, scale, msg = _get_obs_and_scale(timesys, timeref, fermiobs)
+    log.info("Building {0} TOAs".format(msg))
+    return _Fermi_TOA_chunks(
+        ft1name,
+        obs,
+        scale,
+        weightcolumn,
+        dict(
+            targetcoord=targetcoord,
+            logeref=logeref,
+            logesig=logesig,
+        ),
+        minweight,
+        minmjd,
+        maxmjd,
+        chunksize,
+        dict(
+            ephem=ephem,
+            include_bipm=include_bipm,
+            bipm_version=bipm_version,
+            include_gps=include_gps,
+            planets=planets,
+            tdb_method=tdb_method,
+        ),
+    )
+
+
+def _Fermi_TOA_chunks(
+    ft1name,
+    obs,
+    scale,
+    weightcolumn,
+    weight_kwargs,
+    minweight,
+    minmjd,
+    maxmjd,
+    chunksize,
+    toa_kwargs,
+):
+    with fits.open(ft1name, memmap=True) as hdulist:
+        hdu = hdulist[1]
+        nrows = len(hdu.data)
+        for start in range(0, nrows, chunksize):
+            rows = slice(start, min(start + chunksize, nrows))
+            ft1dat = hdu.data[rows]
+            mjds = read_fits_event_mjds_tuples(hdu, rows=rows)
+            mjds_float = mjds[:, 0] + mjds[:, 1]
+            idx = (minmjd < mjds_float) & (mjds_float < maxmjd)
+            flags = {"energy": np.asarray(ft1dat.field("ENERGY"), dtype=float)}
+            if weightcolumn is not None:
+                flags["weight"] = np.asarray(
+                    _get_weights(ft1dat, weightcolumn, **weight_kwargs), dtype=float
+                )
+                if minweight > 0.0:
+                    idx &= flags["weight"] > minweight
+            if not idx.any():
+                continue
+            ts = toa.get_TOAs_array(
+                day_frac(mjds[idx, 0], mjds[idx, 1]),
+                obs,
+                errors=1.0,
+                scale=scale,
+                flags={key: value[idx] for key, value in flags.items()},
+                **toa_kwargs,
+            )
+            ts.filename = ft1name
+            rows = np.arange(rows.start, rows.stop)[idx]
+            yield rows[ts.table["index"]], ts
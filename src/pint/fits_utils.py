@@ -12,12 +12,18 @@ from pint.pulsar_mjd import fortran_float
 __all__ = ["read_fits_event_mjds", "read_fits_event_mjds_tuples"]
 
 
-def read_fits_event_mjds_tuples(event_hdu, timecolumn="TIME"):
+def read_fits_event_mjds_tuples(event_hdu, timecolumn="TIME", rows=None):
     """Read a set of MJDs from a FITS HDU, with proper converstion of times to MJD
 
     The FITS time format is defined here:
     https://heasarc.gsfc.nasa.gov/docs/journal/timing3.html
 
+    Parameters
+    ----------
+    rows : slice, optional
+        Read only these rows of the table; with a memory-mapped file only
+        they are read from disk.
+
     Returns
     -------
     mjds: MJDs returned are tuples of two doubles (jd1, jd2), as use by
@@ -27,6 +33,8 @@ def read_fits_event_mjds_tuples(event_hdu, timecolumn="TIME"):
 
     event_hdr = event_hdu.header
     event_dat = event_hdu.data
+    if rows is not None:
+        event_dat = event_dat[rows]
 
     # Collect TIMEZERO
     # IMPORTANT: TIMEZERO is in SECONDS (not days)!
@@ -62,9 +70,8 @@ def read_fits_event_mjds_tuples(event_hdu, timecolumn="TIME"):
     # Should check timecolumn units to be sure they are seconds!
 
     # MJD = (TIMECOLUMN + TIMEZERO)/SECS_PER_DAY + MJDREF
-    mjds = np.array(
-        [(MJDREF, tt) for tt in (event_dat.field(timecolumn) + TIMEZERO) / SECS_PER_DAY]
-    )
+    frac = (event_dat.field(timecolumn) + TIMEZERO) / SECS_PER_DAY
+    mjds = np.column_stack((np.full(len(frac), MJDREF), frac))
 
     return mjds
 
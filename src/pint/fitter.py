@@ -61,6 +61,7 @@ import astropy.units as u
 import numpy as np
 import scipy.linalg as sl
 import scipy.optimize as opt
+import scipy.sparse
 from astropy import log
 
 import pint.residuals as pr
@@ -493,9 +494,15 @@ class Fitter:
             toas=self.toas, model=self.model, track_mode=self.track_mode
         )
 
-    def get_designmatrix(self):
-        """Return the model's design matrix for these TOAs."""
-        return self.model.designmatrix(toas=self.toas, incfrozen=False, incoffset=True)
+    def get_designmatrix(self, sparse=False):
+        """Return the model's design matrix for these TOAs.
+
+        If sparse is True, the mostly-zero columns are stored as a sparse
+        matrix (see :meth:`pint.models.timing_model.TimingModel.designmatrix`).
+        """
+        return self.model.designmatrix(
+            toas=self.toas, incfrozen=False, incoffset=True, sparse=sparse
+        )
 
     def get_covariance_matrix(self, with_phase=False, pretty_print=False, prec=3):
         """Show the parameter covariance matrix post-fit.
@@ -898,7 +905,7 @@ class WLSFitter(Fitter):
         )
         self.method = "weighted_least_square"
 
-    def fit_toas(self, maxiter=1, threshold=None):
+    def fit_toas(self, maxiter=1, threshold=None, sparse=False):
         """Run a linear weighted least-squared fitting method.
 
         Parameters
@@ -909,6 +916,12 @@ class WLSFitter(Fitter):
             Discard singular values smaller than ``threshold`` times the largest
             singular value. If None, use a value based on floating-point epsilon
             and the matrix sizes.
+        sparse : bool
+            Store the mostly-zero columns of the design matrix (those of DMX
+            ranges and JUMPs, for example) as a sparse matrix, so that the
+            whole design matrix is never stored as a dense array. Either way
+            the design matrix is decomposed a block of TOAs at a time, in the
+            same way, so the results are exactly those of the dense fit.
         """
         # check that params of timing model have necessary components
         self.model.validate()
@@ -919,14 +932,17 @@ class WLSFitter(Fitter):
             fitpv = self.model.get_params_dict("free", "num")
             fitperrs = self.model.get_params_dict("free", "uncertainty")
             # Define the linear system
-            M, params, units = self.get_designmatrix()
+            M, params, units = self.get_designmatrix(sparse=sparse)
             # Get residuals and TOA uncertainties in seconds
             self.update_resids()
             residuals = self.resids.time_resids.to(u.s).value
             Nvec = self.toas.get_errors().to(u.s).value
 
             # "Whiten" design matrix and residuals by dividing by uncertainties
-            M = M / Nvec.reshape((-1, 1))
+            if sparse:
+                M = M.divide_rows(Nvec)
+            else:
+                M = M / Nvec.reshape((-1, 1))
             residuals = residuals / Nvec
 
             # For each column in design matrix except for col 0 (const. pulse
@@ -936,17 +952,31 @@ class WLSFitter(Fitter):
             # NOTE, We remove subtract mean value here, since it did not give us a
             # fast converge fitting.
             # M[:,1:] -= M[:,1:].mean(axis=0)
-            fac = np.sqrt((M ** 2).mean(axis=0))
+            fac = np.sqrt(_sum_squares(M) / M.shape[0])
             # fac[0] = 1.0
             fac[fac == 0] = 1.0
-            M /= fac
+            if sparse:
+                M.divide_columns(fac)
+            else:
+                M /= fac
             # Singular value decomp of design matrix:
             #   M = U s V^T
             # Dimensions:
             #   M, U are Ntoa x Nparam
             #   s is Nparam x Nparam diagonal matrix encoded as 1-D vector
             #   V^T is Nparam x Nparam
-            U, s, Vt = sl.svd(M, full_matrices=False)
+            # Decomposing M^T M would lose the small singular values, so
+            # build up the QR decomposition of [M r] a block of rows at a
+            # time; with M = Q R and R = U_R s V^T, U = Q U_R and
+            # U^T r = U_R^T Q^T r, the last column of the R factor.
+            nparams = M.shape[1]
+            R = np.zeros((0, nparams + 1))
+            for rows, block in _row_blocks(M):
+                block = np.hstack((block, residuals[rows, None]))
+                R = sl.qr(np.vstack((R, block)), mode="r")[0][: nparams + 1]
+            R = R[:nparams]
+            UR, s, Vt = sl.svd(R[:, :nparams], full_matrices=False)
+            Utr = np.dot(UR.T, R[:, nparams])
             # Note, here we could do various checks like report
             # matrix condition number or zero out low singular values.
             # print 'log_10 cond=', np.log10(s.max()/s.min())
@@ -994,7 +1024,7 @@ class WLSFitter(Fitter):
             # The delta-parameter values
             #   dpars = V s^-1 U^T r
             # Scaling by fac recovers original units
-            dpars = np.dot(Vt.T, np.dot(U.T, residuals) / s) / fac
+            dpars = np.dot(Vt.T, Utr / s) / fac
             for ii, pn in enumerate(fitp.keys()):
                 uind = params.index(pn)  # Index of designmatrix
                 un = 1.0 / (units[uind])  # Unit in designmatrix
@@ -1012,6 +1042,47 @@ class WLSFitter(Fitter):
         return chi2
 
 
+# The number of TOAs in each block of rows of a design matrix that fitters
+# decompose or form products of a block at a time
+_ROWS_PER_BLOCK = 4096
+
+
+def _row_blocks(M):
+    """Split a design matrix into blocks of rows.
+
+    M is a dense array or a :class:`pint.pint_matrix.ColumnBlockMatrix`;
+    either way this yields the slice of rows and the rows as a dense array,
+    so that the dense and sparse fits do the same sums, in the same order.
+    """
+    step = max(_ROWS_PER_BLOCK, 4 * M.shape[1])
+    for start in range(0, M.shape[0], step):
+        rows = slice(start, start + step)
+        if isinstance(M, np.ndarray):
+            yield rows, M[rows]
+        else:
+            yield rows, M.rows(start, start + step)
+
+
+def _sum_squares(M):
+    """The sum of the squares of each column of M, a block of rows at a time."""
+    result = np.zeros(M.shape[1])
+    for rows, block in _row_blocks(M):
+        result += np.sum(block ** 2, axis=0)
+    return result
+
+
+def _epoch_sum_matrix(epochs, nepochs):
+    """A sparse matrix that sums values over the TOAs in each epoch.
+
+    This is the transpose of the quantization matrix for these epochs.
+    """
+    in_epoch = np.nonzero(epochs >= 0)[0]
+    return scipy.sparse.csr_matrix(
+        (np.ones(len(in_epoch)), (epochs[in_epoch], in_epoch)),
+        shape=(nepochs, len(epochs)),
+    )
+
+
 class GLSFitter(Fitter):
     """Generalized least-squares fitting.
 
@@ -1026,7 +1097,7 @@ class GLSFitter(Fitter):
         )
         self.method = "generalized_least_square"
 
-    def fit_toas(self, maxiter=1, threshold=0, full_cov=False):
+    def fit_toas(self, maxiter=1, threshold=0, full_cov=False, sparse=False):
         """Run a generalized least-squares fitting method.
 
         A first attempt is made to solve the fitting problem by Cholesky
@@ -1062,18 +1133,27 @@ class GLSFitter(Fitter):
             of the covariance matrix, based on information provided by the noise
             model. The two algorithms should give the same result to numerical
             accuracy where they both can be applied.
+        sparse : bool
+            Store the mostly-zero columns of the design matrix (those of DMX
+            ranges and JUMPs, for example) as a sparse matrix, so that the
+            whole design matrix is never stored as a dense array. This saves
+            memory when there are many such columns. Either way the normal
+            equations are formed a block of TOAs at a time, in the same way,
+            so the results are exactly those of the dense fit. It does not
+            apply if full_cov is True.
         """
         # check that params of timing model have necessary components
         self.model.validate()
         self.model.validate_toas(self.toas)
         chi2 = 0
+        sparse = sparse and not full_cov
         for i in range(maxiter):
             fitp = self.model.get_params_dict("free", "quantity")
             fitpv = self.model.get_params_dict("free", "num")
             fitperrs = self.model.get_params_dict("free", "uncertainty")
 
             # Define the linear system
-            M, params, units = self.get_designmatrix()
+            M, params, units = self.get_designmatrix(sparse=sparse)
 
             # Get residuals and TOA uncertainties in seconds
             if i == 0:
@@ -1082,15 +1162,14 @@ class GLSFitter(Fitter):
 
             # get any noise design matrices and weight vectors
             if not full_cov:
-                Mn = self.model.noise_model_designmatrix(self.toas)
-                phi = self.model.noise_model_basis_weight(self.toas)
+                Mn, phi, noise_dims, ecorr = self._noise_bases()
                 phiinv = np.zeros(M.shape[1])
                 if Mn is not None and phi is not None:
                     phiinv = np.concatenate((phiinv, 1 / phi))
-                    M = np.hstack((M, Mn))
+                    M = M.append_dense(Mn) if sparse else np.hstack((M, Mn))
 
             # normalize the design matrix
-            norm = np.sqrt(np.sum(M ** 2, axis=0))
+            norm = np.sqrt(_sum_squares(M))
             ntmpar = len(fitp)
             if M.shape[1] > ntmpar:
                 norm[ntmpar:] = 1
@@ -1101,7 +1180,10 @@ class GLSFitter(Fitter):
                     DegeneracyWarning,
                 )
             norm[norm == 0] = 1
-            M /= norm
+            if sparse:
+                M.divide_columns(norm)
+            else:
+                M /= norm
 
             # compute covariance matrices
             if full_cov:
@@ -1114,9 +1196,28 @@ class GLSFitter(Fitter):
             else:
                 Nvec = self.model.scaled_toa_uncertainty(self.toas).to(u.s).value ** 2
                 cinv = 1 / Nvec
-                mtcm = np.dot(M.T, cinv[:, None] * M)
+                if ecorr is not None:
+                    # Each ECORR epoch adds a constant block J to the
+                    # covariance matrix, whose inverse for that epoch is
+                    # N^-1 - beta N^-1 1 1^T N^-1 with beta = J/(1 + J sum(N^-1))
+                    # (Sherman-Morrison), so only sums over epochs are needed.
+                    epochs, jvec = ecorr
+                    epoch_sum = _epoch_sum_matrix(epochs, len(jvec))
+                    beta = jvec / (1 + jvec * (epoch_sum @ cinv))
+                    sy = beta * (epoch_sum @ (cinv * residuals))
+                    sm = np.zeros((len(jvec), M.shape[1]))
+                mtcm = np.zeros((M.shape[1], M.shape[1]))
+                mtcy = np.zeros(M.shape[1])
+                for rows, block in _row_blocks(M):
+                    cm = cinv[rows, None] * block
+                    mtcm += np.dot(block.T, cm)
+                    mtcy += np.dot(block.T, cinv[rows] * residuals[rows])
+                    if ecorr is not None:
+                        sm += epoch_sum[:, rows] @ cm
                 mtcm += np.diag(phiinv)
-                mtcy = np.dot(M.T, cinv * residuals)
+                if ecorr is not None:
+                    mtcm -= np.dot(sm.T, beta[:, None] * sm)
+                    mtcy -= np.dot(sm.T, sy)
 
             xhat, xvar = None, None
             if threshold <= 0:
@@ -1149,12 +1250,17 @@ class GLSFitter(Fitter):
 
                 xvar = np.dot(Vt.T / s, Vt)
                 xhat = np.dot(Vt.T, np.dot(U.T, mtcy) / s)
-            newres = residuals - np.dot(M, xhat)
+            newres = residuals - np.concatenate(
+                [np.dot(block, xhat) for rows, block in _row_blocks(M)]
+            )
             # compute linearized chisq
             if full_cov:
                 chi2 = np.dot(newres, sl.cho_solve(cf, newres))
             else:
                 chi2 = np.dot(newres, cinv * newres) + np.dot(xhat, phiinv * xhat)
+                if ecorr is not None:
+                    sr = epoch_sum @ (cinv * newres)
+                    chi2 -= np.dot(sr, beta * sr)
 
             # compute absolute estimates, normalized errors, covariance matrix
             dpars = xhat / norm
@@ -1180,18 +1286,66 @@ class GLSFitter(Fitter):
 
             # Compute the noise realizations if possible
             if not full_cov:
-                noise_dims = self.model.noise_model_dimensions(self.toas)
                 noise_resids = {}
                 for comp in noise_dims.keys():
                     p0 = noise_dims[comp][0] + ntmpar
                     p1 = p0 + noise_dims[comp][1]
-                    noise_resids[comp] = np.dot(M[:, p0:p1], xhat[p0:p1]) * u.s
+                    Mc = M.columns(p0, p1) if sparse else M[:, p0:p1]
+                    noise_resids[comp] = np.dot(Mc, xhat[p0:p1]) * u.s
+                if ecorr is not None:
+                    # The ECORR offset of each epoch, with 0 for TOAs in no epoch
+                    offsets = np.append(beta * sr, 0)
+                    noise_resids["ecorr_noise"] = offsets[epochs] * u.s
                 self.resids.noise_resids = noise_resids
 
         self.update_model(chi2)
 
         return chi2
 
+    def _noise_bases(self):
+        """Collect the bases of the correlated noise components.
+
+        ECORR is handled through the epoch of each TOA rather than as a
+        (number of TOAs) x (number of epochs) basis, unless its epochs
+        overlap.
+
+        Returns
+        -------
+        Mn, phi : numpy.ndarray or None
+            The basis and weights of the other components, if any.
+        noise_dims : dict
+            The (offset, size) of each of these components in Mn.
+        ecorr : tuple or None
+            The ECORR epochs and weights (see
+            :meth:`pint.models.noise_model.EcorrNoise.ecorr_epochs`).
+        """
+        ecorr = None
+        ecorr_component = self.model.components.get("EcorrNoise")
+        if ecorr_component is not None:
+            try:
+                ecorr = ecorr_component.ecorr_epochs(self.toas)
+            except ValueError:
+                log.info("ECORR epochs overlap; using the ECORR basis instead.")
+        bases, weights, noise_dims = [], [], {}
+        ntot = 0
+        if "NoiseComponent" in self.model.component_types:
+            for nc in self.model.NoiseComponent_list:
+                if len(nc.basis_funcs) == 0:
+                    continue
+                if ecorr is not None and nc is ecorr_component:
+                    continue
+                nbf = 0
+                for bf in nc.basis_funcs:
+                    basis, weight = bf(self.toas)
+                    bases.append(basis)
+                    weights.append(weight)
+                    nbf += len(weight)
+                noise_dims[nc.category] = (ntot, nbf)
+                ntot += nbf
+        if len(bases) == 0:
+            return None, None, noise_dims, ecorr
+        return np.hstack(bases), np.hstack(weights), noise_dims, ecorr
+
 
 class WidebandTOAFitter(Fitter):  # Is GLSFitter the best here?
     """A class to for fitting TOAs and other independent measured data.
@@ -24,9 +24,81 @@ astropy_version = sys.modules["astropy"].__version__
 mas_yr = u.mas / u.yr
 
 
+def _moving_unit_vectors(lon, lat, pm_lon_coslat, pm_lat, posepoch, epoch=None):
+    """Unit vectors towards a position with a constant proper motion.
+
+    The position moves along a straight line in space, as
+    ``SkyCoord.apply_space_motion`` moves a distant object with no radial
+    velocity, but without building any astropy coordinate objects.
+
+    Parameters
+    ----------
+    lon, lat : Quantity
+        The longitude and latitude at posepoch.
+    pm_lon_coslat, pm_lat : Quantity
+        The proper motion.
+    posepoch : `astropy.time.Time`
+        The epoch of the position.
+    epoch : `astropy.time.Time` or array-like, optional
+        The epochs at which to compute the direction. If not Times, these
+        are MJD(TDB).
+
+    Returns
+    -------
+    numpy.ndarray
+        Unit vectors, of shape (3,) if epoch is None and epoch.shape + (3,)
+        otherwise.
+    """
+    lon = lon.to_value(u.rad)
+    lat = lat.to_value(u.rad)
+    cos_lon, sin_lon = np.cos(lon), np.sin(lon)
+    cos_lat, sin_lat = np.cos(lat), np.sin(lat)
+    L = np.array([cos_lat * cos_lon, cos_lat * sin_lon, sin_lat])
+    if epoch is None:
+        return L
+    if isinstance(epoch, Time):
+        epoch = epoch.tdb.mjd
+    epoch = np.asarray(epoch, dtype=np.float64)
+    if pm_lon_coslat.value == 0.0 and pm_lat.value == 0.0:
+        return np.broadcast_to(L, epoch.shape + (3,)).copy()
+    # Directions of increasing longitude and latitude
+    e_lon = np.array([-sin_lon, cos_lon, 0.0])
+    e_lat = np.array([-sin_lat * cos_lon, -sin_lat * sin_lon, cos_lat])
+    motion = (
+        pm_lon_coslat.to_value(u.rad / u.day) * e_lon
+        + pm_lat.to_value(u.rad / u.day) * e_lat
+    )
+    dt = epoch - posepoch.tdb.mjd
+    p = L + dt[..., None] * motion
+    return p / np.sqrt(np.sum(p ** 2, axis=-1))[..., None]
+
+
+def _sky_basis(lon, lat):
+    """Unit vectors towards increasing longitude and latitude."""
+    lon = lon.to_value(u.rad)
+    lat = lat.to_value(u.rad)
+    cos_lon, sin_lon = np.cos(lon), np.sin(lon)
+    cos_lat, sin_lat = np.cos(lat), np.sin(lat)
+    return np.array(
+        [[-sin_lon, cos_lon, 0.0], [-sin_lat * cos_lon, -sin_lat * sin_lon, cos_lat]]
+    )
+
+
+def _rotate_ecliptic(xyz, obliquity, to_ecliptic):
+    """Rotate vectors between ICRS and PulsarEcliptic coordinates."""
+    obl = obliquity.to_value(u.rad)
+    c, s = np.cos(obl), np.sin(obl)
+    if to_ecliptic:
+        s = -s
+    x, y, z = xyz[..., 0], xyz[..., 1], xyz[..., 2]
+    return np.stack([x, c * y - s * z, s * y + c * z], axis=-1)
+
+
 class Astrometry(DelayComponent):
     register = False
     category = "astrometry"
+    # Names of the longitude, latitude and their proper motions
+    _sky_params = ()
 
     def __init__(self):
         super(Astrometry, self).__init__()
@@ -53,6 +125,19 @@ class Astrometry(DelayComponent):
         # TODO: would it be better for this to return a 6-vector (pos, vel)?
         return self.coords_as_ICRS(epoch=epoch).cartesian.xyz.transpose()
 
+    def psr_dir_ICRS(self, toas):
+        """Returns unit vectors from SSB to pulsar system barycenter at the TOAs.
+
+        This is :meth:`ssb_to_psb_xyz_ICRS` at the TDB times of the TOAs; it is
+        computed only once within
+        :meth:`pint.models.timing_model.TimingModel.evaluation_cache`.
+        """
+        return self._cached(
+            toas,
+            "psr_dir_ICRS",
+            lambda: self.ssb_to_psb_xyz_ICRS(epoch=toas.table["tdbld"]),
+        )
+
     def ssb_to_psb_xyz_ECL(self, epoch=None):
         """Returns unit vector(s) from SSB to pulsar system barycenter under Ecliptic coordinates.
 
@@ -91,7 +176,7 @@ class Astrometry(DelayComponent):
             osv = tbl["obs_sun_pos"].quantity.copy()
         else:
             osv = -tbl["ssb_obs_pos"].quantity.copy()
-        psr_vec = self.ssb_to_psb_xyz_ICRS(epoch=tbl["tdbld"])
+        psr_vec = self.psr_dir_ICRS(toas)
         r = (osv ** 2).sum(axis=1) ** 0.5
         osv /= r[:, None]
         cos = (osv * psr_vec).sum(axis=1)
@@ -101,7 +186,18 @@ class Astrometry(DelayComponent):
             return np.arccos(cos)
 
     def barycentric_radio_freq(self, toas):
-        raise NotImplementedError
+        """Return radio frequencies (MHz) of the toas corrected for Earth motion"""
+        return self._cached(
+            toas,
+            "barycentric_radio_freq",
+            lambda: self._barycentric_radio_freq(toas),
+        )
+
+    def _barycentric_radio_freq(self, toas):
+        tbl = toas.table
+        L_hat = self.psr_dir_ICRS(toas)
+        v_dot_L_array = np.sum(tbl["ssb_obs_vel"] * L_hat, axis=1)
+        return tbl["freq"] * (1.0 - v_dot_L_array / const.c)
 
     def solar_system_geometric_delay(self, toas, acc_delay=None):
         """Returns geometric delay (in sec) due to position of site in
@@ -111,7 +207,7 @@ class Astrometry(DelayComponent):
         available as 3-vector toa.xyz, in units of light-seconds.
         """
         tbl = toas.table
-        L_hat = self.ssb_to_psb_xyz_ICRS(epoch=tbl["tdbld"].astype(np.float64))
+        L_hat = self.psr_dir_ICRS(toas)
         re_dot_L = np.sum(tbl["ssb_obs_pos"] * L_hat, axis=1)
         delay = -re_dot_L.to(ls).value
         if self.PX.value != 0.0 and np.count_nonzero(tbl["ssb_obs_pos"]) > 0:
@@ -125,12 +221,14 @@ class Astrometry(DelayComponent):
 
     def get_d_delay_quantities(self, toas):
         """Calculate values needed for many d_delay_d_param functions """
+        return self._cached(
+            toas, "d_delay_quantities", lambda: self._d_delay_quantities(toas)
+        )
+
+    def _d_delay_quantities(self, toas):
         # TODO: Move all these calculations in a separate class for elegance
         rd = dict()
 
-        # TODO: Should delay not have units of u.second?
-        delay = self._parent.delay(toas)
-
         # TODO: tbl['tdbld'].quantity should have units of u.day
         # NOTE: Do we need to include the delay here?
         tbl = toas.table
@@ -138,7 +236,7 @@ class Astrometry(DelayComponent):
 
         # Distance from SSB to observatory, and from SSB to psr
         ssb_obs = tbl["ssb_obs_pos"].quantity
-        ssb_psr = self.ssb_to_psb_xyz_ICRS(epoch=np.array(rd["epoch"]))
+        ssb_psr = self.psr_dir_ICRS(toas)
 
         # Cartesian coordinates, and derived quantities
         rd["ssb_obs_r"] = np.sqrt(np.sum(ssb_obs ** 2, axis=1))
@@ -190,6 +288,38 @@ class Astrometry(DelayComponent):
         # We want to return sec / mas
         return dd_dpx.decompose(u.si.bases) / u.mas
 
+    def d_psr_dir_d_param(self, toas, param):
+        """Derivative of :meth:`psr_dir_ICRS` with respect to a parameter.
+
+        The parameter is one of the position and proper motion parameters.
+        As in the d_delay_astrometry functions, the position derivatives are
+        taken at POSEPOCH and proper motion moves the direction linearly in
+        time; this is what other components need to differentiate delays
+        that depend on the direction to the pulsar.
+
+        Returns
+        -------
+        Quantity
+            Array of shape (ntoas, 3), per radian or per (radian / day).
+        """
+        lon, lat, pm_lon, pm_lat = self._sky_params
+        e_lon, e_lat = self._frame_to_ICRS(
+            _sky_basis(getattr(self, lon).quantity, getattr(self, lat).quantity)
+        )
+        if param in (lon, lat):
+            if param == lon:
+                d = np.cos(getattr(self, lat).quantity.to_value(u.rad)) * e_lon
+            else:
+                d = e_lat
+            return np.broadcast_to(d, (toas.ntoas, 3)) / u.rad
+        if param in (pm_lon, pm_lat):
+            dt = np.asarray(
+                toas.table["tdbld"] - self.POSEPOCH.quantity.tdb.mjd_long, dtype=float
+            )
+            d = e_lon if param == pm_lon else e_lat
+            return dt[:, None] * d * (u.day / u.rad)
+        raise ValueError("{} does not change the direction to the pulsar".format(param))
+
     def d_delay_astrometry_d_POSEPOCH(self, toas, param="", acc_delay=None):
         """Calculate the derivative wrt POSEPOCH
         """
@@ -208,6 +338,7 @@ class Astrometry(DelayComponent):
 
 class AstrometryEquatorial(Astrometry):
     register = True
+    _sky_params = ("RAJ", "DECJ", "PMRA", "PMDEC")
 
     def __init__(self):
         super(AstrometryEquatorial, self).__init__()
@@ -284,12 +415,37 @@ class AstrometryEquatorial(Astrometry):
                 result += getattr(self, p).as_parfile_line()
         return result
 
-    def barycentric_radio_freq(self, toas):
-        """Return radio frequencies (MHz) of the toas corrected for Earth motion"""
-        tbl = toas.table
-        L_hat = self.ssb_to_psb_xyz_ICRS(epoch=tbl["tdbld"].astype(np.float64))
-        v_dot_L_array = np.sum(tbl["ssb_obs_vel"] * L_hat, axis=1)
-        return tbl["freq"] * (1.0 - v_dot_L_array / const.c)
+    def ssb_to_psb_xyz_ICRS(self, epoch=None):
+        """Returns unit vector(s) from SSB to pulsar system barycenter under ICRS.
+
+        If epochs (MJD) are given, proper motion is included in the calculation.
+        """
+        return (
+            _moving_unit_vectors(
+                self.RAJ.quantity,
+                self.DECJ.quantity,
+                self.PMRA.quantity,
+                self.PMDEC.quantity,
+                self.POSEPOCH.quantity,
+                epoch,
+            )
+            * u.dimensionless_unscaled
+        )
+
+    def _frame_to_ICRS(self, xyz):
+        return xyz
+
+    def ssb_to_psb_xyz_ECL(self, epoch=None):
+        """Returns unit vector(s) from SSB to pulsar system barycenter under Ecliptic coordinates.
+
+        If epochs (MJD) are given, proper motion is included in the calculation.
+        The obliquity IERS2010 is used, as in :meth:`coords_as_ECL`.
+        """
+        xyz = self.ssb_to_psb_xyz_ICRS(epoch).value
+        return (
+            _rotate_ecliptic(xyz, OBL["IERS2010"], to_ecliptic=True)
+            * u.dimensionless_unscaled
+        )
 
     def get_psr_coords(self, epoch=None):
         """Returns pulsar sky coordinates as an astropy ICRS object instance.
@@ -470,6 +626,7 @@ class AstrometryEquatorial(Astrometry):
 
 class AstrometryEcliptic(Astrometry):
     register = True
+    _sky_params = ("ELONG", "ELAT", "PMELONG", "PMELAT")
 
     def __init__(self):
         super(AstrometryEcliptic, self).__init__()
@@ -548,15 +705,43 @@ class AstrometryEcliptic(Astrometry):
                 log.warning("POSEPOCH not found; using PEPOCH unless set explicitly!")
                 self.POSEPOCH.quantity = self._parent.PEPOCH.quantity
 
-    def barycentric_radio_freq(self, toas):
-        """Return radio frequencies (MHz) of the toas corrected for Earth motion"""
-        if "ssb_obs_vel_ecl" not in toas.table.colnames:
+    def ssb_to_psb_xyz_ECL(self, epoch=None):
+        """Returns unit vector(s) from SSB to pulsar system barycenter under Ecliptic coordinates.
+
+        If epochs (MJD) are given, proper motion is included in the calculation.
+        """
+        return (
+            _moving_unit_vectors(
+                self.ELONG.quantity,
+                self.ELAT.quantity,
+                self.PMELONG.quantity,
+                self.PMELAT.quantity,
+                self.POSEPOCH.quantity,
+                epoch,
+            )
+            * u.dimensionless_unscaled
+        )
+
+    def _frame_to_ICRS(self, xyz):
+        return _rotate_ecliptic(xyz, OBL[self.ECL.value], to_ecliptic=False)
+
+    def ssb_to_psb_xyz_ICRS(self, epoch=None):
+        """Returns unit vector(s) from SSB to pulsar system barycenter under ICRS.
+
+        If epochs (MJD) are given, proper motion is included in the calculation.
+        """
+        try:
             obliquity = OBL[self.ECL.value]
-            toas.add_vel_ecl(obliquity)
-        tbl = toas.table
-        L_hat = self.ssb_to_psb_xyz_ECL(epoch=tbl["tdbld"].astype(np.float64))
-        v_dot_L_array = np.sum(tbl["ssb_obs_vel_ecl"] * L_hat, axis=1)
-        return tbl["freq"] * (1.0 - v_dot_L_array / const.c)
+        except KeyError:
+            raise ValueError(
+                "No obliquity " + str(self.ECL.value) + " provided. "
+                "Check your pint/datafile/ecliptic.dat file."
+            )
+        xyz = self.ssb_to_psb_xyz_ECL(epoch).value
+        return (
+            _rotate_ecliptic(xyz, obliquity, to_ecliptic=False)
+            * u.dimensionless_unscaled
+        )
 
     def get_psr_coords(self, epoch=None):
         """Returns pulsar sky coordinates as an astropy ecliptic coordinate instance.
@@ -629,8 +814,14 @@ class AstrometryEcliptic(Astrometry):
 
     def get_d_delay_quantities_ecliptical(self, toas):
         """Calculate values needed for many d_delay_d_param functions """
+        return self._cached(
+            toas,
+            "d_delay_quantities_ecliptical",
+            lambda: self._d_delay_quantities_ecliptical(toas),
+        )
+
+    def _d_delay_quantities_ecliptical(self, toas):
         # TODO: Move all these calculations in a separate class for elegance
-        rd = dict()
         # From the earth_ra dec to earth_elong and elat
         try:
             obliquity = OBL[self.ECL.value]
@@ -640,7 +831,7 @@ class AstrometryEcliptic(Astrometry):
                 "Check your pint/datafile/ecliptic.dat file."
             )
 
-        rd = self.get_d_delay_quantities(toas)
+        rd = dict(self.get_d_delay_quantities(toas))
         coords_icrs = coords.ICRS(ra=rd["earth_ra"], dec=rd["earth_dec"])
         coords_elpt = coords_icrs.transform_to(PulsarEcliptic(obliquity=obliquity))
         rd["earth_elong"] = coords_elpt.lon
@@ -12,7 +12,7 @@ from pint.models.parameter import (
     maskParameter,
 )
 from pint.models.timing_model import DelayComponent, MissingParameter, MissingTOAs
-from pint.toa_select import TOASelect
+from pint.toa_select import get_selection_index
 from pint.utils import split_prefixed_name, taylor_horner, taylor_horner_deriv
 
 # This value is cited from Duncan Lorimer, Michael Kramer, Handbook of Pulsar
@@ -110,7 +110,7 @@ class Dispersion(DelayComponent):
 
         """
         pn = self.match_param_aliases(param)
-
+        self._structure_changed()
         if pn not in list(self.dm_deriv_funcs.keys()):
             self.dm_deriv_funcs[pn] = [func]
         else:
@@ -455,6 +455,7 @@ class DispersionDMX(Dispersion):
             if prefix_par.startswith("DMX_"):
                 self.register_deriv_funcs(self.d_delay_d_dmparam, prefix_par)
                 self.register_dm_deriv_funcs(self.d_dm_d_DMX, prefix_par)
+                self.register_block_deriv_funcs(self.d_delay_d_DMXs, prefix_par)
 
     def validate(self):
         """Validate the DMX parameters."""
@@ -493,56 +494,100 @@ class DispersionDMX(Dispersion):
         if bad_parameters:
             raise MissingTOAs(bad_parameters)
 
-    def dmx_dm(self, toas):
-        condition = {}
-        tbl = toas.table
-        if not hasattr(self, "dmx_toas_selector"):
-            self.dmx_toas_selector = TOASelect(is_range=True)
-        DMX_mapping = self.get_prefix_mapping_component("DMX_")
+    def dmx_ranges(self, params=None):
+        """Return the start and end MJDs of DMX ranges.
+
+        Parameters
+        ----------
+        params : list of str, optional
+            The DMX_ parameters whose ranges are wanted; the default is all
+            of them.
+
+        Returns
+        -------
+        params : list of str
+            The DMX_ parameters.
+        r1, r2 : numpy.ndarray
+            The MJDs of the start and end of each range.
+        """
+        if params is None:
+            params = list(self.get_prefix_mapping_component("DMX_").values())
         DMXR1_mapping = self.get_prefix_mapping_component("DMXR1_")
         DMXR2_mapping = self.get_prefix_mapping_component("DMXR2_")
-        for epoch_ind in DMX_mapping.keys():
-            r1 = getattr(self, DMXR1_mapping[epoch_ind]).quantity
-            r2 = getattr(self, DMXR2_mapping[epoch_ind]).quantity
-            condition[DMX_mapping[epoch_ind]] = (r1.mjd, r2.mjd)
-        select_idx = self.dmx_toas_selector.get_select_index(
-            condition, tbl["mjd_float"]
+        indices = [getattr(self, p).index for p in params]
+        r1 = np.array([getattr(self, DMXR1_mapping[i]).quantity.mjd for i in indices])
+        r2 = np.array([getattr(self, DMXR2_mapping[i]).quantity.mjd for i in indices])
+        return params, r1, r2
+
+    def dmx_bins(self, toas, params=None):
+        """Return which DMX range each TOA is in.
+
+        The TOAs are assigned to ranges by binary search in the sorted MJDs,
+        which is remembered until the TOAs or the ranges change.
+
+        Parameters
+        ----------
+        toas : pint.toa.TOAs
+            The TOAs.
+        params : list of str, optional
+            The DMX_ parameters whose ranges to use; the default is all of
+            them.
+
+        Returns
+        -------
+        params : list of str
+            The DMX_ parameters.
+        bins : numpy.ndarray of int
+            For each TOA, the position in params of the range it is in, or -1.
+            A TOA in more than one range is assigned to the last one.
+        overlap : bool
+            Whether any TOA is in more than one range.
+        """
+        params, r1, r2 = self.dmx_ranges(params)
+        tbl = toas.table
+        bins, overlap = get_selection_index(tbl).interval_bins(
+            tbl, ("column", "mjd_float"), r1, r2
         )
+        return params, bins, overlap
+
+    def dmx_dm(self, toas):
+        params, bins, overlap = self.dmx_bins(toas)
         # Get DMX delays
-        dm = np.zeros(len(tbl)) * self._parent.DM.units
-        for k, v in select_idx.items():
-            dm[v] = getattr(self, k).quantity
-        return dm
+        dmx = np.array([getattr(self, p).value for p in params] + [0.0])
+        return dmx[bins] * self._parent.DM.units
 
     def DMX_dispersion_delay(self, toas, acc_delay=None):
         """This is a wrapper function for interacting with the TimingModel class"""
         return self.dispersion_type_delay(toas)
 
     def d_dm_d_DMX(self, toas, param_name, acc_delay=None):
-        condition = {}
         tbl = toas.table
-        if not hasattr(self, "dmx_toas_selector"):
-            self.dmx_toas_selector = TOASelect(is_range=True)
-        param = getattr(self, param_name)
-        dmx_index = param.index
-        DMXR1_mapping = self.get_prefix_mapping_component("DMXR1_")
-        DMXR2_mapping = self.get_prefix_mapping_component("DMXR2_")
-        r1 = getattr(self, DMXR1_mapping[dmx_index]).quantity
-        r2 = getattr(self, DMXR2_mapping[dmx_index]).quantity
-        condition = {param_name: (r1.mjd, r2.mjd)}
-        select_idx = self.dmx_toas_selector.get_select_index(
-            condition, tbl["mjd_float"]
+        _, (r1,), (r2,) = self.dmx_ranges([param_name])
+        select_idx = get_selection_index(tbl).select_range(
+            tbl, ("column", "mjd_float"), r1, r2
         )
+        dmx = np.zeros(len(tbl))
+        dmx[select_idx] = 1.0
+        return dmx * (u.pc / u.cm ** 3) / (u.pc / u.cm ** 3)
 
+    def d_delay_d_DMXs(self, toas, params):
+        """Derivatives of the delay with respect to several DMX_ parameters.
+
+        Each TOA only depends on the DMX_ parameter of its range, so the
+        derivatives are returned as the nonzero entries ``rows, columns,
+        values``, with ``columns`` the positions in params; this returns None
+        if the ranges overlap.
+        """
+        params, bins, overlap = self.dmx_bins(toas, params)
+        if overlap:
+            return None
         try:
             bfreq = self._parent.barycentric_radio_freq(toas)
         except AttributeError:
             warn("Using topocentric frequency for dedispersion!")
-            bfreq = tbl["freq"]
-        dmx = np.zeros(len(tbl))
-        for k, v in select_idx.items():
-            dmx[v] = 1.0
-        return dmx * (u.pc / u.cm ** 3) / (u.pc / u.cm ** 3)
+            bfreq = toas.table["freq"]
+        rows = np.flatnonzero(bins >= 0)
+        return rows, bins[rows], DMconst / bfreq[rows] ** 2.0
 
     def print_par(self,):
         result = ""
@@ -159,17 +159,24 @@ class ModelBuilder:
     def search_prefix_param(self, paramList, model, prefix_type):
         """Check if the Unrecognized parameter has prefix parameter"""
         prefixs = {}
+        # Map every prefix and prefix alias to the prefixes it stands for
+        prefix_aliases = defaultdict(list)
         prefix_inModel = model.get_params_of_type_top(prefix_type)
         for pn in prefix_inModel:
             par = getattr(model, pn)
+            if par.prefix in prefixs:
+                continue
             prefixs[par.prefix] = []
-            for p in paramList:
-                try:
-                    pre, idxstr, idxV = split_prefixed_name(p)
-                    if pre in [par.prefix] + par.prefix_aliases:
-                        prefixs[par.prefix].append(p)
-                except ValueError:  # FIXME: is this meant to catch KeyErrors?
-                    continue
+            for pre in [par.prefix] + par.prefix_aliases:
+                if par.prefix not in prefix_aliases[pre]:
+                    prefix_aliases[pre].append(par.prefix)
+        for p in paramList:
+            try:
+                pre, idxstr, idxV = split_prefixed_name(p)
+            except ValueError:  # FIXME: is this meant to catch KeyErrors?
+                continue
+            for prefix in prefix_aliases.get(pre, []):
+                prefixs[prefix].append(p)
 
         return prefixs
 
@@ -184,23 +191,24 @@ class ModelBuilder:
             The parfile name
         """
         if parfile is not None:
+            # This reads the par file into self.param_inparF
             self.get_comp_from_parfile(parfile)
             # ensure coordinate systems match for POS and PM
-            if "RAJ" in self.preprocess_parfile(parfile).keys():
-                if "PMELONG" in self.preprocess_parfile(parfile):
+            if "RAJ" in self.param_inparF:
+                if "PMELONG" in self.param_inparF:
                     raise AttributeError(
                         "Cannot have Ecliptic proper motion parameters (PMELONG/PMELAT) with Equatorial position parameters (RAJ/DECJ) in par file."
                     )
-                elif "PMELAT" in self.preprocess_parfile(parfile):
+                elif "PMELAT" in self.param_inparF:
                     raise AttributeError(
                         "Cannot have Ecliptic proper motion parameters (PMELONG/PMELAT) with Equatorial position parameters (RAJ/DECJ) in par file."
                     )
-            elif "ELONG" in self.preprocess_parfile(parfile).keys():
-                if "PMRA" in self.preprocess_parfile(parfile):
+            elif "ELONG" in self.param_inparF:
+                if "PMRA" in self.param_inparF:
                     raise AttributeError(
                         "Cannot have Equatorial proper motion parameters (PMRA/PMDEC) with Ecliptic position parameters (ELONG/ELAT) in par file."
                     )
-                elif "PMDEC" in self.preprocess_parfile(parfile):
+                elif "PMDEC" in self.param_inparF:
                     raise AttributeError(
                         "Cannot have Equatorial proper motion parameters (PMRA/PMDEC) with Ecliptic position parameters (ELONG/ELAT) in par file."
                     )
@@ -210,12 +218,10 @@ class ModelBuilder:
         # Find unrecognised parameters in par file.
 
         if self.param_inparF is not None:
-            parName = []
+            parName = set(param_inModel)
             # add aliases
-            for p in list(param_inModel.keys()):
-                parName += getattr(self.timing_model, p).aliases
-
-            parName += param_inModel.keys()
+            for p in param_inModel:
+                parName.update(getattr(self.timing_model, p).aliases)
 
             for pp in self.param_inparF.keys():
                 if pp not in parName:
@@ -476,8 +482,9 @@ def choose_model(
                     )
                 alias_map[a] = par
 
+    param_mapping = tm.get_params_mapping()
     leftover_params = par_dict.copy()
-    for k in tm.get_params_mapping():
+    for k in param_mapping:
         leftover_params.pop(k, None)
         for a in getattr(tm, k).aliases:
             leftover_params.pop(a, None)
@@ -497,7 +504,7 @@ def choose_model(
                             p, pre, idxV
                         )
                     )
-            component = tm.get_params_mapping()[par.name]
+            component = param_mapping[par.name]
             new_parameter = par.new_param(idxV)
             if hasattr(tm, new_parameter.name):
                 raise ValueError(
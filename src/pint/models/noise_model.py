@@ -395,6 +395,37 @@ class EcorrNoise(NoiseComponent):
             nctot += nn
         return (umat, weight)
 
+    def ecorr_epochs(self, toas):
+        """Return the ECORR epoch of each TOA and the ECORR weights.
+
+        This is the information in :meth:`ecorr_basis_weight_pair` without
+        the (number of TOAs) x (number of epochs) quantization matrix: the
+        epoch of each TOA is the column of the quantization matrix that
+        contains its 1, or -1 if it is in no epoch.
+
+        Raises
+        ------
+        ValueError
+            If the ECORRs select overlapping sets of TOAs, so that some TOA
+            is in more than one epoch.
+        """
+        tbl = toas.table
+        t = (tbl["tdbld"].quantity * u.day).to(u.s).value
+        epochs = np.full(len(t), -1)
+        weights = []
+        nctot = 0
+        for ec in self.get_ecorrs():
+            mask = ec.select_toa_mask(toas)
+            ec_epochs, nn = create_quantization_epochs(t[mask])
+            old = epochs[mask]
+            if np.any((old >= 0) & (ec_epochs >= 0)):
+                raise ValueError("Some TOAs are in more than one ECORR epoch.")
+            epochs[mask] = np.where(ec_epochs >= 0, ec_epochs + nctot, old)
+            weights.append(np.full(nn, ec.quantity.to(u.s).value ** 2))
+            nctot += nn
+        weight = np.concatenate(weights) if weights else np.zeros(0)
+        return epochs, weight
+
     def ecorr_cov_matrix(self, toas):
         """Full ECORR covariance matrix."""
         U, Jvec = self.ecorr_basis_weight_pair(toas)
@@ -505,27 +536,55 @@ class PLRedNoise(NoiseComponent):
         return np.dot(Fmat * phi[None, :], Fmat.T)
 
 
-def create_quantization_matrix(toas_table, dt=1, nmin=2):
-    """Create quantization matrix mapping TOAs to observing epochs."""
-    isort = np.argsort(toas_table)
+def create_quantization_epochs(t, dt=1, nmin=2):
+    """Assign times to observing epochs.
 
-    bucket_ref = [toas_table[isort[0]]]
-    bucket_ind = [[isort[0]]]
-
-    for i in isort[1:]:
-        if toas_table[i] - bucket_ref[-1] < dt:
-            bucket_ind[-1].append(i)
-        else:
-            bucket_ref.append(toas_table[i])
-            bucket_ind.append([i])
+    Each epoch starts at the earliest time not yet in an epoch and contains
+    all the times less than dt after it; epochs with fewer than nmin times
+    are dropped.
 
+    Returns
+    -------
+    epochs : numpy.ndarray
+        The epoch number of each time, -1 for times in no epoch. Epochs are
+        numbered in time order.
+    nepochs : int
+        The number of epochs.
+    """
+    if len(t) == 0:
+        return np.zeros(0, dtype=int), 0
+    isort = np.argsort(t)
+    ts = t[isort]
+    # Find the first time in each bucket; there is one step per bucket,
+    # not per time.
+    starts = [0]
+    while True:
+        start = starts[-1]
+        end = np.searchsorted(ts, ts[start] + dt, side="left")
+        # Make the bucket edge agree exactly with t - ref < dt
+        while end < len(ts) and ts[end] - ts[start] < dt:
+            end += 1
+        while end > start + 1 and ts[end - 1] - ts[start] >= dt:
+            end -= 1
+        if end >= len(ts):
+            break
+        starts.append(end)
+    starts = np.array(starts)
+    counts = np.diff(np.append(starts, len(ts)))
     # find only epochs with more than 1 TOA
-    bucket_ind2 = [ind for ind in bucket_ind if len(ind) >= nmin]
+    keep = counts >= nmin
+    numbers = np.where(keep, np.cumsum(keep) - 1, -1)
+    epochs = np.empty(len(t), dtype=int)
+    epochs[isort] = np.repeat(numbers, counts)
+    return epochs, int(np.sum(keep))
 
-    U = np.zeros((len(toas_table), len(bucket_ind2)), "d")
-    for i, l in enumerate(bucket_ind2):
-        U[l, i] = 1
 
+def create_quantization_matrix(toas_table, dt=1, nmin=2):
+    """Create quantization matrix mapping TOAs to observing epochs."""
+    epochs, nepochs = create_quantization_epochs(toas_table, dt=dt, nmin=nmin)
+    U = np.zeros((len(toas_table), nepochs), "d")
+    in_epoch = epochs >= 0
+    U[np.nonzero(in_epoch)[0], epochs[in_epoch]] = 1
     return U
 
 
@@ -34,10 +34,23 @@ from pint.pulsar_mjd import (
     time_to_longdouble,
     time_to_mjd_string,
 )
-from pint.toa_select import TOASelect
+from pint.toa_select import get_selection_index
 from pint.utils import split_prefixed_name
 from pint.observatory import get_observatory
 
+# Increased whenever the quantity of any parameter is set; see
+# quantity_version().
+_quantity_version = 0
+
+
+def quantity_version():
+    """A number that changes whenever the quantity of any parameter is set.
+
+    Values computed from parameters can store this and compare it later to
+    tell cheaply whether they may be out of date.
+    """
+    return _quantity_version
+
 
 class Parameter:
     """A base PINT class describing a single timing model parameter.
@@ -190,6 +203,19 @@ class Parameter:
             # Change uncertainty unit to new unit
             self.uncertainty = self.uncertainty.to(self._units)
 
+    @property
+    def _quantity(self):
+        try:
+            return self.__dict__["_quantity"]
+        except KeyError:
+            raise AttributeError("_quantity")
+
+    @_quantity.setter
+    def _quantity(self, val):
+        global _quantity_version
+        _quantity_version += 1
+        self.__dict__["_quantity"] = val
+
     # Setup quantity property
     @property
     def quantity(self):
@@ -1579,43 +1605,31 @@ class maskParameter(floatParameter):
             An array of TOA indices selected by the mask.
         """
         column_match = {"mjd": "mjd_float", "freq": "freq", "tel": "obs"}
-        if len(self.key_value) == 1:
-            if not hasattr(self, "toa_selector"):
-                self.toa_selector = TOASelect(is_range=False, use_hash=True)
-            condition = {self.name: self.key_value[0]}
-        elif len(self.key_value) == 2:
-            if not hasattr(self, "toa_selector"):
-                self.toa_selector = TOASelect(is_range=True, use_hash=True)
-            condition = {self.name: tuple(self.key_value)}
-        elif len(self.key_value) == 0:
+        if len(self.key_value) == 0:
             return np.array([], dtype=int)
-        else:
+        elif len(self.key_value) > 2:
             raise ValueError(
                 "Parameter %s has more key values than "
                 "expected.(Expect 1 or 2 key values)" % self.name
             )
-        # get the table columns
         # TODO Right now it is only supports mjd, freq, tel, and flagkeys,
         # We need to consider some more complicated situation
         if self.key.startswith("-"):
             key = self.key[1::]
         else:
             key = self.key
-
-        tbl = toas.table
-        if (
-            self.key.lower() not in column_match
-        ):  # This only works for the one with flags.
-            # The flags are recomputed every time. If don't
-            # recompute, flags can only be added to the toa table once and then never update,
-            # making it impossible to add additional jump parameters after the par file is read in (pintk)
-            flag_col = [x.get(key, None) for x in tbl["flags"]]
-            tbl[key] = flag_col
-            col = tbl[key]
+        if self.key.lower() in column_match:
+            source = ("column", column_match[key.lower()])
         else:
-            col = tbl[column_match[key.lower()]]
-        select_idx = self.toa_selector.get_select_index(condition, col)
-        return select_idx[self.name]
+            # The flags can change after the par file is read in (pintk adds
+            # and removes jumps); the index notices when they do.
+            source = ("flag", key)
+        # All the mask parameters share one index of the TOA table
+        tbl = toas.table
+        index = get_selection_index(tbl)
+        if len(self.key_value) == 1:
+            return index.select(tbl, source, self.key_value[0])
+        return index.select_range(tbl, source, *self.key_value)
 
 
 class pairParameter(floatParameter):
@@ -185,25 +185,41 @@ class PulsarBinary(DelayComponent):
             bparObj.value = bparObj.value * u.Unit(bparObj.units)
 
     def update_binary_object(self, toas=None, acc_delay=None):
-        """Update binary object instance for this set of parameters/toas."""
+        """Update binary object instance for this set of parameters/toas.
+
+        Inputs the binary object already has are not passed to it again:
+        within :meth:`pint.models.timing_model.TimingModel.evaluation_cache`
+        the barycentric times and positions are computed once, and parameters
+        are only passed on when they have been changed.
+        """
         # Don't need to fill P0 and P1. Translate all the others to the format
         # that is used in bmodel.py
         # Get barycnetric toa first
+        bi = self.binary_instance
+        if getattr(self, "_pushed_to", None) is not bi:
+            self._pushed_to = bi
+            self._pushed = {}
         updates = {}
         if toas is not None:
             tbl = toas.table
             if acc_delay is None:
                 # If the accumulated delay is not provided, calculate and
                 # use the barycentered TOAS
-                self.barycentric_time = self._parent.get_barycentric_toas(toas)
+                inputs = self._cached(
+                    toas, "binary_inputs", lambda: self._toa_inputs(toas)
+                )
             else:
-                self.barycentric_time = tbl["tdbld"] * u.day - acc_delay
-            updates["barycentric_toa"] = self.barycentric_time
-            updates["obs_pos"] = tbl["ssb_obs_pos"].quantity
-            updates["psr_pos"] = self._parent.ssb_to_psb_xyz_ICRS(
-                epoch=tbl["tdbld"].astype(np.float64)
-            )
-        for par in self.binary_instance.binary_params:
+                inputs = self._toa_inputs(toas, tbl["tdbld"] * u.day - acc_delay)
+            self.barycentric_time = inputs["barycentric_toa"]
+            for k, attr in [
+                ("barycentric_toa", "t"),
+                ("obs_pos", "obs_pos"),
+                ("psr_pos", "psr_pos"),
+            ]:
+                if getattr(bi, attr, None) is not inputs[k]:
+                    updates[k] = inputs[k]
+        sources = {}
+        for par in bi.binary_params:
             binary_par_names = [par]
             if par in self.binary_instance.param_aliases.keys():
                 aliase = self.binary_instance.param_aliases[par]
@@ -217,6 +233,13 @@ class PulsarBinary(DelayComponent):
                     if par in self.internal_params:
                         pint_bin_name = par
                 binObjpar = getattr(self, pint_bin_name)
+                pushed = self._pushed.get(par)
+                if (
+                    pushed is not None
+                    and pushed[0] is binObjpar.quantity
+                    and pushed[1] is getattr(bi, par)
+                ):
+                    continue
                 instance_par = getattr(self.binary_instance, par)
                 if hasattr(instance_par, "value"):
                     instance_par_val = instance_par.value
@@ -233,7 +256,20 @@ class PulsarBinary(DelayComponent):
                     updates[par] = binObjpar.value * binObjpar.units
                 else:
                     updates[par] = binObjpar.value
-        self.binary_instance.update_input(**updates)
+                sources[par] = binObjpar.quantity
+        bi.update_input(**updates)
+        for par, q in sources.items():
+            self._pushed[par] = (q, getattr(bi, par))
+
+    def _toa_inputs(self, toas, barycentric_toa=None):
+        """The barycentric times and positions the binary object needs."""
+        if barycentric_toa is None:
+            barycentric_toa = self._parent.get_barycentric_toas(toas)
+        return {
+            "barycentric_toa": np.atleast_1d(barycentric_toa),
+            "obs_pos": np.atleast_1d(toas.table["ssb_obs_pos"].quantity),
+            "psr_pos": np.atleast_1d(self._parent.psr_dir_ICRS(toas)),
+        }
 
     def binarymodel_delay(self, toas, acc_delay=None):
         """Return the binary model independent delay call."""
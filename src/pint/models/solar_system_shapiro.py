@@ -2,7 +2,6 @@
 import astropy.constants as const
 import astropy.units as u
 import numpy
-from astropy import log
 
 from pint import (
     Tearth,
@@ -15,8 +14,12 @@ from pint import (
     Turanus,
     Tvenus,
 )
+from pint.models.astrometry import Astrometry
 from pint.models.parameter import boolParameter
 from pint.models.timing_model import DelayComponent
+from pint.toa_select import get_selection_index
+
+planets = ("jupiter", "saturn", "venus", "uranus", "neptune")
 
 
 class SolarSystemShapiro(DelayComponent):
@@ -38,6 +41,14 @@ class SolarSystemShapiro(DelayComponent):
 
     def setup(self):
         super(SolarSystemShapiro, self).setup()
+        # The delay depends on the direction to the pulsar, so it contributes
+        # to the derivatives with respect to the astrometric parameters.
+        if self._parent is not None:
+            for cp in self._parent.DelayComponent_list:
+                if isinstance(cp, Astrometry):
+                    for param in cp._sky_params:
+                        self.deriv_funcs[param] = [self.d_delay_d_astrometry]
+            self._structure_changed()
 
     def validate(self):
         super(SolarSystemShapiro, self).validate()
@@ -88,30 +99,69 @@ class SolarSystemShapiro(DelayComponent):
         Sun is calculated.
 
         Requires Astrometry or similar model that provides the
-        ssb_to_psb_xyz method for direction to pulsar.
+        psr_dir_ICRS method for direction to pulsar.
 
         If planets are to be included, TOAs.compute_posvels() must
         have been called with the planets=True argument.
         """
-        # Start out with 0 delay with units of seconds
+        return self._shapiro_terms(toas)[0] * u.second
+
+    def shapiro_delay_and_gradient(self, toas):
+        """The Shapiro delay and its gradient with respect to the pulsar direction.
+
+        All TOAs and all the bodies (the Sun, and the planets if
+        PLANET_SHAPIRO is set) are done together, from an array of the
+        vectors from the observatory to each body; barycentric TOAs have no
+        delay. Both are computed only once within
+        :meth:`pint.models.timing_model.TimingModel.evaluation_cache`.
+
+        Returns
+        -------
+        delay : numpy.ndarray
+            The delay in seconds.
+        gradient : numpy.ndarray
+            Array of shape (ntoas, 3), the derivative of the delay in
+            seconds with respect to the components of the unit vector from
+            :meth:`pint.models.astrometry.Astrometry.psr_dir_ICRS`.
+        """
+        delay, obj_pos, weights = self._shapiro_terms(toas)
+        gradient = self._cached(
+            toas,
+            "solar_system_shapiro_gradient",
+            lambda: numpy.einsum("ijk,ij->ik", obj_pos, weights),
+        )
+        return delay, gradient
+
+    def _shapiro_terms(self, toas):
+        """The delay, the observatory-to-body vectors and their gradient weights."""
+        return self._cached(
+            toas, "solar_system_shapiro", lambda: self._compute_shapiro_terms(toas)
+        )
+
+    def _compute_shapiro_terms(self, toas):
         tbl = toas.table
-        delay = numpy.zeros(len(tbl))
-        for ii, key in enumerate(tbl.groups.keys):
-            grp = tbl.groups[ii]
-            # obs = tbl.groups.keys[ii]["obs"]
-            loind, hiind = tbl.groups.indices[ii : ii + 2]
-            if key["obs"].lower() == "barycenter":
-                log.debug("Skipping Shapiro delay for Barycentric TOAs")
-                continue
-            psr_dir = self._parent.ssb_to_psb_xyz_ICRS(
-                epoch=grp["tdbld"].astype(numpy.float64)
-            )
-            delay[loind:hiind] += self.ss_obj_shapiro_delay(
-                grp["obs_sun_pos"], psr_dir, self._ss_mass_sec["sun"]
-            )
-            if self.PLANET_SHAPIRO.value:
-                for pl in ("jupiter", "saturn", "venus", "uranus", "neptune"):
-                    delay[loind:hiind] += self.ss_obj_shapiro_delay(
-                        grp["obs_" + pl + "_pos"], psr_dir, self._ss_mass_sec[pl]
-                    )
-        return delay * u.second
+        bodies = ("sun",) + (planets if self.PLANET_SHAPIRO.value else ())
+        # Vectors from the observatory to each body, (ntoas, nbodies, 3)
+        obj_pos = numpy.stack(
+            [tbl["obs_" + b + "_pos"].quantity.to_value(u.km) for b in bodies], axis=1
+        )
+        T_obj = numpy.array([self._ss_mass_sec[b] for b in bodies])
+        psr_dir = numpy.asarray(self._parent.psr_dir_ICRS(toas))
+        r = numpy.sqrt(numpy.einsum("ijk,ijk->ij", obj_pos, obj_pos))
+        r_minus_rcostheta = r - numpy.einsum("ijk,ik->ij", obj_pos, psr_dir)
+        # See ss_obj_shapiro_delay
+        delay = numpy.log(r_minus_rcostheta / const.au.to_value(u.km)) @ (-2.0 * T_obj)
+        # d delay / d psr_dir is the sum over bodies of weights * obj_pos
+        weights = 2.0 * T_obj / r_minus_rcostheta
+        barycentric = get_selection_index(tbl).select(
+            tbl, ("column", "obs"), "barycenter"
+        )
+        delay[barycentric] = 0.0
+        weights[barycentric] = 0.0
+        return delay, obj_pos, weights
+
+    def d_delay_d_astrometry(self, toas, param, acc_delay=None):
+        """Derivative of the Shapiro delay with respect to an astrometric parameter."""
+        gradient = self.shapiro_delay_and_gradient(toas)[1]
+        d_dir = self._parent.d_psr_dir_d_param(toas, param)
+        return numpy.sum(gradient * d_dir.value, axis=1) * (u.second * d_dir.unit)
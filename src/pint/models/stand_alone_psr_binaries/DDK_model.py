@@ -5,6 +5,7 @@ import numpy as np
 from astropy import log
 from pint import GMsun, Tsun, ls
 
+from .binary_generic import memoized
 from .DD_model import DDmodel
 
 
@@ -498,9 +499,10 @@ class DDKmodel(DDmodel):
         mask = [proper_motion, parallax]
         for ii, cf in enumerate(corr_funs):
             if mask[ii]:
-                a1 += cf()
+                a1 = a1 + cf()
         return a1
 
+    @memoized
     def a1(self):
         if self.K96:
             return self.a1_k()
@@ -516,7 +518,7 @@ class DDKmodel(DDmodel):
                     ko_func = getattr(self, ko_func_name[ii] + par)
                 except:
                     ko_func = lambda: np.zeros(len(self.tt0)) * result.unit
-                result += ko_func()
+                result = result + ko_func()
         return result
 
     def d_a1_d_par(self, par):
@@ -540,9 +542,10 @@ class DDKmodel(DDmodel):
         mask = [proper_motion, parallax]
         for ii, cf in enumerate(corr_funs):
             if mask[ii]:
-                omega += cf()
+                omega = omega + cf()
         return omega
 
+    @memoized
     def omega(self):
         if self.K96:
             return self.omega_k()
@@ -558,7 +561,7 @@ class DDKmodel(DDmodel):
                     ko_func = getattr(self, ko_func_name[ii] + par)
                 except:
                     ko_func = lambda: np.zeros(len(self.tt0)) * result.unit
-                result += ko_func()
+                result = result + ko_func()
         return result
 
     def d_omega_d_par(self, par):
@@ -5,7 +5,7 @@ import numpy as np
 
 from pint import GMsun, Tsun, ls
 
-from .binary_generic import PSR_BINARY
+from .binary_generic import PSR_BINARY, memoized
 
 
 class DDmodel(PSR_BINARY):
@@ -71,6 +71,7 @@ class DDmodel(PSR_BINARY):
     # calculations for delays in DD model
 
     # DDmodel special omega.
+    @memoized
     def omega(self):
         """T. Damour and N. Deruelle(1986)equation [25]
 
@@ -152,6 +153,7 @@ class DDmodel(PSR_BINARY):
 
     ############################################################
     # Calculate er
+    @memoized
     def er(self):
         return self.ecc() + self.DR
 
@@ -177,6 +179,7 @@ class DDmodel(PSR_BINARY):
                 )
 
     ##########
+    @memoized
     def eTheta(self):
         return self.ecc() + self.DTH
 
@@ -202,6 +205,7 @@ class DDmodel(PSR_BINARY):
                 )
 
     ##########
+    @memoized
     def alpha(self):
         """Alpha defined in T. Damour and N. Deruelle(1986)equation [46]
 
@@ -256,6 +260,7 @@ class DDmodel(PSR_BINARY):
     #     return self.tt0/c.c*sinOmg
     ##############################################
 
+    @memoized
     def beta(self):
         """Beta defined in T. Damour and N. Deruelle(1986)equation [47]
 
@@ -415,6 +420,7 @@ class DDmodel(PSR_BINARY):
         return self.a1() / c.c * (-eTheta) / np.sqrt(1 - eTheta ** 2) * cosOmg
 
     ##################################################
+    @memoized
     def Dre(self):
         """Dre defined in T. Damour and N. Deruelle(1986)equation [48]
 
@@ -460,6 +466,7 @@ class DDmodel(PSR_BINARY):
             return (term1 + term2 + term3 + term4).to(Dre.unit / par_obj.unit)
 
     #################################################
+    @memoized
     def Drep(self):
         """Dervitive of Dre respect to E T. Damour and N. Deruelle(1986)equation [49]
 
@@ -501,6 +508,7 @@ class DDmodel(PSR_BINARY):
             return (term1 + term2 + term3).to(Drep.unit / par_obj.unit)
 
     #################################################
+    @memoized
     def Drepp(self):
         """Dervitive of Drep respect to E T. Damour and N. Deruelle(1986)equation [50]
 
@@ -542,6 +550,7 @@ class DDmodel(PSR_BINARY):
 
     #################################################
 
+    @memoized
     def nhat(self):
         """nhat defined as T. Damour and N. Deruelle(1986)equation [51]
 
@@ -581,6 +590,7 @@ class DDmodel(PSR_BINARY):
             )
 
     #################################################
+    @memoized
     def delayInverse(self):
         """DD model Inverse timing delay.
 
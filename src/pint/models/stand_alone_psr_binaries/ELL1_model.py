@@ -5,7 +5,7 @@ import numpy as np
 
 from pint import GMsun, Tsun, ls
 
-from .binary_generic import PSR_BINARY
+from .binary_generic import PSR_BINARY, memoized
 
 
 class ELL1BaseModel(PSR_BINARY):
@@ -38,6 +38,13 @@ class ELL1BaseModel(PSR_BINARY):
     def tt0(self):
         return self.ttasc()
 
+    def cache_dependencies(self):
+        # tt0 is measured from TASC here
+        return {
+            k: v | {"TASC"}
+            for k, v in super(ELL1BaseModel, self).cache_dependencies().items()
+        }
+
     ###############################
 
     def ttasc(self):
@@ -179,6 +186,7 @@ class ELL1BaseModel(PSR_BINARY):
             )
         return d_Dre_d_par
 
+    @memoized
     def Drep(self):
         """ dDre/dPhi
         """
@@ -226,6 +234,7 @@ class ELL1BaseModel(PSR_BINARY):
             )
         return d_Drep_d_par
 
+    @memoized
     def Drepp(self):
         a1 = self.a1()
         eps1 = self.eps1()
@@ -281,6 +290,7 @@ class ELL1BaseModel(PSR_BINARY):
             )
         return d_Drepp_d_par
 
+    @memoized
     def delayR(self):
         """ELL1 Roemer delay in proper time. Ch. Lange,1 F. Camilo, 2001 eq. A6 """
         Phi = self.Phi()
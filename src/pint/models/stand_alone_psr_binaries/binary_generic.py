@@ -1,4 +1,6 @@
 # This file is a prototype of independent psr binary model class
+import functools
+
 import astropy.constants as c
 import astropy.units as u
 import numpy as np
@@ -11,10 +13,40 @@ except ImportError:
 
 from pint import Tsun, ls
 from pint.models.stand_alone_psr_binaries.binary_orbits import OrbitPB
+from pint.orbital.kepler import solve_kepler
 
 SECS_PER_JUL_YEAR = SECS_PER_DAY * 365.25
 
 
+def memoized(method):
+    """Remember the value of a binary model method until its inputs change.
+
+    The value is discarded when one of the inputs listed for it in
+    :meth:`PSR_BINARY.cache_dependencies` changes, or when any input changes
+    if it is not listed there. Callers must not modify the returned array.
+    """
+    key = method.__qualname__
+
+    @functools.wraps(method)
+    def wrapper(self):
+        cache = self._cache
+        if key not in cache:
+            cache[key] = method(self)
+        return cache[key]
+
+    return wrapper
+
+
+def _same_value(a, b):
+    """Whether a new value of an input equals the old one."""
+    if a is b:
+        return True
+    try:
+        return np.shape(a) == np.shape(b) and bool(np.all(a == b))
+    except Exception:
+        return False
+
+
 class PSR_BINARY:
     """A base (generic) object for psr binary models.
 
@@ -90,6 +122,11 @@ class PSR_BINARY:
     """
 
     def __init__(self,):
+        # Memoized intermediate quantities and the inputs they were computed
+        # from; see cache_dependencies()
+        self._cache = {}
+        self._inputs = {}
+        self._units = {}
         # Necessary parameters for all binary model
         self.binary_name = None
         self.param_default_value = {
@@ -119,11 +156,56 @@ class PSR_BINARY:
         self.param_aliases = {"ECC": ["E"], "EDOT": ["ECCDOT"], "A1DOT": ["XDOT"]}
         self.binary_params = list(self.param_default_value.keys())
         self.inter_vars = ["E", "M", "nu", "ecc", "omega", "a1", "TM2"]
-        self.cache_vars = ["E", "nu"]
         self.binary_delay_funcs = []
         self.d_binarydelay_d_par_funcs = []
         self.orbits_cls = OrbitPB(self, ["PB", "PBDOT", "XPBDOT", "T0"])
 
+    def __setattr__(self, name, value):
+        # Any public attribute (the TOAs, the positions, the parameters, the
+        # orbit class...) is an input; drop the memoized values that depend
+        # on it when its value changes.
+        inputs = self.__dict__.get("_inputs")
+        if inputs is not None and not name.startswith("_"):
+            if name not in inputs or not _same_value(inputs[name], value):
+                inputs[name] = value
+                self.invalidate(name)
+        super().__setattr__(name, value)
+
+    def cache_dependencies(self):
+        """The inputs that memoized quantities depend on.
+
+        Returns
+        -------
+        dict
+            Maps the qualified names of :func:`memoized` methods to the sets of
+            attribute names their values depend on. Methods that are not
+            listed depend on every input.
+        """
+        tt0 = {"t", "T0"}
+        ecc = tt0 | {"ECC", "EDOT"}
+        orbits = tt0 | set(self.orbits_cls.orbit_params) | {"orbits_cls"}
+        return {
+            "PSR_BINARY.ecc": ecc,
+            "PSR_BINARY.M": orbits,
+            "PSR_BINARY.E": ecc | orbits,
+            "PSR_BINARY.nu": ecc | orbits,
+        }
+
+    def invalidate(self, name=None):
+        """Discard memoized quantities that depend on the input called name.
+
+        With no name, discard all of them.
+        """
+        if not self._cache:
+            return
+        if name is None:
+            self._cache.clear()
+            return
+        depends = self.cache_dependencies()
+        for key in list(self._cache):
+            if key not in depends or name in depends[key]:
+                del self._cache[key]
+
     @property
     def t(self):
         return self._t
@@ -167,11 +249,6 @@ class PSR_BINARY:
                 parameters[key] = value
         self.set_param_values(parameters)
 
-        # Switch the cache off
-        # NOTE Having cache is needs to be very careful.
-        for cv in self.cache_vars:
-            setattr(self, "_" + cv, None)
-
     def set_param_values(self, valDict=None):
         """Set the parameters and assign values,
 
@@ -300,30 +377,8 @@ class PSR_BINARY:
             return np.longdouble(np.ones(len(self.tt0))) * u.Unit("")
         # Get the unit right
 
-        yAttr = getattr(self, y)
-        xAttr = getattr(self, x)
-        U = [None, None]
-        for i, attr in enumerate([yAttr, xAttr]):
-            if hasattr(attr, "units"):  # If attr is a PINT Parameter class type
-                U[i] = attr.units
-            elif hasattr(attr, "unit"):  # If attr is a Quantity type
-                U[i] = attr.unit
-            elif hasattr(attr, "__call__"):  # If attr is a method
-                U[i] = attr().unit
-            else:
-                raise TypeError(type(attr) + "can not get unit")
-            # U[i] = 1*U[i]
-
-            # commonU = list(set(U[i].unit.bases).intersection([u.rad,u.deg]))
-            # if commonU != []:
-            #     strU = U[i].unit.to_string()
-            #     for cu in commonU:
-            #         scu = cu.to_string()
-            #         strU = strU.replace(scu,'1')
-            #     U[i] = U[i].to(strU, equivalencies=u.dimensionless_angles()).unit
-
-        yU = U[0]
-        xU = U[1]
+        yU = self.get_unit(y)
+        xU = self.get_unit(x)
         # Call derivtive functions
         derU = yU / xU
 
@@ -343,6 +398,25 @@ class PSR_BINARY:
         else:
             return result * derU
 
+    def get_unit(self, name):
+        """The unit of a parameter or intermediate variable.
+
+        The unit of an intermediate variable is found by evaluating it the
+        first time it is needed and is remembered after that, since it does
+        not depend on the values of the inputs.
+        """
+        attr = getattr(self, name)
+        if hasattr(attr, "units"):  # If attr is a PINT Parameter class type
+            return attr.units
+        elif hasattr(attr, "unit"):  # If attr is a Quantity type
+            return attr.unit
+        elif hasattr(attr, "__call__"):  # If attr is a method
+            if name not in self._units:
+                self._units[name] = attr().unit
+            return self._units[name]
+        else:
+            raise TypeError(type(attr) + "can not get unit")
+
     def compute_eccentric_anomaly(self, eccentricity, mean_anomaly):
         """Solve the Kepler Equation, E - e * sin(E) = M
 
@@ -358,6 +432,8 @@ class PSR_BINARY:
         array_like
             The eccentric anomaly in radians, given a set of mean_anomalies
             in radians.
+
+        The equation is solved by :func:`pint.orbital.kepler.solve_kepler`.
         """
         if hasattr(eccentricity, "unit"):
             # FIXME: isn't this an error?
@@ -365,19 +441,11 @@ class PSR_BINARY:
         else:
             e = eccentricity
 
-        if any(e < 0) or any(e >= 1):
-            raise ValueError("Eccentricity should be in the range of [0,1).")
-
         if hasattr(mean_anomaly, "unit"):
             ma = np.longdouble(mean_anomaly).value
         else:
             ma = mean_anomaly
-        k = lambda E: E - e * np.sin(E) - ma  # Kepler Equation
-        dk = lambda E: 1 - e * np.cos(E)  # derivative Kepler Equation
-        U = ma
-        while np.max(abs(k(U))) > 5e-15:  # Newton-Raphson method
-            U = U - k(U) / dk(U)
-        return U * u.rad
+        return solve_kepler(e, ma) * u.rad
 
     def get_tt0(self, barycentricTOA):
         """ tt0 = barycentricTOA - T0 """
@@ -390,6 +458,7 @@ class PSR_BINARY:
         tt0 = (barycentricTOA - T0).to("second")
         return tt0
 
+    @memoized
     def ecc(self):
         """Calculate ecctricity with EDOT """
         ECC = self.ECC
@@ -463,6 +532,7 @@ class PSR_BINARY:
     def orbits(self):
         return self.orbits_cls.orbits()
 
+    @memoized
     def M(self):
         """Orbit phase."""
         return self.orbits_cls.orbit_phase()
@@ -491,11 +561,10 @@ class PSR_BINARY:
 
     ###############################################
 
+    @memoized
     def E(self):
         """Eccentric Anomaly """
-        if not hasattr(self, "_E") or self._E is None:
-            self._E = self.compute_eccentric_anomaly(self.ecc(), self.M())
-        return self._E
+        return self.compute_eccentric_anomaly(self.ecc(), self.M())
 
     # Analytically calculate derivtives.
 
@@ -547,18 +616,14 @@ class PSR_BINARY:
                 E = self.E()
                 return np.zeros(len(self.tt0)) * E.unit / par_obj.unit
 
+    @memoized
     def nu(self):
         """True anomaly  (Ae) """
-        if not hasattr(self, "_nu") or self._nu is None:
-            ecc = self.ecc()
-            nu = 2 * np.arctan(
-                np.sqrt((1.0 + ecc) / (1.0 - ecc)) * np.tan(self.E() / 2.0)
-            )
-            # Normalize True anomaly to on orbit.
-            nu[nu < 0] += 2 * np.pi * u.rad
-            nu2 = 2 * np.pi * self.orbits() * u.rad + nu - self.M()
-            self._nu = nu2
-        return self._nu
+        ecc = self.ecc()
+        nu = 2 * np.arctan(np.sqrt((1.0 + ecc) / (1.0 - ecc)) * np.tan(self.E() / 2.0))
+        # Normalize True anomaly to on orbit.
+        nu[nu < 0] += 2 * np.pi * u.rad
+        return 2 * np.pi * self.orbits() * u.rad + nu - self.M()
 
     def d_nu_d_E(self):
         nu = self.nu()
@@ -3,6 +3,7 @@
 Defines the basic timing model interface classes.
 """
 import abc
+import contextlib
 import copy
 import inspect
 from collections import OrderedDict, defaultdict
@@ -12,6 +13,7 @@ from warnings import warn
 import astropy.time as time
 import astropy.units as u
 import numpy as np
+import scipy.sparse
 from astropy import log
 from scipy.optimize import brentq
 
@@ -23,9 +25,13 @@ from pint.models.parameter import (
     floatParameter,
     Parameter,
     maskParameter,
+    pairParameter,
+    prefixParameter,
+    quantity_version,
     strParameter,
 )
 from pint.phase import Phase
+from pint.pint_matrix import ColumnBlockMatrix
 from pint.toa import TOAs
 from pint.utils import PrefixError, interesting_lines, lines_of, split_prefixed_name
 
@@ -194,6 +200,8 @@ class TimingModel:
         self.name = name
         self.component_types = []
         self.top_level_params = []
+        self._structure_version = 0
+        self._structure = {}
         self.add_param_from_top(
             strParameter(
                 name="PSR", description="Source name", aliases=["PSRJ", "PSRB"]
@@ -276,6 +284,7 @@ class TimingModel:
             "",
         )
 
+        self._evaluation_cache = None
         for cp in components:
             self.add_component(cp, validate=False)
 
@@ -288,6 +297,12 @@ class TimingModel:
     def __str__(self):
         return self.as_parfile()
 
+    def __getstate__(self):
+        # The indexes of components and parameters are rebuilt when needed
+        state = self.__dict__.copy()
+        state.pop("_structure", None)
+        return state
+
     def validate(self):
         """Validate component setup.
 
@@ -314,23 +329,97 @@ class TimingModel:
     #    return result
 
     def __getattr__(self, name):
-        if name in ["components", "component_types", "search_cmp_attr"]:
+        if name in ["components", "component_types", "search_cmp_attr", "_structure"]:
             raise AttributeError
         if not hasattr(self, "component_types"):
             raise AttributeError
+        # Parameters, and methods or properties found before, are looked up
+        # directly in the component that has them.
+        hosts = self._structural("attribute_hosts", dict)
+        host = hosts.get(name, None)
+        if host is None:
+            host = self._param_hosts().get(name, None)
+        if host is not None:
+            return getattr(host, name)
         for cp in self.components.values():
             try:
-                return getattr(cp, name)
+                value = getattr(cp, name)
             except AttributeError:
                 continue
+            if hasattr(type(cp), name):
+                hosts[name] = cp
+            return value
         raise AttributeError(
             "Attribute {} not found in TimingModel or any Component".format(name)
         )
 
+    def _structure_changed(self):
+        """Forget the indexes and lists built from the components.
+
+        Values remembered in :meth:`pint.models.timing_model.TimingModel.evaluation_cache`
+        are discarded too. This is called whenever components are added or removed, parameters
+        are added to or removed from the model or its components, and when
+        components are set up (which may register functions).
+        """
+        self._structure_version += 1
+        self._structure = {}
+        cache = self.__dict__.get("_evaluation_cache")
+        if cache is not None:
+            cache.values = {}
+
+    def _structural(self, name, compute):
+        """Return compute(), remembered until the structure of the model changes.
+
+        See :meth:`pint.models.timing_model.TimingModel._structure_changed`.
+        """
+        structure = self.__dict__.get("_structure", None)
+        if structure is None:
+            # For example a TimingModel pickled by an older version of PINT
+            self._structure_version = 0
+            structure = self._structure = {}
+        try:
+            return structure[name]
+        except KeyError:
+            value = structure[name] = compute()
+            return value
+
+    def _param_hosts(self):
+        """Dictionary mapping each parameter name to the object that has it.
+
+        That is the component for component parameters, and the TimingModel
+        itself for top-level parameters.
+        """
+
+        def compute():
+            hosts = {p: self for p in self.top_level_params}
+            for cp in self.components.values():
+                for p in cp.params:
+                    hosts.setdefault(p, cp)
+            return hosts
+
+        return self._structural("param_hosts", compute)
+
+    def _param_names(self):
+        """Dictionary mapping parameter names and aliases to parameter names."""
+
+        def compute():
+            hosts = self._param_hosts()
+            names = {}
+            for p, host in hosts.items():
+                for a in getattr(host, p).aliases:
+                    names.setdefault(a, p)
+            names.update((p, p) for p in hosts)
+            return names
+
+        return self._structural("param_names", compute)
+
     @property_exists
     def params(self):
         """List of all parameter names in this model and all its components (order is arbitrary)."""
         # FIXME: any reason not to just use params_ordered here?
+        return list(self._structural("params", self._params))
+
+    def _params(self):
         p = self.top_level_params
         for cp in self.components.values():
             p = p + cp.params
@@ -339,6 +428,9 @@ class TimingModel:
     @property_exists
     def params_ordered(self):
         """List of all parameter names in this model and all its components, in a sensible order."""
+        return list(self._structural("params_ordered", self._params_ordered))
+
+    def _params_ordered(self):
         # Define the order of components in the list
         # Any not included will be printed between the first and last set.
         # FIXME: make order completely canonical (sort components by name?)
@@ -391,13 +483,18 @@ class TimingModel:
         On setting, parameter aliases are converted with
         :func:`pint.models.timing_model.TimingModel.match_param_aliases`.
         """
-        return [p for p in self.params_ordered if not getattr(self, p).frozen]
+        hosts = self._param_hosts()
+        return [
+            p
+            for p in self._structural("params_ordered", self._params_ordered)
+            if not getattr(hosts[p], p).frozen
+        ]
 
     @free_params.setter
     def free_params(self, params):
         params_true = {self.match_param_aliases(p) for p in params}
-        for p in self.params:
-            getattr(self, p).frozen = p not in params_true
+        for p, host in self._param_hosts().items():
+            getattr(host, p).frozen = p not in params_true
             params_true.discard(p)
         if params_true:
             raise ValueError(
@@ -406,12 +503,12 @@ class TimingModel:
 
     def match_param_aliases(self, alias):
         """Return the parameter corresponding to this alias."""
-        for p in self.params:
-            if p == alias:
-                return p
-            if alias in getattr(self, p).aliases:
-                return p
-        raise ValueError("{} is not recognized as a parameter or alias".format(alias))
+        try:
+            return self._param_names()[alias]
+        except KeyError:
+            raise ValueError(
+                "{} is not recognized as a parameter or alias".format(alias)
+            )
 
     def get_params_dict(self, which="free", kind="quantity"):
         """Return a dict mapping parameter names to values.
@@ -434,9 +531,10 @@ class TimingModel:
             ps = self.params_ordered
         else:
             raise ValueError("get_params_dict expects which to be 'all' or 'free'")
+        hosts = self._param_hosts()
         c = OrderedDict()
         for p in ps:
-            q = getattr(self, p)
+            q = getattr(hosts[p], p)
             if kind == "quantity":
                 c[p] = q
             elif kind in ("value", "num"):
@@ -477,6 +575,9 @@ class TimingModel:
     @property_exists
     def components(self):
         """All the components in a dictionary indexed by name."""
+        return dict(self._structural("components", self._components))
+
+    def _components(self):
         comps = {}
         for ct in self.component_types:
             for cp in getattr(self, ct + "_list"):
@@ -486,6 +587,9 @@ class TimingModel:
     @property_exists
     def delay_funcs(self):
         """List of all delay functions."""
+        return list(self._structural("delay_funcs", self._delay_funcs))
+
+    def _delay_funcs(self):
         dfs = []
         for d in self.DelayComponent_list:
             dfs += d.delay_funcs_component
@@ -494,6 +598,9 @@ class TimingModel:
     @property_exists
     def phase_funcs(self):
         """List of all phase functions."""
+        return list(self._structural("phase_funcs", self._phase_funcs))
+
+    def _phase_funcs(self):
         pfs = []
         for p in self.PhaseComponent_list:
             pfs += p.phase_funcs_component
@@ -716,6 +823,14 @@ class TimingModel:
         """List of derivative functions for delay components."""
         return self.get_deriv_funcs("DelayComponent")
 
+    @property_exists
+    def delay_block_deriv_funcs(self):
+        """Functions giving the delay derivatives of many parameters at once.
+
+        See :meth:`pint.models.timing_model.DelayComponent.register_block_deriv_funcs`.
+        """
+        return self.get_deriv_funcs("DelayComponent", "block")
+
     @property_exists
     def dm_derivs(self):  #  TODO need to be careful about the name here.
         """List of dm derivative functions."""
@@ -730,7 +845,17 @@ class TimingModel:
         return Dphase_Ddelay
 
     def get_deriv_funcs(self, component_type, derivative_type=""):
-        """Return dictionary of derivative functions."""
+        """Return dictionary of derivative functions.
+
+        The dictionary is shared until the structure of the model changes, so
+        it should not be modified.
+        """
+        return self._structural(
+            ("deriv_funcs", component_type, derivative_type),
+            lambda: self._get_deriv_funcs(component_type, derivative_type),
+        )
+
+    def _get_deriv_funcs(self, component_type, derivative_type):
         # TODO, this function can be a more generical function collector.
         deriv_funcs = defaultdict(list)
         if not derivative_type == "":
@@ -875,6 +1000,7 @@ class TimingModel:
         cur_cps.sort(key=lambda x: x[0])
         new_comp_list = [c[1] for c in cur_cps]
         setattr(self, comp_type + "_list", new_comp_list)
+        self._structure_changed()
         # Set up components
         self.setup()
         # Validate inputs
@@ -891,6 +1017,7 @@ class TimingModel:
         """
         cp, co_order, host, cp_type = self.map_component(component)
         host.remove(cp)
+        self._structure_changed()
 
     def _locate_param_host(self, components, param):
         """Search for the parameter host component.
@@ -949,6 +1076,7 @@ class TimingModel:
         if target_component == "":
             setattr(self, param.name, param)
             self.top_level_params += [param.name]
+            self._structure_changed()
         else:
             if target_component not in list(self.components.keys()):
                 raise AttributeError(
@@ -970,6 +1098,7 @@ class TimingModel:
         if param_map[param] == "timing_model":
             delattr(self, param)
             self.top_level_params.remove(param)
+            self._structure_changed()
         else:
             target_component = param_map[param]
             self.components[target_component].remove_param(param)
@@ -977,11 +1106,11 @@ class TimingModel:
     def get_params_mapping(self):
         """Report whick component each parameter name comes from."""
         param_mapping = {}
-        for p in self.top_level_params:
-            param_mapping[p] = "timing_model"
-        for cp in list(self.components.values()):
-            for pp in cp.params:
-                param_mapping[pp] = cp.__class__.__name__
+        for p, host in self._param_hosts().items():
+            if host is self:
+                param_mapping[p] = "timing_model"
+            else:
+                param_mapping[p] = host.__class__.__name__
         return param_mapping
 
     def get_params_of_type_top(self, param_type):
@@ -1019,6 +1148,44 @@ class TimingModel:
             for par, cp in self.get_params_mapping().items()
         )
 
+    @contextlib.contextmanager
+    def evaluation_cache(self, toas):
+        """Reuse intermediate results computed for toas within this context.
+
+        Many derivative functions need the same quantities: the total and
+        partial delays, d_phase_d_delay, the barycentric frequencies and the
+        pulsar direction. Within this context these are computed once for
+        ``toas`` and remembered as long as no parameter of the model is
+        changed; changing any parameter discards them.
+
+        >>> with model.evaluation_cache(toas):
+        ...     M, params, units = model.designmatrix(toas)
+        """
+        old_cache = self._evaluation_cache
+        if old_cache is None or old_cache.toas is not toas:
+            self._evaluation_cache = EvaluationCache(self, toas)
+        try:
+            yield self._evaluation_cache
+        finally:
+            self._evaluation_cache = old_cache
+
+    def cached(self, toas, name, compute):
+        """Return compute(), remembering the result if inside evaluation_cache.
+
+        Parameters
+        ----------
+        toas: TOAs object
+            The TOAs the value is computed for.
+        name: hashable
+            The name of the value.
+        compute: callable
+            A function of no arguments that computes the value.
+        """
+        cache = getattr(self, "_evaluation_cache", None)
+        if cache is None or cache.toas is not toas:
+            return compute()
+        return cache.get(name, compute)
+
     def delay(self, toas, cutoff_component="", include_last=True):
         """Total delay for the TOAs.
 
@@ -1035,6 +1202,14 @@ class TimingModel:
         Return the total delay which will be subtracted from the given
         TOA to get time of emission at the pulsar.
         """
+        # Callers may modify the result, so don't hand out the cached array
+        return self.cached(
+            toas,
+            ("delay", cutoff_component, include_last),
+            lambda: self._delay(toas, cutoff_component, include_last),
+        ).copy()
+
+    def _delay(self, toas, cutoff_component, include_last):
         delay = np.zeros(toas.ntoas) * u.second
         if cutoff_component == "":
             idx = len(self.DelayComponent_list)
@@ -1055,12 +1230,13 @@ class TimingModel:
 
     def phase(self, toas, abs_phase=False):
         """Return the model-predicted pulse phase for the given TOAs."""
-        # First compute the delays to "pulsar time"
-        delay = self.delay(toas)
-        phase = Phase(np.zeros(toas.ntoas), np.zeros(toas.ntoas))
-        # Then compute the relevant pulse phases
-        for pf in self.phase_funcs:
-            phase += Phase(pf(toas, delay))
+        with self.evaluation_cache(toas):
+            # First compute the delays to "pulsar time"
+            delay = self.delay(toas)
+            phase = Phase(np.zeros(toas.ntoas), np.zeros(toas.ntoas))
+            # Then compute the relevant pulse phases
+            for pf in self.phase_funcs:
+                phase += Phase(pf(toas, delay))
 
         # If the absolute phase flag is on, use the TZR parameters to compute
         # the absolute phase.
@@ -1230,61 +1406,52 @@ class TimingModel:
         """
         from . import jump
 
-        for flag_dict in toas.table["flags"]:
-            if "jump" in flag_dict.keys():
-                break
-            elif "gui_jump" in flag_dict.keys():
-                break
-        else:
+        flags = toas.table["flags"]
+        jump_nums, has_jump = flags.get_values("jump", np.nan)
+        gui_jumps, has_gui_jump = flags.get_values("gui_jump")
+        if not (has_jump.any() or has_gui_jump.any()):
             log.info("No jump flags to process")
             return None
-        for flag_dict in toas.table["flags"]:
-            if "jump" in flag_dict.keys():
-                jump_nums = [
-                    flag_dict["jump"] if "jump" in flag_dict.keys() else np.nan
-                    for flag_dict in toas.table["flags"]
-                ]
-                if "PhaseJump" not in self.components:
-                    log.info("PhaseJump component added")
-                    a = jump.PhaseJump()
-                    a.setup()
-                    self.add_component(a)
-                    self.remove_param("JUMP1")
-                for num in np.arange(1, np.nanmax(jump_nums) + 1):
-                    if "JUMP" + str(int(num)) not in self.params:
-                        param = maskParameter(
-                            name="JUMP",
-                            index=int(num),
-                            key="jump",
-                            key_value=int(num),
-                            value=0.0,
-                            units="second",
-                            uncertainty=0.0,
-                        )
-                        self.add_param_from_top(param, "PhaseJump")
-                        getattr(self, param.name).frozen = False
-                if 0 in jump_nums:
-                    for flag_dict in toas.table["flags"]:
-                        if "jump" in flag_dict.keys() and flag_dict["jump"] == 0:
-                            flag_dict["jump"] = int(np.nanmax(jump_nums) + 1)
+        if has_jump.any():
+            jump_nums = jump_nums.astype(float)
+            if "PhaseJump" not in self.components:
+                log.info("PhaseJump component added")
+                a = jump.PhaseJump()
+                a.setup()
+                self.add_component(a)
+                self.remove_param("JUMP1")
+            for num in np.arange(1, np.nanmax(jump_nums) + 1):
+                if "JUMP" + str(int(num)) not in self.params:
                     param = maskParameter(
                         name="JUMP",
-                        index=int(np.nanmax(jump_nums) + 1),
+                        index=int(num),
                         key="jump",
-                        key_value=int(np.nanmax(jump_nums) + 1),
+                        key_value=int(num),
                         value=0.0,
                         units="second",
                         uncertainty=0.0,
                     )
                     self.add_param_from_top(param, "PhaseJump")
                     getattr(self, param.name).frozen = False
+            if np.any(jump_nums == 0):
+                new_num = int(np.nanmax(jump_nums) + 1)
+                flags[jump_nums == 0].set_values("jump", new_num)
+                param = maskParameter(
+                    name="JUMP",
+                    index=new_num,
+                    key="jump",
+                    key_value=new_num,
+                    value=0.0,
+                    units="second",
+                    uncertainty=0.0,
+                )
+                self.add_param_from_top(param, "PhaseJump")
+                getattr(self, param.name).frozen = False
         # convert string list key_value from file into int list for jumps
         # previously added thru pintk
-        for flag_dict in toas.table["flags"]:
-            if "gui_jump" in flag_dict.keys():
-                num = flag_dict["gui_jump"]
-                jump = getattr(self.components["PhaseJump"], "JUMP" + str(num))
-                jump.key_value = list(map(int, jump.key_value))
+        for num in set(gui_jumps[has_gui_jump]):
+            jump = getattr(self.components["PhaseJump"], "JUMP" + str(num))
+            jump.key_value = list(map(int, jump.key_value))
         self.components["PhaseJump"].setup()
 
     def get_barycentric_toas(self, toas, cutoff_component=""):
@@ -1360,7 +1527,7 @@ class TimingModel:
         par = getattr(self, param)
         result = np.longdouble(np.zeros(toas.ntoas)) / par.units
         phase_derivs = self.phase_deriv_funcs
-        if param in list(phase_derivs.keys()):
+        if param in phase_derivs:
             for df in phase_derivs[param]:
                 result += df(toas, param, delay).to(
                     result.unit, equivalencies=u.dimensionless_angles()
@@ -1374,18 +1541,27 @@ class TimingModel:
             #                         d_delay_d_param
 
             d_delay_d_p = self.d_delay_d_param(toas, param)
-            dpdd_result = np.longdouble(np.zeros(toas.ntoas)) / u.second
-            for dpddf in self.d_phase_d_delay_funcs:
-                dpdd_result += dpddf(toas, delay)
+            dpdd_result = self.cached(
+                toas,
+                ("d_phase_d_delay", id(delay)),
+                lambda: (delay, self.d_phase_d_delay(toas, delay)),
+            )[1]
             result = dpdd_result * d_delay_d_p
         return result.to(result.unit, equivalencies=u.dimensionless_angles())
 
+    def d_phase_d_delay(self, toas, delay):
+        """Return the derivative of phase with respect to the delay."""
+        dpdd_result = np.longdouble(np.zeros(toas.ntoas)) / u.second
+        for dpddf in self.d_phase_d_delay_funcs:
+            dpdd_result += dpddf(toas, delay)
+        return dpdd_result
+
     def d_delay_d_param(self, toas, param, acc_delay=None):
         """Return the derivative of delay with respect to the parameter."""
         par = getattr(self, param)
         result = np.longdouble(np.zeros(toas.ntoas) << (u.s / par.units))
         delay_derivs = self.delay_deriv_funcs
-        if param not in list(delay_derivs.keys()):
+        if param not in delay_derivs:
             raise AttributeError(
                 "Derivative function for '%s' is not provided"
                 " or not registered. " % param
@@ -1476,14 +1652,27 @@ class TimingModel:
             )
         return result
 
-    def designmatrix(self, toas, acc_delay=None, incfrozen=False, incoffset=True):
+    def designmatrix(
+        self, toas, acc_delay=None, incfrozen=False, incoffset=True, sparse=False
+    ):
         """Return the design matrix.
 
         The design matrix is the matrix with columns of d_phase_d_param/F0
         or d_toa_d_param; it is used in fitting and calculating parameter
         covariances.
 
+        If sparse is True, the columns that are mostly zero (those of DMX
+        ranges and JUMPs, for example) are stored as a sparse matrix, and
+        the design matrix is returned as a
+        :class:`pint.pint_matrix.ColumnBlockMatrix`; its values are the same
+        as those of the dense design matrix. (The design matrices of
+        :class:`pint.pint_matrix.DesignMatrixMaker`, used for wideband
+        fitting, are always dense.)
         """
+        with self.evaluation_cache(toas):
+            return self._designmatrix(toas, incfrozen, incoffset, sparse)
+
+    def _designmatrix(self, toas, incfrozen, incoffset, sparse=False):
         params = ["Offset"] if incoffset else []
         params += [
             par for par in self.params if incfrozen or not getattr(self, par).frozen
@@ -1499,28 +1688,105 @@ class TimingModel:
         # for df in self.delay_funcs:
         #    tt -= df(toas)
 
-        M = np.zeros((ntoas, nparams))
+        rows, cols, values, done = self._designmatrix_blocks(toas, delay, params)
+        if sparse:
+            dense, dense_columns = [], []
+            entries = [(rows, cols, values)]
+        else:
+            M = np.zeros((ntoas, nparams))
+            M[rows, cols] = values
         for ii, param in enumerate(params):
             if param == "Offset":
-                M[:, ii] = 1.0
                 units.append(u.s / u.s)
+                q = 1.0
             else:
+                units.append(u.Unit("") / getattr(self, param).units)
+                if ii in done:
+                    continue
                 # NOTE Here we have negative sign here. Since in pulsar timing
                 # the residuals are calculated as (Phase - int(Phase)), which is different
                 # from the conventional definition of least square definition (Data - model)
                 # We decide to add minus sign here in the design matrix, so the fitter
                 # keeps the conventional way.
                 q = -self.d_phase_d_param(toas, delay, param)
+            if not sparse:
                 M[:, ii] = q
-                units.append(u.Unit("") / getattr(self, param).units)
-        mask = []
+                continue
+            column = np.zeros(ntoas)
+            column[:] = q
+            nonzero = np.flatnonzero(column)
+            # Sparse storage only pays for columns that are mostly zero
+            if len(nonzero) <= ntoas // 4:
+                entries.append((nonzero, np.full(len(nonzero), ii), column[nonzero]))
+            else:
+                dense.append(column)
+                dense_columns.append(ii)
+        # Divide in place; indexing the columns would copy the whole matrix
+        scale = np.ones(nparams)
         for ii, un in enumerate(units):
             if params[ii] == "Offset":
                 continue
             units[ii] = un * u.second
-            mask.append(ii)
-        M[:, mask] /= F0.value
-        return M, params, units
+            scale[ii] = F0.value
+        if not sparse:
+            M /= scale
+            return M, params, units
+        dense = np.column_stack(dense) if dense else np.zeros((ntoas, 0))
+        dense /= scale[dense_columns]
+        rows, cols, values = (np.concatenate(e) for e in zip(*entries))
+        values /= scale[cols]
+        sparse_columns = np.setdiff1d(np.arange(nparams), dense_columns)
+        position = np.zeros(nparams, dtype=int)
+        position[sparse_columns] = np.arange(len(sparse_columns))
+        block = scipy.sparse.csc_matrix(
+            (values, (rows, position[cols])), shape=(ntoas, len(sparse_columns))
+        )
+        return (
+            ColumnBlockMatrix(dense, dense_columns, block, sparse_columns),
+            params,
+            units,
+        )
+
+    def _designmatrix_blocks(self, toas, delay, params):
+        """Compute the columns that have block derivative functions.
+
+        Returns the nonzero entries of these columns as arrays rows, columns
+        (positions in params) and values, and the set of the positions in
+        params of the columns computed.
+        """
+        block_funcs = self.delay_block_deriv_funcs
+        phase_derivs = self.phase_deriv_funcs
+        groups = defaultdict(list)
+        for ii, param in enumerate(params):
+            if param in block_funcs and param not in phase_derivs:
+                (func,) = block_funcs[param]
+                groups[func].append(ii)
+        entries = [(np.zeros(0, dtype=int), np.zeros(0, dtype=int), np.zeros(0))]
+        done = set()
+        for func, columns in groups.items():
+            block = func(toas, [params[ii] for ii in columns])
+            if block is None:
+                continue
+            rows, cols, values = block
+            dpdd = self.cached(
+                toas,
+                ("d_phase_d_delay", id(delay)),
+                lambda: (delay, self.d_phase_d_delay(toas, delay)),
+            )[1]
+            # The chain rule as in d_phase_d_param, for the nonzero entries;
+            # each column is in units of 1 / (the parameter's units)
+            scale = np.array(
+                [
+                    values.unit.to(u.s / getattr(self, params[ii]).units)
+                    for ii in columns
+                ]
+            )
+            d_delay_d_p = np.longdouble(values.value * scale[cols])
+            values = -(dpdd[rows].to_value(1 / u.s) * d_delay_d_p)
+            entries.append((rows, np.array(columns)[cols], values.astype(float)))
+            done.update(columns)
+        rows, cols, values = (np.concatenate(e) for e in zip(*entries))
+        return rows, cols, values, done
 
     def compare(self, othermodel, nodmx=True, threshold_sigma=3.0, verbosity="max"):
         """Print comparison with another model
@@ -1836,9 +2102,7 @@ class TimingModel:
             a list of lines, or a readable file-like object.
         """
         repeat_param = defaultdict(int)
-        param_map = self.get_params_mapping()
-        comps = self.components.copy()
-        comps["timing_model"] = self
+        parfile_names = self._parfile_names()
         wants_tcb = None
         stray_lines = []
         for li in interesting_lines(lines_of(file), comments=("#", "C ")):
@@ -1883,8 +2147,8 @@ class TimingModel:
                 li = " ".join(k)
 
             used = []
-            for p, c in param_map.items():
-                if getattr(comps[c], p).from_parfile_line(li):
+            for c, host, p in parfile_names.get(k[0].upper(), []):
+                if getattr(host, p).from_parfile_line(li):
                     used.append((c, p))
             if len(used) > 1:
                 log.warning(
@@ -1930,6 +2194,27 @@ class TimingModel:
         if validate:
             self.validate()
 
+    def _parfile_names(self):
+        """Dictionary mapping par file names to the parameters that may read them.
+
+        Each upper-case name maps to a list of (component name, host,
+        parameter name) tuples. A parameter is listed under its name and
+        aliases and, for mask and pair parameters, also under these with the
+        index removed (``JUMP`` for ``JUMP1``); whether it actually reads a
+        line is still up to its ``from_parfile_line``.
+        """
+        names = defaultdict(list)
+        for p, host in self._param_hosts().items():
+            c = "timing_model" if host is self else host.__class__.__name__
+            par = getattr(host, p)
+            keys = {par.name.upper()} | {a.upper() for a in par.aliases}
+            if isinstance(par, (maskParameter, pairParameter)):
+                suffix = str(par.index)
+                keys |= {k[: -len(suffix)] for k in keys if k.endswith(suffix)}
+            for k in keys:
+                names[k].append((c, host, p))
+        return names
+
     def as_parfile(
         self,
         start_order=["astrometry", "spindown", "dispersion"],
@@ -2008,17 +2293,17 @@ class TimingModel:
         """Run setup methods on all components."""
         for cp in self.components.values():
             cp.setup()
+        self._structure_changed()
 
     def __contains__(self, name):
-        return name in self.params
+        return name in self._param_hosts()
 
     def __getitem__(self, name):
-        if name in self.top_level_params:
-            return getattr(self, name)
-        for cp in self.components.values():
-            if name in cp.params:
-                return getattr(cp, name)
-        raise KeyError("TimingModel does not have parameter {}".format(name))
+        try:
+            host = self._param_hosts()[name]
+        except KeyError:
+            raise KeyError("TimingModel does not have parameter {}".format(name))
+        return getattr(host, name)
 
     def __setitem__(self, name, value):
         # FIXME: This could be the right way to add Parameters?
@@ -2038,6 +2323,34 @@ class TimingModel:
             yield p
 
 
+class EvaluationCache:
+    """Values computed for one TOAs object and one set of parameter values.
+
+    See :meth:`pint.models.timing_model.TimingModel.evaluation_cache`. The
+    values are discarded when the quantity of any parameter is set (see
+    :func:`pint.models.parameter.quantity_version`) or the structure of the
+    model changes (see
+    :meth:`pint.models.timing_model.TimingModel._structure_changed`). Changing the elements of a parameter's quantity in place
+    without setting it is not noticed.
+    """
+
+    def __init__(self, model, toas):
+        self.model = model
+        self.toas = toas
+        self.version = quantity_version()
+        self.values = {}
+
+    def get(self, name, compute):
+        """Return the value called name, computing it if necessary."""
+        version = quantity_version()
+        if version != self.version:
+            self.version = version
+            self.values = {}
+        if name not in self.values:
+            self.values[name] = compute()
+        return self.values[name]
+
+
 class ModelMeta(abc.ABCMeta):
     """Ensure timing model registration.
 
@@ -2080,6 +2393,23 @@ class Component(object, metaclass=ModelMeta):
             ",\n    ".join(str(getattr(self, p)) for p in self.params),
         )
 
+    def _structure_changed(self):
+        """Tell the parent model that parameters or functions have changed.
+
+        See :meth:`pint.models.timing_model.TimingModel._structure_changed`.
+        """
+        if self._parent is not None:
+            self._parent._structure_changed()
+
+    def _cached(self, toas, name, compute):
+        """Return compute(), remembered by the parent model if possible.
+
+        See :meth:`pint.models.timing_model.TimingModel.cached`.
+        """
+        if self._parent is None:
+            return compute()
+        return self._parent.cached(toas, name, compute)
+
     def setup(self):
         """Finalize construction loaded values."""
         pass
@@ -2189,9 +2519,13 @@ class Component(object, metaclass=ModelMeta):
             param.name = prefix + str(idx)
             param.index = idx
 
-        # A more general check
-        if param.name in self.params:
-            exist_par = getattr(self, param.name)
+        # A more general check; only look through the params list when an
+        # attribute of this name is already a parameter
+        exist_par = getattr(self, param.name, None)
+        if (
+            isinstance(exist_par, (Parameter, prefixParameter))
+            and param.name in self.params
+        ):
             if exist_par.value is not None:
                 raise ValueError(
                     "Tried to add a second parameter called {}. "
@@ -2210,6 +2544,7 @@ class Component(object, metaclass=ModelMeta):
             self.setup()
         if deriv_func is not None:
             self.register_deriv_funcs(deriv_func, param.name)
+        self._structure_changed()
 
     def remove_param(self, param):
         """Remove a parameter from the Component.
@@ -2235,6 +2570,7 @@ class Component(object, metaclass=ModelMeta):
             for pn in all_names:
                 self.component_special_params.remove(pn)
         delattr(self, param)
+        self._structure_changed()
 
     def set_special_params(self, spcl_params):
         als = []
@@ -2291,6 +2627,9 @@ class Component(object, metaclass=ModelMeta):
 
     def match_param_aliases(self, alias):
         """Return the parameter corresponding to this alias."""
+        # Parameters are stored in attributes named after them
+        if isinstance(getattr(self, alias, None), (Parameter, prefixParameter)):
+            return alias
         for p in self.params:
             if p == alias:
                 return p
@@ -2311,6 +2650,7 @@ class Component(object, metaclass=ModelMeta):
         """
         pn = self.match_param_aliases(param)
 
+        self._structure_changed()
         if pn not in list(self.deriv_funcs.keys()):
             self.deriv_funcs[pn] = [func]
         else:
@@ -2398,6 +2738,29 @@ class DelayComponent(Component):
     def __init__(self):
         super(DelayComponent, self).__init__()
         self.delay_funcs_component = []
+        self.block_deriv_funcs = {}
+
+    def register_block_deriv_funcs(self, func, param):
+        """Register a function giving the delay derivatives of many parameters.
+
+        ``func(toas, params)`` should return the nonzero entries of the
+        derivatives of the delay with respect to the parameters ``params``
+        (all of which it was registered for) as ``rows, columns, values``,
+        with ``columns`` the positions in ``params`` and ``values`` a
+        Quantity, or None if it can't. The design matrix uses it instead of
+        the functions registered with :meth:`register_deriv_funcs`, which
+        must give the same result one parameter at a time.
+
+        Parameters
+        ----------
+        func : callable
+            Calculates the derivatives
+        param : str
+            Name of a parameter func can calculate the derivative for
+        """
+        pn = self.match_param_aliases(param)
+        self._structure_changed()
+        self.block_deriv_funcs[pn] = [func]
 
 
 class PhaseComponent(Component):
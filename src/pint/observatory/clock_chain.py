@@ -0,0 +1,277 @@
+"""Clock correction chains compiled into a single table.
+
+The clock corrections of an observatory are a sum of several hops (the
+observatory clock to UTC(GPS), UTC(GPS) to UTC, TAI to TT(BIPM), ...), each
+read from a clock file and interpolated linearly. A sum of piecewise-linear
+functions is itself piecewise linear, with breakpoints at the union of the
+breakpoints of the hops, so the whole chain can be merged into one table and
+evaluated with a single binary search.
+
+Reading and parsing the clock files, especially the tempo ``time.dat`` ones,
+takes much longer than evaluating the corrections, so compiled chains are
+stored in a small on-disk cache. Entries are named by a hash of the paths,
+modification times and sizes of the clock files they were built from (including
+files named in tempo ``INCLUDE`` lines), so they are rebuilt when any of these
+files change.
+"""
+import hashlib
+import os
+import tempfile
+
+import numpy as np
+from astropy import log
+
+import pint
+from pint.config import _app, _auth
+from pint.extern import appdirs
+from pint.observatory.clock_file import ClockFile
+
+__all__ = ["ClockChain", "ClockSource", "default_cache_dir", "load_clock_chain"]
+
+# Change this if the layout of the cache files changes
+_cache_format = 1
+
+
+def default_cache_dir():
+    """The directory in which compiled clock chains are cached.
+
+    This is ``$PINT_CLOCK_CACHE`` if that is set, and otherwise a ``clock``
+    directory in the user cache directory (typically ``$HOME/.cache/pint`` on
+    linux). Set ``$PINT_CLOCK_CACHE`` to an empty string to disable the cache.
+    """
+    d = os.getenv("PINT_CLOCK_CACHE")
+    if d is not None:
+        return d or None
+    return os.path.join(appdirs.user_cache_dir(_app, _auth), "clock")
+
+
+class ClockSource:
+    """One hop of a clock correction chain.
+
+    Parameters
+    ----------
+    filename : str
+        The clock file.
+    format : str
+        Its format, as for :meth:`pint.observatory.clock_file.ClockFile.read`.
+    obscode : str, optional
+        The tempo site code, for tempo ``time.dat`` files.
+    offset : float, optional
+        A constant (in seconds) subtracted from the corrections in the file.
+    """
+
+    def __init__(self, filename, format="tempo2", obscode=None, offset=0.0):
+        self.filename = filename
+        self.format = format
+        self.obscode = obscode
+        self.offset = offset
+
+    def files(self):
+        """The clock file and any files it includes."""
+        files = [self.filename]
+        if self.format == "tempo":
+            clkdir = os.path.dirname(os.path.abspath(self.filename))
+            with open(self.filename) as f:
+                for l in f:
+                    if l.startswith("INCLUDE"):
+                        files.append(os.path.join(clkdir, l.split()[1]))
+        return files
+
+    def read(self):
+        """Read the clock file, returning the MJDs and corrections in seconds."""
+        clock = ClockFile.read(self.filename, format=self.format, obscode=self.obscode)
+        return clock.time.mjd, clock.clock.to_value("s") - self.offset
+
+    def __repr__(self):
+        return "ClockSource({!r}, {!r}, {!r}, {!r})".format(
+            self.filename, self.format, self.obscode, self.offset
+        )
+
+
+class ClockChain:
+    """A chain of clock corrections merged into one piecewise-linear table.
+
+    Values are interpolated linearly between the entries of the table, and
+    the first/last values are used outside it, as in
+    :meth:`pint.observatory.clock_file.ClockFile.evaluate`. An MJD may appear
+    twice in a row to describe a jump; at the MJD itself the second value is
+    used.
+
+    Parameters
+    ----------
+    mjd : numpy.ndarray
+        The MJDs of the table, in nondecreasing order.
+    corr : numpy.ndarray
+        The total correction (in seconds) at each MJD.
+    ranges : list of tuple
+        ``(filename, first MJD, last MJD)`` for each hop, so that times outside
+        the range of any of the clock files can be reported.
+    """
+
+    def __init__(self, mjd, corr, ranges):
+        self.mjd = np.asarray(mjd, dtype=float)
+        self.corr = np.asarray(corr, dtype=float)
+        self.ranges = list(ranges)
+
+    @classmethod
+    def from_tables(cls, tables):
+        """Merge hops given as a list of ``(filename, mjd, corr)``."""
+        if not tables:
+            return cls([], [], [])
+        knots = np.unique(np.concatenate([mjd for _, mjd, _ in tables]))
+        left = np.zeros(len(knots))
+        right = np.zeros(len(knots))
+        for _, mjd, corr in tables:
+            value = np.interp(knots, mjd, corr)
+            lo = np.searchsorted(mjd, knots, side="left")
+            hi = np.searchsorted(mjd, knots, side="right")
+            # Jumps within one file are written as repeated MJDs
+            present = hi > lo
+            left += np.where(present, corr[np.minimum(lo, len(mjd) - 1)], value)
+            right += np.where(present, corr[hi - 1], value)
+        jump = left != right
+        mjd = np.concatenate([knots[jump], knots])
+        corr = np.concatenate([left[jump], right])
+        # At a jump the value from the left comes first
+        order = np.lexsort((np.arange(len(mjd)), mjd))
+        ranges = [(f, m[0], m[-1]) for f, m, _ in tables]
+        return cls(mjd[order], corr[order], ranges)
+
+    @classmethod
+    def from_sources(cls, sources):
+        """Read and merge the clock files of a list of :class:`ClockSource`."""
+        tables = []
+        for source in sources:
+            log.info("Loading clock file \n\t{0}".format(source.filename))
+            mjd, corr = source.read()
+            # tempo clock files are not always in order
+            order = np.argsort(mjd, kind="stable")
+            tables.append((source.filename, mjd[order], corr[order]))
+        return cls.from_tables(tables)
+
+    def evaluate(self, t, limits="warn"):
+        """Evaluate the clock corrections at the times t.
+
+        Parameters
+        ----------
+        t : astropy.time.Time or numpy.ndarray
+            The times, or their MJDs.
+        limits : "warn" or "error"
+            What to do if any time is outside the range of one of the clock
+            files: log a warning or raise a RuntimeError.
+
+        Returns
+        -------
+        numpy.ndarray
+            The corrections in seconds, with the shape of t.
+        """
+        mjd = np.asarray(getattr(t, "mjd", t), dtype=float)
+        if mjd.size:
+            lo, hi = mjd.min(), mjd.max()
+            for filename, start, end in self.ranges:
+                if lo < start or hi > end:
+                    msg = "Data points out of range in clock file '%s'" % filename
+                    if limits == "warn":
+                        log.warning(msg)
+                    elif limits == "error":
+                        raise RuntimeError(msg)
+        if len(self.mjd) == 0:
+            return np.zeros(mjd.shape)
+        if len(self.mjd) == 1:
+            return np.full(mjd.shape, self.corr[0])
+        j = np.clip(
+            np.searchsorted(self.mjd, mjd, side="right") - 1, 0, len(self.mjd) - 2
+        )
+        x0 = self.mjd[j]
+        dx = self.mjd[j + 1] - x0
+        y0 = self.corr[j]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            w = np.clip((mjd - x0) / dx, 0, 1)
+        result = np.where(dx > 0, y0 + w * (self.corr[j + 1] - y0), y0)
+        result = np.where(mjd >= self.mjd[-1], self.corr[-1], result)
+        return np.where(mjd < self.mjd[0], self.corr[0], result)
+
+    def save(self, filename):
+        """Write the table to filename (an ``.npz`` file), atomically."""
+        directory = os.path.dirname(os.path.abspath(filename))
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=".npz")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(
+                    f,
+                    format=_cache_format,
+                    mjd=self.mjd,
+                    corr=self.corr,
+                    files=np.array([r[0] for r in self.ranges], dtype=str),
+                    ranges=np.array([r[1:] for r in self.ranges], dtype=float),
+                )
+            os.replace(tmp, filename)
+        except Exception:
+            os.remove(tmp)
+            raise
+
+    @classmethod
+    def load(cls, filename):
+        """Read a table written by :meth:`save`, or return None if it is unusable."""
+        try:
+            with np.load(filename, allow_pickle=False) as d:
+                if d["format"] != _cache_format:
+                    return None
+                ranges = [
+                    (str(f), start, end)
+                    for f, (start, end) in zip(d["files"], d["ranges"].reshape(-1, 2))
+                ]
+                return cls(d["mjd"], d["corr"], ranges)
+        except (OSError, KeyError, ValueError):
+            return None
+
+
+def _chain_key(sources):
+    """A hash of the clock files of sources and their versions on disk.
+
+    Raises an OSError if any of the files is missing.
+    """
+    h = hashlib.sha256()
+    h.update(repr((_cache_format, pint.__version__)).encode())
+    for source in sources:
+        h.update(repr((source.format, source.obscode, source.offset)).encode())
+        for filename in source.files():
+            st = os.stat(filename)
+            h.update(
+                repr((os.path.abspath(filename), st.st_mtime_ns, st.st_size)).encode()
+            )
+    return h.hexdigest()
+
+
+def load_clock_chain(sources, cache_dir=None):
+    """Return the compiled :class:`ClockChain` for a list of :class:`ClockSource`.
+
+    The chain is read from the cache if the clock files have not changed
+    since it was stored, and compiled and stored otherwise. Problems writing
+    to the cache are logged and otherwise ignored.
+
+    Parameters
+    ----------
+    sources : list of ClockSource
+        The hops of the chain.
+    cache_dir : str, optional
+        Where to keep compiled chains; defaults to
+        :func:`pint.observatory.clock_chain.default_cache_dir`.
+    """
+    if cache_dir is None:
+        cache_dir = default_cache_dir()
+    key = _chain_key(sources)
+    if cache_dir:
+        filename = os.path.join(cache_dir, key + ".npz")
+        chain = ClockChain.load(filename)
+        if chain is not None:
+            log.debug("Loaded compiled clock chain {}".format(filename))
+            return chain
+    chain = ClockChain.from_sources(sources)
+    if cache_dir:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            chain.save(filename)
+        except OSError as e:
+            log.debug("Could not store compiled clock chain: {}".format(e))
+    return chain
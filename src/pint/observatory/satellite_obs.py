@@ -1,4 +1,8 @@
 # special_locations.py
+import hashlib
+import os
+import tempfile
+
 import astropy.io.fits as pyfits
 import astropy.units as u
 import astropy.constants as const
@@ -8,11 +12,16 @@ from astropy.table import Table, vstack
 from scipy.interpolate import InterpolatedUnivariateSpline
 import numpy as np
 
+from pint.config import _app, _auth
+from pint.extern import appdirs
 from pint.fits_utils import read_fits_event_mjds
 from pint.observatory.special_locations import SpecialLocation
 from pint.solar_system_ephemerides import objPosVel_wrt_SSB
 from pint.utils import PosVel
 
+# Change this if the layout of cached orbit tables changes
+_orbit_cache_format = 1
+
 
 def load_Fermi_FT2(ft2_filename):
     """Load data from a Fermi FT2 file
@@ -251,19 +260,185 @@ def load_orbit(obs_name, orb_filename):
         full_orb.sort("MJD_TT")
         return full_orb
 
+    return _orbit_loader(obs_name)(orb_filename)
+
+
+def _orbit_loader(obs_name):
+    """The function that reads orbit files for this observatory."""
     lower_name = obs_name.lower()
     if "fermi" in lower_name:
-        return load_Fermi_FT2(orb_filename)
+        return load_Fermi_FT2
     elif "nicer" in lower_name:
-        return load_FPorbit(orb_filename)
+        return load_FPorbit
     elif "rxte" in lower_name:
-        return load_FPorbit(orb_filename)
+        return load_FPorbit
     elif "nustar" in lower_name:
-        return load_nustar_orbit(orb_filename)
+        return load_nustar_orbit
     else:
         raise ValueError("Unrecognized satellite observatory %s." % (obs_name))
 
 
+def default_orbit_cache_dir():
+    """The directory in which parsed orbit tables are cached.
+
+    This is ``$PINT_ORBIT_CACHE`` if that is set, and otherwise an ``orbit``
+    directory in the user cache directory (typically ``$HOME/.cache/pint`` on
+    linux).
+    """
+    d = os.getenv("PINT_ORBIT_CACHE")
+    if d is not None:
+        return d
+    return os.path.join(appdirs.user_cache_dir(_app, _auth), "orbit")
+
+
+def _orbit_files(orb_filename):
+    """The orbit file, or the metafile and the files it lists."""
+    if orb_filename.startswith("@"):
+        files = [orb_filename[1:]]
+        for ll in open(orb_filename[1:]).readlines():
+            files.extend(_orbit_files(ll.strip()))
+        return files
+    return [orb_filename]
+
+
+def orbit_array(orb_table):
+    """Convert an orbit table to an (n, 7) array for interpolation.
+
+    The columns are MJD_TT and the positions (m) and velocities (m/s) X, Y,
+    Z, Vx, Vy, Vz, as float64, sorted by time. Entries at repeated times are
+    dropped, keeping the first.
+    """
+    columns = [np.asarray(orb_table["MJD_TT"], dtype=np.float64)]
+    for c in ("X", "Y", "Z"):
+        columns.append(orb_table[c].quantity.to_value(u.m).astype(np.float64))
+    for c in ("Vx", "Vy", "Vz"):
+        columns.append(orb_table[c].quantity.to_value(u.m / u.s).astype(np.float64))
+    orbit = np.stack(columns, axis=-1)
+    orbit = orbit[np.argsort(orbit[:, 0], kind="stable")]
+    keep = np.concatenate([[True], np.diff(orbit[:, 0]) > 0])
+    if not np.all(keep):
+        log.debug("Dropping {0} repeated times from orbit".format(np.sum(~keep)))
+        orbit = orbit[keep]
+    return orbit
+
+
+def load_orbit_array(obs_name, orb_filename, cachedir=None):
+    """Load an orbit with :func:`load_orbit`, through a persistent cache.
+
+    The result of :func:`orbit_array` is stored as an ``.npy`` file named by a
+    hash of the file format and the paths, modification times and sizes of
+    the orbit files, and memory-mapped (read-only) when it is loaded again.
+
+    Parameters
+    ----------
+    obs_name : str
+        Observatory name. (Fermi, NICER, RXTE, and NuSTAR are valid.)
+    orb_filename : str
+        An FT2-like file tabulating orbit position, or a metafile as for
+        :func:`load_orbit`.
+    cachedir : str, optional
+        The cache directory to use; defaults to
+        :func:`pint.observatory.satellite_obs.default_orbit_cache_dir`.
+
+    Returns
+    -------
+    numpy.ndarray
+        An (n, 7) array of MJD_TT, X, Y, Z (m), Vx, Vy, Vz (m/s).
+    """
+    if cachedir is None:
+        cachedir = default_orbit_cache_dir()
+    h = hashlib.sha256()
+    h.update(repr((_orbit_cache_format, _orbit_loader(obs_name).__name__)).encode())
+    for f in _orbit_files(orb_filename):
+        st = os.stat(f)
+        h.update(repr((os.path.abspath(f), st.st_mtime_ns, st.st_size)).encode())
+    filename = os.path.join(cachedir, h.hexdigest() + ".npy")
+    try:
+        orbit = np.load(filename, mmap_mode="r")
+        log.info("Loaded cached orbit table {0}".format(filename))
+        return orbit
+    except (OSError, ValueError):
+        pass
+    orbit = orbit_array(load_orbit(obs_name, orb_filename))
+    try:
+        os.makedirs(cachedir, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=cachedir, prefix=".tmp-", suffix=".npy")
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, orbit)
+        os.replace(tmp, filename)
+    except OSError as e:
+        log.warning("Could not cache orbit table: {0}".format(e))
+    return orbit
+
+
+class HermiteOrbit:
+    """Cubic Hermite interpolation of a tabulated spacecraft orbit.
+
+    Between two entries of the table, each component of the position is the
+    cubic matching the tabulated positions and velocities at both ends, and
+    the velocity is its derivative. The coefficients of the cubics are
+    computed once, so all six components are evaluated with a single lookup
+    of the times in the table and a gather of one row of coefficients.
+
+    Parameters
+    ----------
+    orbit : numpy.ndarray
+        An (n, 7) array as returned by :func:`orbit_array`.
+    """
+
+    def __init__(self, orbit):
+        self.mjd = np.ascontiguousarray(orbit[:, 0])
+        dt = np.diff(self.mjd) * 86400.0
+        pos = orbit[:, 1:4].T
+        vel = orbit[:, 4:7].T
+        slope = (pos[:, 1:] - pos[:, :-1]) / dt
+        c2 = (3 * slope - 2 * vel[:, :-1] - vel[:, 1:]) / dt
+        c3 = (vel[:, :-1] + vel[:, 1:] - 2 * slope) / dt ** 2
+        # The coefficients of the powers of the time (s) since the start of
+        # each interval, as a (12, n - 1) array
+        self.coefficients = np.concatenate([pos[:, :-1], vel[:, :-1], c2, c3])
+
+    def _interval(self, mjd):
+        mjd = np.asarray(mjd, dtype=float)
+        if np.any(mjd < self.mjd[0]) or np.any(mjd > self.mjd[-1]):
+            raise ValueError(
+                "Times outside orbit table ({0} to {1})".format(
+                    self.mjd[0], self.mjd[-1]
+                )
+            )
+        j = np.searchsorted(self.mjd, mjd, side="right") - 1
+        np.clip(j, 0, len(self.mjd) - 2, out=j)
+        tau = (mjd - self.mjd[j]) * 86400.0
+        c = np.take(self.coefficients, j, axis=1)
+        return c.reshape((4, 3) + tau.shape), tau
+
+    def position(self, mjd):
+        """The position (m) at MJDs (TT), as a (3, ...) array."""
+        c, tau = self._interval(mjd)
+        pos = c[3] * tau
+        pos += c[2]
+        pos *= tau
+        pos += c[1]
+        pos *= tau
+        pos += c[0]
+        return pos
+
+    def posvel(self, mjd):
+        """The position (m) and velocity (m/s) at MJDs (TT), as (3, ...) arrays."""
+        c, tau = self._interval(mjd)
+        vel = c[3] * (3 * tau)
+        vel += 2 * c[2]
+        vel *= tau
+        vel += c[1]
+        pos = c[3] * tau
+        pos += c[2]
+        pos *= tau
+        pos += c[1]
+        pos *= tau
+        pos += c[0]
+        return pos, vel
+
+
 class SatelliteObs(SpecialLocation):
     """Generalized class for high-energy photon data and tabulated position/velocity.
 
@@ -276,22 +451,68 @@ class SatelliteObs(SpecialLocation):
         Observatory name [Fermi, NICER, RXTE, NuSTAR]
     ft2name: str
         File name to read spacecraft position information from
+    interpolator: str
+        How to interpolate the orbit: "spline" fits a separate spline to
+        each component of the position and velocity; "hermite" uses
+        :class:`pint.observatory.satellite_obs.HermiteOrbit`, which evaluates
+        all of them at once.
+    usecache: bool
+        Whether to load the parsed orbit table through the persistent cache
+        (see :func:`pint.observatory.satellite_obs.load_orbit_array`).
+    cachedir: str or None
+        The cache directory to use; defaults to
+        :func:`pint.observatory.satellite_obs.default_orbit_cache_dir`.
     """
 
-    def __init__(self, name, ft2name):
-        self.FT2 = load_orbit(name, ft2name)
+    def __init__(
+        self, name, ft2name, interpolator="spline", usecache=False, cachedir=None
+    ):
+        if interpolator not in ("spline", "hermite"):
+            raise ValueError("Unknown orbit interpolator '%s'" % interpolator)
+        self.interpolator = interpolator
+        if usecache:
+            orbit = load_orbit_array(name, ft2name, cachedir=cachedir)
+            self.FT2 = Table(
+                list(orbit.T),
+                names=("MJD_TT", "X", "Y", "Z", "Vx", "Vy", "Vz"),
+                units=(u.d, u.m, u.m, u.m, u.m / u.s, u.m / u.s, u.m / u.s),
+                meta={"name": name},
+                copy=False,
+            )
+        else:
+            self.FT2 = load_orbit(name, ft2name)
 
         # Now build the interpolator here:
-        tt = self.FT2["MJD_TT"]
-        self.X = InterpolatedUnivariateSpline(tt, self.FT2["X"], ext="raise")
-        self.Y = InterpolatedUnivariateSpline(tt, self.FT2["Y"], ext="raise")
-        self.Z = InterpolatedUnivariateSpline(tt, self.FT2["Z"], ext="raise")
-        self.Vx = InterpolatedUnivariateSpline(tt, self.FT2["Vx"], ext="raise")
-        self.Vy = InterpolatedUnivariateSpline(tt, self.FT2["Vy"], ext="raise")
-        self.Vz = InterpolatedUnivariateSpline(tt, self.FT2["Vz"], ext="raise")
+        if interpolator == "hermite":
+            self._orbit = HermiteOrbit(orbit if usecache else orbit_array(self.FT2))
+        else:
+            tt = self.FT2["MJD_TT"]
+            self.X = InterpolatedUnivariateSpline(tt, self.FT2["X"], ext="raise")
+            self.Y = InterpolatedUnivariateSpline(tt, self.FT2["Y"], ext="raise")
+            self.Z = InterpolatedUnivariateSpline(tt, self.FT2["Z"], ext="raise")
+            self.Vx = InterpolatedUnivariateSpline(tt, self.FT2["Vx"], ext="raise")
+            self.Vy = InterpolatedUnivariateSpline(tt, self.FT2["Vy"], ext="raise")
+            self.Vz = InterpolatedUnivariateSpline(tt, self.FT2["Vz"], ext="raise")
         self._geocenter = EarthLocation.from_geocentric(0.0 * u.m, 0.0 * u.m, 0.0 * u.m)
         super(SatelliteObs, self).__init__(name=name)
 
+    def _geo_pos(self, t):
+        """Position of the satellite wrt the geocenter at times t."""
+        mjd = t.tt.mjd
+        if self.interpolator == "hermite":
+            return self._orbit.position(mjd) * u.m
+        return np.array([self.X(mjd), self.Y(mjd), self.Z(mjd)]) * self.FT2["X"].unit
+
+    def _geo_posvel(self, t):
+        """Position and velocity of the satellite wrt the geocenter at times t."""
+        mjd = t.tt.mjd
+        if self.interpolator == "hermite":
+            pos, vel = self._orbit.posvel(mjd)
+            return pos * u.m, vel * (u.m / u.s)
+        pos = np.array([self.X(mjd), self.Y(mjd), self.Z(mjd)]) * self.FT2["X"].unit
+        vel = np.array([self.Vx(mjd), self.Vy(mjd), self.Vz(mjd)]) * self.FT2["Vx"].unit
+        return pos, vel
+
     @property
     def timescale(self):
         return "tt"
@@ -320,10 +541,7 @@ class SatelliteObs(SpecialLocation):
         Returns a 3-vector of Quantities representing the position
         in GCRS coordinates.
         """
-        return (
-            np.array([self.X(t.tt.mjd), self.Y(t.tt.mjd), self.Z(t.tt.mjd)])
-            * self.FT2["X"].unit
-        )
+        return self._geo_pos(t)
 
     def posvel(self, t, ephem):
         """Return position and velocity vectors of satellite, wrt SSB.
@@ -336,15 +554,8 @@ class SatelliteObs(SpecialLocation):
         # Compute vector from SSB to Earth
         geo_posvel = objPosVel_wrt_SSB("earth", t, ephem)
         # Now add vector from Earth to satellite
-        sat_pos_geo = (
-            np.array([self.X(t.tt.mjd), self.Y(t.tt.mjd), self.Z(t.tt.mjd)])
-            * self.FT2["X"].unit
-        )
+        sat_pos_geo, sat_vel_geo = self._geo_posvel(t)
         log.debug("[{0}] sat_pos_geo {1}".format(self.name, sat_pos_geo[:, 0]))
-        sat_vel_geo = (
-            np.array([self.Vx(t.tt.mjd), self.Vy(t.tt.mjd), self.Vz(t.tt.mjd)])
-            * self.FT2["Vx"].unit
-        )
         sat_posvel = PosVel(sat_pos_geo, sat_vel_geo, origin="earth", obj=self.name)
         # Vector add to geo_posvel to get full posvel vector.
         return geo_posvel + sat_posvel
@@ -370,10 +581,7 @@ class NICERObs(SatelliteObs):
                 "Extrapolating NICER position by more than %d minutes!" % maxextrap
             )
             raise ValueError("Bad extrapolation of S/C file.")
-        return (
-            np.array([self.X(t.tt.mjd), self.Y(t.tt.mjd), self.Z(t.tt.mjd)])
-            * self.FT2["X"].unit
-        )
+        return self._geo_pos(t)
 
     def posvel(self, t, ephem, maxextrap=2):
         """Return position and velocity vectors of NICER.
@@ -404,14 +612,7 @@ class NICERObs(SatelliteObs):
         # Compute vector from SSB to Earth
         geo_posvel = objPosVel_wrt_SSB("earth", t, ephem)
         # Now add vector from Earth to NICER
-        nicer_pos_geo = (
-            np.array([self.X(t.tt.mjd), self.Y(t.tt.mjd), self.Z(t.tt.mjd)])
-            * self.FT2["X"].unit
-        )
-        nicer_vel_geo = (
-            np.array([self.Vx(t.tt.mjd), self.Vy(t.tt.mjd), self.Vz(t.tt.mjd)])
-            * self.FT2["Vx"].unit
-        )
+        nicer_pos_geo, nicer_vel_geo = self._geo_posvel(t)
         nicer_posvel = PosVel(nicer_pos_geo, nicer_vel_geo, origin="earth", obj="nicer")
         # Vector add to geo_posvel to get full posvel vector.
         return geo_posvel + nicer_posvel
@@ -439,20 +640,13 @@ class NICERObs(SatelliteObs):
             raise ValueError("Bad extrapolation of S/C file.")
 
         # Now add vector from Earth to NICER
-        nicer_pos_geo = (
-            np.array([self.X(t.tt.mjd), self.Y(t.tt.mjd), self.Z(t.tt.mjd)])
-            * self.FT2["X"].unit
-        )
-        nicer_vel_geo = (
-            np.array([self.Vx(t.tt.mjd), self.Vy(t.tt.mjd), self.Vz(t.tt.mjd)])
-            * self.FT2["Vx"].unit
-        )
+        nicer_pos_geo, nicer_vel_geo = self._geo_posvel(t)
         nicer_posvel = PosVel(nicer_pos_geo, nicer_vel_geo, origin="earth", obj="nicer")
         # Vector add to geo_posvel to get full posvel vector.
         return nicer_posvel
 
 
-def get_satellite_observatory(name, ft2name):
+def get_satellite_observatory(name, ft2name, **kwargs):
     """ Factory to get/instantiate a SatelliteObs.""
 
     Parameters
@@ -461,7 +655,10 @@ def get_satellite_observatory(name, ft2name):
         Observatory name [Fermi, NICER, RXTE, NuSTAR]
     ft2name: str
         File name to read spacecraft position information from.
+
+    Other keyword arguments (``interpolator``, ``usecache``, ``cachedir``)
+    are passed to :class:`pint.observatory.satellite_obs.SatelliteObs`.
     """
     if "nicer" in name.lower():
-        return NICERObs(name, ft2name)
-    return SatelliteObs(name, ft2name)
+        return NICERObs(name, ft2name, **kwargs)
+    return SatelliteObs(name, ft2name, **kwargs)
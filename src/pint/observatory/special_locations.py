@@ -3,6 +3,8 @@
 Special "site" locations (eg, barycenter) which do not need clock
 corrections or much else done.
 """
+import os
+
 import astropy.constants as const
 import astropy.units as u
 from astropy import log
@@ -11,7 +13,7 @@ import numpy as np
 
 from pint.config import datapath
 from pint.observatory import bipm_default
-from pint.observatory.clock_file import ClockFile
+from pint.observatory.clock_chain import ClockSource, load_clock_chain
 from pint.solar_system_ephemerides import objPosVel_wrt_SSB
 from pint.utils import PosVel
 from . import Observatory
@@ -60,12 +62,11 @@ class SpecialLocation(Observatory):
     ):
         # GPS corrections not implemented yet
         self.include_gps = include_gps
-        self._gps_clock = None
 
         # BIPM corrections not implemented yet
         self.include_bipm = include_bipm
         self.bipm_version = bipm_version
-        self._bipm_clock = None
+        self._clock_chains = {}
 
         super(SpecialLocation, self).__init__(name, aliases=aliases)
 
@@ -102,37 +103,28 @@ class SpecialLocation(Observatory):
         )
         return os.path.join(os.getenv("TEMPO2"), "clock", fname)
 
-    def clock_corrections(self, t):
-        corr = np.zeros(t.shape) * u.s
+    def clock_sources(self):
+        """The GPS and BIPM hops of the clock correction chain, as ClockSources."""
+        sources = []
         if self.include_gps:
-            log.info("Applying GPS to UTC clock correction (~few nanoseconds)")
-            if self._gps_clock is None:
-                log.info(
-                    "Observatory {0}, loading GPS clock file {1}".format(
-                        self.name, self.gps_fullpath
-                    )
-                )
-                self._gps_clock = ClockFile.read(self.gps_fullpath, format="tempo2")
-            corr += self._gps_clock.evaluate(t)
+            sources.append(ClockSource(self.gps_fullpath))
         if self.include_bipm:
-            log.info("Applying TT(TAI) to TT(BIPM) clock correction (~27 us)")
-            tt2tai = 32.184 * 1e6 * u.us
-            if self._bipm_clock is None:
-                try:
-                    log.info(
-                        "Observatory {0}, loading BIPM clock file {1}".format(
-                            self.name, self.bipm_fullpath
-                        )
-                    )
-                    self._bipm_clock = ClockFile.read(
-                        self.bipm_fullpath, format="tempo2"
-                    )
-                except:
-                    raise ValueError(
-                        "Can not find TT BIPM file '%s'. " % self.bipm_version
-                    )
-            corr += self._bipm_clock.evaluate(t) - tt2tai
-        return corr
+            try:
+                bipm = self.bipm_fullpath
+                os.stat(bipm)
+            except:
+                raise ValueError("Can not find TT BIPM file '%s'. " % self.bipm_version)
+            # TT(TAI) = TAI + 32.184 s
+            sources.append(ClockSource(bipm, offset=32.184))
+        return sources
+
+    def clock_corrections(self, t):
+        if not (self.include_gps or self.include_bipm):
+            return np.zeros(t.shape) * u.s
+        key = (self.include_gps, self.include_bipm, self.bipm_version)
+        if key not in self._clock_chains:
+            self._clock_chains[key] = load_clock_chain(self.clock_sources())
+        return self._clock_chains[key].evaluate(t) * u.s
 
 
 class BarycenterObs(SpecialLocation):
@@ -220,12 +212,10 @@ class T2SpacecraftObs(SpecialLocation):
         if grp is None:
             raise ValueError("TOA group table needed for SpacecraftObs get_gcrs")
 
-        try:
-            # Is there a better way to do this?
-            x = np.array([flags["telx"] for flags in grp["flags"]])
-            y = np.array([flags["tely"] for flags in grp["flags"]])
-            z = np.array([flags["telz"] for flags in grp["flags"]])
-        except:
+        x, has_x = grp["flags"].get_values("telx")
+        y, has_y = grp["flags"].get_values("tely")
+        z, has_z = grp["flags"].get_values("telz")
+        if not (has_x.all() and has_y.all() and has_z.all()):
             log.error(
                 "Missing flag. TOA line should have telx,tely,telz flags for GCRS position in km."
             )
@@ -233,7 +223,7 @@ class T2SpacecraftObs(SpecialLocation):
                 "Missing flag. TOA line should have telx,tely,telz flags for GCRS position in km."
             )
 
-        pos = np.vstack((x, y, z))
+        pos = np.vstack((x, y, z)).astype(float)
         vdim = (3,) + t.shape
         if pos.shape != vdim:
             raise ValueError(
@@ -251,12 +241,10 @@ class T2SpacecraftObs(SpecialLocation):
         if grp is None:
             raise ValueError("TOA group table needed for SpacecraftObs posvel_gcrs")
 
-        try:
-            # Is there a better way to do this?
-            vx = np.array([flags["vx"] for flags in grp["flags"]])
-            vy = np.array([flags["vy"] for flags in grp["flags"]])
-            vz = np.array([flags["vz"] for flags in grp["flags"]])
-        except:
+        vx, has_vx = grp["flags"].get_values("vx")
+        vy, has_vy = grp["flags"].get_values("vy")
+        vz, has_vz = grp["flags"].get_values("vz")
+        if not (has_vx.all() and has_vy.all() and has_vz.all()):
             log.error(
                 "Missing flag. TOA line should have vx,vy,vz flags for GCRS velocity in km/s."
             )
@@ -264,7 +252,7 @@ class T2SpacecraftObs(SpecialLocation):
                 "Missing flag. TOA line should have vx,vy,vz flags for GCRS velocity in km/s."
             )
 
-        vel_geo = np.vstack((vx, vy, vz)) * (u.km / u.s)
+        vel_geo = np.vstack((vx, vy, vz)).astype(float) * (u.km / u.s)
         vdim = (3,) + t.shape
         if vel_geo.shape != vdim:
             raise ValueError(
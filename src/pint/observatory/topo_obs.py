@@ -13,7 +13,7 @@ from pint import JD_MJD
 from pint.config import datapath
 from pint.erfautils import gcrs_posvel_from_itrf
 from pint.observatory import Observatory, bipm_default
-from pint.observatory.clock_file import ClockFile
+from pint.observatory.clock_chain import ClockSource, load_clock_chain
 from pint.pulsar_mjd import Time
 from pint.solar_system_ephemerides import get_tdb_tt_ephem_geocenter, objPosVel_wrt_SSB
 from pint.utils import has_astropy_unit
@@ -116,7 +116,9 @@ class TopoObs(Observatory):
         self._multiple_clock_files = not isinstance(clock_file, str)
         self.clock_dir = clock_dir
         self.clock_fmt = clock_fmt
-        self._clock = None  # The ClockFile object, will be read on demand
+        # Compiled clock chains, one for each combination of GPS and BIPM
+        # settings, will be read on demand
+        self._clock_chains = {}
 
         # If using TEMPO time.dat we need to know the 1-char tempo-style
         # observatory code.
@@ -125,12 +127,10 @@ class TopoObs(Observatory):
 
         # GPS corrections
         self.include_gps = include_gps
-        self._gps_clock = None
 
         # BIPM corrections
         self.include_bipm = include_bipm
         self.bipm_version = bipm_version
-        self._bipm_clock = None
 
         self.tempo_code = tempo_code
         if aliases is None:
@@ -203,71 +203,56 @@ class TopoObs(Observatory):
     def earth_location_itrf(self, time=None):
         return self._loc_itrf
 
+    def clock_sources(self):
+        """The hops of the clock correction chain of this observatory.
+
+        Returns a list of :class:`~pint.observatory.clock_chain.ClockSource`
+        for the observatory clock files and, depending on the current
+        settings, the GPS and BIPM clock files.
+        """
+        clock_files = (
+            self.clock_fullpath if self._multiple_clock_files else [self.clock_fullpath]
+        )
+        sources = [
+            ClockSource(f, format=self.clock_fmt, obscode=self.tempo_code)
+            for f in clock_files
+        ]
+        if self.include_gps:
+            sources.append(ClockSource(self.gps_fullpath))
+        if self.include_bipm:
+            try:
+                bipm = self.bipm_fullpath
+                os.stat(bipm)
+            except Exception as e:
+                raise ValueError(
+                    f"Can not find TT BIPM file for version '{self.bipm_version}'."
+                ) from e
+            # The file gives TT(BIPM) - TAI; TT(TAI) = TAI + 32.184 s
+            sources.append(ClockSource(bipm, offset=32.184))
+        return sources
+
     def clock_corrections(self, t):
         """Compute the total clock corrections,
 
+        All the hops (observatory clock to UTC, UTC(GPS) to UTC, TT(TAI) to
+        TT(BIPM)) are merged into one compiled clock chain, see
+        :mod:`pint.observatory.clock_chain`.
+
         Parameters
         ----------
         t : astropy.time.Time
             The time when the clock correcions are applied.
         """
-        # Read clock file if necessary
         # TODO provide some method for re-reading the clock file?
-        if self._clock is None:
-            clock_files = (
-                self.clock_fullpath
-                if self._multiple_clock_files
-                else [self.clock_fullpath]
-            )
-            self._clock = []
-            for clock_file in clock_files:
-                log.info(
-                    "Observatory {0}, loading clock file \n\t{1}".format(
-                        self.name, clock_file
-                    )
-                )
-                self._clock.append(
-                    ClockFile.read(
-                        clock_file, format=self.clock_fmt, obscode=self.tempo_code
-                    )
-                )
-        log.info("Applying observatory clock corrections.")
-        corr = self._clock[0].evaluate(t)
-        for clock in self._clock[1:]:
-            corr += clock.evaluate(t)
-
-        if self.include_gps:
-            log.info("Applying GPS to UTC clock correction (~few nanoseconds)")
-            if self._gps_clock is None:
-                log.info(
-                    "Observatory {0}, loading GPS clock file \n\t{1}".format(
-                        self.name, self.gps_fullpath
-                    )
-                )
-                self._gps_clock = ClockFile.read(self.gps_fullpath, format="tempo2")
-            corr += self._gps_clock.evaluate(t)
-
-        if self.include_bipm:
+        key = (self.include_gps, self.include_bipm, self.bipm_version)
+        if key not in self._clock_chains:
             log.info(
-                f"Applying TT(TAI) to TT({self.bipm_version}) clock correction (~27 us)"
+                "Observatory {0}, loading clock chain (include_gps = {1}, "
+                "include_bipm = {2})".format(self.name, *key[:2])
             )
-            tt2tai = 32.184 * 1e6 * u.us
-            if self._bipm_clock is None:
-                try:
-                    log.info(
-                        "Observatory {0}, loading BIPM clock file \n\t{1}".format(
-                            self.name, self.bipm_fullpath
-                        )
-                    )
-                    self._bipm_clock = ClockFile.read(
-                        self.bipm_fullpath, format="tempo2"
-                    )
-                except Exception as e:
-                    raise ValueError(
-                        f"Can not find TT BIPM file for version '{self.bipm_version}'."
-                    ) from e
-            corr += self._bipm_clock.evaluate(t) - tt2tai
-        return corr
+            self._clock_chains[key] = load_clock_chain(self.clock_sources())
+        log.info("Applying observatory clock corrections.")
+        return self._clock_chains[key].evaluate(t) * u.s
 
     def _get_TDB_ephem(self, t, ephem):
         """Read the ephem TDB-TT column.
@@ -7,7 +7,7 @@ import collections
 import numpy as np
 import scipy.linalg
 from scipy.linalg import block_diag
-from scipy.optimize import fsolve, newton
+from scipy.optimize import fsolve
 
 # FIXME: can I import this from somewhere?
 G = 36768.59290949113  # Based on standard gravitational parameter
@@ -43,6 +43,75 @@ def true_from_eccentric(e, eccentric_anomaly):
     return true_anomaly, true_anomaly_de, true_anomaly_prime
 
 
+def _kepler_start(e, mean_anomaly):
+    """Starting guess for the eccentric anomaly, for mean anomaly in [0, pi].
+
+    This is the cubic approximation of Markley (1995, Celestial Mechanics and
+    Dynamical Astronomy 63, 101), which is good to about 1e-3 radians for
+    all eccentricities.
+    """
+    pi = np.arccos(-np.ones_like(mean_anomaly))
+    alpha = (3 * pi ** 2 + 1.6 * pi * (pi - mean_anomaly) / (1 + e)) / (pi ** 2 - 6)
+    d = 3 * (1 - e) + alpha * e
+    q = 2 * alpha * d * (1 - e) - mean_anomaly ** 2
+    r = 3 * alpha * d * (d - 1 + e) * mean_anomaly + mean_anomaly ** 3
+    w = (np.abs(r) + np.sqrt(q ** 3 + r ** 2)) ** (2 / 3)
+    return (2 * r * w / (w ** 2 + w * q + q ** 2) + mean_anomaly) / d
+
+
+def solve_kepler(e, mean_anomaly, maxiter=10):
+    """Solve Kepler's equation, E - e sin(E) = M, for the eccentric anomaly.
+
+    This works on arrays (of float64 or long double, and the result has the
+    precision of the inputs). The mean anomaly is reduced to [-pi, pi], a
+    starting guess is computed in closed form, and Halley's method is applied
+    to the elements that have not yet converged, so each element takes as
+    few iterations (usually two) as it needs.
+
+    Parameters
+    ----------
+    e : array_like
+        the eccentricity, in [0, 1)
+    mean_anomaly : array_like
+        the mean anomaly, in radians
+
+    Returns
+    -------
+    eccentric_anomaly : array_like
+        the eccentric anomaly, in radians
+    """
+    e, mean_anomaly = np.broadcast_arrays(e, mean_anomaly)
+    dtype = np.result_type(e, mean_anomaly, float)
+    e = e.astype(dtype)
+    mean_anomaly = mean_anomaly.astype(dtype)
+    if np.any(e < 0) or np.any(e >= 1):
+        raise ValueError("Eccentricity should be in the range of [0,1).")
+    twopi = 2 * np.arccos(np.array(-1, dtype=dtype))
+    orbits = np.round(mean_anomaly / twopi)
+    ma = mean_anomaly - orbits * twopi
+    # E(-M) = -E(M)
+    sign = np.where(ma < 0, -1, 1).astype(dtype)
+    ma = np.abs(ma)
+    E = _kepler_start(e, ma)
+    tol = 8 * np.finfo(dtype).eps
+    todo = np.arange(E.size)
+    E, e, ma = E.reshape(-1), e.reshape(-1), ma.reshape(-1)
+    for _ in range(maxiter):
+        Et, et = E[todo], e[todo]
+        esin = et * np.sin(Et)
+        f = Et - esin - ma[todo]
+        fp = 1 - et * np.cos(Et)
+        step = f / (fp - f * esin / (2 * fp))
+        E[todo] = Et - step
+        # Halley's method converges cubically, so one step from where the
+        # residual is at the rounding level leaves nothing more to gain.
+        todo = todo[np.abs(f) > tol]
+        if not todo.size:
+            break
+    E = E.reshape(mean_anomaly.shape)
+    return (sign * E + orbits * twopi)[()]
+
+
 def eccentric_from_mean(e, mean_anomaly):
     """Compute the eccentric anomaly from the mean anomaly.
 
@@ -60,11 +129,7 @@ def eccentric_from_mean(e, mean_anomaly):
     derivatives : float
         pair of derivatives with respect to the two inputs
     """
-    eccentric_anomaly = newton(
-        lambda E: E - e * np.sin(E) - mean_anomaly,
-        mean_anomaly,
-        lambda E: 1 - e * np.cos(E),
-    )
+    eccentric_anomaly = solve_kepler(e, mean_anomaly)
     eccentric_anomaly_de = np.sin(eccentric_anomaly) / (
         1 - e * np.cos(eccentric_anomaly)
     )
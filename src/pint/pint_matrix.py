@@ -6,11 +6,13 @@ from itertools import combinations
 import astropy.units as u
 from collections import OrderedDict
 import copy
+import scipy.sparse
 
 
 __all__ = [
     "PintMatrix",
     "DesignMatrix",
+    "ColumnBlockMatrix",
     "CovarianceMatrix",
     "combine_design_matrices_by_quantity",
     "combine_design_matrices_by_param",
@@ -229,6 +231,176 @@ class DesignMatrix(PintMatrix):
         return [lb[0] for lb in param_lb]
 
 
+class ColumnBlockMatrix:
+    """A matrix with some of its columns stored as a sparse matrix.
+
+    Many columns of a design matrix, like those of DMX ranges and JUMPs, are
+    nonzero for only a few TOAs. This keeps those columns in a
+    `scipy.sparse.csc_matrix` and the others in a dense array, and provides
+    the products least-squares fitting needs, computed block by block so that
+    the zeros are skipped. The products are summed in a different order from
+    the dense ones, so they agree with them to rounding rather than exactly;
+    the fitters instead take dense blocks of rows with :meth:`rows`, which
+    reduce exactly as the rows of the dense matrix do.
+
+    Parameters
+    ----------
+    dense : `numpy.ndarray`
+        The dense columns, of shape (number of rows, number of dense columns).
+    dense_columns : array of int
+        The position of each dense column in the matrix.
+    sparse : `scipy.sparse.spmatrix`
+        The sparse columns, of shape (number of rows, number of sparse
+        columns).
+    sparse_columns : array of int
+        The position of each sparse column in the matrix.
+    """
+
+    def __init__(self, dense, dense_columns, sparse, sparse_columns):
+        self.dense = np.asarray(dense, dtype=float)
+        self.dense_columns = np.asarray(dense_columns, dtype=int)
+        self.sparse = scipy.sparse.csc_matrix(sparse, dtype=float)
+        self.sparse.sort_indices()
+        self.sparse_columns = np.asarray(sparse_columns, dtype=int)
+        nrows = self.dense.shape[0]
+        ncols = len(self.dense_columns) + len(self.sparse_columns)
+        if (
+            self.dense.shape != (nrows, len(self.dense_columns))
+            or self.sparse.shape != (nrows, len(self.sparse_columns))
+            or not np.array_equal(
+                np.sort(np.concatenate((self.dense_columns, self.sparse_columns))),
+                np.arange(ncols),
+            )
+        ):
+            raise ValueError("The dense and sparse blocks do not fit together.")
+        self.shape = (nrows, ncols)
+
+    def _with_blocks(self, dense, sparse):
+        return ColumnBlockMatrix(dense, self.dense_columns, sparse, self.sparse_columns)
+
+    def _entry_columns(self):
+        """The sparse column of each stored entry of the sparse block."""
+        return np.repeat(np.arange(self.sparse.shape[1]), np.diff(self.sparse.indptr))
+
+    @property
+    def nnz(self):
+        """The number of entries stored, dense or not."""
+        return self.dense.size + self.sparse.nnz
+
+    def toarray(self):
+        """Return the matrix as a dense array."""
+        M = np.zeros(self.shape)
+        M[:, self.dense_columns] = self.dense
+        rows = self.sparse.indices
+        M[rows, self.sparse_columns[self._entry_columns()]] = self.sparse.data
+        return M
+
+    def _sparse_with_data(self, data):
+        """The sparse block with the same structure and different values."""
+        return scipy.sparse.csc_matrix(
+            (data, self.sparse.indices, self.sparse.indptr), shape=self.sparse.shape
+        )
+
+    def columns(self, start, stop):
+        """Return the columns start to stop as a dense array."""
+        M = np.zeros((self.shape[0], stop - start))
+        dense = (self.dense_columns >= start) & (self.dense_columns < stop)
+        M[:, self.dense_columns[dense] - start] = self.dense[:, dense]
+        sparse = (self.sparse_columns >= start) & (self.sparse_columns < stop)
+        if np.any(sparse):
+            M[:, self.sparse_columns[sparse] - start] = self.sparse[:, sparse].toarray()
+        return M
+
+    def rows(self, start, stop):
+        """Return the rows start to stop as a dense array."""
+        dense = self.dense[start:stop]
+        M = np.zeros((dense.shape[0], self.shape[1]))
+        M[:, self.dense_columns] = dense
+        M[:, self.sparse_columns] = self.sparse[start:stop].toarray()
+        return M
+
+    def multiply_rows(self, weights):
+        """Return the matrix with each row multiplied by its weight."""
+        return self._with_blocks(
+            weights[:, None] * self.dense,
+            self._sparse_with_data(weights[self.sparse.indices] * self.sparse.data),
+        )
+
+    def divide_rows(self, divisors):
+        """Return the matrix with each row divided by its divisor."""
+        return self._with_blocks(
+            self.dense / divisors[:, None],
+            self._sparse_with_data(self.sparse.data / divisors[self.sparse.indices]),
+        )
+
+    def divide_columns(self, divisors):
+        """Divide each column by its divisor, in place."""
+        self.dense /= divisors[self.dense_columns]
+        self.sparse.data /= divisors[self.sparse_columns][self._entry_columns()]
+
+    def sum_squares(self):
+        """Return the sum of the squares of each column."""
+        result = np.zeros(self.shape[1])
+        result[self.dense_columns] = np.sum(self.dense ** 2, axis=0)
+        result[self.sparse_columns] = np.bincount(
+            self._entry_columns(),
+            weights=self.sparse.data ** 2,
+            minlength=self.sparse.shape[1],
+        )
+        return result
+
+    def append_dense(self, columns):
+        """Return the matrix with dense columns added at the end."""
+        columns = np.asarray(columns, dtype=float)
+        return ColumnBlockMatrix(
+            np.hstack((self.dense, columns)),
+            np.concatenate(
+                (
+                    self.dense_columns,
+                    np.arange(self.shape[1], self.shape[1] + columns.shape[1]),
+                )
+            ),
+            self.sparse,
+            self.sparse_columns,
+        )
+
+    def premultiply(self, A):
+        """Return A @ M, for a dense or sparse matrix A, as a ColumnBlockMatrix."""
+        return self._with_blocks(A @ self.dense, A @ self.sparse)
+
+    def dot(self, x):
+        """Return M @ x for a vector x."""
+        return self.dense @ x[self.dense_columns] + self.sparse @ x[self.sparse_columns]
+
+    def rdot(self, y):
+        """Return M.T @ y for a vector y."""
+        result = np.zeros(self.shape[1])
+        result[self.dense_columns] = self.dense.T @ y
+        result[self.sparse_columns] = self.sparse.T @ y
+        return result
+
+    def gram(self, weights=None):
+        """Return M.T @ W @ M for a diagonal matrix W of weights.
+
+        The weights default to ones. The result is a dense array.
+        """
+        if weights is None:
+            wdense, wsparse = self.dense, self.sparse
+        else:
+            wdense = weights[:, None] * self.dense
+            wsparse = self._sparse_with_data(
+                weights[self.sparse.indices] * self.sparse.data
+            )
+        dc, sc = self.dense_columns, self.sparse_columns
+        result = np.zeros((self.shape[1], self.shape[1]))
+        result[np.ix_(dc, dc)] = self.dense.T @ wdense
+        cross = self.sparse.T @ wdense
+        result[np.ix_(sc, dc)] = cross
+        result[np.ix_(dc, sc)] = cross.T
+        result[np.ix_(sc, sc)] = (self.sparse.T @ wsparse).toarray()
+        return result
+
+
 class DesignMatrixMaker:
     """Class for pint design matrix maker class.
 
@@ -3,6 +3,8 @@ import os
 import tempfile
 
 import astropy.time
+import astropy.units as u
+import numpy as np
 import tkinter as tk
 import tkinter.filedialog as tkFileDialog
 import tkinter.messagebox as tkMessageBox
@@ -121,16 +123,21 @@ class TimWidget(tk.Frame):
             pnChange = True
             for i in range(len(toas.table["flags"])):
                 toas.table["flags"][i]["pn"] = toas.table["pn"][i]
-        for time, err, freq, obs, flags in zip(
+        if "clkcorr" in toas.table.colnames:
+            clkcorrs = toas.table["clkcorr"].quantity
+        else:
+            clkcorrs = np.zeros(toas.ntoas) * u.s
+        for time, err, freq, obs, flags, clkcorr in zip(
             toas.table["mjd"],
             toas.table["error"].quantity,
             toas.table["freq"].quantity,
             toas.table["obs"],
             toas.table["flags"],
+            clkcorrs,
         ):
             obs_obj = pint.observatory.Observatory.get(obs)
-            if "clkcorr" in flags.keys():
-                time_out = time - astropy.time.TimeDelta(flags["clkcorr"])
+            if clkcorr != 0:
+                time_out = time - astropy.time.TimeDelta(clkcorr)
             else:
                 time_out = time
             asfile += pint.toa.format_toa_line(
@@ -10,6 +10,7 @@ import numpy as np
 from astropy.io import registry
 from astropy.time import Time
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 
 import pint.toa as toa
 from pint.phase import Phase
@@ -365,7 +366,7 @@ def tempo_polyco_table_writer(polycoTable, filename="polyco.dat"):
             bin_phase,
         )
 
-        coeffs = entry.coeffs
+        coeffs = entry.coeffs.copy()
         coeffs[0] += excess
 
         coeff_block = ""
@@ -379,6 +380,56 @@ def tempo_polyco_table_writer(polycoTable, filename="polyco.dat"):
     f.close()
 
 
+def _fit_polycos(model, tmids, segLength, ncoeff, obs, obsFreq, numNodes):
+    """Fit the polyco coefficients for segments centred on tmids.
+
+    The model phase is computed for the midpoints and the nodes of all the
+    segments at once, and since every segment has its nodes at the same
+    offsets from its midpoint the fits share one design matrix.
+
+    Returns
+    -------
+    refPhase : Phase
+        The model phase at each midpoint.
+    coeffs : numpy.ndarray
+        The coefficients, one row per segment.
+    binphase : numpy.ndarray or None
+        The orbital phase at each midpoint, if the model is binary.
+    """
+    nseg = len(tmids)
+    mjdSpan = data2longdouble(segLength / MIN_PER_DAY)
+    offsets = np.linspace(-mjdSpan / 2, mjdSpan / 2, numNodes)
+    nodes = tmids[:, np.newaxis] + offsets
+    toas = toa.get_TOAs_array(
+        np.concatenate((tmids, nodes.ravel())), obs=obs, freqs=obsFreq
+    )
+    # The table is grouped by observatory, which keeps the order of the
+    # times for a single observatory; the index column says where they are.
+    order = np.argsort(toas.table["index"])
+    ph = model.phase(toas)
+    phint, phfrac = ph.int[order], ph.frac[order]
+    refPhase = Phase(phint[:nseg], phfrac[:nseg])
+    # Subtract the midpoint phase from the phases at its nodes
+    rdcPhase = Phase(phint[nseg:], phfrac[nseg:]) - Phase(
+        np.repeat(refPhase.int, numNodes), np.repeat(refPhase.frac, numNodes)
+    )
+    dt = offsets * MIN_PER_DAY
+    rdcPhase = (
+        rdcPhase.int.value.reshape(nseg, numNodes)
+        - dt * model.F0.value * 60.0
+        + rdcPhase.frac.value.reshape(nseg, numNodes)
+    )
+    dtd = dt.astype(float)  # Truncate to double
+    rdcPhased = rdcPhase.astype(float)
+    # With a 2-d y, polyfit does one least-squares solve for every segment
+    coeffs = np.polyfit(dtd, rdcPhased.T, ncoeff - 1)[::-1].T
+
+    binphase = None
+    if model.is_binary:
+        binphase = model.orbital_phase(toas[order[:nseg]], radians=False)
+    return refPhase, coeffs, binphase
+
+
 class Polycos:
     """A class for polycos model.
 
@@ -489,6 +540,7 @@ class Polycos:
         maxha=12.0,
         method="TEMPO",
         numNodes=20,
+        ncpu=1,
     ):
         """
         Generate the polyco data.
@@ -527,6 +579,9 @@ class Polycos:
             Number of nodes for fitting. It cannot be less then the number of
             coefficents.
 
+        ncpu : int optional. Default 1
+            Number of processes to divide the segments between.
+
         Return
         ---------
         A polyco table.
@@ -543,7 +598,6 @@ class Polycos:
         if numNodes < ncoeff:
             numNodes = ncoeff + 1
 
-        mjdSpan = data2longdouble(segLength / MIN_PER_DAY)
         # Generate "nice" MJDs for consistency with what tempo2 does
         tmids = np.arange(
             int(mjdStart * 24) * 60, int(mjdEnd * 24) * 60 + segLength, segLength
@@ -552,44 +606,32 @@ class Polycos:
 
         # generate the ploynomial coefficents
         if method == "TEMPO":
-            entryList = []
             # Using tempo1 method to create polycos
-            for tmid in tmids:
-                tStart = tmid - mjdSpan / 2
-                tStop = tmid + mjdSpan / 2
-                nodes = np.linspace(tStart, tStop, numNodes)
-
-                toaMid = toa.get_TOAs_list(
-                    [
-                        toa.TOA(
-                            (np.modf(tmid)[1], np.modf(tmid)[0]), obs=obs, freq=obsFreq
-                        )
-                    ]
-                )
-
-                refPhase = model.phase(toaMid)
-
-                # Create node toas(Time sample using TOA class)
-                toaList = [
-                    toa.TOA(
-                        (np.modf(toaNode)[1], np.modf(toaNode)[0]),
-                        obs=obs,
-                        freq=obsFreq,
-                    )
-                    for toaNode in nodes
+            if ncpu > 1 and len(tmids) > 1:
+                blocks = np.array_split(tmids, min(ncpu, len(tmids)))
+                args = [
+                    (model, b, segLength, ncoeff, obs, obsFreq, numNodes)
+                    for b in blocks
                 ]
+                with ProcessPoolExecutor(max_workers=len(blocks)) as executor:
+                    results = list(executor.map(_fit_polycos, *zip(*args)))
+                refPhase = Phase(
+                    np.concatenate([r[0].int for r in results]),
+                    np.concatenate([r[0].frac for r in results]),
+                )
+                coeffs = np.concatenate([r[1] for r in results])
+                binphase = None
+                if model.is_binary:
+                    binphase = np.concatenate([r[2] for r in results])
+            else:
+                refPhase, coeffs, binphase = _fit_polycos(
+                    model, tmids, segLength, ncoeff, obs, obsFreq, numNodes
+                )
 
-                toas = toa.get_TOAs_list(toaList)
-
-                ph = model.phase(toas)
-                dt = (nodes - tmid) * MIN_PER_DAY
-                rdcPhase = ph - refPhase
-                rdcPhase = rdcPhase.int - (dt * model.F0.value * 60.0) + rdcPhase.frac
-                dtd = dt.astype(float)  # Truncate to double
-                rdcPhased = rdcPhase.astype(float)
-                coeffs = np.polyfit(dtd, rdcPhased, ncoeff - 1)[::-1]
-
-                date, hms = Time(tmid, format="mjd", scale="utc").iso.split()
+            dates = Time(tmids, format="mjd", scale="utc").iso
+            entryList = []
+            for i, tmid in enumerate(tmids):
+                date, hms = dates[i].split()
                 yy, mm, dd = date.split("-")
                 date = dd + "-" + MONTHS[int(mm) - 1] + "-" + yy[-2:]
                 hms = float(hms.replace(":", ""))
@@ -597,11 +639,11 @@ class Polycos:
                 entry = PolycoEntry(
                     tmid,
                     segLength,
-                    refPhase.int,
-                    refPhase.frac,
+                    refPhase.int[i],
+                    refPhase.frac[i],
                     model.F0.value,
                     ncoeff,
-                    coeffs,
+                    coeffs[i],
                 )
 
                 entry_dict = OrderedDict()
@@ -619,8 +661,7 @@ class Polycos:
                 entry_dict["obsfreq"] = obsFreq
 
                 if model.is_binary:
-                    binphase = model.orbital_phase(toaMid, radians=False)[0]
-                    entry_dict["binary_phase"] = binphase
+                    entry_dict["binary_phase"] = binphase[i]
                     b = model.get_components_by_category()["pulsar_system"][0]
                     entry_dict["f_orbit"] = 1 / b.PB.value
 
@@ -686,19 +727,56 @@ class Polycos:
 
         self.polycoTable.write(filename, format=format)
 
+    @property
+    def polycoTable(self):
+        return self._polycoTable
+
+    @polycoTable.setter
+    def polycoTable(self, value):
+        self._polycoTable = value
+        self._arrays = None
+
+    def _entry_arrays(self):
+        """The polyco entries as arrays, one row per entry.
+
+        These are built from the table the first time they are needed:
+        ``tstart``, ``tstop``, ``tmid`` and ``f0`` are long double arrays,
+        ``rphase`` is a Phase and ``coeffs`` is a long double array of shape
+        (number of entries, largest number of coefficients), with missing
+        coefficients set to zero.
+        """
+        if self.polycoTable is None:
+            raise ValueError("polycoTable not set!")
+        if self._arrays is None:
+            entries = self.polycoTable["entry"]
+            ncoeff = max(e.ncoeff for e in entries)
+            coeffs = np.zeros((len(entries), ncoeff), dtype=np.longdouble)
+            for i, e in enumerate(entries):
+                coeffs[i, : e.ncoeff] = e.coeffs[: e.ncoeff]
+            self._arrays = dict(
+                tstart=np.array([e.tstart.value for e in entries]),
+                tstop=np.array([e.tstop.value for e in entries]),
+                tmid=np.array([e.tmid.value for e in entries]),
+                f0=np.array([e.f0 for e in entries]),
+                rphase=Phase(
+                    np.array([e.rphase.int.value[0] for e in entries]),
+                    np.array([e.rphase.frac.value[0] for e in entries]),
+                ),
+                coeffs=coeffs,
+            )
+        return self._arrays
+
     def find_entry(self, t):
         """Find the right entry for the input time."""
         if not isinstance(t, (np.ndarray, list)):
             t = np.array([t])
 
         # Check if polyco table exists
-        if self.polycoTable is None:
-            raise ValueError("polycoTable not set!")
-        t_start = self.polycoTable["t_start"]
-        t_stop = self.polycoTable["t_stop"]
+        a = self._entry_arrays()
+        t = data2longdouble(t)
 
-        start_idx = np.searchsorted(t_start, t) - 1
-        stop_idx = np.searchsorted(t_stop, t)
+        start_idx = np.searchsorted(a["tstart"], t) - 1
+        stop_idx = np.searchsorted(a["tstop"], t)
 
         if not np.allclose(start_idx, stop_idx):
             raise ValueError("Some input times not covered by Polyco entries.")
@@ -713,10 +791,13 @@ class Polycos:
         """
         Polyco evaluate absolute phase for a time array.
 
+        All the times are evaluated together, each with its own entry's
+        coefficients, so they need not be in order.
+
         Parameters
         ---------
         t: numpy.ndarray or a single number.
-           An time array in MJD. Time sample should be in order
+           An time array in MJD.
 
         Returns
         ---------
@@ -729,24 +810,22 @@ class Polycos:
             t = np.array([t])
 
         entryIndex = self.find_entry(t)
-        phaseInt = ()
-        phaseFrac = ()
-        # Compute phase for time in each entry
-        for i in range(len(self.polycoTable)):
-            mask = np.where(entryIndex == i)  # Build mask for time in each entry
-            t_in_entry = t[mask]
-            if len(t_in_entry) == 0:
-                continue
-            # Calculate the phase as an array
-            absp = self.polycoTable["entry"][i].evalabsphase(t_in_entry)
-            phaseInt += (absp.int,)
-            phaseFrac += (absp.frac,)
-            # Maybe add sort function here, since the time has been masked.
-        phaseInt = np.hstack(phaseInt).value
-        phaseFrac = np.hstack(phaseFrac).value
-        absPhase = Phase(phaseInt, phaseFrac)
-
-        return absPhase
+        a = self._entry_arrays()
+        coeffs = a["coeffs"]
+        dt = (data2longdouble(t) - a["tmid"][entryIndex]) * MIN_PER_DAY
+        # Horner's method, keeping the integer and fractional parts of the
+        # phase separate as in PolycoEntry.evalabsphase
+        phase = Phase(coeffs[entryIndex, -1])
+        for i in range(coeffs.shape[1] - 2, -1, -1):
+            pI = Phase(dt * phase.int)
+            pF = Phase(dt * phase.frac)
+            c = Phase(coeffs[entryIndex, i])
+            phase = pI + pF + c
+
+        # Add DC term
+        rphase = Phase(a["rphase"].int[entryIndex], a["rphase"].frac[entryIndex])
+        phase += rphase + Phase(dt * 60.0 * a["f0"][entryIndex])
+        return phase
 
     def eval_spin_freq(self, t):
         """
@@ -755,7 +834,7 @@ class Polycos:
         Parameters
         ---------
         t: numpy.ndarray or a single number.
-           An time array in MJD. Time sample should be in order
+           An time array in MJD.
 
         Returns
         ---------
@@ -768,21 +847,14 @@ class Polycos:
             t = np.array([t])
 
         entryIndex = self.find_entry(t)
-        poly_result = data2longdouble(np.zeros(len(t)))
-
-        dt = (data2longdouble(t) - self.polycoTable[entryIndex]["tmid"]) * MIN_PER_DAY
-
-        for ii, (tt, eidx) in enumerate(zip(dt, entryIndex)):
-            coeffs = self.polycoTable["entry"][eidx].coeffs
-            coeffs = data2longdouble(range(len(coeffs))) * coeffs
-            coeffs = coeffs[::-1][:-1]
-            poly_result[ii] = np.polyval(coeffs, tt)
-        spinFreq = np.array(
-            [
-                self.polycoTable["entry"][eidx].f0
-                + poly_result[ii] / data2longdouble(60.0)
-                for ii, eidx in zip(range(len(t)), entryIndex)
-            ]
-        )
+        a = self._entry_arrays()
+        coeffs = a["coeffs"]
+        dt = (data2longdouble(t) - a["tmid"][entryIndex]) * MIN_PER_DAY
+
+        # Horner's method for the derivative of the polynomial
+        poly_result = np.zeros(len(dt), dtype=np.longdouble)
+        for i in range(coeffs.shape[1] - 1, 0, -1):
+            poly_result = poly_result * dt + i * coeffs[entryIndex, i]
+        spinFreq = a["f0"][entryIndex] + poly_result / data2longdouble(60.0)
 
         return spinFreq
@@ -11,8 +11,7 @@ import pint.models
 import pint.residuals
 import pint.toa as toa
 from pint.eventstats import h2sig, hmw
-from pint.fermi_toas import load_Fermi_TOAs
-from pint.fits_utils import read_fits_event_mjds_tuples
+from pint.fermi_toas import iter_Fermi_TOAs
 from pint.observatory.satellite_obs import get_satellite_observatory
 from pint.plot_utils import phaseogram
 from pint.pulsar_mjd import Time
@@ -65,6 +64,12 @@ def main(argv=None):
     parser.add_argument(
         "--ephem", help="Planetary ephemeris to use (default=DE421)", default="DE421"
     )
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=100000,
+        help="Number of events to process at a time (default=100000)",
+    )
     args = parser.parse_args(argv)
 
     # If outfile is specified, that implies addphase
@@ -86,38 +91,46 @@ def main(argv=None):
         # Instantiate Fermi observatory once so it gets added to the observatory registry
         get_satellite_observatory("Fermi", args.ft2)
 
-    # Read event file and return list of TOA objects
+    # Read the event file a chunk at a time, computing TDBs, posvels and
+    # phases for each chunk of TOAs
     maxmjd = np.inf if (args.maxMJD is None) else float(args.maxMJD)
     minmjd = 0.0 if (args.minMJD is None) else float(args.minMJD)
-    tl = load_Fermi_TOAs(
+    # For Fermi, we are not including GPS or TT(BIPM) corrections
+    chunks = iter_Fermi_TOAs(
         args.eventfile,
         maxmjd=maxmjd,
         minmjd=minmjd,
         weightcolumn=args.weightcol,
         targetcoord=tc,
-    )
-
-    # Now convert to TOAs object and compute TDBs and posvels
-    # For Fermi, we are not including GPS or TT(BIPM) corrections
-    ts = toa.get_TOAs_list(
-        tl,
+        chunksize=args.chunksize,
         include_gps=False,
         include_bipm=False,
         planets=args.planets,
         ephem=args.ephem,
     )
-    ts.filename = args.eventfile
-
-    print(ts.get_summary())
-    mjds = ts.get_mjds()
+    rows, mjds, phases, weights = [], [], [], []
+    for nchunks, (r, ts) in enumerate(chunks, start=1):
+        rows.append(r)
+        mjds.append(ts.get_mjds().value)
+        # Compute model phase for each TOA
+        iphss, phss = modelin.phase(ts, abs_phase=True)
+        phases.append(phss.value % 1)
+        weights.append(ts.table["flags"].get_values("weight")[0])
+    if len(rows) == 0:
+        log.error("No TOAs, exiting!")
+        return 1
+
+    rows = np.concatenate(rows)
+    mjds = np.concatenate(mjds) * u.d
+    phases = np.concatenate(phases)
+    weights = np.concatenate(weights)
+    print(
+        "{0} TOAs in {1} chunks of {2} events".format(
+            len(rows), nchunks, args.chunksize
+        )
+    )
     print(mjds.min(), mjds.max())
 
-    # Compute model phase for each TOA
-    iphss, phss = modelin.phase(ts, abs_phase=True)
-    phss %= 1
-    phases = phss.value
-    mjds = ts.get_mjds()
-    weights = np.array([w["weight"] for w in ts.table["flags"]])
     h = float(hmw(phases, weights))
     print("Htest : {0:.2f} ({1:.2f} sigma)".format(h, h2sig(h)))
     if args.plot:
@@ -134,11 +147,9 @@ def main(argv=None):
         event_hdu = hdulist[1]
         event_hdr = event_hdu.header
         event_dat = event_hdu.data
-        event_mjds = read_fits_event_mjds_tuples(event_hdu)
-        mjds_float = np.asarray([r[0] + r[1] for r in event_mjds])
-        time_mask = np.logical_and((mjds_float > minmjd), (mjds_float < maxmjd))
+        # Only the events between minMJD and maxMJD, in rows, have phases
         new_phases = np.full(len(event_dat), -1, dtype=float)
-        new_phases[time_mask] = phases
+        new_phases[rows] = phases
 
         if "PULSE_PHASE" in event_hdu.columns.names:
             log.info("Found existing PULSE_PHASE column, overwriting...")
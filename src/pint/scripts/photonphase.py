@@ -9,14 +9,8 @@ from astropy import log
 import pint.models
 import pint.residuals
 import pint.toa as toa
-from pint.event_toas import (
-    load_NICER_TOAs,
-    load_NuSTAR_TOAs,
-    load_RXTE_TOAs,
-    load_XMM_TOAs,
-)
+from pint.event_toas import iter_event_TOAs
 from pint.eventstats import h2sig, hm
-from pint.fits_utils import read_fits_event_mjds
 from pint.observatory.satellite_obs import get_satellite_observatory
 from pint.plot_utils import phaseogram_binned
 from pint.pulsar_mjd import Time
@@ -97,6 +91,12 @@ def main(argv=None):
         action="store_true",
         help="Use TT(BIPM) instead of TT(TAI)",
     )
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=100000,
+        help="Number of events to process at a time (default=100000)",
+    )
     #    parser.add_argument("--fix",help="Apply 1.0 second offset for NICER", action='store_true', default=False)
     args = parser.parse_args(argv)
 
@@ -127,14 +127,7 @@ def main(argv=None):
         if args.orbfile is not None:
             log.info("Setting up NICER observatory")
             get_satellite_observatory("NICER", args.orbfile)
-        # Read event file and return list of TOA objects
-        try:
-            tl = load_NICER_TOAs(args.eventfile, minmjd=minmjd, maxmjd=maxmjd)
-        except KeyError:
-            log.error(
-                "Observatory not recognized.  This probably means you need to provide an orbit file or barycenter the event file."
-            )
-            sys.exit(1)
+        mission = "nicer"
     elif hdr["TELESCOP"] == "XTE":
 
         # Instantiate RXTE observatory once so it gets added to the observatory registry
@@ -142,16 +135,15 @@ def main(argv=None):
             # Determine what observatory type is.
             log.info("Setting up RXTE observatory")
             get_satellite_observatory("RXTE", args.orbfile)
-        # Read event file and return list of TOA objects
-        tl = load_RXTE_TOAs(args.eventfile, minmjd=minmjd, maxmjd=maxmjd)
+        mission = "rxte"
     elif hdr["TELESCOP"].startswith("XMM"):
         # Not loading orbit file here, since that is not yet supported.
-        tl = load_XMM_TOAs(args.eventfile, minmjd=minmjd, maxmjd=maxmjd)
+        mission = "xmm"
     elif hdr["TELESCOP"].lower().startswith("nustar"):
         if args.orbfile is not None:
             log.info("Setting up NuSTAR observatory")
             get_satellite_observatory("NuSTAR", args.orbfile)
-        tl = load_NuSTAR_TOAs(args.eventfile, minmjd=minmjd, maxmjd=maxmjd)
+        mission = "nustar"
     else:
         log.error(
             "FITS file not recognized, TELESCOPE = {0}, INSTRUMENT = {1}".format(
@@ -160,11 +152,6 @@ def main(argv=None):
         )
         sys.exit(1)
 
-    # Now convert to TOAs object and compute TDBs and posvels
-    if len(tl) == 0:
-        log.error("No TOAs, exiting!")
-        sys.exit(0)
-
     # Read in model
     modelin = pint.models.get_model(args.parfile)
     use_planets = False
@@ -186,39 +173,67 @@ def main(argv=None):
         )
         raise ValueError("Model missing BINARY component.")
 
-    ts = toa.get_TOAs_list(
-        tl,
-        ephem=args.ephem,
-        include_bipm=args.use_bipm,
-        include_gps=args.use_gps,
-        planets=use_planets,
-        tdb_method=args.tdbmethod,
-    )
-    ts.filename = args.eventfile
-    #    if args.fix:
-    #        ts.adjust_TOAs(TimeDelta(np.ones(len(ts.table))*-1.0*u.s,scale='tt'))
+    # Read the event file a chunk at a time, computing TDBs, posvels and
+    # phases for each chunk of TOAs
+    try:
+        chunks = iter_event_TOAs(
+            args.eventfile,
+            mission,
+            minmjd=minmjd,
+            maxmjd=maxmjd,
+            chunksize=args.chunksize,
+            ephem=args.ephem,
+            include_bipm=args.use_bipm,
+            include_gps=args.use_gps,
+            planets=use_planets,
+            tdb_method=args.tdbmethod,
+        )
+    except KeyError:
+        log.error(
+            "Observatory not recognized.  This probably means you need to provide an orbit file or barycenter the event file."
+        )
+        sys.exit(1)
+
+    rows, mjds, iphss, phases, orbphases, bats = [], [], [], [], [], []
+    for nchunks, (r, ts) in enumerate(chunks, start=1):
+        rows.append(r)
+        mjds.append(ts.get_mjds().value)
+        # Compute model phase for each TOA
+        iphs, phs = modelin.phase(ts, abs_phase=True)
+        # The fractional phases are in [-0.5, 0.5); the integral part of
+        # the pulse phase goes with the fractional phase wrapped into [0, 1).
+        iphss.append(iphs.value.astype(np.int64) + np.floor(phs.value).astype(np.int64))
+        phases.append(phs.value % 1)
+        # Compute orbital phases for each photon TOA
+        if args.addorbphase:
+            delay = modelin.delay(ts)
+            orbits = modelin.binary_instance.orbits()
+            # These lines are already in orbits.orbit_phase() in binary_orbits.py.
+            # What is the correct syntax is to call this function here?
+            norbits = np.array(np.floor(orbits), dtype=np.long)
+            orbphases.append(orbits - norbits)  # fractional phase
+        if args.barytime:
+            bats.append(modelin.get_barycentric_toas(ts).value)
+
+    if len(rows) == 0:
+        log.error("No TOAs, exiting!")
+        sys.exit(0)
 
-    print(ts.get_summary())
-    mjds = ts.get_mjds()
+    rows = np.concatenate(rows)
+    mjds = np.concatenate(mjds) * u.d
+    phases = np.concatenate(phases)
+    print(
+        "{0} TOAs in {1} chunks of {2} events".format(
+            len(rows), nchunks, args.chunksize
+        )
+    )
     print(mjds.min(), mjds.max())
 
-    # Compute model phase for each TOA
-    iphss, phss = modelin.phase(ts, abs_phase=True)
-    phases = phss.value % 1
     h = float(hm(phases))
     print("Htest : {0:.2f} ({1:.2f} sigma)".format(h, h2sig(h)))
     if args.plot:
         phaseogram_binned(mjds, phases, bins=100, plotfile=args.plotfile)
 
-    # Compute orbital phases for each photon TOA
-    if args.addorbphase:
-        delay = modelin.delay(ts)
-        orbits = modelin.binary_instance.orbits()
-        # These lines are already in orbits.orbit_phase() in binary_orbits.py.
-        # What is the correct syntax is to call this function here?
-        norbits = np.array(np.floor(orbits), dtype=np.long)
-        orbphases = orbits - norbits  # fractional phase
-
     if args.addphase or args.addorbphase:
         # Read input FITS file (again).
         # If overwriting, open in 'update' mode
@@ -230,46 +245,31 @@ def main(argv=None):
         datacol = []
         data_to_add = {}
 
-        # Handle case where minMJD/maxMJD do not exceed length of events
-        mjds_float = read_fits_event_mjds(hdulist[1])
-        time_mask = np.logical_and((mjds_float > minmjd), (mjds_float < maxmjd))
+        # Only the events between minMJD and maxMJD, in rows, have TOAs
+        nrows = len(hdulist[1].data)
 
         if args.addphase:
-            if time_mask.sum() != len(phases):
-                raise RuntimeError(
-                    "Mismatch between data selection {0} and length of phase array ({1})!".format(
-                        time_mask.sum(), len(phases)
-                    )
-                )
             data_to_add["PULSE_PHASE"] = [phases, "D"]
 
         if args.absphase:
-            data_to_add["ABS_PHASE"] = [iphss - negmask, "K"]
+            data_to_add["ABS_PHASE"] = [np.concatenate(iphss), "K"]
 
         if args.barytime:
-            bats = modelin.get_barycentric_toas(ts)
-            data_to_add["BARY_TIME"] = [bats, "D"]
+            data_to_add["BARY_TIME"] = [np.concatenate(bats), "D"]
 
         if args.addorbphase:
-            if time_mask.sum() != len(orbphases):
-                raise RuntimeError(
-                    "Mismatch between data selection ({0}) and length of orbital phase array ({1})!".format(
-                        time_mask.sum(), len(orbphases)
-                    )
-                )
-            data_to_add["ORBIT_PHASE"] = [orbphases, "D"]
-        # End if args.addorbphase
+            data_to_add["ORBIT_PHASE"] = [np.concatenate(orbphases), "D"]
 
         for key in data_to_add.keys():
             if key in hdulist[1].columns.names:
                 log.info("Found existing %s column, overwriting..." % key)
                 # Overwrite values in existing Column
-                hdulist[1].data[key][time_mask] = data_to_add[key][0]
+                hdulist[1].data[key][rows] = data_to_add[key][0]
             else:
                 # Construct and append new column, preserving HDU header and name
                 log.info("Adding new %s column." % key)
-                new_dat = np.full(time_mask.shape, -1, dtype=data_to_add[key][0].dtype)
-                new_dat[time_mask] = data_to_add[key][0]
+                new_dat = np.full(nrows, -1, dtype=data_to_add[key][0].dtype)
+                new_dat[rows] = data_to_add[key][0]
                 datacol.append(
                     pyfits.ColDefs(
                         [
@@ -5,12 +5,49 @@ import astropy.units as u
 import numpy as np
 from astropy import log
 from astropy.utils.data import download_file
+from jplephem.spk import S_PER_DAY, T0
 from urllib.parse import urljoin
 
 from pint.config import datapath
 from pint.utils import PosVel
 
-__all__ = ["objPosVel_wrt_SSB", "get_tdb_tt_ephem_geocenter"]
+# These are private to astropy; the fallbacks are copies of the versions the
+# SPK engine was checked against, so that its results match astropy's
+# get_body_barycentric_posvel bitwise.
+try:
+    from astropy.coordinates.builtin_frames.utils import get_jd12
+except ImportError:
+
+    def get_jd12(time, scale):
+        """The two-part Julian dates of time in the given scale."""
+        newtime = time if time.scale == scale else getattr(time, scale)
+        return newtime.jd1, newtime.jd2
+
+
+try:
+    from astropy.coordinates.solar_system import BODY_NAME_TO_KERNEL_SPEC
+except ImportError:
+    BODY_NAME_TO_KERNEL_SPEC = {
+        "sun": [(0, 10)],
+        "mercury": [(0, 1), (1, 199)],
+        "venus": [(0, 2), (2, 299)],
+        "earth-moon-barycenter": [(0, 3)],
+        "earth": [(0, 3), (3, 399)],
+        "moon": [(0, 3), (3, 301)],
+        "mars": [(0, 4)],
+        "jupiter": [(0, 5)],
+        "saturn": [(0, 6)],
+        "uranus": [(0, 7)],
+        "neptune": [(0, 8)],
+        "pluto": [(0, 9)],
+    }
+
+__all__ = [
+    "objPosVel_wrt_SSB",
+    "objPosVels_wrt_SSB",
+    "SPKEphemeris",
+    "get_tdb_tt_ephem_geocenter",
+]
 
 ephemeris_mirrors = [
     # NOTE the JPL ftp site is disabled for our automatic builds. Instead,
@@ -194,10 +231,269 @@ def load_kernel(ephem, path=None, link=None):
     _load_kernel_link(ephem, link=link)
 
 
-def objPosVel_wrt_SSB(objname, t, ephem, path=None, link=None):
+# Number of times to evaluate together; small enough for the intermediate
+# arrays of the Chebyshev recurrence to stay in the processor cache
+block_size = 4096
+
+
+class _ChebyshevSegment:
+    """The Chebyshev coefficient records of one type 2 or 3 SPK segment.
+
+    Records are decoded from the memory-mapped file the first time a time
+    falls in their interval and kept in memory, laid out as jplephem
+    evaluates them: by coefficient from the highest degree down, then by
+    component, then by record.
+    """
+
+    def __init__(self, segment):
+        if segment.data_type == 2:
+            self.components = 3
+        elif segment.data_type == 3:
+            self.components = 6
+        else:
+            raise ValueError(
+                "Cannot evaluate SPK segments of data type {}".format(segment.data_type)
+            )
+        self.data_type = segment.data_type
+        init, intlen, rsize, n = segment.daf.read_array(
+            segment.end_i - 3, segment.end_i
+        )
+        self.init = init
+        self.intlen = intlen
+        self.rsize = int(rsize)
+        self.n = int(n)
+        self.ncoef = (self.rsize - 2) // self.components
+        self.coefficients = np.empty((self.ncoef, self.components, self.n))
+        self.decoded = np.zeros(self.n, dtype=bool)
+
+    def decode(self, segment, index):
+        """Make sure the records in index are in memory."""
+        missing = np.unique(index[~self.decoded[index]])
+        if len(missing):
+            data = segment.daf.map_array(segment.start_i, segment.end_i - 4)
+            data = data.reshape(self.n, self.rsize)[missing, 2:]
+            data = data.reshape(len(missing), self.components, self.ncoef)
+            self.coefficients[:, :, missing] = data.transpose(2, 1, 0)[::-1]
+            self.decoded[missing] = True
+
+    def posvel(self, segment, jd1, jd2):
+        """Position and velocity at the times jd1 + jd2 (TDB), in km and km/day.
+
+        This follows jplephem's Segment.generate operation by operation, a
+        block of times at a time so that the intermediate arrays stay small.
+        """
+        index1, offset1 = np.divmod((jd1 - T0) * S_PER_DAY - self.init, self.intlen)
+        index2, offset2 = np.divmod(jd2 * S_PER_DAY, self.intlen)
+        index3, offset = np.divmod(offset1 + offset2, self.intlen)
+        index = (index1 + index2 + index3).astype(int)
+        if (index < 0).any() or (index > self.n).any():
+            # Let jplephem report which dates the segment covers
+            segment.compute(jd1, jd2)
+        omegas = index == self.n
+        index[omegas] -= 1
+        offset[omegas] += self.intlen
+
+        self.decode(segment, index)
+        posvel = np.empty((2, 3) + jd1.shape)
+        for start in range(0, len(index), block_size):
+            block = slice(start, start + block_size)
+            self._chebyshev(
+                self.coefficients[:, :, index[block]],
+                offset[block],
+                posvel[:, :, block],
+            )
+        return posvel
+
+    def _chebyshev(self, coefficients, offset, posvel):
+        shape = coefficients.shape[1:]
+        # The Chebyshev recurrence, reusing arrays where jplephem would
+        # allocate temporaries; each value goes through the same operations.
+        s = 2.0 * offset / self.intlen - 1.0
+        s2 = 2.0 * s
+        w0 = w1 = 0.0
+        wlist = []
+        for coefficient in coefficients[:-1]:
+            w2 = w1
+            w1 = w0
+            w0 = np.multiply(s2, w1, out=np.empty(shape))
+            w0 -= w2
+            w0 += coefficient
+            wlist.append(w1)
+        if self.data_type == 3:
+            # Type 3 segments store the velocities as components
+            components = s * w0
+            components -= w1
+            components += coefficients[-1]
+            posvel[...] = components.reshape(posvel.shape)
+            return
+        components = np.multiply(s, w0, out=posvel[0])
+        components -= w1
+        components += coefficients[-1]
+
+        dw0 = dw1 = 0.0
+        buffers = [np.empty(shape) for _ in range(4)]
+        for w1 in wlist:
+            dw2 = dw1
+            dw1 = dw0
+            dw0, w1x2 = [b for b in buffers if b is not dw1 and b is not dw2][:2]
+            np.multiply(dw1, s2, out=dw0)
+            dw0 += np.multiply(w1, 2.0, out=w1x2)
+            dw0 -= dw2
+        rates = np.multiply(s, dw0, out=posvel[1])
+        rates += w0
+        rates -= dw1
+        rates /= self.intlen
+        rates *= 2.0
+        rates *= S_PER_DAY
+
+
+class SPKEphemeris:
+    """Positions and velocities of many solar system bodies from a JPL kernel.
+
+    astropy's ``get_body_barycentric_posvel`` works out one body at a time,
+    and jplephem gathers the Chebyshev coefficients for every time from the
+    memory-mapped file on each call. This evaluates each segment needed for
+    a list of bodies once over the whole array of times, and keeps the
+    coefficient records it has decoded in memory for later calls. The
+    arithmetic is jplephem's and the segments are added up in the order
+    astropy uses, so the results are identical to astropy's.
+
+    Parameters
+    ----------
+    kernel : jplephem.spk.SPK
+        The kernel, normally ``astropy.coordinates.solar_system_ephemeris.kernel``.
+    """
+
+    def __init__(self, kernel):
+        self.kernel = kernel
+        self._segments = {}
+
+    def posvel(self, objnames, jd1, jd2):
+        """Positions and velocities of the bodies with respect to the SSB.
+
+        Parameters
+        ----------
+        objnames : list of str
+            Names of the bodies, as in
+            ``astropy.coordinates.solar_system_ephemeris.bodies``.
+        jd1, jd2 : numpy.ndarray
+            The two parts of the TDB Julian dates.
+
+        Returns
+        -------
+        dict
+            For each body an array of shape ``(2, 3) + jd1.shape`` holding
+            the position in km and the velocity in km/day.
+        """
+        jd1, jd2 = np.broadcast_arrays(jd1, jd2)
+        shape = jd1.shape
+        jd1, jd2 = jd1.ravel(), jd2.ravel()
+        segments = {}
+        result = {}
+        for objname in objnames:
+            try:
+                kernel_spec = BODY_NAME_TO_KERNEL_SPEC[objname]
+            except KeyError:
+                raise KeyError(
+                    "{}'s position cannot be calculated with the SPK engine".format(
+                        objname
+                    )
+                )
+            posvel = np.zeros((2, 3) + jd1.shape)
+            for pair in kernel_spec:
+                if pair not in segments:
+                    segment = self.kernel[pair]
+                    if pair not in self._segments:
+                        self._segments[pair] = _ChebyshevSegment(segment)
+                    segments[pair] = self._segments[pair].posvel(segment, jd1, jd2)
+                posvel += segments[pair]
+            result[objname] = posvel.reshape((2, 3) + shape)
+        return result
+
+
+_spk_ephemerides = {}
+
+ephemeris_engines = ["spk", "astropy"]
+
+
+def _get_spk_ephemeris(ephem, path=None, link=None):
+    """The SPKEphemeris for ephem, or None if astropy has no kernel for it."""
+    load_kernel(ephem, path=path, link=link)
+    kernel = coor.solar_system_ephemeris.kernel
+    if kernel is None:
+        return None
+    key = coor.solar_system_ephemeris.get()
+    spk = _spk_ephemerides.get(key)
+    if spk is None:
+        spk = _spk_ephemerides[key] = SPKEphemeris(kernel)
+    else:
+        # astropy reopens the file when switching between ephemerides;
+        # the records already decoded from it are still good.
+        spk.kernel = kernel
+    return spk
+
+
+def objPosVels_wrt_SSB(objnames, t, ephem, path=None, link=None, engine="spk"):
+    """Compute the positions and velocities of several solar system objects.
+
+    This is :func:`objPosVel_wrt_SSB` for a list of objects, evaluating the
+    ephemeris once for all of them.
+
+    Parameters
+    ----------
+    objnames: list of str
+        Solar system object names.
+    t: Astropy.time.Time object
+        Observation times.
+    ephem: str
+        The ephem to for computing solar system object position and velocity
+    path : str, optional
+        Local path to the ephemeris file.
+    link : str, optional
+        Location of path on the internet.
+    engine : str, optional
+        "spk" to evaluate the ephemeris with :class:`SPKEphemeris`, or
+        "astropy" to use ``astropy.coordinates.get_body_barycentric_posvel``.
+        Both give the same results.
+
+    Returns
+    -------
+    dict
+        PosVel object for each object name.
+    """
+    if engine not in ephemeris_engines:
+        raise ValueError(
+            "Unknown ephemeris engine '{}', must be one of {}".format(
+                engine, ephemeris_engines
+            )
+        )
+    objnames = [o.lower() for o in objnames]
+    spk = _get_spk_ephemeris(ephem, path=path, link=link) if engine == "spk" else None
+    if spk is None:
+        load_kernel(ephem, path=path, link=link)
+        result = {}
+        for objname in objnames:
+            pos, vel = coor.get_body_barycentric_posvel(objname, t)
+            result[objname] = PosVel(
+                pos.xyz, vel.xyz.to(u.km / u.second), origin="ssb", obj=objname
+            )
+        return result
+    jd1, jd2 = get_jd12(t, "tdb")
+    posvels = spk.posvel(objnames, jd1, jd2)
+    return {
+        objname: PosVel(
+            posvel[0] * u.km,
+            (posvel[1] * (u.km / u.day)).to(u.km / u.second),
+            origin="ssb",
+            obj=objname,
+        )
+        for objname, posvel in posvels.items()
+    }
+
+
+def objPosVel_wrt_SSB(objname, t, ephem, path=None, link=None, engine="spk"):
     """This function computes a solar system object position and velocity respect
-    to solar system barycenter using astropy coordinates get_body_barycentric()
-    method.
+    to solar system barycenter using the JPL ephemeris.
 
     The coordinate frame is that of the underlying solar system ephemeris, which
     has been the ICRF (J2000) since the DE4XX series.
@@ -215,16 +511,19 @@ def objPosVel_wrt_SSB(objname, t, ephem, path=None, link=None):
         Local path to the ephemeris file.
     link : str, optional
         Location of path on the internet.
+    engine : str, optional
+        "spk" to evaluate the ephemeris with :class:`SPKEphemeris`, or
+        "astropy" to use ``astropy.coordinates.get_body_barycentric_posvel``.
+        Both give the same results.
 
     Returns
     -------
     PosVel object with 3-vectors for the position and velocity of the object
     """
     objname = objname.lower()
-
-    load_kernel(ephem, path=path, link=link)
-    pos, vel = coor.get_body_barycentric_posvel(objname, t)
-    return PosVel(pos.xyz, vel.xyz.to(u.km / u.second), origin="ssb", obj=objname)
+    return objPosVels_wrt_SSB([objname], t, ephem, path=path, link=link, engine=engine)[
+        objname
+    ]
 
 
 def objPosVel(obj1, obj2, t, ephem, path=None, link=None):
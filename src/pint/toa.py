@@ -11,6 +11,7 @@ import hashlib
 import os
 import re
 import warnings
+import weakref
 from collections import OrderedDict
 
 import astropy.table as table
@@ -19,7 +20,6 @@ import astropy.units as u
 import numpy as np
 import numpy.ma
 from astropy import log
-from astropy.coordinates import EarthLocation
 from astropy.coordinates import ICRS, CartesianDifferential, CartesianRepresentation
 import pickle
 
@@ -27,15 +27,19 @@ import pint
 from pint.observatory import Observatory, get_observatory, bipm_default
 from pint.observatory.special_locations import T2SpacecraftObs
 from pint.observatory.topo_obs import TopoObs
-from pint.pulsar_mjd import Time
-from pint.solar_system_ephemerides import objPosVel_wrt_SSB
+from pint.pulsar_mjd import Time, jds_to_mjds
+from pint.toa_cache import TOACache
+from pint.toa_flags import FlagColumn
+from pint.solar_system_ephemerides import objPosVels_wrt_SSB
 from pint.phase import Phase
 from pint.pulsar_ecliptic import PulsarEcliptic
 
 __all__ = [
     "TOAs",
+    "TOAsView",
     "get_TOAs",
     "get_TOAs_list",
+    "get_TOAs_array",
     "load_pickle",
     "save_pickle",
     "make_fake_toas",
@@ -91,6 +95,9 @@ def get_TOAs(
     usepickle=False,
     tdb_method="default",
     picklefilename=None,
+    usecache=False,
+    cachedir=None,
+    base=None,
 ):
     """Load and prepare TOAs for PINT use.
 
@@ -111,7 +118,10 @@ def get_TOAs(
 
     Note also that if usepickle is set, the pickled file will have clock
     corrections and other values set from when it was loaded and these may not
-    correspond to the values you set here.
+    correspond to the values you set here. The cache used if usecache is set
+    does not have this problem: its entries are keyed by the contents of the
+    ``.tim`` files and all of the settings, and are checked against the clock
+    files; see :mod:`pint.toa_cache`.
 
     See :func:`pint.toa.TOAs.apply_clock_corrections` for further information on the meaning of
     the clock correction flags.
@@ -152,6 +162,16 @@ def get_TOAs(
         Filename to use for caching loaded file. Defaults to adding ``.pickle.gz`` to the
         filename of the timfile, if there is one and only one. If no filename is available,
         or multiple filenames are provided, a specific filename must be provided.
+    usecache : bool
+        Whether to look up and store the prepared TOAs in the persistent TOA cache
+        (see :mod:`pint.toa_cache`). This can be used instead of usepickle.
+    cachedir : str or None
+        The cache directory to use; defaults to :func:`pint.toa_cache.default_cache_dir`.
+    base : pint.toa.TOAs or None
+        Previously loaded TOAs to add the TOAs in timfile to. Only the new TOAs are
+        processed, with the settings used for base (see :func:`pint.toa.TOAs.extend`);
+        base is extended in place and returned. The clock, ephemeris and planet
+        arguments, if given, must agree with those used for base.
 
     Returns
     -------
@@ -192,6 +212,36 @@ def get_TOAs(
             planets = True
             log.info("Using PLANET_SHAPIRO = True from the given model")
 
+    if base is not None:
+        settings = {
+            "ephem": (ephem, base.ephem),
+            "planets": (planets, base.planets),
+            "include_bipm": (include_bipm, base.clock_corr_info.get("include_bipm")),
+            "bipm_version": (bipm_version, base.clock_corr_info.get("bipm_version")),
+            "include_gps": (include_gps, base.clock_corr_info.get("include_gps")),
+        }
+        for k, (v, bv) in settings.items():
+            if v is not None and str(v).lower() != str(bv).lower():
+                raise ValueError(f"{k}={v} but the base TOAs were loaded with {bv}")
+        base.extend(_read_TOAs(timfile), tdb_method=tdb_method)
+        return base
+
+    if usecache:
+        cache = TOACache(cachedir)
+        key = cache.key(
+            timfile,
+            ephem="DE421" if ephem is None else ephem,
+            include_bipm=True if include_bipm is None else include_bipm,
+            bipm_version=bipm_default if bipm_version is None else bipm_version,
+            include_gps=True if include_gps is None else include_gps,
+            planets=bool(planets),
+            tdb_method=tdb_method,
+        )
+        t = cache.load(key, timfile)
+        if t is not None:
+            log.info("Using TOAs from the cache.")
+            return t
+
     updatepickle = False
     recalc = False
     if usepickle:
@@ -209,6 +259,16 @@ def get_TOAs(
                 # Only pre-v0.8 pickles lack hashes.
                 updatepickle = True
                 log.info("Pickle is very old")
+            if "clkcorr" not in t.table.colnames and any(
+                "clkcorr" in f for f in t.table["flags"]
+            ):
+                # Older pickles record the clock corrections as flags; the
+                # times have been corrected but they would be corrected again.
+                updatepickle = True
+                log.info("Pickle stores clock corrections as flags")
+            if not isinstance(t.table["flags"], FlagColumn):
+                updatepickle = True
+                log.info("Pickle stores flags as dictionaries")
             if (
                 include_gps is not None
                 and t.clock_corr_info.get("include_gps", None) != include_gps
@@ -228,26 +288,16 @@ def get_TOAs(
                 log.info("Pickle contains wrong bipm_version")
                 updatepickle = True
     if not usepickle or updatepickle:
-        if isinstance(timfile, str) or hasattr(timfile, "readlines"):
-            t = TOAs(timfile)
-        else:
-            t = merge_TOAs([TOAs(t) for t in timfile])
-        if isinstance(t.filename, str):
-            files = [t.filename]
-        else:
-            files = t.filename
-        if files is not None:
-            t.hashes = {f: _compute_hash(f) for f in files}
+        t = _read_TOAs(timfile)
         recalc = True
 
-    if not any(["clkcorr" in f for f in t.table["flags"]]):
+    if "clkcorr" not in t.table.colnames:
         if include_gps is None:
             include_gps = True
         if bipm_version is None:
             bipm_version = bipm_default
         if include_bipm is None:
             include_bipm = True
-        # FIXME: should we permit existing clkcorr flags?
         t.apply_clock_corrections(
             include_gps=include_gps,
             include_bipm=include_bipm,
@@ -279,6 +329,23 @@ def get_TOAs(
     if usepickle and updatepickle:
         log.info("Pickling TOAs.")
         save_pickle(t, picklefilename=picklefilename)
+    if usecache:
+        cache.save(key, t, timfile)
+    return t
+
+
+def _read_TOAs(timfile):
+    """Read the TOAs from one or more files, recording the hashes of the files."""
+    if isinstance(timfile, str) or hasattr(timfile, "readlines"):
+        t = TOAs(timfile)
+    else:
+        t = merge_TOAs([TOAs(t) for t in timfile])
+    if isinstance(t.filename, str):
+        files = [t.filename]
+    else:
+        files = t.filename
+    if files is not None:
+        t.hashes = {f: _compute_hash(f) for f in files}
     return t
 
 
@@ -380,7 +447,7 @@ def get_TOAs_list(
         t.hashes = {}
     else:
         t.hashes = hashes
-    if not any(["clkcorr" in f for f in t.table["flags"]]):
+    if "clkcorr" not in t.table.colnames:
         t.apply_clock_corrections(
             include_gps=include_gps,
             include_bipm=include_bipm,
@@ -393,6 +460,75 @@ def get_TOAs_list(
     return t
 
 
+def get_TOAs_array(
+    times,
+    obs,
+    freqs=np.inf,
+    errors=0.0,
+    ephem=None,
+    include_bipm=True,
+    bipm_version=bipm_default,
+    include_gps=True,
+    planets=False,
+    tdb_method="default",
+    flags=None,
+    scale=None,
+):
+    """Load TOAs from arrays of times.
+
+    This is much faster than constructing a :class:`pint.toa.TOA` for each
+    time and calling :func:`pint.toa.get_TOAs_list`. See
+    :func:`pint.toa.get_TOAs` for details of what this function does.
+
+    Parameters
+    ----------
+    times : array-like or tuple of two array-likes
+        The MJDs, in the timescale of the observatory, either as (long
+        double) numbers or as a pair of arrays, integer and fractional
+        parts.
+    obs : str
+        The observatory for all the TOAs.
+    freqs : float or array-like, optional
+        The observing frequencies in MHz.
+    errors : float or array-like, optional
+        The TOA uncertainties in us.
+    flags : dict, optional
+        Flags to set on the TOAs, mapping each flag name to a single value
+        or an array with one value per TOA.
+    scale : str, optional
+        The timescale of the times, if it is not that of the observatory
+        (for example TT times at the geocenter).
+    """
+    if isinstance(times, tuple):
+        mjd_int, mjd_frac = times
+        mjd_int, mjd_frac = np.asarray(mjd_int), np.asarray(mjd_frac)
+    else:
+        mjd_frac, mjd_int = np.modf(np.asarray(times))
+    ntoas = len(mjd_int)
+    freqs = np.broadcast_to(np.asarray(freqs, dtype=float), (ntoas,)).copy()
+    freqs[freqs == 0.0] = np.inf
+    columns = {
+        "mjd_int": mjd_int.astype(float),
+        "mjd_frac": mjd_frac.astype(float),
+        "freq": freqs,
+        "error": np.broadcast_to(np.asarray(errors, dtype=float), (ntoas,)).copy(),
+        "obs": np.full(ntoas, get_observatory(obs).name),
+        "flags": FlagColumn(length=ntoas),
+    }
+    if flags is not None:
+        for name, values in flags.items():
+            columns["flags"].set_values(name, values)
+    if scale is not None:
+        columns["scale"] = scale
+    t = TOAs(columns=columns)
+    t.apply_clock_corrections(
+        include_gps=include_gps, include_bipm=include_bipm, bipm_version=bipm_version
+    )
+    t.compute_TDBs(method=tdb_method, ephem=ephem)
+    t.compute_posvels(ephem, planets)
+    return t
+
+
 def _toa_format(line, fmt="Unknown"):
     """Determine the type of a TOA line.
 
@@ -423,12 +559,29 @@ def _toa_format(line, fmt="Unknown"):
         return "Unknown"
 
 
-def _parse_TOA_line(line, fmt="Unknown"):
+def _observatory_name(code, obs_names=None):
+    """The name of the observatory with the given code.
+
+    If ``obs_names`` is a dict it is used to memoize the lookup, so that a
+    file with many TOAs from the same observatory looks it up only once.
+    """
+    code = code.upper()
+    if obs_names is None:
+        return get_observatory(code).name
+    try:
+        return obs_names[code]
+    except KeyError:
+        name = obs_names[code] = get_observatory(code).name
+        return name
+
+
+def _parse_TOA_line(line, fmt="Unknown", obs_names=None):
     """Parse a one-line ASCII time-of-arrival.
 
     Return an MJD tuple and a dictionary of other TOA information.
     The format can be one of: Comment, Command, Blank, Tempo2,
-    Princeton, ITOA, Parkes, or Unknown.
+    Princeton, ITOA, Parkes, or Unknown. If ``obs_names`` is given it
+    is a dict used to memoize observatory lookups by code.
     """
     MJD = None
     fmt = _toa_format(line, fmt)
@@ -443,7 +596,7 @@ def _parse_TOA_line(line, fmt="Unknown"):
         # 25-44   TOA (decimal point must be in column 30 or column 31)
         # 45-53   TOA uncertainty (microseconds)
         # 69-78   DM correction (pc cm^-3)
-        d["obs"] = get_observatory(line[0].upper()).name
+        d["obs"] = _observatory_name(line[0], obs_names)
         d["freq"] = float(line[15:24])
         d["error"] = float(line[44:53])
         ii, ff = line[24:44].split(".")
@@ -463,7 +616,7 @@ def _parse_TOA_line(line, fmt="Unknown"):
         else:
             MJD = (int(fields[2]), 0.0)
         d["error"] = float(fields[3])
-        d["obs"] = get_observatory(fields[4].upper()).name
+        d["obs"] = _observatory_name(fields[4], obs_names)
         # All the rest should be flags
         flags = fields[5:]
         for i in range(0, len(flags), 2):
@@ -500,7 +653,7 @@ def _parse_TOA_line(line, fmt="Unknown"):
                 "Cannot interpret Parkes format with phaseoffset=%f yet" % phaseoffset
             )
         d["error"] = float(line[63:71])
-        d["obs"] = get_observatory(line[79].upper()).name
+        d["obs"] = _observatory_name(line[79], obs_names)
     elif fmt == "ITOA":
         raise RuntimeError("TOA format '%s' not implemented yet" % fmt)
     return MJD, d
@@ -635,57 +788,73 @@ def format_toa_line(
     return out
 
 
-def read_toa_file(filename, process_includes=True, cdict=None):
-    """Read TOAs from the given filename into a list.
+def _default_cdict():
+    return {
+        "EFAC": 1.0,
+        "EQUAD": 0.0 * u.us,
+        "EMIN": 0.0 * u.us,
+        "EMAX": np.inf * u.us,
+        "FMIN": 0.0 * u.MHz,
+        "FMAX": np.inf * u.MHz,
+        "INFO": None,
+        "SKIP": False,
+        "TIME": 0.0,
+        "PHASE": 0,
+        "PHA1": None,
+        "PHA2": None,
+        "MODE": 1,
+        "JUMP": [False, 0],
+        "FORMAT": "Unknown",
+        "END": False,
+    }
+
+
+def _read_toa_lines(
+    filename, commands, process_includes=True, cdict=None, obs_names=None
+):
+    """Iterate over the TOA lines of a ``.tim`` file, obeying commands.
 
-    Will process INCLUDEd files unless process_includes is False.
+    This is the tokenizer shared by :func:`pint.toa.read_toa_file` and
+    :func:`pint.toa.read_toa_file_columns`. It keeps track of the command
+    state (``INCLUDE``, ``JUMP``, ``EFAC``, ``SKIP``, ...), drops TOAs that
+    are excluded by ``EMIN``/``EMAX``/``FMIN``/``FMAX`` and attaches the flags
+    implied by the commands. Observatory lookups are memoized by code in
+    ``obs_names`` (a new dict if not given), which is shared with any
+    included files.
 
-    Parameters
-    ----------
-    filename : str or file-like object
-        The name of the file to open, or an open file to read from.
-    process_includes : bool, optional
-        If true, obey INCLUDE directives in the file and read other
-        files.
-    top : bool, optional
-        If true, wipe this instance's contents, otherwise append
-        new TOAs. Used recursively; note that surprises may ensue
-        if this function is called on an already existing and
-        processed TOAs object.
+    Yields
+    ------
+    MJD : tuple
+        The (integer, fractional) MJD as parsed.
+    d : dict
+        The TOA information from :func:`pint.toa._parse_TOA_line`.
+    efac : float
+        The ``EFAC`` in force for this TOA.
+    equad : float
+        The ``EQUAD`` in force for this TOA, in microseconds.
     """
     if isinstance(filename, str):
         with open(filename, "r") as f:
-            return read_toa_file(f, process_includes=process_includes, cdict=cdict)
-    else:
-        f = filename
+            yield from _read_toa_lines(
+                f,
+                commands,
+                process_includes=process_includes,
+                cdict=cdict,
+                obs_names=obs_names,
+            )
+        return
+    f = filename
 
     ntoas = 0
-    toas = []
-    commands = []
     if cdict is None:
-        cdict = {
-            "EFAC": 1.0,
-            "EQUAD": 0.0 * u.us,
-            "EMIN": 0.0 * u.us,
-            "EMAX": np.inf * u.us,
-            "FMIN": 0.0 * u.MHz,
-            "FMAX": np.inf * u.MHz,
-            "INFO": None,
-            "SKIP": False,
-            "TIME": 0.0,
-            "PHASE": 0,
-            "PHA1": None,
-            "PHA2": None,
-            "MODE": 1,
-            "JUMP": [False, 0],
-            "FORMAT": "Unknown",
-            "END": False,
-        }
+        cdict = _default_cdict()
         top = True
     else:
         top = False
+    if obs_names is None:
+        obs_names = {}
     for line in f.readlines():
-        MJD, d = _parse_TOA_line(line, fmt=cdict["FORMAT"])
+        MJD, d = _parse_TOA_line(line, fmt=cdict["FORMAT"], obs_names=obs_names)
         if d["format"] == "Command":
             cmd = d["Command"][0].upper()
             commands.append((d["Command"], ntoas))
@@ -725,9 +894,9 @@ def read_toa_file(filename, process_includes=True, cdict=None):
                 fmt = cdict["FORMAT"]
                 cdict["FORMAT"] = "Unknown"
                 log.info("Processing included TOA file {0}".format(d["Command"][1]))
-                new_toas, new_commands = read_toa_file(d["Command"][1], cdict=cdict)
-                toas.extend(new_toas)
-                commands.extend(new_commands)
+                yield from _read_toa_lines(
+                    d["Command"][1], commands, cdict=cdict, obs_names=obs_names
+                )
                 # re-set FORMAT
                 cdict["FORMAT"] = fmt
             else:
@@ -738,31 +907,120 @@ def read_toa_file(filename, process_includes=True, cdict=None):
             if top:
                 break
         else:
-            newtoa = TOA(MJD, **d)
+            # In TOA objects (and the table) a frequency of zero means infinite
+            freq = np.inf if d["freq"] == 0.0 else d["freq"]
             if (
-                (cdict["EMIN"] > newtoa.error)
-                or (cdict["EMAX"] < newtoa.error)
-                or (cdict["FMIN"] > newtoa.freq)
-                or (cdict["FMAX"] < newtoa.freq)
+                (cdict["EMIN"].to_value(u.us) > d["error"])
+                or (cdict["EMAX"].to_value(u.us) < d["error"])
+                or (cdict["FMIN"].to_value(u.MHz) > freq)
+                or (cdict["FMAX"].to_value(u.MHz) < freq)
             ):
                 continue
-            else:
-                newtoa.error *= cdict["EFAC"]
-                newtoa.error = np.hypot(newtoa.error, cdict["EQUAD"])
-                if cdict["INFO"]:
-                    newtoa.flags["info"] = cdict["INFO"]
-                if cdict["JUMP"][0]:
-                    newtoa.flags["jump"] = cdict["JUMP"][1]
-                if cdict["PHASE"] != 0:
-                    newtoa.flags["phase"] = cdict["PHASE"]
-                if cdict["TIME"] != 0.0:
-                    newtoa.flags["to"] = cdict["TIME"]
-                toas.append(newtoa)
-                ntoas += 1
+            if cdict["INFO"]:
+                d["info"] = cdict["INFO"]
+            if cdict["JUMP"][0]:
+                d["jump"] = cdict["JUMP"][1]
+            if cdict["PHASE"] != 0:
+                d["phase"] = cdict["PHASE"]
+            if cdict["TIME"] != 0.0:
+                d["to"] = cdict["TIME"]
+            ntoas += 1
+            yield MJD, d, cdict["EFAC"], cdict["EQUAD"].to_value(u.us)
+
+
+def read_toa_file(filename, process_includes=True, cdict=None):
+    """Read TOAs from the given filename into a list.
+
+    Will process INCLUDEd files unless process_includes is False.
+
+    See :func:`pint.toa.read_toa_file_columns` for a faster version that
+    does not construct a :class:`pint.toa.TOA` object for each line.
+
+    Parameters
+    ----------
+    filename : str or file-like object
+        The name of the file to open, or an open file to read from.
+    process_includes : bool, optional
+        If true, obey INCLUDE directives in the file and read other
+        files.
+    cdict : dict, optional
+        The command state to start from; used when processing INCLUDEs.
 
+    Returns
+    -------
+    toas : list of :class:`pint.toa.TOA`
+    commands : list
+        The commands encountered, each with the number of TOAs read before it.
+    """
+    toas = []
+    commands = []
+    for MJD, d, efac, equad in _read_toa_lines(
+        filename, commands, process_includes=process_includes, cdict=cdict
+    ):
+        newtoa = TOA(MJD, **d)
+        newtoa.error *= efac
+        newtoa.error = np.hypot(newtoa.error, equad * u.us)
+        toas.append(newtoa)
     return toas, commands
 
 
+def read_toa_file_columns(filename, process_includes=True, cdict=None):
+    """Read TOAs from the given filename directly into columns.
+
+    This obeys the same commands as :func:`pint.toa.read_toa_file` but
+    instead of a :class:`pint.toa.TOA` per line it returns NumPy arrays,
+    which :func:`pint.toa.build_table_from_columns` turns into a TOA table
+    with one :class:`astropy.time.Time` construction per observatory.
+
+    Parameters
+    ----------
+    filename : str or file-like object
+        The name of the file to open, or an open file to read from.
+    process_includes : bool, optional
+        If true, obey INCLUDE directives in the file and read other
+        files.
+    cdict : dict, optional
+        The command state to start from.
+
+    Returns
+    -------
+    columns : dict
+        ``mjd_int`` and ``mjd_frac`` (the two parts of the MJD), ``freq`` (in
+        MHz), ``error`` (in us, with ``EFAC`` and ``EQUAD`` applied), ``obs``
+        (observatory names) and ``flags`` (a :class:`pint.toa_flags.FlagColumn`).
+    commands : list
+        The commands encountered, each with the number of TOAs read before it.
+    """
+    commands = []
+    mjd_int, mjd_frac, freqs, errors, efacs, equads, obss, flags = (
+        [] for i in range(8)
+    )
+    for MJD, d, efac, equad in _read_toa_lines(
+        filename, commands, process_includes=process_includes, cdict=cdict
+    ):
+        mjd_int.append(MJD[0])
+        mjd_frac.append(MJD[1])
+        freqs.append(d.pop("freq"))
+        errors.append(d.pop("error"))
+        obss.append(d.pop("obs"))
+        efacs.append(efac)
+        equads.append(equad)
+        flags.append(d)
+
+    freqs = np.array(freqs, dtype=float)
+    freqs[freqs == 0.0] = np.inf
+    errors = np.hypot(np.array(errors, dtype=float) * np.array(efacs), equads)
+    columns = {
+        "mjd_int": np.array(mjd_int),
+        "mjd_frac": np.array(mjd_frac, dtype=float),
+        "freq": freqs,
+        "error": errors,
+        "obs": np.array(obss, dtype=str),
+        "flags": FlagColumn(flags),
+    }
+    return columns, commands
+
+
 def build_table(toas, filename=None):
     mjds, mjd_floats, errors, freqs, obss, flags = zip(
         *[
@@ -785,7 +1043,7 @@ def build_table(toas, filename=None):
             np.array(errors) * u.us,
             np.array(freqs) * u.MHz,
             np.array(obss),
-            np.array(flags),
+            FlagColumn(flags),
             np.zeros(len(mjds)),
         ],
         names=(
@@ -802,6 +1060,61 @@ def build_table(toas, filename=None):
     ).group_by("obs")
 
 
+def build_table_from_columns(columns, filename=None):
+    """Build a TOA table from the output of :func:`pint.toa.read_toa_file_columns`.
+
+    The times for each observatory are constructed as a single array-valued
+    :class:`astropy.time.Time`; the result is the same as constructing a
+    :class:`pint.toa.TOA` for each row and calling :func:`pint.toa.build_table`.
+    If ``columns`` has a ``"scale"`` entry, the times are in that timescale
+    rather than that of their observatory.
+    """
+    obss = columns["obs"]
+    ntoas = len(obss)
+    mjds = np.empty(ntoas, dtype=object)
+    mjd_floats = np.zeros(ntoas)
+    for obs in np.unique(obss):
+        ix = np.nonzero(obss == obs)[0]
+        site = get_observatory(obs)
+        scale = columns.get("scale", site.timescale)
+        # Note that when scale is UTC, must use pulsar_mjd format!
+        fmt = "pulsar_mjd" if scale.lower() == "utc" else "mjd"
+        t = time.Time(
+            columns["mjd_int"][ix],
+            columns["mjd_frac"][ix],
+            scale=scale,
+            format=fmt,
+            precision=9,
+        )
+        t = time.Time(t, location=site.earth_location_itrf(time=t), precision=9)
+        mjd_floats[ix] = t.mjd
+        for i, tt in zip(ix, t):
+            mjds[i] = tt
+    return table.Table(
+        [
+            np.arange(ntoas),
+            table.Column(mjds),
+            mjd_floats * u.d,
+            columns["error"] * u.us,
+            columns["freq"] * u.MHz,
+            obss,
+            columns["flags"],
+            np.zeros(ntoas),
+        ],
+        names=(
+            "index",
+            "mjd",
+            "mjd_float",
+            "error",
+            "freq",
+            "obs",
+            "flags",
+            "delta_pulse_number",
+        ),
+        meta={"filename": filename},
+    ).group_by("obs")
+
+
 def make_fake_toas(
     startMJD,
     endMJD,
@@ -906,9 +1219,8 @@ def make_fake_toas(
     )
     ts.table["error"] = error
     if dm is not None:
-        for f in ts.table["flags"]:
-            f["pp_dm"] = dm
-            f["pp_dme"] = dm_error.to_value(u.pc / u.cm ** 3)
+        ts.table["flags"].set_values("pp_dm", dm)
+        ts.table["flags"].set_values("pp_dme", dm_error.to_value(u.pc / u.cm ** 3))
     ts.compute_TDBs()
     ts.compute_posvels()
     ts.compute_pulse_numbers(model)
@@ -1175,12 +1487,17 @@ class TOAs:
          - the observatory at which the TOA was acquired (a
            :class:`pint.observatory.Observatory` object)
        * - ``flags``
-         - free-form flags associated with the TOA (a dictionary mapping flag
-           to value)
+         - free-form flags associated with the TOA (a
+           :class:`pint.toa_flags.FlagColumn`; each element behaves like a
+           dictionary mapping flag to value)
+       * - ``clkcorr``
+         - the clock correction (including any ``TIME`` statements) that has
+           been applied to ``mjd``, in seconds; computed by
+           :func:`pint.toa.TOAs.apply_clock_corrections`
        * - ``tdb``
          - the pulse arrival time converted to TDB (but not barycentered, that is,
-           not corrected for light travel time; an :class:`astropy.time.Time` object);
-           computed by :func:`pint.toa.TOAs.compute_TDBs`
+           not corrected for light travel time; a single array-valued
+           :class:`astropy.time.Time` column); computed by :func:`pint.toa.TOAs.compute_TDBs`
        * - ``tdbld``
          - a ``longdouble`` version of ``tdb`` for computational convenience
        * - ``ssb_obs_pos``, ``ssb_obs_vel``
@@ -1213,8 +1530,11 @@ class TOAs:
     toafile : str, optional
         Filename to load TOAs from.
     toalist : list of TOA objects, optional
-        The TOA objects this TOAs should contain.  Exactly one of
-        these two parameters must be provided.
+        The TOA objects this TOAs should contain.
+    columns : dict, optional
+        The TOA data as arrays, in the form returned by
+        :func:`pint.toa.read_toa_file_columns`. Exactly one of these three
+        parameters must be provided.
 
     Attributes
     ----------
@@ -1240,10 +1560,10 @@ class TOAs:
         This is used by ``check_hashes()`` to verify whether the data on disk
         has changed so that the file can be re-read if necessary.
     was_pickled : bool
-        Whether this file was loaded from a pickle.
+        Whether this file was loaded from a pickle or from the TOA cache.
     """
 
-    def __init__(self, toafile=None, toalist=None):
+    def __init__(self, toafile=None, toalist=None, columns=None):
         # First, just make an empty container
         self.commands = []
         self.filename = None
@@ -1255,25 +1575,32 @@ class TOAs:
         self.hashes = {}
         self.was_pickled = False
 
-        if (toalist is not None) and (toafile is not None):
-            raise ValueError("Cannot initialize TOAs from both file and list.")
+        if sum(x is not None for x in (toafile, toalist, columns)) > 1:
+            raise ValueError(
+                "Cannot initialize TOAs from more than one of a file, a list and columns."
+            )
 
         if isinstance(toafile, str):
-            toalist, self.commands = read_toa_file(toafile)
+            columns, self.commands = read_toa_file_columns(toafile)
             # Check to see if there were any INCLUDEs:
             inc_fns = [x[0][1] for x in self.commands if x[0][0].upper() == "INCLUDE"]
             self.filename = [toafile] + inc_fns if inc_fns else toafile
         elif toafile is not None:
-            toalist, self.commands = read_toa_file(toafile)
+            columns, self.commands = read_toa_file_columns(toafile)
             self.filename = None
 
-        if toalist is None:
+        if columns is not None:
+            if len(columns["obs"]) == 0:
+                raise ValueError("No TOAs found!")
+            self.table = build_table_from_columns(columns, filename=self.filename)
+        elif toalist is None:
             raise ValueError("No TOAs found!")
+        elif not isinstance(toalist, (list, tuple)):
+            raise ValueError("Trying to initialize TOAs from a non-list class")
         else:
-            if not isinstance(toalist, (list, tuple)):
-                raise ValueError("Trying to initialize TOAs from a non-list class")
-        self.table = build_table(toalist, filename=self.filename)
-        groups = self.get_groups()
+            self.table = build_table(toalist, filename=self.filename)
+        # There is no groups column yet, so compute the default two-hour groups
+        groups = _group_by_gaps(self.get_mjds().value, (2 * u.h).to_value(u.d))
         self.table.add_column(groups, name="groups")
         # Add pulse number column (if needed) or make PHASE adjustments
         try:
@@ -1289,37 +1616,17 @@ class TOAs:
     def __getitem__(self, index):
         if not hasattr(self, "table"):
             raise ValueError("This TOAs object is incomplete and does not have a table")
-        if isinstance(index, np.ndarray) and index.dtype == np.bool:
-            r = copy.deepcopy(self)
-            r.table = r.table[index]
-            if len(r.table) > 0:
-                r.table = r.table.group_by("obs")
-            return r
-        elif (
-            isinstance(index, np.ndarray)
-            and index.dtype == np.int
-            or isinstance(index, list)
-        ):
-            r = copy.deepcopy(self)
-            r.table = r.table[index]
-            if len(r.table) > 0:
-                r.table = r.table.group_by("obs")
-            return r
-        elif isinstance(index, slice):
-            r = copy.deepcopy(self)
-            r.table = r.table[index]
-            if len(r.table) > 0:
-                r.table = r.table.group_by("obs")
-            return r
-        elif isinstance(index, int):
+        if isinstance(index, int):
             raise ValueError("TOAs do not support extraction of TOA objects (yet?)")
+        elif _is_selection(index):
+            return TOAsView(self, np.arange(len(self))[index])
         else:
             raise ValueError("Unable to index TOAs with {}".format(index))
 
     def __eq__(self, other):
+        st, ot = self.table, other.table
         sd, od = self.__dict__.copy(), other.__dict__.copy()
-        st = sd.pop("table")
-        ot = od.pop("table")
+        del sd["table"], od["table"]
         return sd == od and np.all(st == ot)
 
     @property
@@ -1389,7 +1696,7 @@ class TOAs:
         if "pn" in self.table["flags"][0]:
             if "pulse_number" in self.table.colnames:
                 raise ValueError("Pulse number cannot be both a column and a TOA flag")
-            return np.array(flags["pn"] for flags in self.table["flags"])
+            return self.table["flags"].get_values("pn")[0]
         elif "pulse_number" in self.table.colnames:
             return self.table["pulse_number"]
         else:
@@ -1397,7 +1704,7 @@ class TOAs:
             return None
 
     def get_flags(self):
-        """Return a numpy array of the TOA flags."""
+        """Return the TOA flags, as a :class:`pint.toa_flags.FlagColumn`."""
         return self.table["flags"]
 
     def get_flag_value(self, flag, fill_value=None):
@@ -1416,16 +1723,15 @@ class TOAs:
         valid_index : list
             The indices, in ``self.table``, of the places where the flag values occur.
         """
-        result = []
-        valid_index = []
-        for ii, flags in enumerate(self.table["flags"]):
-            try:
-                val = flags[flag]
-                valid_index.append(ii)
-            except KeyError:
-                val = fill_value
-            result.append(val)
-        return result, valid_index
+        if flag == "clkcorr" and "clkcorr" in self.table.colnames:
+            # Clock corrections are kept in their own column; present them
+            # as a flag on the TOAs where they are nonzero.
+            clkcorr = self.table["clkcorr"].quantity
+            valid_index = list(np.nonzero(clkcorr)[0])
+            result = [c if c != 0 else fill_value for c in clkcorr]
+            return result, valid_index
+        values, present = self.table["flags"].get_values(flag, fill_value)
+        return values.tolist(), np.nonzero(present)[0].tolist()
 
     def get_dms(self):
         """Get the Wideband DM data.
@@ -1435,10 +1741,10 @@ class TOAs:
         This does not handle situations where some but not all TOAs have
         DM information.
         """
-        result, valid = self.get_flag_value("pp_dm")
-        if valid == []:
+        values, present = self.table["flags"].get_values("pp_dm")
+        if not present.any():
             raise AttributeError("No DM is provided.")
-        return np.array(result)[valid] * u.pc / u.cm ** 3
+        return values[present].astype(float) * u.pc / u.cm ** 3
 
     def get_dm_errors(self):
         """Get the Wideband DM data error.
@@ -1448,10 +1754,10 @@ class TOAs:
         This does not handle situations where some but not all TOAs have
         DM information.
         """
-        result, valid = self.get_flag_value("pp_dme")
-        if valid == []:
+        values, present = self.table["flags"].get_values("pp_dme")
+        if not present.any():
             raise AttributeError("No DM error is provided.")
-        return np.array(result)[valid] * u.pc / u.cm ** 3
+        return values[present].astype(float) * u.pc / u.cm ** 3
 
     def get_groups(self, gap_limit=None):
         """Flag toas within gap limit (default 2h = 0.0833d) of each other as the same group.
@@ -1548,11 +1854,11 @@ class TOAs:
             # Allow for selection undos
             if not hasattr(self, "table_selects"):
                 self.table_selects = []
-            self.table_selects.append(copy.deepcopy(self.table))
+            # Selecting makes a new table, so the old one need not be copied
+            self.table_selects.append(self.table)
             # Our TOA table must be grouped by observatory for phase calcs
-            self.table = self.table[selectarray]
-            if len(self.table) > 0:
-                self.table = self.table.group_by("obs")
+            index, groups = _group_rows(self.table, np.arange(len(self))[selectarray])
+            self.table = _take_rows(self.table, index, groups)
         else:
             raise ValueError("TOA selection not implemented for TOA lists.")
 
@@ -1604,30 +1910,23 @@ class TOAs:
         Modifes the ``delta_pulse_number`` column, if required.
         Removes the pulse numbers from the flags.
         """
+        _detach_views(self.table)
+        flags = self.table["flags"]
         # First get any PHASE commands
-        dphs = np.asarray(
-            [
-                flags["phase"] if "phase" in flags else 0.0
-                for flags in self.table["flags"]
-            ]
-        )
+        dphs = flags.get_values("phase", 0.0)[0].astype(float)
         # Then add any -padd flag values
-        dphs += np.asarray(
-            [flags["padd"] if "padd" in flags else 0.0 for flags in self.table["flags"]]
-        )
+        dphs += flags.get_values("padd", 0.0)[0].astype(float)
         self.table["delta_pulse_number"] += dphs
 
         # Then, add pulse_number as a table column if possible
-        try:
-            pns = [flags["pn"] for flags in self.table["flags"]]
-            self.table["pulse_number"] = pns
-            self.table["pulse_number"].unit = u.dimensionless_unscaled
-
-            # Remove pn from dictionary to prevent redundancies
-            for flags in self.table["flags"]:
-                del flags["pn"]
-        except KeyError:
+        pns, present = flags.get_values("pn")
+        if not present.all():
             raise ValueError("Not all TOAs have pn flags")
+        self.table["pulse_number"] = np.asarray(pns.tolist())
+        self.table["pulse_number"].unit = u.dimensionless_unscaled
+
+        # Remove pn from the flags to prevent redundancies
+        flags.remove("pn")
 
     def compute_pulse_numbers(self, model):
         """Set pulse numbers (in TOA table column pulse_numbers) based on model.
@@ -1642,6 +1941,7 @@ class TOAs:
             The model defining times of arrival; the pulse numbers assigned will
             be the nearest integer number of turns to that predicted by the model.
         """
+        _detach_views(self.table)
         # paulr: I think pulse numbers should be computed with abs_phase=True!
         delta_pulse_numbers = Phase(self.table["delta_pulse_number"])
         phases = model.phase(self, abs_phase=True) + delta_pulse_numbers
@@ -1661,6 +1961,7 @@ class TOAs:
         delta : astropy.time.TimeDelta
             The time difference to add to the MJD of each TOA
         """
+        _detach_views(self.table)
         col = self.table["mjd"]
         if not isinstance(delta, time.TimeDelta):
             raise ValueError("Type of argument must be TimeDelta")
@@ -1713,21 +2014,25 @@ class TOAs:
         pnChange = False
         if "pulse_number" in self.table.colnames:
             pnChange = True
-            for i in range(len(self.table["flags"])):
-                self.table["flags"][i]["pn"] = self.table["pulse_number"][i]
+            self.table["flags"].set_values("pn", self.table["pulse_number"])
 
-        for (toatime, toaerr, freq, obs, flags) in zip(
+        if "clkcorr" in self.table.colnames:
+            clkcorrs = self.table["clkcorr"].quantity
+        else:
+            clkcorrs = np.zeros(self.ntoas) * u.s
+        for (toatime, toaerr, freq, obs, flags, clkcorr) in zip(
             self.table["mjd"],
             self.table["error"].quantity,
             self.table["freq"].quantity,
             self.table["obs"],
             self.table["flags"],
+            clkcorrs,
         ):
             obs_obj = Observatory.get(obs)
 
             flags = flags.copy()
-            if "clkcorr" in flags.keys():
-                toatime_out = toatime - time.TimeDelta(flags["clkcorr"])
+            if clkcorr != 0:
+                toatime_out = toatime - time.TimeDelta(clkcorr)
             else:
                 toatime_out = toatime
             out_str = format_toa_line(
@@ -1743,8 +2048,7 @@ class TOAs:
 
         # If pulse numbers were added to flags, remove them again
         if pnChange:
-            for flags in self.table["flags"]:
-                del flags["pn"]
+            self.table["flags"].remove("pn")
 
         if not handle:
             outf.close()
@@ -1756,7 +2060,7 @@ class TOAs:
 
         Apply clock corrections to all the TOAs where corrections are
         available.  This routine actually changes the value of the TOA,
-        although the correction is also listed as a new flag for the TOA
+        although the correction is also stored in a new column of the table
         called 'clkcorr' so that it can be reversed if necessary.  This
         routine also applies all 'TIME' commands (``-to`` flags) and
         treats them exactly as if they were a part of the observatory
@@ -1771,15 +2075,11 @@ class TOAs:
         A description of how PINT handles clock corrections and timescales is here:
         https://github.com/nanograv/PINT/wiki/Clock-Corrections-and-Timescales-in-PINT
         """
+        _detach_views(self.table)
         # First make sure that we haven't already applied clock corrections
-        flags = self.table["flags"]
-        if any(["clkcorr" in f for f in flags]):
-            if all(["clkcorr" in f for f in flags]):
-                log.warning("Clock corrections already applied. Not re-applying.")
-                return
-            else:
-                # FIXME: could apply clock corrections to just the ones that don't have any
-                raise ValueError("Some TOAs have 'clkcorr' flag and some do not!")
+        if "clkcorr" in self.table.colnames:
+            log.warning("Clock corrections already applied. Not re-applying.")
+            return
         # An array of all the time corrections, one for each TOA
         log.info(
             "Applying clock corrections (include_gps = {0}, include_bipm = {1})".format(
@@ -1787,7 +2087,8 @@ class TOAs:
             )
         )
         corr = np.zeros(self.ntoas) * u.s
-        times = self.table["mjd"]
+        col = self.table["mjd"]
+        flags = self.table["flags"]
         for ii, key in enumerate(self.table.groups.keys):
             grp = self.table.groups[ii]
             obs = self.table.groups.keys[ii]["obs"]
@@ -1798,24 +2099,29 @@ class TOAs:
                 bipm_version=bipm_version,
             )
             loind, hiind = self.table.groups.indices[ii : ii + 2]
+            # All TOAs from one observatory share a location
+            mjds = time.Time(grp["mjd"], location=grp["mjd"][0].location, precision=9)
             # First apply any TIME statements
-            for jj in range(loind, hiind):
-                if "to" in flags[jj]:
-                    # TIME commands are in sec
-                    # SUGGESTION(@paulray): These time correction units should
-                    # be applied in the parser, not here. In the table the time
-                    # correction should have units.
-                    corr[jj] = flags[jj]["to"] * u.s
-                    times[jj] += time.TimeDelta(corr[jj])
-
-            gcorr = site.clock_corrections(time.Time(grp["mjd"]))
-            for jj, cc in enumerate(gcorr):
-                grp["mjd"][jj] += time.TimeDelta(cc)
+            # SUGGESTION(@paulray): These time correction units should
+            # be applied in the parser, not here. In the table the time
+            # correction should have units.
+            to, has_to = flags[loind:hiind].get_values("to")
+            if np.any(has_to):
+                # TIME commands are in sec
+                to = to[has_to].astype(float) * u.s
+                corr[loind:hiind][has_to] = to
+                mjds[has_to] = mjds[has_to] + time.TimeDelta(to)
+
+            gcorr = site.clock_corrections(mjds)
             corr[loind:hiind] += gcorr
-            # Now update the flags with the clock correction used
-            for jj in range(loind, hiind):
-                if corr[jj] != 0:
-                    flags[jj]["clkcorr"] = corr[jj]
+            # Sites without clock corrections (photon events from a
+            # spacecraft or the barycenter, say) keep their times
+            if np.any(has_to) or np.any(gcorr != 0):
+                mjds = mjds + time.TimeDelta(gcorr)
+                for jj, t in enumerate(mjds):
+                    col[loind + jj] = t
+        # Store the corrections so that they can be reversed if necessary
+        self.table["clkcorr"] = corr
         # Update clock correction info
         self.clock_corr_info.update(
             {
@@ -1843,6 +2149,7 @@ class TOAs:
             Solar System ephemeris to use for the computation. If not specified
             use the value in ``self.ephem``; if specified, replace ``self.ephem``.
         """
+        _detach_views(self.table)
         log.info("Computing TDB columns.")
         if "tdb" in self.table.colnames:
             log.info("tdb column already exists. Deleting...")
@@ -1870,43 +2177,37 @@ class TOAs:
         self.ephem = ephem
         log.info(f"Using EPHEM = {self.ephem} for TDB calculation.")
 
-        # Compute in observatory groups
-        tdbs = np.zeros_like(self.table["mjd"])
+        # Compute in observatory groups, collecting the two parts of the JD
+        jd1 = np.zeros(self.ntoas)
+        jd2 = np.zeros(self.ntoas)
         for ii, key in enumerate(self.table.groups.keys):
             grp = self.table.groups[ii]
             obs = self.table.groups.keys[ii]["obs"]
             loind, hiind = self.table.groups.indices[ii : ii + 2]
             site = get_observatory(obs)
+            # Initializing a Time from a list (or Column) of Times throws
+            # away the location information, so put it back.
+            grpmjds = time.Time(grp["mjd"], precision=9)
             if isinstance(site, TopoObs):
                 # For TopoObs, it is safe to assume that all TOAs have same location
-                # I think we should report to astropy that initializing
-                # a Time from a list (or Column) of Times throws away the location information
-                grpmjds = time.Time(grp["mjd"], location=grp["mjd"][0].location)
+                loc = grp["mjd"][0].location
             else:
-                # Grab locations for each TOA
-                # It is crazy that I have to deconstruct the locations like
-                # this to build a single EarthLocation object with an array
-                # of locations contained in it.
-                # Is there a more efficient way to convert a list of EarthLocations
-                # into a single EarthLocation object with an array of values internally?
-                loclist = [t.location for t in grp["mjd"]]
-                if loclist[0] is None:
-                    grpmjds = time.Time(grp["mjd"], location=None)
-                else:
-                    locs = EarthLocation(
-                        np.array([loc.x.value for loc in loclist]) * u.m,
-                        np.array([loc.y.value for loc in loclist]) * u.m,
-                        np.array([loc.z.value for loc in loclist]) * u.m,
-                    )
-                    grpmjds = time.Time(grp["mjd"], location=locs)
+                # This is where the TOA constructor gets the location from;
+                # moving observatories can return an array of locations.
+                loc = site.earth_location_itrf(time=grpmjds)
+            if loc is not None:
+                grpmjds = time.Time(grpmjds, location=loc, precision=9)
 
-            grptdbs = site.get_TDBs(grpmjds, method=method, ephem=ephem, grp=grp)
-            tdbs[loind:hiind] = np.asarray([t for t in grptdbs])
+            grptdbs = site.get_TDBs(grpmjds, method=method, ephem=ephem, grp=grp).tdb
+            jd1[loind:hiind] = grptdbs.jd1
+            jd2[loind:hiind] = grptdbs.jd2
 
         # Now add the new columns to the table
-        col_tdb = table.Column(name="tdb", data=tdbs)
-        col_tdbld = table.Column(name="tdbld", data=[t.tdb.mjd_long for t in tdbs])
-        self.table.add_columns([col_tdb, col_tdbld])
+        tdbs = time.Time(jd1, jd2, format="jd", scale="tdb", precision=9)
+        tdbs.format = "pulsar_mjd"
+        mjd1, mjd2 = jds_to_mjds(jd1, jd2)
+        tdblds = np.longdouble(mjd1) + np.longdouble(mjd2)
+        self.table.add_columns([tdbs, tdblds], names=["tdb", "tdbld"])
 
     def compute_posvels(self, ephem=None, planets=None):
         """Compute positions and velocities of the observatories and Earth.
@@ -1931,6 +2232,7 @@ class TOAs:
             not specified, use the value stored in ``self.planets``; if
             specified, set ``self.planets`` to this value.
         """
+        _detach_views(self.table)
         if ephem is None:
             if self.ephem is not None:
                 ephem = self.ephem
@@ -2007,6 +2309,13 @@ class TOAs:
                     meta={"origin": "OBS", "obj": p},
                 )
 
+        # The Sun and planets do not depend on the observatory, so
+        # evaluate the ephemeris for them once for all TOAs.
+        bodies = ["sun"] + (list(all_planets) if planets else [])
+        ssb_bodies = objPosVels_wrt_SSB(
+            bodies, time.Time(self.table["tdb"], precision=9), ephem
+        )
+
         # Now step through in observatory groups
         for ii, key in enumerate(self.table.groups.keys):
             grp = self.table.groups[ii]
@@ -2023,13 +2332,12 @@ class TOAs:
             log.debug("SSB obs pos {0}".format(ssb_obs.pos[:, 0]))
             ssb_obs_pos[loind:hiind, :] = ssb_obs.pos.T.to(u.km)
             ssb_obs_vel[loind:hiind, :] = ssb_obs.vel.T.to(u.km / u.s)
-            sun_obs = objPosVel_wrt_SSB("sun", tdb, ephem) - ssb_obs
+            sun_obs = ssb_bodies["sun"][loind:hiind] - ssb_obs
             obs_sun_pos[loind:hiind, :] = sun_obs.pos.T.to(u.km)
             if planets:
                 for p in all_planets:
                     name = "obs_" + p + "_pos"
-                    dest = p
-                    pv = objPosVel_wrt_SSB(dest, tdb, ephem) - ssb_obs
+                    pv = ssb_bodies[p][loind:hiind] - ssb_obs
                     plan_poss[name][loind:hiind, :] = pv.pos.T.to(u.km)
         cols_to_add = [ssb_obs_pos, ssb_obs_vel, obs_sun_pos]
         if planets:
@@ -2046,6 +2354,7 @@ class TOAs:
         deletes this column so that this function will be called again and
         velocities will be calculated with updated TOAs.
         """
+        _detach_views(self.table)
         # Remove any existing columns
         col_to_remove = "ssb_obs_vel_ecl"
         if col_to_remove in self.table.colnames:
@@ -2091,6 +2400,426 @@ class TOAs:
         log.debug("Adding columns " + " ".join(col.name))
         self.table.add_column(col)
 
+    def extend(self, other, tdb_method="default"):
+        """Append the TOAs in another TOAs object to this one.
+
+        Only the new TOAs are processed: clock corrections, TDBs, observatory
+        positions and velocities (including planets and ecliptic velocities)
+        are computed for them if this object has them, using this object's
+        settings, and the new rows are appended to the existing table. Its
+        columns have room to grow, so that appending a few TOAs at a time to
+        many does not copy the existing ones each time; the new TOAs form
+        observatory groups of their own after the existing ones, until the
+        table is grouped again (once there are more TOAs out of observatory
+        order than in order). The ``index`` column continues from the largest
+        index already present, the two-hour ``groups`` continue from the last
+        one if the new TOAs are all later (and are found again for all TOAs
+        otherwise), and a ``pulse_number`` column present in only one of the
+        two objects is filled with NaN for the other's TOAs.
+
+        Parameters
+        ----------
+        other : :class:`pint.toa.TOAs`
+            The TOAs to add. If it has already been processed it must have been
+            processed with the same settings. It may be modified.
+        tdb_method : str
+            The method used to compute the TDBs of the new TOAs; see
+            :func:`pint.toa.TOAs.compute_TDBs`.
+        """
+        _detach_views(self.table)
+        if "clkcorr" in self.table.colnames:
+            if "clkcorr" not in other.table.colnames:
+                other.apply_clock_corrections(
+                    include_gps=self.clock_corr_info["include_gps"],
+                    include_bipm=self.clock_corr_info["include_bipm"],
+                    bipm_version=self.clock_corr_info["bipm_version"],
+                )
+            elif other.clock_corr_info != self.clock_corr_info:
+                raise ValueError(
+                    f"Cannot extend TOAs with clock corrections {self.clock_corr_info} "
+                    f"with TOAs with clock corrections {other.clock_corr_info}"
+                )
+        if "tdb" in self.table.colnames:
+            if "tdb" not in other.table.colnames:
+                other.compute_TDBs(method=tdb_method, ephem=self.ephem)
+            elif other.ephem != self.ephem:
+                raise ValueError(
+                    f"Cannot extend TOAs using {self.ephem} with TOAs using {other.ephem}"
+                )
+        if "ssb_obs_pos" in self.table.colnames:
+            if "ssb_obs_pos" not in other.table.colnames:
+                other.compute_posvels(self.ephem, self.planets)
+            elif other.planets != self.planets:
+                raise ValueError(
+                    f"Cannot extend TOAs with planets={self.planets} "
+                    f"with TOAs with planets={other.planets}"
+                )
+        if "ssb_obs_vel_ecl" in self.table.colnames:
+            if other.obliquity != self.obliquity:
+                other.add_vel_ecl(self.obliquity)
+
+        new = other.table.copy(copy_data=False)
+        for c in set(self.table.colnames) ^ set(new.colnames):
+            if c != "pulse_number":
+                raise ValueError(f"Column {c} is not present in both TOAs objects")
+            if c in new.colnames:
+                self.table[c] = np.full(len(self.table), np.nan)
+                self.table[c].unit = u.dimensionless_unscaled
+            else:
+                new[c] = np.full(len(new), np.nan)
+                new[c].unit = u.dimensionless_unscaled
+        new["index"] = self.table["index"].max() + 1 + np.arange(len(new))
+        gap = (2 * u.h).to_value(u.d)
+        mjds = self.table["mjd_float"].quantity.to_value(u.d)
+        new_mjds = new["mjd_float"].quantity.to_value(u.d)
+        # TOAs after all the existing ones continue their two-hour groups
+        later = len(mjds) > 0 and len(new_mjds) > 0 and new_mjds.min() > mjds.max()
+        if later:
+            new_groups = _group_by_gaps(new_mjds, gap) + self.table["groups"].max() + 1
+            if new_mjds.min() - mjds.max() < gap:
+                new_groups[new_groups == new_groups.min()] = self.table["groups"][
+                    mjds.argmax()
+                ]
+            new["groups"] = new_groups
+        self.table = _append_rows(self.table, new[self.table.colnames])
+        if not later:
+            self.table["groups"][:] = _group_by_gaps(
+                self.table["mjd_float"].quantity.to_value(u.d), gap
+            )
+
+        filenames = []
+        for f in [self.filename, other.filename]:
+            if isinstance(f, list):
+                filenames.extend(f)
+            elif f is not None:
+                filenames.append(f)
+        self.filename = filenames
+        self.table.meta["filename"] = self.filename
+        self.hashes.update(other.hashes)
+        self.commands = self.commands + other.commands
+        self.merged = True
+
+
+def _group_rows(tbl, index):
+    """Put the rows index of tbl in observatory order and find their groups.
+
+    Returns the reordered index and the indices and keys of the groups the
+    selected rows form (None if tbl is not grouped by observatory or nothing
+    is selected).
+    """
+    if len(index) == 0 or tbl.groups.keys is None:
+        return index, None
+    parent_indices = tbl.groups.indices
+    group = np.repeat(np.arange(len(parent_indices) - 1), np.diff(parent_indices))
+    index = index[np.argsort(group[index], kind="stable")]
+    counts = np.bincount(group[index], minlength=len(parent_indices) - 1)
+    present = counts > 0
+    indices = np.concatenate(([0], np.cumsum(counts[present])))
+    return index, (indices, tbl.groups.keys[present])
+
+
+def _take_rows(tbl, index, groups):
+    """Build a new table of the rows index of tbl, as found by _group_rows."""
+    new = tbl[index]
+    if "flags" in new.colnames:
+        # Selecting rows of a FlagColumn shares storage with the original
+        new["flags"] = FlagColumn(new["flags"])
+    if groups is not None:
+        # The rows are already grouped, so avoid Table.group_by copying every
+        # column again
+        indices, keys = groups
+        new._groups = table.groups.TableGroups(new, indices=indices, keys=keys)
+    elif len(new) > 0:
+        new = new.group_by("obs")
+    return new
+
+
+# The buffers that columns made by _append_column are the start of, by the
+# id of the column
+_column_buffers = {}
+
+
+def _claim_buffer(col, length):
+    """Return the buffer col is the start of, if it has room for length rows.
+
+    The buffer is forgotten, so that appending to col again (through an
+    older table, say) cannot overwrite the rows appended this time.
+    """
+    entry = _column_buffers.pop(id(col), None)
+    if entry is None or entry[0]() is not col or len(entry[1]) < length:
+        return None
+    return entry[1]
+
+
+def _remember_buffer(col, buffer):
+    key = id(col)
+
+    def forget(ref):
+        if _column_buffers.get(key, (None,))[0] is ref:
+            del _column_buffers[key]
+
+    _column_buffers[key] = weakref.ref(col, forget), buffer
+
+
+def _append_column(col, new):
+    """Return the values of col followed by those of new, and their buffer.
+
+    The result is a view of the start of a buffer with room for as many
+    rows again, so that when it is appended to in turn only the new rows
+    are written. Columns of a kind that can't be buffered are stacked.
+    """
+    n, m = len(col), len(new)
+    buffer = _claim_buffer(col, n + m)
+    if isinstance(col, FlagColumn):
+        rows = col._data.copy_rows(new._data, new._rows)
+        if buffer is None:
+            buffer = np.empty(2 * (n + m), dtype=col._rows.dtype)
+            buffer[:n] = col._rows
+        buffer[n : n + m] = rows
+        out = col._view(buffer[: n + m])
+        out.info.indices = []
+        return out, buffer
+    elif isinstance(col, time.Time) and col.location is None:
+        if buffer is None:
+            zeros = np.zeros(2 * (n + m))
+            buffer = col.__class__(
+                zeros, zeros, format="jd", scale=col.scale, precision=col.precision
+            )
+            buffer[:n] = col
+        buffer[n : n + m] = new
+        out = buffer[: n + m]
+        out.format = col.format
+        out.info.indices = []
+        return out, buffer
+    elif type(col) is table.Column:
+        if col.unit is not None and new.unit is not None:
+            values = new.quantity.to_value(col.unit)
+        else:
+            values = np.asarray(new)
+        dtype = np.result_type(col.dtype, values.dtype)
+        if buffer is None or buffer.dtype != dtype:
+            buffer = np.empty((2 * (n + m),) + col.shape[1:], dtype=dtype)
+            buffer[:n] = col
+        buffer[n : n + m] = values
+        out = table.Column(
+            buffer[: n + m],
+            name=col.info.name,
+            unit=col.unit,
+            format=col.format,
+            description=col.description,
+            meta=col.meta,
+            copy=False,
+        )
+        return out, buffer
+    out = table.vstack(
+        [table.Table([col], names=["c"]), table.Table([new], names=["c"])],
+        join_type="exact",
+        metadata_conflicts="silent",
+    )["c"]
+    return out, None
+
+
+def _append_rows(tbl, new):
+    """Return a table of the rows of tbl followed by those of new.
+
+    Both tables must have the same columns and be grouped by observatory.
+    The columns are appended to with :func:`pint.toa._append_column`, so
+    adding a few rows at a time to a large table takes time proportional to
+    the number of rows added rather than to the size of the table. The new
+    rows keep their own observatory groups, after those of tbl (the first
+    joining the last of tbl if they are for the same observatory); the table
+    is grouped again, which sorts it, once there are more rows out of order
+    than in order.
+    """
+    columns = [_append_column(tbl.columns[c], new[c]) for c in tbl.colnames]
+    out = table.Table(
+        [c for c, buffer in columns], names=tbl.colnames, meta=tbl.meta, copy=False
+    )
+    for c, (col, buffer) in zip(out.colnames, columns):
+        if buffer is not None:
+            _remember_buffer(out.columns[c], buffer)
+    if tbl.groups.keys is None or new.groups.keys is None:
+        return out.group_by("obs")
+    n = len(tbl)
+    indices = np.concatenate((tbl.groups.indices, n + new.groups.indices[1:]))
+    keys = table.vstack([tbl.groups.keys, new.groups.keys])
+    ngroups = len(tbl.groups.keys)
+    if 0 < ngroups < len(keys) and keys["obs"][ngroups - 1] == keys["obs"][ngroups]:
+        indices = np.delete(indices, ngroups)
+        keys.remove_row(ngroups)
+    obs = np.asarray(keys["obs"])
+    out_of_order = np.flatnonzero(obs[1:] <= obs[:-1])
+    in_order = indices[out_of_order[0] + 1] if len(out_of_order) else len(out)
+    if len(out) - in_order > in_order:
+        return out.group_by("obs")
+    out._groups = table.groups.TableGroups(out, indices=indices, keys=keys)
+    return out
+
+
+def _is_selection(index):
+    return (
+        isinstance(index, np.ndarray)
+        and index.dtype.kind in "biu"
+        or isinstance(index, (list, slice))
+    )
+
+
+def _take_column(col, index, name):
+    """The rows index of the table column col, in storage of their own."""
+    out = col[index]
+    if isinstance(out, FlagColumn):
+        # Selecting rows of a FlagColumn shares storage with the original
+        out = FlagColumn(out)
+    out.info.name = name
+    out.info.indices = []
+    return out
+
+
+class _SelectedRows(table.Table):
+    """A table of some of the rows of another, copied only when needed.
+
+    Made by :meth:`_SelectedRows.select`, which records only the parent
+    table and the positions of the selected rows in it. Until the table is
+    changed, each column is gathered from the parent the first time it is
+    read, and slicing gives another such table. Anything else that needs
+    the columns, including adding, replacing or removing a column, first
+    gathers the rest of them, after which this is an ordinary table. So is
+    the copy astropy makes when a table is copied or pickled.
+
+    Gathered columns have their own storage, so writing to them never
+    changes the parent. Methods of :class:`pint.toa.TOAs` that change their
+    table call :func:`pint.toa._detach_views` first, so that the tables
+    selected from it gather their rows before the change.
+    """
+
+    _lazy = None
+
+    @classmethod
+    def select(cls, parent, index, groups=None):
+        """Select the rows index of parent, grouped as found by _group_rows."""
+        new = cls(meta=parent.meta)
+        new._lazy = parent, index
+        new._gathered = {}
+        if groups is not None:
+            indices, keys = groups
+            new._groups = table.groups.TableGroups(new, indices=indices, keys=keys)
+        views = parent.__dict__.setdefault("_views", [])
+        views[:] = [ref for ref in views if ref() is not None]
+        views.append(weakref.ref(new))
+        return new
+
+    @property
+    def columns(self):
+        if self._lazy is not None:
+            self._gather()
+        return self._columns
+
+    @columns.setter
+    def columns(self, columns):
+        self._columns = columns
+
+    @property
+    def colnames(self):
+        if self._lazy is not None:
+            return self._lazy[0].colnames
+        return super().colnames
+
+    def __len__(self):
+        if self._lazy is not None:
+            return len(self._lazy[1])
+        return super().__len__()
+
+    def __getitem__(self, item):
+        if self._lazy is None:
+            return super().__getitem__(item)
+        parent, index = self._lazy
+        if isinstance(item, str):
+            if item not in self._gathered:
+                self._gathered[item] = _take_column(parent[item], index, item)
+            return self._gathered[item]
+        if _is_selection(item) and not isinstance(item, list):
+            rows = np.arange(len(index))[item]
+            if self._gathered:
+                # Columns read from this table may have been written to
+                return _SelectedRows.select(self, rows)
+            return _SelectedRows.select(parent, index[rows])
+        return super().__getitem__(item)
+
+    def _gather(self):
+        """Gather the remaining columns, making this an ordinary table."""
+        parent, index = self._lazy
+        cols = [
+            self._gathered[name]
+            if name in self._gathered
+            else _take_column(parent[name], index, name)
+            for name in parent.colnames
+        ]
+        groups = self.__dict__.get("_groups")
+        self._lazy = None
+        self._gathered = {}
+        self._init_from_cols(cols)
+        if groups is not None:
+            self._groups = groups
+
+
+def _detach_views(tbl):
+    """Make the tables selected from tbl gather their rows, before tbl changes."""
+    for ref in tbl.__dict__.pop("_views", []):
+        view = ref()
+        if view is not None and view._lazy is not None:
+            view._gather()
+
+
+class TOAsView(TOAs):
+    """A selection of the TOAs in another TOAs object.
+
+    This is what indexing a :class:`pint.toa.TOAs` object with a boolean mask,
+    an array of indices or a slice returns. Unlike the deep copy indexing
+    used to make, creating one copies none of the table: the view's table
+    keeps the parent's table and the positions of the selected rows in it
+    (in the parent's observatory order, so that the table does not need to
+    be grouped again). A column is gathered from the parent, into storage
+    of its own, when it is first read, and the rest of them once the view's
+    table is changed in any other way, as :meth:`pint.toa.TOAs.adjust_TOAs`
+    or :meth:`pint.toa.TOAs.compute_TDBs` do.
+
+    Changes made through the view are never seen by the parent. Methods of
+    the parent that change its table gather the rows of its views first, so
+    the views don't see those changes either; values written directly into
+    a column of the parent's table are seen by a view that has not yet read
+    that column.
+
+    Parameters
+    ----------
+    parent : :class:`pint.toa.TOAs`
+        The TOAs to select from.
+    index : numpy.ndarray of int
+        The positions of the selected TOAs in parent.
+    """
+
+    def __init__(self, parent, index):
+        tbl = parent.table
+        # The other attributes are small, so copy them so that changes
+        # don't affect the parent; the tables kept for undoing selections
+        # are never modified, so they can be shared.
+        d = {
+            k: v
+            for k, v in parent.__dict__.items()
+            if k not in ("table", "table_selects")
+        }
+        self.__dict__.update(copy.deepcopy(d))
+        if "table_selects" in parent.__dict__:
+            self.table_selects = list(parent.table_selects)
+        index = np.asarray(index, dtype=int)
+        if isinstance(tbl, _SelectedRows) and tbl._lazy and not tbl._gathered:
+            tbl, index = tbl._lazy[0], tbl._lazy[1][index]
+        # Our TOA table must be grouped by observatory for phase calcs
+        index, groups = _group_rows(tbl, index)
+        if groups is None and len(index) > 0:
+            self.table = _take_rows(tbl, index, groups)
+        else:
+            self.table = _SelectedRows.select(tbl, index, groups)
+
 
 def merge_TOAs(TOAs_list):
     """Merge a list of TOAs instances and return a new combined TOAs instance
@@ -0,0 +1,374 @@
+"""A persistent cache of prepared TOAs.
+
+Loading a ``.tim`` file, applying clock corrections and computing TDBs and
+observatory positions takes a while for large data sets, so
+:func:`pint.toa.get_TOAs` can store the result with ``usecache=True``.
+
+Each cache entry is a directory named by a hash of everything that affects
+the prepared TOAs: the contents of the ``.tim`` files, the clock correction
+settings, the ephemeris, whether planets are included, the TDB method and
+the PINT version. Some inputs are only known once the ``.tim`` file has been
+read (files named in ``INCLUDE`` commands and the clock files of the
+observatories that appear in it); their hashes are stored in the entry and
+checked when it is loaded.
+
+The numeric columns of the TOA table are stored as uncompressed ``.npy``
+files and memory-mapped (copy-on-write) when an entry is loaded; the flags,
+the remaining table metadata and the attributes of the
+:class:`~pint.toa.TOAs` object are stored in a small pickle. When the cache
+grows beyond its maximum size the least recently used entries are removed.
+"""
+import copy
+import hashlib
+import os
+import pickle
+import shutil
+import tempfile
+
+import astropy.table as table
+import astropy.time as time
+import numpy as np
+from astropy import log
+from astropy.table.groups import TableGroups
+
+import pint
+from pint.config import _app, _auth
+from pint.extern import appdirs
+from pint.observatory import bipm_default, get_observatory
+from pint.observatory.topo_obs import TopoObs
+from pint.toa_flags import FlagColumn
+
+__all__ = ["TOACache", "default_cache_dir"]
+
+# Change this if the layout of cache entries changes
+_cache_format = 2
+
+
+def default_cache_dir():
+    """The directory in which TOAs are cached unless told otherwise.
+
+    This is ``$PINT_TOA_CACHE`` if that is set, and otherwise a ``toas``
+    directory in the user cache directory (typically ``$HOME/.cache/pint`` on
+    linux).
+    """
+    d = os.getenv("PINT_TOA_CACHE")
+    if d is not None:
+        return d
+    return os.path.join(appdirs.user_cache_dir(_app, _auth), "toas")
+
+
+def _file_hash(filename):
+    h = hashlib.sha256()
+    with open(filename, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _timfiles(timfile):
+    """The list of filenames in timfile, or None if it is not made of filenames."""
+    if isinstance(timfile, str):
+        return [timfile]
+    elif hasattr(timfile, "readlines"):
+        return None
+    timfiles = list(timfile)
+    if not all(isinstance(f, str) for f in timfiles):
+        return None
+    return timfiles
+
+
+def _clock_files(toas):
+    """The clock files used for the clock corrections of these TOAs."""
+    info = toas.clock_corr_info
+    files = set()
+    for obs in np.unique(toas.table["obs"]):
+        site = get_observatory(
+            obs,
+            include_gps=info.get("include_gps", True),
+            include_bipm=info.get("include_bipm", True),
+            bipm_version=info.get("bipm_version", bipm_default),
+        )
+        if not isinstance(site, TopoObs):
+            continue
+        try:
+            paths = site.clock_fullpath
+            paths = [paths] if isinstance(paths, str) else list(paths)
+            if site.include_gps:
+                paths.append(site.gps_fullpath)
+            if site.include_bipm:
+                paths.append(site.bipm_fullpath)
+        except (OSError, RuntimeError):
+            continue
+        files.update(p for p in paths if p is not None and os.path.exists(p))
+    return sorted(files)
+
+
+class TOACache:
+    """A directory of prepared TOAs.
+
+    Parameters
+    ----------
+    directory : str, optional
+        Where to keep the cache; defaults to :func:`pint.toa_cache.default_cache_dir`.
+    max_size : int, optional
+        The maximum total size of the cache in bytes. Least recently used
+        entries are removed when it is exceeded.
+    """
+
+    def __init__(self, directory=None, max_size=2 ** 30):
+        self.directory = default_cache_dir() if directory is None else directory
+        self.max_size = max_size
+
+    def key(
+        self,
+        timfile,
+        ephem="DE421",
+        include_bipm=True,
+        bipm_version=bipm_default,
+        include_gps=True,
+        planets=False,
+        tdb_method="default",
+    ):
+        """Return the cache key for loading timfile with these settings.
+
+        Returns None if the TOAs cannot be cached, for example because
+        they come from a file-like object or use a custom TDB method.
+        """
+        timfiles = _timfiles(timfile)
+        if timfiles is None or callable(tdb_method):
+            return None
+        h = hashlib.sha256()
+        for f in timfiles:
+            h.update(_file_hash(f).encode())
+        settings = (
+            _cache_format,
+            pint.__version__,
+            ephem.lower(),
+            bool(include_bipm),
+            bipm_version.upper() if include_bipm else None,
+            bool(include_gps),
+            bool(planets),
+            tdb_method.lower(),
+        )
+        h.update(repr(settings).encode())
+        return h.hexdigest()
+
+    def _entry(self, key):
+        return os.path.join(self.directory, key)
+
+    def load(self, key, timfile=None):
+        """Return the TOAs stored under key, or None if there are none.
+
+        Entries whose included ``.tim`` files or clock files have changed
+        are removed. Since entries are found by the contents of the ``.tim``
+        files, the TOAs may have been stored from files with other names; if
+        timfile is given the TOAs are marked as read from it instead.
+        """
+        if key is None:
+            return None
+        entry = self._entry(key)
+        try:
+            with open(os.path.join(entry, "toas.pickle"), "rb") as f:
+                toas, layout, depends, timfiles = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+            return None
+        for filename, h in depends.items():
+            if not os.path.exists(filename) or _file_hash(filename) != h:
+                log.info(f"TOA cache entry is out of date ({filename} changed)")
+                self.remove(key)
+                return None
+        toas.table = self._read_table(entry, layout)
+        if timfile is not None:
+            names = dict(zip(timfiles, _timfiles(timfile)))
+            if isinstance(toas.filename, str):
+                toas.filename = names.get(toas.filename, toas.filename)
+            elif toas.filename is not None:
+                toas.filename = [names.get(f, f) for f in toas.filename]
+            toas.hashes = {names.get(f, f): h for f, h in toas.hashes.items()}
+            toas.table.meta["filename"] = toas.filename
+        toas.was_pickled = True
+        # Mark the entry as recently used
+        os.utime(entry)
+        return toas
+
+    def save(self, key, toas, timfile):
+        """Store toas, loaded from timfile, under key.
+
+        The contents of timfile are part of the key; the contents of any
+        other files the TOAs were read from (through ``INCLUDE`` commands) and of
+        the clock files are recorded so that :meth:`load` can check them.
+        Old entries are evicted if the cache is too big.
+        """
+        if key is None:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        tmp = tempfile.mkdtemp(dir=self.directory, prefix=".tmp-")
+        try:
+            layout = self._write_table(tmp, toas.table)
+            timfiles = _timfiles(timfile)
+            files = set(toas.hashes) - set(timfiles) | set(_clock_files(toas))
+            depends = {f: _file_hash(f) for f in sorted(files)}
+            t = copy.copy(toas)
+            del t.table
+            t.pintversion = pint.__version__
+            with open(os.path.join(tmp, "toas.pickle"), "wb") as f:
+                pickle.dump((t, layout, depends, timfiles), f)
+            self.remove(key)
+            os.rename(tmp, self._entry(key))
+        except Exception:
+            shutil.rmtree(tmp, ignore_errors=True)
+            raise
+        self.evict(keep=key)
+
+    def remove(self, key):
+        """Remove one entry from the cache, if it is present."""
+        shutil.rmtree(self._entry(key), ignore_errors=True)
+
+    def clear(self):
+        """Remove all entries from the cache."""
+        for key in self.entries():
+            self.remove(key)
+
+    def entries(self):
+        """The keys of the entries in the cache, least recently used first."""
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return []
+        keys = [n for n in names if not n.startswith(".")]
+        return sorted(keys, key=lambda k: os.path.getmtime(self._entry(k)))
+
+    def size(self, key=None):
+        """The size in bytes of one entry, or of the whole cache."""
+        keys = self.entries() if key is None else [key]
+        total = 0
+        for k in keys:
+            for dirpath, _, filenames in os.walk(self._entry(k)):
+                total += sum(
+                    os.path.getsize(os.path.join(dirpath, f)) for f in filenames
+                )
+        return total
+
+    def evict(self, keep=None):
+        """Remove least recently used entries until the cache is small enough."""
+        keys = self.entries()
+        sizes = {k: self.size(k) for k in keys}
+        total = sum(sizes.values())
+        for k in keys:
+            if total <= self.max_size:
+                break
+            if k == keep:
+                continue
+            log.info(f"Removing TOA cache entry {k}")
+            self.remove(k)
+            total -= sizes[k]
+
+    @staticmethod
+    def _write_table(directory, tbl):
+        """Write the columns of tbl, returning a description of the layout."""
+        columns = []
+        for i, name in enumerate(tbl.colnames):
+            col = tbl[name]
+            base = os.path.join(directory, str(i))
+            if isinstance(col, FlagColumn):
+                # A copy, without the info (which refers to the table and
+                # cannot be pickled)
+                columns.append((name, "pickle", FlagColumn(col)))
+            elif isinstance(col, time.Time):
+                np.save(base + ".jd1.npy", col.jd1)
+                np.save(base + ".jd2.npy", col.jd2)
+                info = dict(
+                    scale=col.scale,
+                    format=col.format,
+                    precision=col.precision,
+                    location=col.location,
+                )
+                columns.append((name, "time", info))
+            elif col.dtype == object and len(col) and isinstance(col[0], time.Time):
+                # Scalar Times, possibly in different scales; they get their
+                # locations from their observatories, as in the TOA constructor.
+                np.save(base + ".jd1.npy", np.array([t.jd1 for t in col]))
+                np.save(base + ".jd2.npy", np.array([t.jd2 for t in col]))
+                np.save(base + ".scale.npy", np.array([t.scale for t in col]))
+                np.save(base + ".format.npy", np.array([t.format for t in col]))
+                columns.append((name, "times", None))
+            elif col.dtype != object:
+                np.save(base + ".npy", col.data)
+                info = dict(
+                    unit=col.unit,
+                    description=col.description,
+                    format=col.format,
+                    meta=col.meta,
+                )
+                columns.append((name, "array", info))
+            else:
+                columns.append((name, "pickle", col))
+        groups = None
+        if tbl.groups.keys is not None and tbl.groups.keys.colnames == ["obs"]:
+            groups = (np.array(tbl.groups.indices), tbl.groups.keys)
+        return dict(columns=columns, meta=tbl.meta, groups=groups)
+
+    @staticmethod
+    def _read_table(directory, layout):
+        """Rebuild a table written by _write_table."""
+        cols = []
+        names = []
+        obss = None
+        for i, (name, kind, info) in enumerate(layout["columns"]):
+            base = os.path.join(directory, str(i))
+            if kind == "array":
+                c = table.Column(
+                    np.load(base + ".npy", mmap_mode="c"),
+                    name=name,
+                    copy=False,
+                    **info,
+                )
+                if name == "obs":
+                    obss = c
+            elif kind == "time":
+                c = time.Time(
+                    np.load(base + ".jd1.npy", mmap_mode="c"),
+                    np.load(base + ".jd2.npy", mmap_mode="c"),
+                    format="jd",
+                    scale=info["scale"],
+                    precision=info["precision"],
+                    location=info["location"],
+                )
+                c.format = info["format"]
+            elif kind == "times":
+                c = (base, name)
+            else:
+                c = info
+            cols.append(c)
+            names.append(name)
+        for i, c in enumerate(cols):
+            if isinstance(c, tuple):
+                cols[i] = table.Column(_read_times(c[0], obss), name=c[1])
+        tbl = table.Table(cols, names=names, meta=layout["meta"], copy=False)
+        if layout["groups"] is not None:
+            # The rows are already in order, so avoid copying every column
+            # with Table.group_by.
+            indices, keys = layout["groups"]
+            tbl._groups = TableGroups(tbl, indices=indices, keys=keys)
+        return tbl
+
+
+def _read_times(base, obss):
+    """Rebuild a column of scalar Times, one array-valued Time per observatory."""
+    jd1 = np.load(base + ".jd1.npy")
+    jd2 = np.load(base + ".jd2.npy")
+    scales = np.load(base + ".scale.npy")
+    formats = np.load(base + ".format.npy")
+    out = np.empty(len(jd1), dtype=object)
+    for obs in np.unique(obss):
+        site = get_observatory(obs)
+        for scale in np.unique(scales[obss == obs]):
+            for fmt in np.unique(formats[(obss == obs) & (scales == scale)]):
+                ix = np.nonzero((obss == obs) & (scales == scale) & (formats == fmt))[0]
+                t = time.Time(jd1[ix], jd2[ix], format="jd", scale=scale, precision=9)
+                loc = site.earth_location_itrf(time=t)
+                t = time.Time(t, location=loc, precision=9)
+                t.format = fmt
+                for j, tt in zip(ix, t):
+                    out[j] = tt
+    return out
@@ -0,0 +1,559 @@
+"""Columnar storage for the free-form flags attached to TOAs.
+
+Each TOA can carry an arbitrary set of flags (``-fe L-wide -be PUPPI``...).
+Rather than keeping a Python dictionary per TOA, :class:`pint.toa_flags.FlagColumn`
+stores one typed array per flag name: integers and floats as NumPy arrays,
+strings as integer codes into a list of categories, and anything else in an
+object array. A boolean mask per flag records which TOAs have it.
+
+A :class:`~pint.toa_flags.FlagColumn` is an astropy Table mixin column, so it
+can live in ``TOAs.table["flags"]`` and survives slicing, sorting, grouping and
+stacking. Indexing it with an integer gives a :class:`~pint.toa_flags.FlagDict`,
+a dictionary-like view of one row that reads and writes the underlying arrays;
+indexing it with a slice or mask gives another column sharing the same storage,
+so ``for f in toas.table["flags"][mask]: f["jump"] = "1"`` modifies the
+original table just as it did when the flags were a column of dictionaries.
+Code that needs a whole flag at once should use
+:meth:`~pint.toa_flags.FlagColumn.get_values` or
+:meth:`~pint.toa_flags.FlagColumn.matches`, which work on the arrays directly.
+"""
+from collections.abc import Mapping, MutableMapping
+
+import numpy as np
+from astropy.units import Quantity
+from astropy.utils.data_info import ParentDtypeInfo
+
+__all__ = ["FlagColumn", "FlagDict"]
+
+_dtypes = {"int": np.int64, "float": np.float64, "str": np.int32, "object": object}
+
+
+def _kind(value):
+    """Which kind of array a flag value can be stored in."""
+    t = type(value)
+    if t is str:
+        return "str"
+    elif t is float:
+        return "float"
+    elif t is int and -(2 ** 63) <= value < 2 ** 63:
+        return "int"
+    return "object"
+
+
+class _FlagValues:
+    """The values of one flag for every row of a :class:`_FlagData`."""
+
+    def __init__(self, kind, nrows):
+        self.kind = kind
+        self.present = np.zeros(nrows, dtype=bool)
+        if kind == "object":
+            self.values = np.full(nrows, None, dtype=object)
+        else:
+            self.values = np.zeros(nrows, dtype=_dtypes[kind])
+        self.categories = []
+        self.codes = {}
+
+    @classmethod
+    def from_values(cls, rows, values, nrows):
+        kinds = {_kind(v) for v in values}
+        kind = kinds.pop() if len(kinds) == 1 else "object"
+        f = cls(kind, nrows)
+        f.present[rows] = True
+        if kind == "str":
+            categories, codes = np.unique(np.array(values), return_inverse=True)
+            f.categories = categories.tolist()
+            f.codes = {c: i for i, c in enumerate(f.categories)}
+            f.values[rows] = codes
+        elif kind == "object":
+            v = np.empty(len(values), dtype=object)
+            v[:] = values
+            f.values[rows] = v
+        else:
+            f.values[rows] = values
+        return f
+
+    def code(self, value):
+        """Return the category code for a string, adding it if necessary."""
+        try:
+            return self.codes[value]
+        except KeyError:
+            self.codes[value] = len(self.categories)
+            self.categories.append(value)
+            return self.codes[value]
+
+    def get(self, row):
+        v = self.values[row]
+        if self.kind == "str":
+            return self.categories[v]
+        elif self.kind == "int":
+            return int(v)
+        elif self.kind == "float":
+            return float(v)
+        return v
+
+    def set(self, row, value):
+        if _kind(value) != self.kind:
+            self.to_object()
+        if self.kind == "str":
+            self.values[row] = self.code(value)
+        else:
+            self.values[row] = value
+        self.present[row] = True
+
+    def to_object(self):
+        """Switch to an object array, as needed when the kinds of values mix."""
+        if self.kind == "object":
+            return
+        self.values = self.take(slice(None))
+        self.values[~self.present] = None
+        self.kind = "object"
+        self.categories = []
+        self.codes = {}
+
+    def take(self, rows, fill_value=None):
+        """Return the values for the given rows as an array of Python objects."""
+        if self.kind == "str":
+            categories = np.empty(len(self.categories) + 1, dtype=object)
+            categories[:-1] = self.categories
+            categories[-1] = fill_value
+            return categories[
+                np.where(self.present[rows], self.values[rows], len(self.categories))
+            ]
+        values = self.values[rows].astype(object)
+        values[~self.present[rows]] = fill_value
+        return values
+
+    def resize(self, nrows):
+        """Make room for at least nrows rows.
+
+        The arrays grow to twice the size needed, so that adding a few rows
+        at a time does not copy them every time; rows beyond those in use
+        have no value.
+        """
+        n = len(self.present)
+        if nrows <= n:
+            return
+        extra = 2 * nrows - n
+        self.present = np.concatenate([self.present, np.zeros(extra, dtype=bool)])
+        extra = np.zeros(extra, dtype=self.values.dtype)
+        if self.kind == "object":
+            extra[:] = None
+        self.values = np.concatenate([self.values, extra])
+
+
+class _FlagData:
+    """The arrays backing one or more :class:`FlagColumn` objects.
+
+    ``version`` is increased whenever flags are set or removed, so that
+    indexes built from the flags can tell when they are out of date.
+    """
+
+    def __init__(self, nrows=0):
+        self.nrows = nrows
+        self.flags = {}
+        self.version = 0
+
+    @classmethod
+    def from_dicts(cls, dicts):
+        rows, values = {}, {}
+        n = 0
+        for i, d in enumerate(dicts):
+            for k, v in d.items():
+                try:
+                    rows[k].append(i)
+                    values[k].append(v)
+                except KeyError:
+                    rows[k] = [i]
+                    values[k] = [v]
+            n += 1
+        data = cls(n)
+        for k in rows:
+            data.flags[k] = _FlagValues.from_values(np.array(rows[k]), values[k], n)
+        return data
+
+    def add_rows(self, n):
+        """Add n rows without any flags, returning their row numbers."""
+        start = self.nrows
+        self.nrows += n
+        self.version += 1
+        for f in self.flags.values():
+            f.resize(self.nrows)
+        return np.arange(start, self.nrows)
+
+    def flag(self, name, kind):
+        """Return the values for a flag, creating it if needed."""
+        try:
+            return self.flags[name]
+        except KeyError:
+            self.flags[name] = _FlagValues(kind, self.nrows)
+            return self.flags[name]
+
+    def copy_rows(self, other, rows):
+        """Append copies of the given rows of another _FlagData."""
+        new_rows = self.add_rows(len(rows))
+        for name, o in other.flags.items():
+            present = o.present[rows]
+            if not present.any():
+                continue
+            f = self.flag(name, o.kind)
+            if f.kind != o.kind:
+                f.to_object()
+            if f.kind == "str":
+                codes = np.array(
+                    [f.code(c) for c in o.categories] + [0], dtype=np.int32
+                )
+                f.values[new_rows] = codes[np.where(present, o.values[rows], -1)]
+            elif f.kind == "object":
+                f.values[new_rows] = o.take(rows)
+            else:
+                f.values[new_rows] = o.values[rows]
+            f.present[new_rows] = present
+        return new_rows
+
+
+class FlagDict(MutableMapping):
+    """The flags of one TOA, as a view into a :class:`FlagColumn`.
+
+    This behaves like the dictionary mapping flag names to values that
+    PINT used to store for each TOA; changes are written to the column.
+    Use :meth:`copy` to obtain an independent plain dictionary.
+    """
+
+    __slots__ = ("_data", "_row")
+
+    def __init__(self, data, row):
+        self._data = data
+        self._row = row
+
+    def __getitem__(self, key):
+        f = self._data.flags.get(key)
+        if f is None or not f.present[self._row]:
+            raise KeyError(key)
+        return f.get(self._row)
+
+    def __setitem__(self, key, value):
+        self._data.flag(key, _kind(value)).set(self._row, value)
+        self._data.version += 1
+
+    def __delitem__(self, key):
+        f = self._data.flags.get(key)
+        if f is None or not f.present[self._row]:
+            raise KeyError(key)
+        f.present[self._row] = False
+        self._data.version += 1
+        if f.kind == "object":
+            f.values[self._row] = None
+
+    def __contains__(self, key):
+        f = self._data.flags.get(key)
+        return f is not None and bool(f.present[self._row])
+
+    def __iter__(self):
+        return iter([k for k, f in self._data.flags.items() if f.present[self._row]])
+
+    def __len__(self):
+        return sum(bool(f.present[self._row]) for f in self._data.flags.values())
+
+    def __repr__(self):
+        return repr(self.copy())
+
+    def copy(self):
+        """Return the flags as a plain dictionary."""
+        return {
+            k: f.get(self._row)
+            for k, f in self._data.flags.items()
+            if f.present[self._row]
+        }
+
+    def __copy__(self):
+        return self.copy()
+
+    def __deepcopy__(self, memo):
+        return self.copy()
+
+
+class FlagColumnInfo(ParentDtypeInfo):
+    """Information about a :class:`FlagColumn` used by astropy Tables."""
+
+    def new_like(self, cols, length, metadata_conflicts="warn", name=None):
+        """Return an empty FlagColumn with ``length`` rows, for vstack and join."""
+        attrs = self.merge_cols_attributes(
+            cols, metadata_conflicts, name, ("meta", "description")
+        )
+        out = cols[0].__class__(length=1)
+        out._rows = np.zeros(length, dtype=int)
+        for attr, value in attrs.items():
+            if attr not in ("dtype", "shape"):
+                setattr(out.info, attr, value)
+        return out
+
+
+class FlagColumn:
+    """Flags for a set of TOAs, stored one typed array per flag name.
+
+    Parameters
+    ----------
+    flags : iterable of dict, optional
+        The flags for each TOA.
+    length : int, optional
+        If ``flags`` is not given, create this many TOAs without flags.
+
+    Notes
+    -----
+    Slicing (and the copies astropy makes when it groups or stacks tables)
+    shares the underlying storage, so that a :class:`FlagDict` obtained from
+    any of them refers to the same TOA, as with a column of dictionaries. Use
+    :func:`copy.deepcopy` for independent storage.
+    """
+
+    info = FlagColumnInfo()
+    dtype = np.dtype(object)
+
+    def __init__(self, flags=None, length=None):
+        if flags is None:
+            self._data = _FlagData(0 if length is None else length)
+        elif isinstance(flags, FlagColumn):
+            self._data = _FlagData()
+            self._data.copy_rows(flags._data, flags._rows)
+        else:
+            self._data = _FlagData.from_dicts(flags)
+        self._rows = np.arange(self._data.nrows)
+
+    def _view(self, rows):
+        out = self.__class__.__new__(self.__class__)
+        out._data = self._data
+        out._rows = rows
+        if "info" in self.__dict__:
+            out.info = self.info
+        return out
+
+    def __len__(self):
+        return len(self._rows)
+
+    @property
+    def shape(self):
+        return self._rows.shape
+
+    @property
+    def ndim(self):
+        return 1
+
+    def __iter__(self):
+        for row in self._rows:
+            yield FlagDict(self._data, row)
+
+    def __getitem__(self, item):
+        if isinstance(item, tuple) and len(item) == 1:
+            item = item[0]
+        if isinstance(item, (int, np.integer)):
+            return FlagDict(self._data, self._rows[item])
+        return self._view(self._rows[item])
+
+    def _rows_for(self, value):
+        """Row numbers in self._data holding the flags in value."""
+        if isinstance(value, FlagDict):
+            value = FlagColumn._view_of(value)
+        elif isinstance(value, Mapping):
+            value = FlagColumn([value])
+        elif not isinstance(value, FlagColumn):
+            value = FlagColumn(value)
+        if value._data is self._data:
+            return value._rows
+        return self._data.copy_rows(value._data, value._rows)
+
+    @staticmethod
+    def _view_of(d):
+        out = FlagColumn.__new__(FlagColumn)
+        out._data = d._data
+        out._rows = np.array([d._row])
+        return out
+
+    def __setitem__(self, item, value):
+        rows = self._rows_for(value)
+        if isinstance(item, (int, np.integer)):
+            (self._rows[item],) = rows
+        else:
+            self._rows[item] = rows
+        self._data.version += 1
+
+    def take(self, indices, axis=None):
+        """Take elements, as :func:`numpy.take`."""
+        return self._view(self._rows.take(indices, axis=axis))
+
+    def insert(self, obj, values, axis=0):
+        """Insert flags before the given indices, as :func:`numpy.insert`."""
+        if axis != 0:
+            raise ValueError("FlagColumn only supports axis=0")
+        if isinstance(values, Mapping):
+            values = [values]
+        return self._view(np.insert(self._rows, obj, self._rows_for(values)))
+
+    def copy(self):
+        """Return a copy of the column that shares its storage."""
+        return self._view(self._rows.copy())
+
+    def __array__(self, dtype=None):
+        out = np.empty(len(self), dtype=object)
+        for i, row in enumerate(self._rows):
+            out[i] = FlagDict(self._data, row)
+        return out
+
+    def __eq__(self, other):
+        if isinstance(other, Mapping):
+            return np.array([d == other for d in self], dtype=bool)
+        return np.array([a == b for a, b in zip(self, other)], dtype=bool)
+
+    def __ne__(self, other):
+        return ~(self == other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "<{} length={}>\n{}".format(
+            self.__class__.__name__, len(self), "\n".join(repr(d) for d in self)
+        )
+
+    @property
+    def names(self):
+        """The names of the flags set on at least one of these TOAs."""
+        return [k for k, f in self._data.flags.items() if f.present[self._rows].any()]
+
+    def get_values(self, name, fill_value=None):
+        """Return the values of one flag for all TOAs.
+
+        Parameters
+        ----------
+        name : str
+            The name of the flag, without the leading ``-``.
+        fill_value : object, optional
+            The value to use for TOAs without this flag.
+
+        Returns
+        -------
+        values : numpy.ndarray
+            The values. If every TOA has the flag and they are all integers
+            or all floats, this has dtype int or float; otherwise its
+            elements are Python objects.
+        present : numpy.ndarray of bool
+            Which TOAs have the flag.
+        """
+        f = self._data.flags.get(name)
+        if f is None:
+            return np.full(len(self), fill_value, dtype=object), np.zeros(
+                len(self), dtype=bool
+            )
+        present = f.present[self._rows]
+        if f.kind in ("int", "float") and present.all():
+            return f.values[self._rows], present
+        return f.take(self._rows, fill_value), present
+
+    def matches(self, name, value):
+        """Return a boolean array selecting the TOAs whose flag equals value."""
+        f = self._data.flags.get(name)
+        if f is None:
+            return np.zeros(len(self), dtype=bool)
+        present = f.present[self._rows]
+        if f.kind == "str":
+            if not isinstance(value, str) or value not in f.codes:
+                return np.zeros(len(self), dtype=bool)
+            return present & (f.values[self._rows] == f.codes[value])
+        elif f.kind in ("int", "float"):
+            if _kind(value) not in ("int", "float"):
+                return (
+                    np.array([v == value for v in f.take(self._rows)], dtype=bool)
+                    & present
+                )
+            return present & (f.values[self._rows] == value)
+        return present & np.array(
+            [v == value for v in f.values[self._rows]], dtype=bool
+        )
+
+    def groups(self, name):
+        """Return the TOAs that have each value of a flag.
+
+        Parameters
+        ----------
+        name : str
+            The name of the flag, without the leading ``-``.
+
+        Returns
+        -------
+        dict
+            A dictionary mapping each value of the flag to a sorted array of
+            the indices of the TOAs with that value; ``groups(name)[value]``
+            selects the same TOAs as ``matches(name, value)``.
+        """
+        f = self._data.flags.get(name)
+        if f is None:
+            return {}
+        rows = np.flatnonzero(f.present[self._rows])
+        values = f.values[self._rows[rows]]
+        if f.kind == "object":
+            groups = {}
+            for i, v in zip(rows, values):
+                groups.setdefault(v, []).append(i)
+            return {k: np.array(v) for k, v in groups.items()}
+        codes, inverse = np.unique(values, return_inverse=True)
+        order = np.argsort(inverse, kind="stable")
+        splits = np.cumsum(np.bincount(inverse, minlength=len(codes)))[:-1]
+        if f.kind == "str":
+            keys = [f.categories[c] for c in codes]
+        else:
+            keys = codes.tolist()
+        return dict(zip(keys, np.split(rows[order], splits)))
+
+    def set_values(self, name, values):
+        """Set a flag on all these TOAs.
+
+        Parameters
+        ----------
+        name : str
+            The name of the flag, without the leading ``-``.
+        values : object or array-like
+            A single value for all TOAs or one value per TOA.
+        """
+        if np.ndim(values) == 0:
+            kind = _kind(values)
+            values = [values] * len(self)
+        else:
+            if len(values) != len(self):
+                raise ValueError(
+                    f"Got {len(values)} values for the flag {name} but there are {len(self)} TOAs"
+                )
+            # Arrays of numbers can be stored as they are; anything else
+            # (including Quantities, which would lose their units) is
+            # treated as a sequence of Python objects.
+            if (
+                isinstance(values, np.ndarray)
+                and not isinstance(values, Quantity)
+                and values.dtype.kind in "iuf"
+            ):
+                kind = "float" if values.dtype.kind == "f" else "int"
+            else:
+                values = list(values)
+                kinds = {_kind(v) for v in values}
+                kind = kinds.pop() if len(kinds) == 1 else "object"
+        f = self._data.flag(name, kind)
+        if f.kind != kind:
+            f.to_object()
+        if f.kind == "str":
+            codes = {v: f.code(v) for v in set(values)}
+            f.values[self._rows] = [codes[v] for v in values]
+        elif f.kind == "object":
+            v = np.empty(len(values), dtype=object)
+            v[:] = values
+            f.values[self._rows] = v
+        else:
+            f.values[self._rows] = values
+        f.present[self._rows] = True
+        self._data.version += 1
+
+    def remove(self, name):
+        """Remove a flag from all these TOAs."""
+        f = self._data.flags.get(name)
+        if f is None:
+            return
+        f.present[self._rows] = False
+        self._data.version += 1
+        if not f.present.any():
+            del self._data.flags[name]
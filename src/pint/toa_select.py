@@ -1,7 +1,11 @@
 """Tool for selecting a subset of TOAs."""
+import weakref
+import zlib
+
+import astropy.units as u
 import numpy as np
 
-__all__ = ["TOASelect"]
+__all__ = ["TOASelect", "TOASelectionIndex", "get_selection_index"]
 
 
 class TOASelect:
@@ -142,3 +146,248 @@ class TOASelect:
                 new_select = self.get_select_non_range(condition, column)
             self.select_result = new_select
             return new_select
+
+
+class TOASelectionIndex:
+    """Index of the TOAs in a table by flag and column values.
+
+    Mask parameters (JUMP, EFAC, EQUAD, ECORR, DMJUMP...) each select the
+    TOAs with a particular flag value or observatory, or in a frequency or
+    MJD range. Rather than have each of them compare a whole column, the
+    index for a table (obtained with :func:`get_selection_index`) keeps,
+    for each flag or column that has been used, a dictionary from value to
+    matching rows and the order that sorts the values, so that a selection
+    is a dictionary lookup or a binary search.
+
+    The index of a flag is rebuilt when any flag changes, which the
+    :class:`~pint.toa_flags.FlagColumn` records in a version number. The
+    index of a column is rebuilt when the column is replaced or its values
+    change, which is noticed from a CRC-32 checksum of its data; this is a
+    single pass over the column's memory, much cheaper than building the
+    index, which sorts it.
+
+    Note
+    ----
+    The arrays returned are shared by everything selecting the same TOAs,
+    so they are read-only; copy them to modify them.
+    """
+
+    def __init__(self):
+        self.entries = {}
+
+    def _entry(self, table, source, kind):
+        if source[0] == "flag":
+            col = table["flags"]
+            signature = (id(col), id(col._rows), col._data.version)
+        else:
+            col = table[source[1]]
+            signature = (id(col), len(col), _checksum(col))
+        try:
+            # The entry keeps col, so its id can't be reused while it exists
+            old_signature, old_col, entry = self.entries[source, kind]
+            if old_signature == signature and signature[-1] is not None:
+                return entry
+        except KeyError:
+            pass
+        if kind == "groups":
+            entry = self._build_groups(col, source)
+        else:
+            entry = self._build_sorted(col)
+        self.entries[source, kind] = signature, col, entry
+        return entry
+
+    def invalidate(self):
+        """Forget everything that has been indexed."""
+        self.entries = {}
+
+    @staticmethod
+    def _build_groups(col, source):
+        """Dictionary from value to rows, or None if values can't be keys."""
+        try:
+            if source[0] == "flag":
+                groups = col.groups(source[1])
+            else:
+                values = np.asarray(col)
+                keys, inverse = np.unique(values, return_inverse=True)
+                order = np.argsort(inverse, kind="stable")
+                splits = np.cumsum(np.bincount(inverse, minlength=len(keys)))[:-1]
+                groups = dict(zip(keys.tolist(), np.split(order, splits)))
+        except TypeError:
+            return None
+        for rows in groups.values():
+            rows.flags.writeable = False
+        return groups
+
+    @staticmethod
+    def _build_sorted(col):
+        """The sorting order, sorted values and a dictionary of selections.
+
+        The order is None if the values can't be sorted.
+        """
+        values = np.asarray(col)
+        if values.dtype.kind not in "iuf":
+            return None, values, {}
+        order = np.argsort(values, kind="stable")
+        return order, values[order], {}
+
+    def select(self, table, source, value):
+        """Return the indices of the TOAs with a given flag or column value.
+
+        Parameters
+        ----------
+        table : astropy.table.Table
+            The TOA table.
+        source : tuple
+            ``("flag", name)`` for a flag (without the leading ``-``) or
+            ``("column", name)`` for a column of the table.
+        value : object
+            The value to look for.
+
+        Returns
+        -------
+        numpy.ndarray
+            The sorted indices of the matching TOAs. The array may be shared
+            with other callers and is read-only.
+        """
+        groups = self._entry(table, source, "groups")
+        if groups is None:
+            if source[0] == "flag":
+                mask = table["flags"].matches(source[1], value)
+            else:
+                mask = np.asarray(table[source[1]]) == value
+            return np.flatnonzero(mask)
+        try:
+            return groups.get(value, _no_rows)
+        except TypeError:  # unhashable value
+            return _no_rows
+
+    def select_range(self, table, source, low, high):
+        """Return the indices of the TOAs with values in a closed interval.
+
+        Parameters
+        ----------
+        table : astropy.table.Table
+            The TOA table.
+        source : tuple
+            ``("flag", name)`` or ``("column", name)``, as for :meth:`select`;
+            only columns are indexed for ranges.
+        low, high : float or astropy.units.Quantity
+            The ends of the interval. Quantities are converted to the unit
+            of the column.
+
+        Returns
+        -------
+        numpy.ndarray
+            The sorted indices of the TOAs with ``low <= value <= high``. The
+            array may be shared with other callers and is read-only.
+        """
+        if source[0] == "flag":
+            # Flag values are compared as they are (usually as strings)
+            values = table["flags"].get_values(source[1])[0]
+            return np.flatnonzero(np.logical_and(values >= low, values <= high))
+        unit = table[source[1]].unit
+        if isinstance(low, u.Quantity):
+            low = low.to_value(unit)
+        if isinstance(high, u.Quantity):
+            high = high.to_value(unit)
+        order, values, selections = self._entry(table, source, "sorted")
+        if order is None:
+            return np.flatnonzero(np.logical_and(values >= low, values <= high))
+        try:
+            return selections[low, high]
+        except KeyError:
+            pass
+        start = np.searchsorted(values, low, side="left")
+        stop = np.searchsorted(values, high, side="right")
+        rows = np.sort(order[start:stop])
+        rows.flags.writeable = False
+        selections[low, high] = rows
+        return rows
+
+    def interval_bins(self, table, source, lows, highs):
+        """Return which of a set of intervals each TOA is in.
+
+        This is equivalent to calling :meth:`select_range` for each
+        interval, but it takes one binary search per interval rather than a
+        pass over the TOAs, and the result is remembered until the column
+        or the intervals change.
+
+        Parameters
+        ----------
+        table : astropy.table.Table
+            The TOA table.
+        source : tuple
+            ``("column", name)``, the column to look at.
+        lows, highs : array-like of float
+            The (closed) intervals.
+
+        Returns
+        -------
+        bins : numpy.ndarray of int
+            For each TOA, the position of its interval in ``lows``, or -1 if
+            it is in none. A TOA in more than one interval is assigned to
+            the last of them. The array is shared with other callers and is
+            read-only.
+        overlap : bool
+            Whether any TOA is in more than one interval.
+        """
+        order, values, selections = self._entry(table, source, "sorted")
+        key = ("bins", tuple(lows), tuple(highs))
+        try:
+            return selections[key]
+        except KeyError:
+            pass
+        if order is None:
+            raise ValueError("Column {} cannot be sorted".format(source[1]))
+        starts = np.searchsorted(values, lows, side="left")
+        stops = np.maximum(np.searchsorted(values, highs, side="right"), starts)
+        sorted_bins = np.full(len(values), -1)
+        for i, (start, stop) in enumerate(zip(starts, stops)):
+            sorted_bins[start:stop] = i
+        overlap = bool(np.sum(stops - starts) > np.sum(sorted_bins >= 0))
+        bins = np.empty_like(sorted_bins)
+        bins[order] = sorted_bins
+        bins.flags.writeable = False
+        selections[key] = bins, overlap
+        return bins, overlap
+
+
+def _checksum(col):
+    """A checksum of the values in a column.
+
+    This is None for a column of objects, whose index is never reused.
+    """
+    values = np.ascontiguousarray(col)
+    if values.dtype.hasobject:
+        return None
+    return zlib.crc32(values.view(np.uint8))
+
+
+_no_rows = np.array([], dtype=int)
+_no_rows.flags.writeable = False
+
+_indexes = {}
+
+
+def get_selection_index(table):
+    """Return the :class:`TOASelectionIndex` for a TOA table.
+
+    There is one index per table, shared by all the mask parameters that
+    select from it, and kept until the table is deleted.
+    """
+    key = id(table)
+    try:
+        ref, index = _indexes[key]
+    except KeyError:
+        pass
+    else:
+        if ref() is table:
+            return index
+
+    def forget(ref):
+        if _indexes.get(key, (None,))[0] is ref:
+            del _indexes[key]
+
+    index = TOASelectionIndex()
+    _indexes[key] = weakref.ref(table, forget), index
+    return index
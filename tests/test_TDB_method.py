@@ -2,6 +2,8 @@
 import os
 import unittest
 
+import astropy.time as time
+import astropy.units as u
 import numpy as np
 
 import pint.toa as toa
@@ -23,3 +25,13 @@ class TestTDBMethod(unittest.TestCase):
         assert np.all(np.abs(diff) < 5e-9), (
             "Test TDB method, 'astropy' vs " "'ephemeris' failed."
         )
+
+    def test_tdb_columns_agree(self):
+        t = toa.get_TOAs(self.tim, ephem="DE421")
+        tdbs = t.table["tdb"]
+        assert tdbs.scale == "tdb"
+        for i in [0, len(t) // 2, len(t) - 1]:
+            mjd = t.table["mjd"][i]
+            site_tdb = time.Time(mjd, location=mjd.location).tdb
+            assert abs(tdbs[i] - site_tdb) < 1 * u.ns
+            assert t.table["tdbld"][i] == tdbs[i].mjd_long
@@ -0,0 +1,111 @@
+import os
+
+import astropy.units as u
+import numpy as np
+import pytest
+
+from pint.observatory import get_observatory
+from pint.observatory.clock_chain import (
+    ClockChain,
+    ClockSource,
+    _chain_key,
+    load_clock_chain,
+)
+from pint.observatory.clock_file import ClockFile
+from pint.pulsar_mjd import Time
+
+
+@pytest.fixture
+def times():
+    return Time(np.linspace(44000, 60000, 10001), scale="utc", format="pulsar_mjd")
+
+
+@pytest.mark.parametrize("include_gps", [True, False])
+@pytest.mark.parametrize("include_bipm", [True, False])
+def test_matches_clock_files(tmp_path, times, include_gps, include_bipm):
+    site = get_observatory(
+        "gbt",
+        include_gps=include_gps,
+        include_bipm=include_bipm,
+        bipm_version="BIPM2015",
+    )
+    sources = site.clock_sources()
+    expected = np.zeros(len(times)) * u.s
+    for source in sources:
+        clock = ClockFile.read(
+            source.filename, format=source.format, obscode=source.obscode
+        )
+        expected += clock.evaluate(times) - source.offset * u.s
+    chain = load_clock_chain(sources, cache_dir=str(tmp_path))
+    assert np.allclose(
+        chain.evaluate(times), expected.to_value(u.s), rtol=0, atol=1e-14
+    )
+    assert np.allclose(
+        site.clock_corrections(times).to_value(u.s),
+        expected.to_value(u.s),
+        rtol=0,
+        atol=1e-14,
+    )
+    assert site.clock_corrections(times[0]).shape == ()
+
+
+def test_jumps():
+    a = (np.array([1.0, 3.0, 3.0, 6.0]), np.array([0.0, 2.0, 5.0, 4.0]))
+    b = (np.array([2.0, 4.0, 5.0]), np.array([1.0, -1.0, 3.0]))
+    chain = ClockChain.from_tables([("a", *a), ("b", *b)])
+    assert np.all(np.diff(chain.mjd) >= 0)
+    x = np.linspace(0, 7, 701)
+    x = x[x != 3]
+    assert np.allclose(chain.evaluate(x), np.interp(x, *a) + np.interp(x, *b))
+    # Just before and at the jump
+    assert np.isclose(chain.evaluate(3 - 1e-9), 2 + np.interp(3, *b), atol=1e-6)
+    assert np.isclose(chain.evaluate(3.0), 5 + np.interp(3, *b))
+
+
+def test_limits():
+    chain = ClockChain.from_tables([("a", np.array([1.0, 2.0]), np.array([0.0, 1.0]))])
+    assert chain.evaluate(np.array([0.0, 3.0])).tolist() == [0.0, 1.0]
+    with pytest.raises(RuntimeError):
+        chain.evaluate(np.array([1.5, 3.0]), limits="error")
+    chain.evaluate(np.array([1.5]), limits="error")
+
+
+def write_time_dat(directory, values):
+    with open(os.path.join(directory, "time.dat"), "w") as f:
+        f.write("INCLUDE time2.dat\n")
+        f.write("{:9.2f}{:12.3f}{:12.3f} 1\n".format(50000, 0, values[0]))
+    with open(os.path.join(directory, "time2.dat"), "w") as f:
+        f.write("{:9.2f}{:12.3f}{:12.3f} 1\n".format(50010, 0, values[1]))
+
+
+def test_cache(tmp_path, monkeypatch):
+    clock_dir = tmp_path / "clock"
+    cache_dir = tmp_path / "cache"
+    clock_dir.mkdir()
+    write_time_dat(str(clock_dir), [1.0, 2.0])
+    sources = [ClockSource(str(clock_dir / "time.dat"), format="tempo", obscode="1")]
+    assert len(sources[0].files()) == 2
+    key = _chain_key(sources)
+
+    chain = load_clock_chain(sources, cache_dir=str(cache_dir))
+    assert os.listdir(cache_dir) == [key + ".npz"]
+    assert np.allclose(chain.evaluate(np.array([50005.0])), 1.5e-6)
+
+    def fail(cls, sources):
+        raise AssertionError("clock files should not be read again")
+
+    with monkeypatch.context() as m:
+        m.setattr(ClockChain, "from_sources", classmethod(fail))
+        cached = load_clock_chain(sources, cache_dir=str(cache_dir))
+    assert np.array_equal(cached.mjd, chain.mjd)
+    assert np.array_equal(cached.corr, chain.corr)
+    assert cached.ranges == chain.ranges
+
+    # Changing the included file invalidates the entry
+    write_time_dat(str(clock_dir), [1.0, 4.0])
+    st = os.stat(clock_dir / "time2.dat")
+    os.utime(clock_dir / "time2.dat", ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+    assert _chain_key(sources) != key
+    chain = load_clock_chain(sources, cache_dir=str(cache_dir))
+    assert np.allclose(chain.evaluate(np.array([50005.0])), 2.5e-6)
+    assert len(os.listdir(cache_dir)) == 2
@@ -45,5 +45,57 @@ class TestDD(unittest.TestCase):
         ), "DD B1855 TEST FAILED"
 
 
+def test_dd_kepler_solved_once():
+    m = mb.get_model(os.path.join(datadir, "B1855+09_NANOGrav_dfg+12_modified_DD.par"))
+    t = toa.get_TOAs(
+        os.path.join(datadir, "B1855+09_NANOGrav_dfg+12.tim"),
+        ephem="DE405",
+        planets=False,
+        include_bipm=False,
+    )
+    b = m.binary_instance
+    solve = b.compute_eccentric_anomaly
+    calls = []
+
+    def counting_solve(*args):
+        calls.append(args)
+        return solve(*args)
+
+    b.compute_eccentric_anomaly = counting_solve
+    m.designmatrix(t)
+    assert len(calls) == 1
+    # M2 does not affect the eccentric anomaly
+    d = m.binarymodel_delay(t, None)
+    m.M2.value *= 1.1
+    assert np.any(m.binarymodel_delay(t, None) != d)
+    assert len(calls) == 1
+    m.ECC.value *= 1.1
+    m.binarymodel_delay(t, None)
+    assert len(calls) == 2
+
+
+def test_dd_derivatives_share_barycentric_toas():
+    m = mb.get_model(os.path.join(datadir, "B1855+09_NANOGrav_dfg+12_modified_DD.par"))
+    t = toa.get_TOAs(
+        os.path.join(datadir, "B1855+09_NANOGrav_dfg+12.tim"),
+        ephem="DE405",
+        planets=False,
+        include_bipm=False,
+    )
+    expected = {p: m.d_delay_d_param(t, p) for p in ["A1", "ECC", "PB", "M2"]}
+    get_barycentric_toas = m.get_barycentric_toas
+    calls = []
+
+    def counting_get_barycentric_toas(*args, **kwargs):
+        calls.append(args)
+        return get_barycentric_toas(*args, **kwargs)
+
+    m.get_barycentric_toas = counting_get_barycentric_toas
+    with m.evaluation_cache(t):
+        for p, d in expected.items():
+            assert np.all(m.d_delay_d_param(t, p) == d)
+    assert len(calls) == 1
+
+
 if __name__ == "__main__":
     pass
@@ -2,10 +2,12 @@
 import os
 import pytest
 import numpy as np
+import scipy.sparse
 
 from pint.models import get_model
 from pint.toa import get_TOAs
 from pint.pint_matrix import (
+    ColumnBlockMatrix,
     DesignMatrixMaker,
     combine_design_matrices_by_quantity,
     combine_design_matrices_by_param,
@@ -111,3 +113,52 @@ class TestDesignMatrix:
             ]
             == 0.0
         )
+
+
+def test_column_block_matrix():
+    rng = np.random.default_rng(0)
+    M = rng.standard_normal((50, 6))
+    sparse_columns = [1, 2, 4]
+    M[:, sparse_columns] *= rng.random((50, 3)) < 0.2
+    dense_columns = [0, 3, 5]
+    S = ColumnBlockMatrix(
+        M[:, dense_columns],
+        dense_columns,
+        scipy.sparse.csc_matrix(M[:, sparse_columns]),
+        sparse_columns,
+    )
+    w = rng.random(50) + 0.5
+    x = rng.standard_normal(6)
+    assert S.shape == M.shape
+    assert np.array_equal(S.toarray(), M)
+    assert np.array_equal(S.divide_rows(w).toarray(), M / w[:, None])
+    assert np.array_equal(S.multiply_rows(w).toarray(), w[:, None] * M)
+    assert np.allclose(S.sum_squares(), np.sum(M ** 2, axis=0), rtol=1e-14, atol=0)
+    assert np.array_equal(S.columns(2, 5), M[:, 2:5])
+    assert np.array_equal(S.rows(10, 20), M[10:20])
+    assert np.allclose(S.dot(x), M @ x)
+    assert np.allclose(S.rdot(w), M.T @ w)
+    assert np.allclose(S.gram(), M.T @ M)
+    assert np.allclose(S.gram(w), M.T @ (w[:, None] * M))
+    A = scipy.sparse.random(7, 50, density=0.1, random_state=0)
+    assert np.allclose(S.premultiply(A).toarray(), A @ M)
+    extra = rng.standard_normal((50, 2))
+    assert np.array_equal(S.append_dense(extra).toarray(), np.hstack((M, extra)))
+    S.divide_columns(x)
+    assert np.array_equal(S.toarray(), M / x)
+
+
+def test_sparse_designmatrix():
+    os.chdir(datadir)
+    model = get_model("B1855+09_NANOGrav_9yv1.gls.par")
+    toas = get_TOAs("B1855+09_NANOGrav_9yv1.tim")
+    M, params, units = model.designmatrix(toas)
+    S, sparse_params, sparse_units = model.designmatrix(toas, sparse=True)
+    assert sparse_params == params
+    assert sparse_units == units
+    assert np.array_equal(S.toarray(), M)
+    sparse_names = [params[i] for i in S.sparse_columns]
+    assert "DMX_0001" in sparse_names
+    assert "F0" not in sparse_names
+    assert np.all(S.sparse.getnnz(axis=0) <= len(toas) / 4)
+    assert S.nnz < M.size / 2
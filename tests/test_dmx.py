@@ -1,13 +1,15 @@
+import io
 import logging
 import os
 import unittest
 
 import astropy.units as u
 import numpy as np
+import pytest
 
 import pint.toa as toa
 from pint import residuals
-from pint.models import model_builder as mb
+from pint.models import get_model, model_builder as mb
 from pinttestdata import datadir
 
 
@@ -58,5 +60,65 @@ class TestDMX(unittest.TestCase):
             assert np.nanmax(relative_diff) < tol, msg
 
 
+dmx_par = """
+PSR J1234+5678
+ELAT 10
+ELONG 20
+PEPOCH 55000
+F0 100 1
+DM 10
+DMX 14
+DMX_0001 0.001 1
+DMXR1_0001 54000
+DMXR2_0001 54100
+DMX_0002 0.002 1
+DMXR1_0002 54100.5
+DMXR2_0002 54300
+DMX_0003 -0.001 1
+DMXR1_0003 54400
+DMXR2_0003 54500
+"""
+
+
+@pytest.mark.parametrize("overlap", [False, True])
+def test_dmx_bins(overlap):
+    model = get_model(io.StringIO(dmx_par))
+    if overlap:
+        model.DMXR2_0002.value = 54450
+    t = toa.make_fake_toas(53900, 54600, 200, model)
+    dmx = model.components["DispersionDMX"]
+    params, bins, found_overlap = dmx.dmx_bins(t)
+    assert params == ["DMX_0001", "DMX_0002", "DMX_0003"]
+    assert found_overlap == overlap
+    mjds = t.table["mjd_float"]
+    dm = np.zeros(len(t))
+    for i, p in enumerate(params):
+        r1, r2 = (
+            getattr(model, "DMXR1" + p[3:]).value,
+            getattr(model, "DMXR2" + p[3:]).value,
+        )
+        in_range = (mjds >= r1) & (mjds <= r2)
+        assert np.all(bins[in_range & (bins != i)] > i)
+        dm[in_range] = getattr(model, p).value
+        d = dmx.d_dm_d_DMX(t, p)
+        assert np.all(d[in_range] == 1) and np.all(d[~in_range] == 0)
+    assert np.all(bins[dm == 0] == -1)
+    assert np.all(dmx.dmx_dm(t).value == dm)
+
+
+@pytest.mark.parametrize("overlap", [False, True])
+def test_dmx_designmatrix_block(overlap):
+    model = get_model(io.StringIO(dmx_par))
+    if overlap:
+        model.DMXR2_0002.value = 54450
+    t = toa.make_fake_toas(53900, 54600, 200, model)
+    M, params, units = model.designmatrix(t)
+    delay = model.delay(t)
+    for i, p in enumerate(params):
+        if p.startswith("DMX_"):
+            q = -model.d_phase_d_param(t, delay, p) / model.F0.quantity
+            assert np.allclose(M[:, i], q.to_value(units[i]), rtol=1e-12, atol=0), p
+
+
 if __name__ == "__main__":
     pass
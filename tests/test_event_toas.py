@@ -0,0 +1,82 @@
+import os
+
+import numpy as np
+import pytest
+from astropy.coordinates import SkyCoord
+from pinttestdata import datadir
+
+import pint.models
+import pint.toa as toa
+from pint.event_toas import iter_event_TOAs, load_NICER_TOAs
+from pint.fermi_toas import iter_Fermi_TOAs, load_Fermi_TOAs
+
+eventfile_nicer = os.path.join(datadir, "ngc300nicer_bary.evt")
+eventfile_fermi = os.path.join(
+    datadir, "J0030+0451_P8_15.0deg_239557517_458611204_ft1weights_GEO_wt.gt.0.4.fits"
+)
+parfile_fermi = os.path.join(datadir, "PSRJ0030+0451_psrcat.par")
+
+
+def concatenate_chunks(chunks):
+    rows, mjds, flags = [], [], []
+    for r, ts in chunks:
+        rows.append(r)
+        mjds.append(ts.get_mjds(high_precision=True))
+        flags.append(ts.table["flags"])
+    return np.concatenate(rows), np.concatenate(mjds), flags
+
+
+@pytest.mark.parametrize("chunksize", [300, 100000])
+def test_iter_event_TOAs(chunksize):
+    minmjd, maxmjd = 58155.7, 58155.75
+    ts = toa.get_TOAs_list(
+        load_NICER_TOAs(eventfile_nicer, minmjd=minmjd, maxmjd=maxmjd),
+        include_bipm=False,
+        include_gps=False,
+    )
+    rows, mjds, flags = concatenate_chunks(
+        iter_event_TOAs(
+            eventfile_nicer,
+            "nicer",
+            minmjd=minmjd,
+            maxmjd=maxmjd,
+            chunksize=chunksize,
+            include_bipm=False,
+            include_gps=False,
+        )
+    )
+    assert 0 < len(rows) < 2408
+    assert np.all(np.diff(rows) > 0)
+    assert np.all(mjds == ts.get_mjds(high_precision=True))
+    pha = np.concatenate([f.get_values("pha")[0] for f in flags])
+    assert np.all(pha == ts.table["flags"].get_values("pha")[0].astype(int))
+
+
+def test_iter_Fermi_TOAs():
+    model = pint.models.get_model(parfile_fermi)
+    tc = SkyCoord(model.RAJ.quantity, model.DECJ.quantity, frame="icrs")
+    kwargs = dict(weightcolumn="CALC", targetcoord=tc, minweight=0.1, maxmjd=55000)
+    ts = toa.get_TOAs_list(
+        load_Fermi_TOAs(eventfile_fermi, **kwargs),
+        include_bipm=False,
+        include_gps=False,
+    )
+    chunks = list(
+        iter_Fermi_TOAs(
+            eventfile_fermi,
+            chunksize=1000,
+            include_bipm=False,
+            include_gps=False,
+            **kwargs
+        )
+    )
+    rows, mjds, flags = concatenate_chunks(chunks)
+    assert len(chunks) > 1
+    assert np.all(mjds == ts.get_mjds(high_precision=True))
+    weights = np.concatenate([f.get_values("weight")[0] for f in flags])
+    assert np.allclose(weights, ts.table["flags"].get_values("weight")[0].astype(float))
+    assert np.all(weights > 0.1)
+    phase = model.phase(ts, abs_phase=True)
+    phases = [model.phase(t, abs_phase=True) for r, t in chunks]
+    assert np.all(np.concatenate([p.int for p in phases]) == phase.int)
+    assert np.all(np.concatenate([p.frac for p in phases]) == phase.frac)
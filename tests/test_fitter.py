@@ -1,10 +1,12 @@
 #! /usr/bin/env python
+import io
 import os
 from copy import deepcopy
 
 # import matplotlib
 # matplotlib.use('TKAgg')
 import matplotlib.pyplot as plt
+import numpy as np
 import pytest
 import astropy.units as u
 
@@ -196,3 +198,58 @@ def test_ftest_wb():
     # Test removing parallax
     Ftest_dict = wb_f.ftest(PX, PX_Component, remove=True, full_output=True)
     assert isinstance(Ftest_dict["ft"], float) or isinstance(Ftest_dict["ft"], bool)
+
+
+@pytest.mark.parametrize("fitter_class", [fitter.WLSFitter, fitter.GLSFitter])
+def test_sparse_fit_matches_dense(fitter_class, monkeypatch):
+    # Use several blocks of rows, as a large fit would
+    monkeypatch.setattr(fitter, "_ROWS_PER_BLOCK", 300)
+    lines = [
+        "PSR J1234+5618",
+        "RAJ 12:34:00.0 1",
+        "DECJ 56:18:00.0 1",
+        "F0 100.0 1",
+        "F1 -1e-15 1",
+        "PEPOCH 55000",
+        "DM 10.0 1",
+        "EPHEM DE421",
+        "JUMP -be A 0.0 1",
+        "JUMP -be B 0.0 1",
+        "ECORR -be C 0.5",
+        "TNRedAmp -13",
+        "TNRedGam 3",
+        "TNRedC 10",
+        "DMX 50",
+    ]
+    for i in range(1, 21):
+        lines += [
+            "DMX_{:04d} 0.0 1".format(i),
+            "DMXR1_{:04d} {}".format(i, 54000 + 50 * i),
+            "DMXR2_{:04d} {}".format(i, 54050 + 50 * i),
+        ]
+    m = tm.get_model(io.StringIO("\n".join(lines)))
+    freqs = np.where(np.arange(2000) % 2, 800, 1400) * u.MHz
+    t = toa.make_fake_toas(54050, 55050, 2000, m, freq=freqs)
+    for i, f in enumerate(t.table["flags"]):
+        f["be"] = "ABC"[i % 3]
+    m.F0.value += 1e-10
+    m.DMX_0003.value = 1e-3
+    m.JUMP1.value = 1e-6
+
+    f = fitter_class(t, m)
+    chi2 = f.fit_toas()
+    values = {p: getattr(f.model, p).value for p in f.model.free_params}
+    errors = {p: getattr(f.model, p).uncertainty_value for p in f.model.free_params}
+    covariance = f.covariance_matrix
+    noise = getattr(f.resids, "noise_resids", {})
+    f.reset_model()
+    f.update_resids()
+    # The dense and sparse fits do the same sums in the same order
+    assert f.fit_toas(sparse=True) == chi2
+    for p, v in values.items():
+        par = getattr(f.model, p)
+        assert par.value == v, p
+        assert par.uncertainty_value == errors[p], p
+    assert np.array_equal(f.covariance_matrix, covariance)
+    for c, r in noise.items():
+        assert np.array_equal(f.resids.noise_resids[c], r), c
@@ -77,3 +77,41 @@ class TestGLS(unittest.TestCase):
 
     def test_has_correlated_errors(self):
         assert self.f.resids.model.has_correlated_errors
+
+    def test_ecorr_epochs_match_basis(self):
+        ecorr = self.f.model.components["EcorrNoise"]
+        U, weight = ecorr.ecorr_basis_weight_pair(self.t)
+        epochs, epoch_weight = ecorr.ecorr_epochs(self.t)
+        assert np.all(epoch_weight == weight)
+        assert np.all(U.sum(axis=1)[epochs < 0] == 0)
+        assert np.all(U[epochs >= 0, epochs[epochs >= 0]] == 1)
+
+    def test_gls_compare_params(self):
+        self.fit(full_cov=False)
+        pars = self.f.model.free_params
+        vals = [getattr(self.f.model, p).value for p in pars]
+        errs = [getattr(self.f.model, p).uncertainty_value for p in pars]
+        assert "ecorr_noise" in self.f.resids.noise_resids
+        self.fit(full_cov=True)
+        for p, v, e in zip(pars, vals, errs):
+            par = getattr(self.f.model, p)
+            assert np.abs(par.value - v) < 1e-3 * e, p
+            assert np.isclose(par.uncertainty_value, e, rtol=1e-3), p
+
+    def test_gls_sparse(self):
+        self.fit(full_cov=False)
+        chi2 = self.f.resids.chi2
+        pars = self.f.model.free_params
+        vals = [getattr(self.f.model, p).value for p in pars]
+        errs = [getattr(self.f.model, p).uncertainty_value for p in pars]
+        noise = self.f.resids.noise_resids
+        self.f.reset_model()
+        self.f.update_resids()
+        self.f.fit_toas(sparse=True)
+        assert self.f.resids.chi2 == chi2
+        for p, v, e in zip(pars, vals, errs):
+            par = getattr(self.f.model, p)
+            assert par.value == v, p
+            assert par.uncertainty_value == e, p
+        for k, v in noise.items():
+            assert np.array_equal(self.f.resids.noise_resids[k], v), k
@@ -1,5 +1,6 @@
 import astropy.units as u
 import numpy as np
+import pytest
 from numpy.testing import assert_allclose
 
 import pint.orbital.kepler as kepler
@@ -20,6 +21,27 @@ def test_mass_derivs():
     check_all_partials(kepler.mass_partials, [a, pb])
 
 
+@pytest.mark.parametrize("dtype", [np.float64, np.longdouble])
+@pytest.mark.parametrize("e", [0, 1e-8, 0.1, 0.5, 0.9, 0.99, 0.999999])
+def test_solve_kepler(dtype, e):
+    mean_anomaly = np.linspace(-1000, 1000, 10001, dtype=dtype)
+    E = kepler.solve_kepler(dtype(e), mean_anomaly)
+    assert E.dtype == dtype
+    residual = E - e * np.sin(E) - mean_anomaly
+    assert np.all(np.abs(residual) <= 8 * np.finfo(dtype).eps * 1000)
+
+
+def test_solve_kepler_scalar():
+    E = kepler.solve_kepler(0.3, 1.0)
+    assert np.isscalar(E)
+    assert_allclose(E - 0.3 * np.sin(E), 1.0, rtol=0, atol=1e-15)
+
+
+def test_solve_kepler_bad_eccentricity():
+    with pytest.raises(ValueError):
+        kepler.solve_kepler(np.array([0.1, 1.0]), np.array([1.0, 2.0]))
+
+
 def test_kepler_2d_t0():
     p = kepler.Kepler2DParameters(a=2, pb=3, eps1=0.2, eps2=0.1, t0=1)
     xyv, _ = kepler.kepler_2d(p, p.t0)
@@ -92,7 +92,9 @@ def test_name_mask(toas):
     assert mp_name.key_value == ["53393.000009.3.000.000.9y.x.ff"]
     select_toas = mp_name.select_toa_mask(toas)
     assert len(select_toas) > 0
-    raw_selection = np.where(toas.table["name"] == "53393.000009.3.000.000.9y.x.ff")
+    raw_selection = np.where(
+        [f.get("name") == "53393.000009.3.000.000.9y.x.ff" for f in toas.table["flags"]]
+    )
     assert np.all(select_toas == raw_selection[0])
     with pytest.raises(ValueError):
         mp_wrong_keyvalue = maskParameter(
@@ -111,10 +113,49 @@ def test_flag_mask(toas):
     assert mp_flag3.key_value == ["L-wide"]
     select_toas = mp_flag3.select_toa_mask(toas)
     assert len(select_toas) > 0
-    raw_selection = np.where(toas.table["fe"] == "L-wide")
+    raw_selection = np.where([f.get("fe") == "L-wide" for f in toas.table["flags"]])
     assert np.all(select_toas == raw_selection[0])
 
 
+def test_masks_share_selection(toas):
+    mp1 = maskParameter("test1", key="-fe", key_value="L-wide")
+    mp2 = maskParameter("test2", key="-fe", key_value="L-wide")
+    assert mp1.select_toa_mask(toas) is mp2.select_toa_mask(toas)
+    mp_mjd = maskParameter("test3", key="mjd", key_value=[54000, 54100])
+    assert mp_mjd.select_toa_mask(toas) is mp_mjd.select_toa_mask(toas)
+    with pytest.raises(ValueError):
+        mp1.select_toa_mask(toas)[0] = 0
+    # The selection follows changes to the flags and columns
+    first = mp1.select_toa_mask(toas)[0]
+    toas.table["flags"][first]["fe"] = "S-wide"
+    assert first not in mp1.select_toa_mask(toas)
+    toas.table["mjd_float"][first] = 54050
+    assert first in mp_mjd.select_toa_mask(toas)
+
+
+@pytest.mark.parametrize(
+    "key,key_value,column,value",
+    [("freq", [1000, 2000], "freq", 3000.0), ("tel", "ao", "obs", "gbt")],
+)
+def test_mask_follows_column_written_in_place(toas, key, key_value, column, value):
+    mp = maskParameter("test1", key=key, key_value=key_value)
+    selected = mp.select_toa_mask(toas)
+    assert len(selected) > 0
+    first = selected[0]
+    toas.table[column][first] = value
+    assert np.all(mp.select_toa_mask(toas) == selected[1:])
+
+
+def test_mask_follows_adjust_TOAs(toas):
+    mp = maskParameter("test1", key="mjd", key_value=[54000, 54100])
+    mp_earlier = maskParameter("test2", key="mjd", key_value=[53800, 53900])
+    earlier = mp_earlier.select_toa_mask(toas)
+    assert len(earlier) > 0
+    assert not np.array_equal(mp.select_toa_mask(toas), earlier)
+    toas.adjust_TOAs(time.TimeDelta(np.full(toas.ntoas, 200.0) * u.day))
+    assert np.all(mp.select_toa_mask(toas) == earlier)
+
+
 def test_read_from_par(toas):
     temp_par = """
             F0    10 1 0.0001
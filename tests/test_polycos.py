@@ -101,3 +101,38 @@ def test_generate_polycos(tmpdir, par_file, obs, obsfreq, nspan, ncoeff):
     assert np.allclose(ph1.frac.value[0], ph3.frac.value[0])
     assert np.allclose(ph2.int.value[0], ph3.int.value[0])
     assert np.allclose(ph2.frac.value[0], ph3.frac.value[0])
+
+
+def test_generate_polycos_multiprocess(par_file):
+    model = get_model(str(par_file))
+    p = Polycos()
+    p.generate_polycos(model, 55000, 55000.5, "ao", 60, 12, 1400.0)
+    q = Polycos()
+    q.generate_polycos(model, 55000, 55000.5, "ao", 60, 12, 1400.0, ncpu=2)
+    assert len(p.polycoTable) == len(q.polycoTable)
+    mjds = np.linspace(55000, 55000.5, 101)
+    assert np.all(p.eval_abs_phase(mjds).int == q.eval_abs_phase(mjds).int)
+    assert np.allclose(
+        p.eval_abs_phase(mjds).frac.value, q.eval_abs_phase(mjds).frac.value, atol=1e-9
+    )
+
+
+def test_eval_unsorted_times(polyco_file):
+    p = Polycos()
+    p.read_polyco_file(polyco_file)
+    entries = p.polycoTable["entry"]
+    ts = np.concatenate(
+        [
+            np.linspace(e.tstart.value + 1e-6, e.tstop.value - 1e-6, 5)
+            for e in entries[:3]
+        ]
+    )
+    ts = ts[np.random.default_rng(0).permutation(len(ts))]
+    idx = p.find_entry(ts)
+    ph = p.eval_abs_phase(ts)
+    freq = p.eval_spin_freq(ts)
+    for i, t in enumerate(ts):
+        e = entries[idx[i]]
+        assert ph.int[i] == e.evalabsphase(t).int[0]
+        assert ph.frac[i] == e.evalabsphase(t).frac[0]
+        assert freq[i] == e.evalfreq(t)
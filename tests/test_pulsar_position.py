@@ -6,6 +6,7 @@ import unittest
 import numpy as np
 
 import pint.models.model_builder as mb
+from pint.models.astrometry import Astrometry
 from pinttestdata import datadir
 
 
@@ -46,6 +47,29 @@ class TestPulsarPosition(unittest.TestCase):
 
         self.assertTrue(np.max(np.abs(p1 - p2)) < 1e-7)
 
+    def test_ssb_2_psr_matches_skycoord(self):
+        for m in (self.m1, self.m2):
+            p = m.ssb_to_psb_xyz_ICRS(epoch=self.t)
+            c = m.coords_as_ICRS(epoch=self.t)
+            assert p.shape == (len(self.t), 3)
+            assert np.max(np.abs(p - c.cartesian.xyz.transpose())) < 1e-12
+            e = m.ssb_to_psb_xyz_ECL(epoch=self.t)
+            c = m.coords_as_ECL(epoch=self.t)
+            assert np.max(np.abs(e - c.cartesian.xyz.transpose())) < 1e-12
+
+    def test_ssb_2_psr_base_class(self):
+        # Astrometry components that do not provide a closed form go through
+        # SkyCoord.
+        for m, name in (
+            (self.m1, "AstrometryEcliptic"),
+            (self.m2, "AstrometryEquatorial"),
+        ):
+            comp = m.components[name]
+            p = Astrometry.ssb_to_psb_xyz_ICRS(comp, epoch=self.t)
+            assert np.max(np.abs(p - comp.ssb_to_psb_xyz_ICRS(epoch=self.t))) < 1e-12
+            e = Astrometry.ssb_to_psb_xyz_ECL(comp, epoch=self.t)
+            assert np.max(np.abs(e - comp.ssb_to_psb_xyz_ECL(epoch=self.t))) < 1e-12
+
     def test_parse_line(self):
         self.m1.ELONG.from_parfile_line(
             "LAMBDA   286.8634893301156  1  0.0000000165859"
@@ -0,0 +1,110 @@
+import os
+
+import astropy.units as u
+import numpy as np
+import pytest
+from astropy.table import Table
+from astropy.time import Time
+from pinttestdata import datadir
+
+from pint.observatory.satellite_obs import (
+    HermiteOrbit,
+    get_satellite_observatory,
+    load_orbit_array,
+    orbit_array,
+)
+
+orbits = [
+    ("NICER", os.path.join(datadir, "sgr1830.orb")),
+    ("RXTE", os.path.join(datadir, "FPorbit_Day6223")),
+]
+
+
+@pytest.fixture(scope="module", params=orbits, ids=[o[0] for o in orbits])
+def satellites(request, tmp_path_factory):
+    name, filename = request.param
+    cachedir = str(tmp_path_factory.mktemp("orbit"))
+    spline = get_satellite_observatory(name + "_spline_test", filename)
+    hermite = get_satellite_observatory(
+        name + "_hermite_test",
+        filename,
+        interpolator="hermite",
+        usecache=True,
+        cachedir=cachedir,
+    )
+    return spline, hermite
+
+
+def test_hermite_matches_spline(satellites):
+    spline, hermite = satellites
+    mjd = np.asarray(spline.FT2["MJD_TT"])
+    t = Time((mjd[:-1] + mjd[1:]) / 2, format="mjd", scale="tt")
+    pos, vel = hermite._geo_posvel(t)
+    pos_spline, vel_spline = spline._geo_posvel(t)
+    assert np.allclose(pos, pos_spline, rtol=0, atol=10 * u.m)
+    assert np.allclose(vel, vel_spline, rtol=0, atol=1 * u.m / u.s)
+    assert np.all(hermite.get_gcrs(t) == pos)
+
+
+def test_hermite_nodes(satellites):
+    spline, hermite = satellites
+    mjd = np.asarray(spline.FT2["MJD_TT"])
+    t = Time(mjd, format="mjd", scale="tt")
+    pos, vel = hermite._geo_posvel(t)
+    for i, c in enumerate("XYZ"):
+        assert np.allclose(pos[i], spline.FT2[c].quantity, rtol=1e-12)
+        assert np.allclose(vel[i], spline.FT2["V" + c.lower()].quantity, rtol=1e-9)
+    with pytest.raises(ValueError):
+        hermite._geo_posvel(Time(mjd[-1] + 1e-3, format="mjd", scale="tt"))
+
+
+def test_hermite_cubic():
+    mjd = 55000 + np.array([0, 10, 25, 30, 60, 65, 90]) / 86400
+    s = (mjd - mjd[0]) * 86400
+    coeffs = np.array([[7e6, 1e3, -2.0, 0.01], [1e6, -3e3, 1.0, 0.02], [0, 5, 0, 0]])
+    pos = np.array([np.polyval(c[::-1], s) for c in coeffs])
+    vel = np.array([np.polyval(np.polyder(c[::-1]), s) for c in coeffs])
+    orbit = HermiteOrbit(np.vstack([mjd, pos, vel]).T)
+    x = np.linspace(mjd[0], mjd[-1], 101)
+    s = (x - mjd[0]) * 86400
+    p, v = orbit.posvel(x)
+    assert np.allclose(p, [np.polyval(c[::-1], s) for c in coeffs], rtol=1e-12)
+    assert np.allclose(
+        v, [np.polyval(np.polyder(c[::-1]), s) for c in coeffs], rtol=1e-9
+    )
+    assert np.array_equal(orbit.position(x), p)
+
+
+def test_orbit_array():
+    table = Table(
+        [
+            [3.0, 1.0, 2.0, 2.0] * u.d,
+            [3.0, 1.0, 2.0, 5.0] * u.km,
+            [0.0] * 4 * u.km,
+            [0.0] * 4 * u.km,
+            [1.0] * 4 * u.km / u.s,
+            [0.0] * 4 * u.km / u.s,
+            [0.0] * 4 * u.km / u.s,
+        ],
+        names=("MJD_TT", "X", "Y", "Z", "Vx", "Vy", "Vz"),
+    )
+    orbit = orbit_array(table)
+    assert orbit.shape == (3, 7)
+    assert orbit[:, 0].tolist() == [1.0, 2.0, 3.0]
+    assert orbit[:, 1].tolist() == [1000.0, 2000.0, 3000.0]
+    assert np.all(orbit[:, 4] == 1000.0)
+
+
+def test_orbit_cache(tmp_path):
+    name, filename = orbits[0]
+    orbit = load_orbit_array(name, filename, cachedir=str(tmp_path))
+    assert len(os.listdir(tmp_path)) == 1
+    cached = load_orbit_array(name, filename, cachedir=str(tmp_path))
+    assert isinstance(cached, np.memmap)
+    assert np.array_equal(cached, orbit)
+
+
+def test_unknown_interpolator():
+    name, filename = orbits[1]
+    with pytest.raises(ValueError):
+        get_satellite_observatory(name + "_bad", filename, interpolator="linear")
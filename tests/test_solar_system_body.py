@@ -8,7 +8,11 @@ import numpy as np
 from astropy.coordinates import solar_system_ephemeris
 
 from pint.config import datapath
-from pint.solar_system_ephemerides import objPosVel, objPosVel_wrt_SSB
+from pint.solar_system_ephemerides import (
+    objPosVel,
+    objPosVel_wrt_SSB,
+    objPosVels_wrt_SSB,
+)
 from pinttestdata import datadir
 
 # Hack to support FileNotFoundError in Python 2
@@ -60,6 +64,27 @@ class TestSolarSystemDynamic(unittest.TestCase):
                 assert a.pos.shape == (3, 10000)
                 assert a.vel.shape == (3, 10000)
 
+    def test_engines_agree(self):
+        objs = ["earth", "sun", "moon", "earth-moon-barycenter"] + self.planets
+        for ep in self.ephem:
+            spk = objPosVels_wrt_SSB(objs, self.tdb_time, ep)
+            for obj in objs:
+                a = objPosVel_wrt_SSB(obj, self.tdb_time, ep, engine="astropy")
+                assert np.array_equal(spk[obj].pos, a.pos)
+                assert np.array_equal(spk[obj].vel, a.vel)
+
+    def test_engine_shapes(self):
+        for t in [self.tdb_time[0], self.tdb_time[:6].reshape(2, 3)]:
+            a = objPosVel_wrt_SSB("earth", t, "de421", engine="astropy")
+            b = objPosVel_wrt_SSB("earth", t, "de421", engine="spk")
+            assert b.pos.shape == a.pos.shape
+            assert np.array_equal(b.pos, a.pos)
+            assert np.array_equal(b.vel, a.vel)
+
+    def test_unknown_engine(self):
+        with pytest.raises(ValueError):
+            objPosVel_wrt_SSB("earth", self.tdb_time, "de421", engine="erfa")
+
     def test_earth2obj(self):
         objs = self.planets + ["sun"]
         for obj in objs:
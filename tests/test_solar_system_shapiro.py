@@ -0,0 +1,93 @@
+import io
+
+import astropy.units as u
+import numpy as np
+import pytest
+
+import pint.toa
+from pint.models import get_model
+
+par_equatorial = """
+PSR J1234+5678
+RAJ 12:00:00 1
+DECJ 05:00:00 1
+PMRA 3 1
+PMDEC -2 1
+"""
+
+par_ecliptic = """
+PSR J1234+5678
+ELONG 181.0 1
+ELAT 1.5 1
+PMELONG 3 1
+PMELAT -2 1
+"""
+
+par_rest = """
+PEPOCH 55000
+POSEPOCH 55000
+F0 100 1
+DM 10
+PLANET_SHAPIRO Y
+"""
+
+
+@pytest.fixture(scope="module")
+def toas():
+    rng = np.random.default_rng(0)
+    return pint.toa.merge_TOAs(
+        [
+            pint.toa.get_TOAs_array(
+                np.sort(rng.uniform(53000, 58000, 200)),
+                obs,
+                freqs=1400.0,
+                errors=1.0,
+                ephem="DE421",
+                planets=True,
+            )
+            for obs in ["gbt", "ao", "barycenter"]
+        ]
+    )
+
+
+@pytest.fixture(params=[par_equatorial, par_ecliptic])
+def model(request):
+    return get_model(io.StringIO(request.param + par_rest))
+
+
+def test_delay_matches_per_body(model, toas):
+    shapiro = model.components["SolarSystemShapiro"]
+    delay = shapiro.solar_system_shapiro_delay(toas)
+    psr_dir = model.psr_dir_ICRS(toas)
+    expected = np.zeros(toas.ntoas)
+    for body in ["sun", "jupiter", "saturn", "venus", "uranus", "neptune"]:
+        expected += shapiro.ss_obj_shapiro_delay(
+            toas.table["obs_" + body + "_pos"], psr_dir, shapiro._ss_mass_sec[body]
+        )
+    barycentric = toas.table["obs"] == "barycenter"
+    expected[barycentric] = 0
+    assert np.all(delay[barycentric] == 0)
+    assert np.allclose(delay.to_value(u.s), expected, rtol=1e-12, atol=1e-18)
+
+
+def test_astrometry_derivatives(model, toas):
+    shapiro = model.components["SolarSystemShapiro"]
+    params = list(shapiro.deriv_funcs)
+    assert len(params) == 4
+    for p in params:
+        assert shapiro.d_delay_d_astrometry in model.delay_deriv_funcs[p]
+        par = getattr(model, p)
+        value = par.value
+        h = 1e-7 if p in ["RAJ", "DECJ", "ELONG", "ELAT"] else 1e-2
+        delays = []
+        for step in [h, -h]:
+            par.value = value + step
+            delays.append(shapiro.solar_system_shapiro_delay(toas).to_value(u.s))
+        par.value = value
+        numerical = (delays[0] - delays[1]) / (2 * h)
+        analytic = shapiro.d_delay_d_astrometry(toas, p).to_value(
+            u.s / par.units, equivalencies=u.dimensionless_angles()
+        )
+        assert np.allclose(
+            analytic, numerical, rtol=1e-4, atol=1e-4 * max(abs(numerical))
+        )
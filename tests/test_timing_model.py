@@ -252,6 +252,44 @@ def test_iterator(model_0437):
     assert [k for k in model_0437] == model_0437.params
 
 
+def test_param_index_follows_changes(model_0437):
+    m = model_0437
+    assert m.match_param_aliases("PSRJ") == "PSR"
+    assert "TESTPAR" not in m
+    m.components["Spindown"].add_param(
+        p.floatParameter(name="TESTPAR", value=1.0, units="s", aliases=["TP"])
+    )
+    assert "TESTPAR" in m.params
+    assert m["TESTPAR"] is m.components["Spindown"].TESTPAR
+    assert m.match_param_aliases("TP") == "TESTPAR"
+    m.TESTPAR.frozen = False
+    assert "TESTPAR" in m.free_params
+    m.remove_param("TESTPAR")
+    assert "TESTPAR" not in m
+    assert "TESTPAR" not in m.free_params
+    with pytest.raises(ValueError):
+        m.match_param_aliases("TP")
+    with pytest.raises(AttributeError):
+        m.TESTPAR
+
+
+def test_components_follow_changes():
+    tm = TimingModel("TestTimingModel", [AstrometryEquatorial(), Spindown()])
+    assert tm.spindown_phase in tm.phase_funcs
+    assert "T0" not in tm
+    tm.add_component(BinaryELL1(), validate=False)
+    assert "BinaryELL1" in tm.components
+    assert "T0" in tm.params
+    binary_delay = tm.binarymodel_delay
+    assert binary_delay in tm.delay_funcs
+    assert "A1" in tm.delay_deriv_funcs
+    tm.remove_component("BinaryELL1")
+    assert "BinaryELL1" not in tm.components
+    assert "T0" not in tm
+    assert binary_delay not in tm.delay_funcs
+    assert "A1" not in tm.delay_deriv_funcs
+
+
 par_base = """
 PSR J1234+5678
 ELAT 0
@@ -298,3 +336,66 @@ def test_free_params(lines, param, exception):
 def test_pepoch_late():
     model = get_model(io.StringIO(par_base))
     t = make_fake_toas(56000, 57000, 10, model=model)
+
+
+def test_evaluation_cache(model_0437):
+    toas = make_fake_toas(53000, 54000, 20, model_0437)
+    delay = model_0437.delay(toas)
+    with model_0437.evaluation_cache(toas):
+        d1 = model_0437.delay(toas)
+        d1[0] = 0 * u.s
+        assert np.all(model_0437.delay(toas) == delay)
+        assert model_0437.cached(toas, "x", lambda: 1) == 1
+        assert model_0437.cached(toas, "x", lambda: 2) == 1
+        model_0437.PX.value += 1
+        assert model_0437.cached(toas, "x", lambda: 3) == 3
+        assert np.any(model_0437.delay(toas) != delay)
+    assert model_0437.cached(toas, "x", lambda: 4) == 4
+
+
+def test_evaluation_cache_invalidated(model_0437):
+    toas = make_fake_toas(53000, 54000, 20, model_0437)
+    with model_0437.evaluation_cache(toas):
+        assert model_0437.cached(toas, "x", lambda: 1) == 1
+        model_0437.PX.quantity += 1 * u.mas
+        assert model_0437.cached(toas, "x", lambda: 2) == 2
+        model_0437.DM.quantity = model_0437.DM.quantity
+        assert model_0437.cached(toas, "x", lambda: 3) == 3
+        model_0437.remove_component("SolarSystemShapiro")
+        assert model_0437.cached(toas, "x", lambda: 4) == 4
+        assert model_0437.cached(toas, "x", lambda: 5) == 4
+
+
+def test_designmatrix_cache_matches(model_0437):
+    toas = make_fake_toas(53000, 54000, 20, model_0437)
+    M, params, units = model_0437.designmatrix(toas)
+    delay = model_0437.delay(toas)
+    for i, p in enumerate(params[1:], start=1):
+        q = -model_0437.d_phase_d_param(toas, delay, p) / model_0437.F0.quantity
+        assert np.allclose(M[:, i], q.to_value(units[i]), rtol=1e-12, atol=0), p
+
+
+def test_read_parfile_many_prefix_params():
+    lines = [par_base, "DMX 14"]
+    for i in range(1, 51):
+        lines += [
+            "DMX_{:04d} 0.001 1".format(i),
+            "DMXR1_{:04d} {}".format(i, 50000 + i),
+            "DMXR2_{:04d} {}".format(i, 50000.5 + i),
+        ]
+    lines += [
+        "JUMP -fe L_band 0.1 1",
+        "JUMP -fe S_band 0.2",
+        "EFAC -f L 1.1",
+        "EFAC -f S 1.2",
+    ]
+    model = get_model(io.StringIO("\n".join(lines)))
+    assert model.DMX_0050.value == 0.001
+    assert model.DMXR2_0033.value == 50033.5
+    assert model.JUMP1.key_value == ["L_band"]
+    assert model.JUMP2.key_value == ["S_band"]
+    assert not model.JUMP1.frozen
+    assert model.JUMP2.frozen
+    assert model.EFAC1.value == 1.1
+    assert model.EFAC2.value == 1.2
+    assert get_model(io.StringIO(model.as_parfile())).as_parfile() == model.as_parfile()
@@ -0,0 +1,90 @@
+import os
+import shutil
+
+import numpy as np
+import pytest
+
+from pint import toa
+from pint.toa_cache import TOACache
+from pinttestdata import datadir
+
+
+@pytest.fixture
+def temp_tim(tmpdir):
+    tt = os.path.join(tmpdir, "test.tim")
+    shutil.copy(os.path.join(datadir, "test2.tim"), tt)
+    cd = os.path.join(tmpdir, "cache")
+    return tt, cd
+
+
+def test_cache_used(temp_tim):
+    tt, cd = temp_tim
+    assert not toa.get_TOAs(tt, usecache=True, cachedir=cd).was_pickled
+    assert toa.get_TOAs(tt, usecache=True, cachedir=cd).was_pickled
+    assert len(TOACache(cd).entries()) == 1
+
+
+def test_cache_same_toas(temp_tim):
+    tt, cd = temp_tim
+    t = toa.get_TOAs(tt, usecache=True, cachedir=cd, planets=True)
+    tc = toa.get_TOAs(tt, usecache=True, cachedir=cd, planets=True)
+    assert tc.was_pickled
+    assert tc.table.colnames == t.table.colnames
+    assert np.all(tc.table["tdbld"] == t.table["tdbld"])
+    assert np.all(tc.table["ssb_obs_pos"] == t.table["ssb_obs_pos"])
+    assert np.all(tc.table["obs"] == t.table["obs"])
+    assert np.all(tc.get_mjds(high_precision=True) == t.get_mjds(high_precision=True))
+    assert list(tc.table["flags"]) == list(t.table["flags"])
+    assert tc.ephem == t.ephem
+    assert tc.clock_corr_info == t.clock_corr_info
+    assert np.all(tc.table.groups.indices == t.table.groups.indices)
+
+
+@pytest.mark.parametrize(
+    "k,v,wv",
+    [
+        ("ephem", "DE436", "DE421"),
+        ("planets", True, False),
+        ("bipm_version", "BIPM2019", "BIPM2018"),
+        ("include_bipm", True, False),
+        ("include_gps", True, False),
+    ],
+)
+def test_cache_keyed_on_settings(temp_tim, k, v, wv):
+    tt, cd = temp_tim
+    toa.get_TOAs(tt, usecache=True, cachedir=cd, **{k: v})
+    assert not toa.get_TOAs(tt, usecache=True, cachedir=cd, **{k: wv}).was_pickled
+    assert toa.get_TOAs(tt, usecache=True, cachedir=cd, **{k: v}).was_pickled
+    assert len(TOACache(cd).entries()) == 2
+
+
+def test_cache_content_addressed(temp_tim):
+    tt, cd = temp_tim
+    tt2 = tt + ".also.tim"
+    shutil.copy(tt, tt2)
+    toa.get_TOAs(tt, usecache=True, cachedir=cd)
+    t2 = toa.get_TOAs(tt2, usecache=True, cachedir=cd)
+    assert t2.was_pickled
+    assert t2.filename == tt2
+    assert t2.table.meta["filename"] == tt2
+    assert list(t2.hashes) == [tt2]
+    assert t2.check_hashes()
+    assert toa.get_TOAs(tt, usecache=True, cachedir=cd).filename == tt
+    with open(tt2, "at") as f:
+        f.write("\n")
+    assert not toa.get_TOAs(tt2, usecache=True, cachedir=cd).was_pickled
+
+
+def test_cache_eviction(temp_tim):
+    tt, cd = temp_tim
+    toa.get_TOAs(tt, usecache=True, cachedir=cd)
+    cache = TOACache(cd)
+    (first,) = cache.entries()
+    size = cache.size()
+    cache.max_size = size + size // 2
+    t = toa.get_TOAs(tt, ephem="DE436")
+    key = cache.key(tt, ephem="DE436")
+    cache.save(key, t, tt)
+    assert cache.entries() == [key]
+    assert cache.load(first) is None
+    assert cache.load(key).was_pickled
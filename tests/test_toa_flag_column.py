@@ -0,0 +1,112 @@
+"""Tests of the columnar storage of TOA flags."""
+import copy
+import pickle
+
+import numpy as np
+import pytest
+from astropy.table import Table, vstack
+
+from pint.toa_flags import FlagColumn
+
+
+@pytest.fixture
+def flags():
+    return FlagColumn(
+        [
+            {"fe": "L-wide", "be": "PUPPI", "pn": 1},
+            {"fe": "S-wide", "be": "PUPPI", "pn": 2, "to": 1e-6},
+            {"fe": "L-wide", "pn": 3, "info": ["odd"]},
+        ]
+    )
+
+
+def test_rows_look_like_dicts(flags):
+    assert flags[0] == {"fe": "L-wide", "be": "PUPPI", "pn": 1}
+    assert flags[1]["to"] == 1e-6
+    assert "be" not in flags[2]
+    assert flags[2]["info"] == ["odd"]
+    assert [d.copy() for d in flags][1] == {
+        "fe": "S-wide",
+        "be": "PUPPI",
+        "pn": 2,
+        "to": 1e-6,
+    }
+
+
+def test_get_values(flags):
+    pn, present = flags.get_values("pn")
+    assert pn.dtype == np.int64
+    assert np.all(pn == [1, 2, 3])
+    assert np.all(present)
+    be, present = flags.get_values("be", fill_value="none")
+    assert list(be) == ["PUPPI", "PUPPI", "none"]
+    assert list(present) == [True, True, False]
+    missing, present = flags.get_values("nothing")
+    assert list(missing) == [None] * 3
+    assert not present.any()
+
+
+def test_matches(flags):
+    assert list(flags.matches("fe", "L-wide")) == [True, False, True]
+    assert list(flags.matches("be", "GUPPI")) == [False, False, False]
+    assert list(flags.matches("pn", 2)) == [False, True, False]
+    assert list(flags.matches("pn", "2")) == [False, False, False]
+
+
+def test_groups(flags):
+    groups = flags.groups("fe")
+    assert set(groups) == {"L-wide", "S-wide"}
+    assert list(groups["L-wide"]) == [0, 2]
+    assert list(flags.groups("pn")[2]) == [1]
+    assert list(flags[1:].groups("fe")["L-wide"]) == [1]
+    assert flags.groups("nothing") == {}
+
+
+def test_version(flags):
+    v = flags._data.version
+    flags[0]["jump"] = "1"
+    assert flags._data.version > v
+    v = flags._data.version
+    flags.remove("jump")
+    assert flags._data.version > v
+
+
+def test_row_views_write_through(flags):
+    for d in flags[np.array([True, False, True])]:
+        d["jump"] = 1
+    assert list(flags.get_values("jump")[1]) == [True, False, True]
+    del flags[0]["fe"]
+    assert "fe" not in flags[0]
+    flags[1]["pn"] = "two"
+    assert flags[1]["pn"] == "two"
+    assert flags[2]["pn"] == 3
+
+
+def test_set_and_remove(flags):
+    flags.set_values("pp_dm", np.array([10.0, 11.0, 12.0]))
+    assert flags[2]["pp_dm"] == 12.0
+    flags[1:].set_values("gui_jump", "1")
+    assert list(flags.get_values("gui_jump")[1]) == [False, True, True]
+    flags.remove("pn")
+    assert "pn" not in flags.names
+    assert all("pn" not in d for d in flags)
+
+
+def test_table_operations(flags):
+    t = Table([np.arange(3), flags], names=("a", "flags"))
+    assert t[1]["flags"]["fe"] == "S-wide"
+    t.sort("a", reverse=True)
+    assert list(t["flags"].get_values("pn")[0]) == [3, 2, 1]
+    g = t.group_by("a")
+    assert g.groups[0]["flags"][0]["pn"] == 1
+    s = vstack([t, t[:1]])
+    assert len(s) == 4
+    assert s["flags"][3] == t["flags"][0]
+
+
+def test_copies(flags):
+    c = copy.deepcopy(flags)
+    c[0]["fe"] = "430"
+    assert flags[0]["fe"] == "L-wide"
+    p = pickle.loads(pickle.dumps(flags))
+    assert np.all(p == flags)
@@ -1,12 +1,15 @@
+import pickle
 from io import StringIO
 
+import astropy.units as u
 import numpy as np
 import pytest
+from astropy.time import TimeDelta
 from hypothesis import given, assume
 from hypothesis.strategies import slices, integers, booleans, one_of, lists
 from hypothesis.extra.numpy import arrays, array_shapes
 
-from pint.toa import get_TOAs
+from pint.toa import TOAsView, get_TOAs
 
 tim = """FORMAT 1
 fake 1400 54000 1.0 @ -flag thing
@@ -87,3 +90,75 @@ def test_getitem_slice(c):
     if len(s) > 0:
         assert np.all(s.table["mjd_float"] == s.table.group_by("obs")["mjd_float"])
         toas.get_summary()
+
+
+def test_getitem_view():
+    toas = get_TOAs(StringIO(tim), ephem="de421")
+    m = toas.get_mjds()
+    c = toas.get_freqs().value < 1450
+    s = toas[c]
+    assert isinstance(s, TOAsView)
+    assert len(s) == np.sum(c)
+    ss = s[1:]
+    assert isinstance(ss, TOAsView)
+    assert np.all(ss.get_mjds() == m[c][1:])
+    assert np.all(s.get_mjds() == m[c])
+
+
+def test_view_independent_of_parent():
+    toas = get_TOAs(StringIO(tim), ephem="de421")
+    s = toas[::2]
+    s.table["error"][0] = 17
+    s.table["flags"][0]["flag"] = "changed"
+    s.ephem = "de436"
+    assert not np.any(toas.table["error"] == 17)
+    assert "changed" not in toas.get_flag_value("flag")[0]
+    assert toas.ephem == "de421"
+
+
+def test_view_adjust_independent_of_parent():
+    toas = get_TOAs(StringIO(tim), ephem="de421")
+    mjds = toas.get_mjds()
+    s = toas[::2]
+    s.adjust_TOAs(TimeDelta(np.ones(len(s)) * u.s))
+    assert np.all(toas.get_mjds() == mjds)
+    assert np.all(s.get_mjds() > mjds[::2])
+
+
+def test_view_reads_parent_when_used():
+    toas = get_TOAs(StringIO(tim), ephem="de421")
+    s = toas[::2]
+    # The view copies a column from the parent when it first reads it
+    toas.table["error"][0] = 17
+    assert s.table["error"][0] == 17
+    toas.table["error"][2] = 18
+    assert s.table["error"][1] != 18
+    # Slices of the view see what was written to it
+    s.table["error"][1] = 19
+    ss = s[1:]
+    assert ss.table["error"][0] == 19
+    assert np.all(ss.get_mjds() == toas.get_mjds()[2::2])
+    assert not np.any(toas.table["error"] == 19)
+
+
+def test_view_unaffected_by_parent_methods():
+    toas = get_TOAs(StringIO(tim), ephem="de421")
+    mjds = toas.get_mjds(high_precision=True)[::2]
+    mjd_float = toas.table["mjd_float"][::2].copy()
+    s = toas[::2]
+    # Methods that change the parent's table make its views copy their rows
+    # first, whether they change elements or whole columns
+    toas.adjust_TOAs(TimeDelta(np.ones(len(toas)) * u.s))
+    assert np.all(s.table["mjd_float"] == mjd_float)
+    assert np.all(s.get_mjds(high_precision=True) == mjds)
+    toas.table["error"][0] = 17
+    assert not np.any(s.table["error"] == 17)
+
+
+def test_view_pickle():
+    toas = get_TOAs(StringIO(tim), ephem="de421")
+    s = toas[[1, 5, 7]]
+    p = pickle.loads(pickle.dumps(s))
+    assert len(p) == 3
+    assert np.all(p.get_mjds() == s.get_mjds())
+    assert p == s
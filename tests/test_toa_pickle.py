@@ -4,9 +4,12 @@ import unittest
 import shutil
 import time
 
+import numpy as np
 import pytest
+from astropy.table import Column
 
 from pint import toa
+from pint.toa_flags import FlagColumn
 from pinttestdata import datadir
 
 
@@ -114,3 +117,31 @@ def test_pickle_moved(temp_tim):
     with open(tt2, "at") as f:
         f.write("\n")
     assert not toa.get_TOAs(tt2, usepickle=True, picklefilename=tp).was_pickled
+
+
+def test_pickle_clkcorr_flags(temp_tim):
+    tt, tp = temp_tim
+    t = toa.get_TOAs(tt)
+    # Pickles from before the clkcorr column record the corrections as flags
+    old = toa.get_TOAs(tt)
+    for f, c in zip(old.table["flags"], old.table["clkcorr"]):
+        f["clkcorr"] = str(c)
+    del old.table["clkcorr"]
+    toa.save_pickle(old, picklefilename=tp)
+    tn = toa.get_TOAs(tt, usepickle=True)
+    assert not tn.was_pickled
+    assert np.all(tn.get_mjds(high_precision=True) == t.get_mjds(high_precision=True))
+    assert np.all(tn.table["clkcorr"] == t.table["clkcorr"])
+
+
+def test_pickle_dict_flags(temp_tim):
+    tt, tp = temp_tim
+    old = toa.get_TOAs(tt)
+    # Pickles from before FlagColumn have a column of dictionaries
+    flags = [dict(f) for f in old.table["flags"]]
+    old.table["flags"] = Column(flags, dtype=object)
+    toa.save_pickle(old, picklefilename=tp)
+    tn = toa.get_TOAs(tt, usepickle=True)
+    assert not tn.was_pickled
+    assert isinstance(tn.table["flags"], FlagColumn)
+    assert [dict(f) for f in tn.table["flags"]] == flags
@@ -1,3 +1,4 @@
+import copy
 import os
 import unittest
 import pytest
@@ -10,6 +11,7 @@ from hypothesis.strategies import integers, floats
 from hypothesis.extra.numpy import arrays
 from pint import toa
 from pint.observatory import bipm_default
+from pint.pulsar_ecliptic import OBL
 from pint.models import get_model, get_model_and_toas
 from pinttestdata import datadir
 
@@ -240,6 +242,107 @@ def test_load_multiple(tmpdir):
     assert merged == toa.get_TOAs(filenames, model=m)
 
 
+def test_extend(tmpdir):
+    m = get_model(StringIO(simplepar))
+
+    fakes = [
+        toa.make_fake_toas(55000, 55500, 10, model=m, obs="ao"),
+        toa.make_fake_toas(56000, 56500, 10, model=m, obs="gbt"),
+        toa.make_fake_toas(57000, 57500, 10, model=m, obs="@"),
+    ]
+
+    filenames = [os.path.join(tmpdir, f"t{i+1}.tim") for i in range(len(fakes))]
+
+    for t, f in zip(fakes, filenames):
+        t.write_TOA_file(f, format="tempo2")
+
+    full = toa.get_TOAs(filenames, model=m, planets=True)
+    base = toa.get_TOAs(filenames[:2], model=m, planets=True)
+    extended = toa.get_TOAs(filenames[2], model=m, base=base)
+    assert extended is base
+    assert extended.ntoas == full.ntoas
+    assert extended.table.colnames == full.table.colnames
+    # The new TOAs come after the existing ones, so compare in time order
+    ix = np.argsort(extended.table["mjd_float"])
+    full_ix = np.argsort(full.table["mjd_float"])
+    new = extended.table["obs"] == "barycenter"
+    assert np.all(extended.table["index"][new] > 9)
+    for c in [
+        "mjd_float",
+        "tdbld",
+        "ssb_obs_pos",
+        "obs_jupiter_pos",
+    ]:
+        assert np.all(extended.table[c][ix] == full.table[c][full_ix])
+    assert list(extended.table["flags"][ix]) == list(full.table["flags"][full_ix])
+    # The new TOAs are far apart and after the others, so in groups of their own
+    groups = extended.table["groups"]
+    assert len(set(groups[new])) == 10
+    assert not set(groups[new]) & set(groups[~new])
+    assert extended.filename == filenames
+    assert extended.check_hashes()
+    with pytest.raises(ValueError):
+        toa.get_TOAs(filenames[2], model=m, base=base, ephem="DE421")
+
+
+def test_extend_vel_ecl():
+    m = get_model(StringIO(simplepar))
+    full = toa.merge_TOAs(
+        [
+            toa.make_fake_toas(55000, 55500, 10, model=m, obs="ao"),
+            toa.make_fake_toas(56000, 56500, 10, model=m, obs="gbt"),
+        ]
+    )
+    full.add_vel_ecl(OBL["IERS2010"])
+    base = toa.make_fake_toas(55000, 55500, 10, model=m, obs="ao")
+    base.add_vel_ecl(OBL["IERS2010"])
+    base.extend(toa.make_fake_toas(56000, 56500, 10, model=m, obs="gbt"))
+    assert base.ntoas == 20
+    assert np.all(base.table["ssb_obs_vel_ecl"] == full.table["ssb_obs_vel_ecl"])
+
+
+def test_extend_appends_in_place():
+    m = get_model(StringIO(simplepar))
+    parts = [
+        toa.make_fake_toas(55000, 55500, 40, model=m, obs="ao"),
+        toa.make_fake_toas(56000, 56100, 5, model=m, obs="gbt"),
+        toa.make_fake_toas(56200, 56300, 5, model=m, obs="ao"),
+        toa.make_fake_toas(56400, 56500, 5, model=m, obs="ao"),
+    ]
+    base = copy.deepcopy(parts[0])
+    base.extend(copy.deepcopy(parts[1]))
+    first = base.table
+    base.extend(copy.deepcopy(parts[2]))
+    second = base.table
+    base.extend(copy.deepcopy(parts[3]))
+    # The existing rows were not copied again after the first extension
+    for c in ["mjd_float", "tdbld", "ssb_obs_pos", "obs"]:
+        assert np.shares_memory(base.table[c], first[c])
+    assert np.shares_memory(base.table["tdb"].jd1, first["tdb"].jd1)
+    assert np.all(second["mjd_float"] == base.table["mjd_float"][:50])
+    # The ao TOAs after the gbt ones form a group of their own
+    assert list(base.table.groups.indices) == [0, 40, 45, 55]
+    assert list(base.table.groups.keys["obs"]) == ["arecibo", "gbt", "arecibo"]
+    assert np.all(base.table["obs"][45:] == "arecibo")
+    mjds = np.concatenate([p.table["mjd_float"] for p in parts])
+    assert np.all(base.table["mjd_float"] == mjds)
+    assert np.all(base.table["index"] == np.arange(base.ntoas))
+    assert list(base.table["flags"]) == [f for p in parts for f in p.table["flags"]]
+    assert np.all(
+        base.table["groups"] == toa._group_by_gaps(base.get_mjds().value, 2 / 24)
+    )
+    # TOAs less than two hours after the last join its group
+    base.extend(toa.make_fake_toas(56500.04, 56500.05, 2, model=m, obs="ao"))
+    assert np.all(
+        base.table["groups"] == toa._group_by_gaps(base.get_mjds().value, 2 / 24)
+    )
+    assert base.table["groups"][-1] == base.table["groups"][-3]
+    # Once most of the TOAs are out of order the table is grouped again
+    base.extend(toa.make_fake_toas(56600, 56700, 60, model=m, obs="gbt"))
+    assert list(base.table.groups.keys["obs"]) == ["arecibo", "gbt"]
+    assert np.all(np.diff(base.table.groups.indices) == [52, 65])
+
+
 def test_pickle_multiple(tmpdir):
     m = get_model(StringIO(simplepar))
 
@@ -265,3 +368,51 @@ def test_pickle_multiple(tmpdir):
     assert not toa.get_TOAs(
         filenames, model=m, usepickle=True, picklefilename=picklefilename
     ).was_pickled
+
+
+@pytest.mark.parametrize(
+    "timfile", ["test1.tim", "parkes.toa", "B1855+09_NANOGrav_9yv1.tim"]
+)
+def test_columns_match_toa_list(timfile):
+    x = toa.TOAs(timfile)
+    toas, commands = toa.read_toa_file(timfile)
+    y = toa.TOAs(toalist=toas)
+    assert x.commands == commands
+    for c in ["index", "mjd_float", "error", "freq", "obs", "delta_pulse_number"]:
+        assert np.all(x.table[c] == y.table[c])
+    for tx, ty in zip(x.table["mjd"], y.table["mjd"]):
+        assert tx.scale == ty.scale
+        assert tx.format == ty.format
+        assert tx.jd1 == ty.jd1
+        assert tx.jd2 == ty.jd2
+        assert np.all(tx.location == ty.location)
+    assert list(x.table["flags"]) == list(y.table["flags"])
+
+
+def test_read_looks_up_each_observatory_once(monkeypatch):
+    calls = []
+    get_observatory = toa.get_observatory
+
+    def counting_get_observatory(name, *args, **kwargs):
+        calls.append(name)
+        return get_observatory(name, *args, **kwargs)
+
+    monkeypatch.setattr(toa, "get_observatory", counting_get_observatory)
+    columns, commands = toa.read_toa_file_columns("B1855+09_NANOGrav_9yv1.tim")
+    assert len(columns["obs"]) > 1
+    assert len(calls) == len(set(calls)) == len(set(columns["obs"]))
+
+
+@pytest.mark.parametrize("obs", ["gbt", "@", "coe"])
+def test_get_TOAs_array_matches_list(obs):
+    mjds = np.linspace(np.longdouble(55000), np.longdouble(55001), 7)
+    x = toa.get_TOAs_array(mjds, obs=obs, freqs=1400.0, ephem="DE421")
+    y = toa.get_TOAs_list(
+        [toa.TOA((np.modf(m)[1], np.modf(m)[0]), obs=obs, freq=1400.0) for m in mjds],
+        ephem="DE421",
+    )
+    for c in ["index", "freq", "obs"]:
+        assert np.all(x.table[c] == y.table[c])
+    assert np.allclose(x.table["clkcorr"], y.table["clkcorr"], rtol=0, atol=1e-12)
+    assert np.all(np.abs(x.table["tdbld"] - y.table["tdbld"]) < 1e-14)
+    assert np.allclose(x.table["ssb_obs_pos"], y.table["ssb_obs_pos"])
@@ -90,12 +90,18 @@ class TestTOAselection(unittest.TestCase):
         dmx_new = self.model.dmx_dm(self.sort_toas).value
         assert np.allclose(dmx_old, dmx_new)
 
-    def test_hash(self):
-        self.model.dmx_toas_selector.use_hash = True
+    def dmx_rows(self, toas, param):
+        params, bins, overlap = self.model.dmx_bins(toas)
+        return np.nonzero(bins == params.index(param))[0]
+
+    def test_bins_reused(self):
+        params, bins, overlap = self.model.dmx_bins(self.toas)
+        assert not overlap
+        assert self.model.dmx_bins(self.toas)[1] is bins
         dmx_old = self.get_dmx_old(self.toas).value
         dmx_new = self.model.dmx_dm(self.toas).value
         assert np.allclose(dmx_old, dmx_new)
-        assert self.model.dmx_toas_selector.use_hash
+        assert self.model.dmx_bins(self.sort_toas)[1] is not bins
         dmx_old = self.get_dmx_old(self.sort_toas).value
         dmx_new = self.model.dmx_dm(self.sort_toas).value
         assert np.allclose(dmx_old, dmx_new)
@@ -104,8 +110,8 @@ class TestTOAselection(unittest.TestCase):
         log = logging.getLogger("TestTOAselection.test_change_condition")
         dmx_old = self.get_dmx_old(self.toas).value
         dmx_new = self.model.dmx_dm(self.toas).value
-        indx0004 = self.model.dmx_toas_selector.select_result["DMX_0004"]
-        indx0005 = self.model.dmx_toas_selector.select_result["DMX_0005"]
+        indx0004 = self.dmx_rows(self.toas, "DMX_0004")
+        indx0005 = self.dmx_rows(self.toas, "DMX_0005")
         for l in indx0004:
             log.debug("indx0004= %s", str(l))
         for l in indx0005:
@@ -116,8 +122,8 @@ class TestTOAselection(unittest.TestCase):
         self.model.DMXR1_0005.value = self.model.DMXR2_0005.value
         dmx_old = self.get_dmx_old(self.toas).value
         dmx_new = self.model.dmx_dm(self.toas).value
-        indx0004_2 = self.model.dmx_toas_selector.select_result["DMX_0004"]
-        indx0005_2 = self.model.dmx_toas_selector.select_result["DMX_0005"]
+        indx0004_2 = self.dmx_rows(self.toas, "DMX_0004")
+        indx0005_2 = self.dmx_rows(self.toas, "DMX_0005")
         for l in indx0004_2:
             log.debug("indx0004_2= %s", str(l))
         for l in indx0005_2:
@@ -56,5 +56,20 @@ class Testwls(unittest.TestCase):
             msg = "Fitting parameter " + p + " failed. with red_chi2 " + str(red_chi2)
             assert red_chi2 < tol, msg
 
+    def test_wls_sparse(self):
+        self.f.reset_model()
+        self.f.update_resids()
+        self.f.fit_toas()
+        pars = self.f.model.free_params
+        vals = [getattr(self.f.model, p).value for p in pars]
+        errs = [getattr(self.f.model, p).uncertainty_value for p in pars]
+        self.f.reset_model()
+        self.f.update_resids()
+        self.f.fit_toas(sparse=True)
+        for p, v, e in zip(pars, vals, errs):
+            par = getattr(self.f.model, p)
+            assert par.value == v, p
+            assert par.uncertainty_value == e, p
+
     def test_has_correlated_errors(self):
         assert not self.f.resids.model.has_correlated_errors